@@ -63,6 +63,9 @@ setuptools.setup(
         ),
         "hosted": read_requirements("requirements/requirements.hosted.txt"),
         "http": read_requirements("requirements/requirements.http.txt"),
+        "quantization": read_requirements(
+            "requirements/requirements.quantization.txt"
+        ),
         "sam": read_requirements("requirements/requirements.sam.txt"),
         "waf": read_requirements("requirements/requirements.waf.txt"),
         "yolo-world": read_requirements("requirements/requirements.yolo_world.txt"),
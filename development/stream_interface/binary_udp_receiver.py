@@ -0,0 +1,20 @@
+import os
+
+from inference.core.interfaces.stream.binary_udp import BinaryUDPReceiver
+
+HOST = os.getenv("HOST", "127.0.0.1")
+PORT = int(os.getenv("PORT", "9999"))
+
+
+def main() -> None:
+    receiver = BinaryUDPReceiver.init(ip_address=HOST, port=PORT)
+    try:
+        while True:
+            for prediction in receiver.receive():
+                print(prediction)
+    finally:
+        receiver.close()
+
+
+if __name__ == "__main__":
+    main()
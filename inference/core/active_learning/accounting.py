@@ -1,4 +1,6 @@
-from typing import List, Optional
+import time
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
 
 from inference.core.entities.types import DatasetID, WorkspaceID
 from inference.core.roboflow_api import (
@@ -28,6 +30,32 @@ def image_can_be_submitted_to_batch(
     """
     if max_batch_images is None:
         return True
+    total_batch_images = get_number_of_images_in_batch(
+        batch_name=batch_name,
+        workspace_id=workspace_id,
+        dataset_id=dataset_id,
+        api_key=api_key,
+    )
+    return max_batch_images > total_batch_images
+
+
+def get_number_of_images_in_batch(
+    batch_name: str,
+    workspace_id: WorkspaceID,
+    dataset_id: DatasetID,
+    api_key: str,
+) -> int:
+    """Get the number of images registered in a batch (including ones under labeling).
+
+    Args:
+        batch_name: Name of the batch.
+        workspace_id: ID of the workspace.
+        dataset_id: ID of the dataset.
+        api_key: API key to use for the request.
+
+    Returns:
+        The number of images in the batch - 0 if batch does not exist.
+    """
     labeling_batches = get_roboflow_labeling_batches(
         api_key=api_key,
         workspace_id=workspace_id,
@@ -38,7 +66,7 @@ def image_can_be_submitted_to_batch(
         batch_name=batch_name,
     )
     if matching_labeling_batch is None:
-        return max_batch_images > 0
+        return 0
     batch_images_under_labeling = 0
     if matching_labeling_batch["numJobs"] > 0:
         labeling_jobs = get_roboflow_labeling_jobs(
@@ -48,8 +76,90 @@ def image_can_be_submitted_to_batch(
             all_labeling_jobs=labeling_jobs["jobs"],
             batch_id=matching_labeling_batch["id"],
         )
-    total_batch_images = matching_labeling_batch["images"] + batch_images_under_labeling
-    return max_batch_images > total_batch_images
+    return matching_labeling_batch["images"] + batch_images_under_labeling
+
+
+class BatchCapacityCache:
+    """Caches remaining capacity of labeling batches to avoid Roboflow API calls per image.
+
+    Capacity is fetched from Roboflow API at most once per `ttl_seconds` for given batch
+    and decremented locally for each image accepted in the meantime.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self._ttl_seconds = ttl_seconds
+        self._remaining_capacity: Dict[Tuple[WorkspaceID, DatasetID, str], int] = {}
+        self._fetch_timestamps: Dict[Tuple[WorkspaceID, DatasetID, str], float] = {}
+        self._lock = Lock()
+
+    def reserve_capacity(
+        self,
+        requested_images: int,
+        batch_name: str,
+        workspace_id: WorkspaceID,
+        dataset_id: DatasetID,
+        max_batch_images: Optional[int],
+        api_key: str,
+    ) -> int:
+        """Reserve place for images in the batch.
+
+        Args:
+            requested_images: Number of images to be submitted.
+            batch_name: Name of the batch.
+            workspace_id: ID of the workspace.
+            dataset_id: ID of the dataset.
+            max_batch_images: Maximum number of images allowed in the batch.
+            api_key: API key to use for the request.
+
+        Returns:
+            Number of images (not greater than `requested_images`) that can be submitted.
+        """
+        if max_batch_images is None:
+            return requested_images
+        key = (workspace_id, dataset_id, batch_name)
+        with self._lock:
+            fetched_at = self._fetch_timestamps.get(key)
+            if fetched_at is None or time.monotonic() - fetched_at > self._ttl_seconds:
+                images_in_batch = get_number_of_images_in_batch(
+                    batch_name=batch_name,
+                    workspace_id=workspace_id,
+                    dataset_id=dataset_id,
+                    api_key=api_key,
+                )
+                self._remaining_capacity[key] = max(
+                    max_batch_images - images_in_batch, 0
+                )
+                self._fetch_timestamps[key] = time.monotonic()
+            reserved = min(requested_images, self._remaining_capacity[key])
+            self._remaining_capacity[key] -= reserved
+            return reserved
+
+    def release_capacity(
+        self,
+        released_images: int,
+        batch_name: str,
+        workspace_id: WorkspaceID,
+        dataset_id: DatasetID,
+        max_batch_images: Optional[int],
+    ) -> None:
+        """Give back place reserved for images which were not submitted to the batch.
+
+        Args:
+            released_images: Number of previously reserved images that were not submitted.
+            batch_name: Name of the batch.
+            workspace_id: ID of the workspace.
+            dataset_id: ID of the dataset.
+            max_batch_images: Maximum number of images allowed in the batch.
+        """
+        if max_batch_images is None or released_images <= 0:
+            return None
+        key = (workspace_id, dataset_id, batch_name)
+        with self._lock:
+            if key not in self._remaining_capacity:
+                return None
+            self._remaining_capacity[key] = min(
+                self._remaining_capacity[key] + released_images, max_batch_images
+            )
 
 
 def get_matching_labeling_batch(
@@ -55,6 +55,35 @@ def use_credit_of_matching_strategy(
         return strategy_with_spare_credit
 
 
+def use_credits_of_matching_strategies(
+    cache: BaseCache,
+    workspace: str,
+    project: str,
+    matching_strategies_limits: List[OrderedDict[str, List[StrategyLimit]]],
+) -> List[Optional[str]]:
+    # Batch variant of `use_credit_of_matching_strategy(...)` - usage limits lock is
+    # acquired once for all datapoints instead of once per datapoint.
+    # Returns: strategy with spare credit for each datapoint (or None if not found)
+    with lock_limits(cache=cache, workspace=workspace, project=project):
+        strategies_with_spare_credit = []
+        for datapoint_strategies_limits in matching_strategies_limits:
+            strategy_with_spare_credit = find_strategy_with_spare_usage_credit(
+                cache=cache,
+                workspace=workspace,
+                project=project,
+                matching_strategies_limits=datapoint_strategies_limits,
+            )
+            if strategy_with_spare_credit is not None:
+                consume_strategy_limits_usage_credit(
+                    cache=cache,
+                    workspace=workspace,
+                    project=project,
+                    strategy_name=strategy_with_spare_credit,
+                )
+            strategies_with_spare_credit.append(strategy_with_spare_credit)
+        return strategies_with_spare_credit
+
+
 def return_strategy_credit(
     cache: BaseCache,
     workspace: str,
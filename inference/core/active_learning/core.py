@@ -1,4 +1,6 @@
+import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import List, Optional, Tuple
 from uuid import uuid4
 
@@ -8,6 +10,7 @@ from inference.core import logger
 from inference.core.active_learning.cache_operations import (
     return_strategy_credit,
     use_credit_of_matching_strategy,
+    use_credits_of_matching_strategies,
 )
 from inference.core.active_learning.entities import (
     ActiveLearningConfiguration,
@@ -22,6 +25,12 @@ from inference.core.active_learning.post_processing import (
 )
 from inference.core.cache.base import BaseCache
 from inference.core.env import ACTIVE_LEARNING_TAGS
+from inference.core.exceptions import (
+    RoboflowAPIConnectionError,
+    RoboflowAPINotAuthorizedError,
+    RoboflowAPINotNotFoundError,
+    RoboflowAPIUnsuccessfulRequestError,
+)
 from inference.core.roboflow_api import (
     annotate_image_at_roboflow,
     register_image_at_roboflow,
@@ -29,6 +38,8 @@ from inference.core.roboflow_api import (
 from inference.core.utils.image_utils import encode_image_to_jpeg_bytes
 from inference.core.utils.preprocess import downscale_image_keeping_aspect_ratio
 
+UPLOAD_RETRY_BACKOFF_SECONDS = 0.5
+
 
 def execute_sampling(
     image: np.ndarray,
@@ -93,6 +104,100 @@ def execute_datapoint_registration(
     )
 
 
+def execute_batch_of_datapoints_registration(
+    cache: BaseCache,
+    matching_strategies: List[List[str]],
+    images: List[np.ndarray],
+    predictions: List[Prediction],
+    prediction_type: PredictionType,
+    configuration: ActiveLearningConfiguration,
+    api_key: str,
+    batch_name: str,
+    inference_ids: List[Optional[str]],
+    upload_executor: ThreadPoolExecutor,
+    max_upload_attempts: int = 1,
+) -> List[bool]:
+    matching_strategies_limits = [
+        OrderedDict(
+            (strategy_name, configuration.strategies_limits[strategy_name])
+            for strategy_name in datapoint_matching_strategies
+        )
+        for datapoint_matching_strategies in matching_strategies
+    ]
+    strategies_with_spare_credit = use_credits_of_matching_strategies(
+        cache=cache,
+        workspace=configuration.workspace_id,
+        project=configuration.dataset_id,
+        matching_strategies_limits=matching_strategies_limits,
+    )
+    uploads = []
+    for strategy_with_spare_credit, image, prediction, inference_id in zip(
+        strategies_with_spare_credit, images, predictions, inference_ids
+    ):
+        if strategy_with_spare_credit is None:
+            logger.debug(f"Limit on Active Learning strategy reached.")
+            continue
+        upload = upload_executor.submit(
+            register_datapoint_with_spare_credit,
+            cache=cache,
+            strategy_with_spare_credit=strategy_with_spare_credit,
+            image=image,
+            prediction=prediction,
+            prediction_type=prediction_type,
+            configuration=configuration,
+            api_key=api_key,
+            batch_name=batch_name,
+            inference_id=inference_id,
+            max_upload_attempts=max_upload_attempts,
+        )
+        uploads.append(upload)
+    wait(uploads)
+    for upload in uploads:
+        error = upload.exception()
+        if error is not None:
+            logger.warning(
+                f"Error in datapoint registration for Active Learning. Details: {error}."
+            )
+    return [strategy is not None for strategy in strategies_with_spare_credit]
+
+
+def register_datapoint_with_spare_credit(
+    cache: BaseCache,
+    strategy_with_spare_credit: str,
+    image: np.ndarray,
+    prediction: Prediction,
+    prediction_type: PredictionType,
+    configuration: ActiveLearningConfiguration,
+    api_key: str,
+    batch_name: str,
+    inference_id: Optional[str],
+    max_upload_attempts: int = 1,
+) -> None:
+    encoded_image, scaling_factor = prepare_image_to_registration(
+        image=image,
+        desired_size=configuration.max_image_size,
+        jpeg_compression_level=configuration.jpeg_compression_level,
+    )
+    prediction = adjust_prediction_to_client_scaling_factor(
+        prediction=prediction,
+        scaling_factor=scaling_factor,
+        prediction_type=prediction_type,
+    )
+    register_datapoint_at_roboflow(
+        cache=cache,
+        strategy_with_spare_credit=strategy_with_spare_credit,
+        encoded_image=encoded_image,
+        local_image_id=str(uuid4()),
+        prediction=prediction,
+        prediction_type=prediction_type,
+        configuration=configuration,
+        api_key=api_key,
+        batch_name=batch_name,
+        inference_id=inference_id,
+        max_upload_attempts=max_upload_attempts,
+    )
+
+
 def prepare_image_to_registration(
     image: np.ndarray,
     desired_size: Optional[ImageDimensions],
@@ -123,6 +228,7 @@ def register_datapoint_at_roboflow(
     api_key: str,
     batch_name: str,
     inference_id: Optional[str],
+    max_upload_attempts: int = 1,
 ) -> None:
     tags = collect_tags(
         configuration=configuration,
@@ -138,6 +244,7 @@ def register_datapoint_at_roboflow(
         batch_name=batch_name,
         tags=tags,
         inference_id=inference_id,
+        max_upload_attempts=max_upload_attempts,
     )
     if is_prediction_registration_forbidden(
         prediction=prediction,
@@ -181,10 +288,12 @@ def safe_register_image_at_roboflow(
     batch_name: str,
     tags: List[str],
     inference_id: Optional[str],
+    max_upload_attempts: int = 1,
 ) -> Optional[str]:
     credit_to_be_returned = False
     try:
-        registration_response = register_image_at_roboflow(
+        registration_response = register_image_at_roboflow_with_retries(
+            max_upload_attempts=max_upload_attempts,
             api_key=api_key,
             dataset_id=configuration.dataset_id,
             local_image_id=local_image_id,
@@ -212,6 +321,26 @@ def safe_register_image_at_roboflow(
             )
 
 
+def register_image_at_roboflow_with_retries(max_upload_attempts: int, **kwargs) -> dict:
+    attempt = 1
+    while True:
+        try:
+            return register_image_at_roboflow(**kwargs)
+        except (RoboflowAPINotAuthorizedError, RoboflowAPINotNotFoundError) as error:
+            raise error
+        except (
+            RoboflowAPIConnectionError,
+            RoboflowAPIUnsuccessfulRequestError,
+        ) as error:
+            if attempt >= max_upload_attempts:
+                raise error
+            logger.debug(
+                f"Active Learning image upload attempt {attempt} failed: {error}. Retrying..."
+            )
+            time.sleep(UPLOAD_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            attempt += 1
+
+
 def is_prediction_registration_forbidden(
     prediction: Prediction,
     persist_predictions: bool,
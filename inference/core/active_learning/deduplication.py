@@ -0,0 +1,76 @@
+from threading import Lock
+from typing import Sequence
+
+import cv2
+import numpy as np
+
+HASH_SIZE = 8
+
+
+def compute_difference_hash(image: np.ndarray, hash_size: int = HASH_SIZE) -> int:
+    """Compute perceptual difference hash (dHash) of an image.
+
+    Args:
+        image: Image in BGR (or grayscale) format.
+        hash_size: Side of the hash grid - resulting hash has `hash_size ** 2` bits.
+
+    Returns:
+        Hash encoded as integer.
+    """
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    resized = cv2.resize(
+        image, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA
+    )
+    differences = resized[:, 1:] > resized[:, :-1]
+    return int.from_bytes(np.packbits(differences).tobytes(), byteorder="big")
+
+
+class PerceptualHashDeduplicator:
+    """Drops near-duplicate images based on Hamming distance between dHashes.
+
+    Remembers hashes of `history_size` most recently registered images - image is
+    considered duplicate if its hash is within `max_hamming_distance` bits of any of them.
+    Checking and remembering are separate steps, such that images which end up not
+    being registered do not block later registration of the same content.
+    """
+
+    def __init__(self, max_hamming_distance: int, history_size: int):
+        self._max_hamming_distance = max_hamming_distance
+        self._history = np.zeros((max(history_size, 1),), dtype=np.uint64)
+        self._history_filled = 0
+        self._next_slot = 0
+        self._lock = Lock()
+
+    def is_duplicate(self, image_hash: int, pending_hashes: Sequence[int] = ()) -> bool:
+        """Check if image is a near-duplicate of remembered or pending images.
+
+        Args:
+            image_hash: dHash of the image, as returned by `compute_difference_hash(...)`.
+            pending_hashes: Hashes of images not remembered yet, but already accepted
+                for registration (for instance - earlier images of the same batch).
+
+        Returns:
+            True if the image is a near-duplicate, False otherwise.
+        """
+        with self._lock:
+            known_hashes = self._history[: self._history_filled].copy()
+        if len(pending_hashes) > 0:
+            known_hashes = np.concatenate(
+                [known_hashes, np.array(pending_hashes, dtype=np.uint64)]
+            )
+        if known_hashes.shape[0] == 0:
+            return False
+        distances = _count_bits(np.bitwise_xor(known_hashes, np.uint64(image_hash)))
+        return bool(distances.min() <= self._max_hamming_distance)
+
+    def remember(self, image_hash: int) -> None:
+        with self._lock:
+            self._history[self._next_slot] = np.uint64(image_hash)
+            self._next_slot = (self._next_slot + 1) % self._history.shape[0]
+            self._history_filled = min(self._history_filled + 1, self._history.shape[0])
+
+
+def _count_bits(values: np.ndarray) -> np.ndarray:
+    bytes_view = values.view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(bytes_view, axis=1).sum(axis=1)
@@ -1,25 +1,45 @@
 import queue
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
 from threading import Thread
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
 
 from inference.core import logger
-from inference.core.active_learning.accounting import image_can_be_submitted_to_batch
+from inference.core.active_learning.accounting import (
+    BatchCapacityCache,
+    image_can_be_submitted_to_batch,
+)
 from inference.core.active_learning.batching import generate_batch_name
 from inference.core.active_learning.configuration import (
     prepare_active_learning_configuration,
     prepare_active_learning_configuration_inplace,
 )
 from inference.core.active_learning.core import (
+    execute_batch_of_datapoints_registration,
     execute_datapoint_registration,
     execute_sampling,
 )
+from inference.core.active_learning.deduplication import (
+    PerceptualHashDeduplicator,
+    compute_difference_hash,
+)
 from inference.core.active_learning.entities import (
     ActiveLearningConfiguration,
     Prediction,
     PredictionType,
 )
 from inference.core.cache.base import BaseCache
+from inference.core.env import (
+    ACTIVE_LEARNING_BATCH_CAPACITY_CACHE_TTL,
+    ACTIVE_LEARNING_DEDUPLICATION_ENABLED,
+    ACTIVE_LEARNING_DEDUPLICATION_HISTORY_SIZE,
+    ACTIVE_LEARNING_DEDUPLICATION_MAX_HAMMING_DISTANCE,
+    ACTIVE_LEARNING_MAX_CONCURRENT_UPLOADS,
+    ACTIVE_LEARNING_MAX_UPLOAD_ATTEMPTS,
+    ACTIVE_LEARNING_REGISTRATION_BATCH_SIZE,
+)
 from inference.core.utils.image_utils import load_image
 
 MAX_REGISTRATION_QUEUE_SIZE = 512
@@ -327,3 +347,296 @@ class ThreadingActiveLearningMiddleware(ActiveLearningMiddleware):
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.stop_registration_thread()
+
+
+RegistrationTask = Tuple[Any, Prediction, PredictionType, bool, Optional[str]]
+
+
+class BatchingActiveLearningMiddleware(ActiveLearningMiddleware):
+    """Active Learning middleware optimised for high-throughput sources (like video).
+
+    Registration requests are only put into the queue in the caller thread. Background
+    thread drains the queue in batches, evaluates sampling, drops near-duplicate images,
+    reserves batch capacity and strategies credits once per batch and uploads
+    datapoints concurrently (with retries) using bounded thread pool.
+    Already decoded images (`np.ndarray`, expected to be in BGR) are used as is.
+    """
+
+    @classmethod
+    def init(
+        cls,
+        api_key: str,
+        target_dataset: str,
+        model_id: str,
+        cache: BaseCache,
+        max_queue_size: int = MAX_REGISTRATION_QUEUE_SIZE,
+    ) -> "BatchingActiveLearningMiddleware":
+        configuration = prepare_active_learning_configuration(
+            api_key=api_key,
+            target_dataset=target_dataset,
+            model_id=model_id,
+            cache=cache,
+        )
+        return cls(
+            api_key=api_key,
+            configuration=configuration,
+            cache=cache,
+            task_queue=Queue(max_queue_size),
+        )
+
+    @classmethod
+    def init_from_config(
+        cls,
+        api_key: str,
+        target_dataset: str,
+        model_id: str,
+        cache: BaseCache,
+        config: Optional[dict],
+        max_queue_size: int = MAX_REGISTRATION_QUEUE_SIZE,
+    ) -> "BatchingActiveLearningMiddleware":
+        configuration = prepare_active_learning_configuration_inplace(
+            api_key=api_key,
+            target_dataset=target_dataset,
+            model_id=model_id,
+            active_learning_configuration=config,
+        )
+        return cls(
+            api_key=api_key,
+            configuration=configuration,
+            cache=cache,
+            task_queue=Queue(max_queue_size),
+        )
+
+    def __init__(
+        self,
+        api_key: str,
+        configuration: Optional[ActiveLearningConfiguration],
+        cache: BaseCache,
+        task_queue: Queue,
+        max_batch_size: int = ACTIVE_LEARNING_REGISTRATION_BATCH_SIZE,
+        max_concurrent_uploads: int = ACTIVE_LEARNING_MAX_CONCURRENT_UPLOADS,
+        max_upload_attempts: int = ACTIVE_LEARNING_MAX_UPLOAD_ATTEMPTS,
+        deduplicator: Optional[PerceptualHashDeduplicator] = None,
+        batch_capacity_cache: Optional[BatchCapacityCache] = None,
+    ):
+        super().__init__(api_key=api_key, configuration=configuration, cache=cache)
+        if deduplicator is None and ACTIVE_LEARNING_DEDUPLICATION_ENABLED:
+            deduplicator = PerceptualHashDeduplicator(
+                max_hamming_distance=ACTIVE_LEARNING_DEDUPLICATION_MAX_HAMMING_DISTANCE,
+                history_size=ACTIVE_LEARNING_DEDUPLICATION_HISTORY_SIZE,
+            )
+        if batch_capacity_cache is None:
+            batch_capacity_cache = BatchCapacityCache(
+                ttl_seconds=ACTIVE_LEARNING_BATCH_CAPACITY_CACHE_TTL
+            )
+        self._task_queue = task_queue
+        self._max_batch_size = max(max_batch_size, 1)
+        self._max_concurrent_uploads = max(max_concurrent_uploads, 1)
+        self._max_upload_attempts = max(max_upload_attempts, 1)
+        self._deduplicator = deduplicator
+        self._batch_capacity_cache = batch_capacity_cache
+        self._registration_thread: Optional[Thread] = None
+        self._upload_executor: Optional[ThreadPoolExecutor] = None
+
+    def register_batch(
+        self,
+        inference_inputs: List[Any],
+        predictions: List[Prediction],
+        prediction_type: PredictionType,
+        disable_preproc_auto_orient: bool = False,
+        inference_id=None,
+    ) -> None:
+        if self._configuration is None:
+            return None
+        for inference_input, prediction in zip(inference_inputs, predictions):
+            self._enqueue_task(
+                task=(
+                    inference_input,
+                    prediction,
+                    prediction_type,
+                    disable_preproc_auto_orient,
+                    inference_id,
+                )
+            )
+
+    def register(
+        self,
+        inference_input: Any,
+        prediction: dict,
+        prediction_type: PredictionType,
+        disable_preproc_auto_orient: bool = False,
+        inference_id=None,
+    ) -> None:
+        if self._configuration is None:
+            return None
+        self._enqueue_task(
+            task=(
+                inference_input,
+                prediction,
+                prediction_type,
+                disable_preproc_auto_orient,
+                inference_id,
+            )
+        )
+
+    def _enqueue_task(self, task: RegistrationTask) -> None:
+        try:
+            self._task_queue.put_nowait(task)
+        except queue.Full:
+            logger.warning(
+                f"Dropping datapoint registered in Active Learning due to insufficient processing "
+                f"capabilities."
+            )
+
+    def start_registration_thread(self) -> None:
+        if self._registration_thread is not None:
+            logger.warning(f"Registration thread already started.")
+            return None
+        logger.debug("Staring registration thread")
+        self._upload_executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrent_uploads
+        )
+        self._registration_thread = Thread(target=self._consume_queue)
+        self._registration_thread.start()
+
+    def stop_registration_thread(self) -> None:
+        if self._registration_thread is None:
+            logger.warning("Registration thread is already stopped.")
+            return None
+        logger.debug("Stopping registration thread")
+        self._task_queue.put(None)
+        self._registration_thread.join()
+        if self._registration_thread.is_alive():
+            logger.warning(f"Registration thread stopping was unsuccessful.")
+        self._registration_thread = None
+        self._upload_executor.shutdown(wait=True)
+        self._upload_executor = None
+
+    def _consume_queue(self) -> None:
+        queue_closed = False
+        while not queue_closed:
+            tasks, queue_closed = self._collect_tasks_batch()
+            if len(tasks) == 0:
+                continue
+            try:
+                self._execute_batch_registration(tasks=tasks)
+            except Exception as error:
+                logger.warning(
+                    f"Error in datapoints batch registration for Active Learning. Details: {error}. "
+                    f"Error is suppressed in favour of normal operations of registration thread."
+                )
+
+    def _collect_tasks_batch(self) -> Tuple[List[RegistrationTask], bool]:
+        tasks = []
+        task = self._task_queue.get()
+        self._task_queue.task_done()
+        while task is not None:
+            tasks.append(task)
+            if len(tasks) >= self._max_batch_size:
+                return tasks, False
+            try:
+                task = self._task_queue.get_nowait()
+                self._task_queue.task_done()
+            except queue.Empty:
+                return tasks, False
+        logger.debug("Terminating registration thread")
+        return tasks, True
+
+    def _execute_batch_registration(self, tasks: List[RegistrationTask]) -> None:
+        images, predictions, matching_strategies, inference_ids = [], [], [], []
+        image_hashes = []
+        for (
+            inference_input,
+            prediction,
+            prediction_type,
+            disable_preproc_auto_orient,
+            inference_id,
+        ) in tasks:
+            image = _load_image_for_registration(
+                inference_input=inference_input,
+                disable_preproc_auto_orient=disable_preproc_auto_orient,
+            )
+            datapoint_matching_strategies = execute_sampling(
+                image=image,
+                prediction=prediction,
+                prediction_type=prediction_type,
+                sampling_methods=self._configuration.sampling_methods,
+            )
+            if len(datapoint_matching_strategies) == 0:
+                continue
+            if self._deduplicator is not None:
+                image_hash = compute_difference_hash(image=image)
+                if self._deduplicator.is_duplicate(
+                    image_hash=image_hash, pending_hashes=image_hashes
+                ):
+                    logger.debug("Near-duplicate image rejected by Active Learning.")
+                    continue
+                image_hashes.append(image_hash)
+            images.append(image)
+            predictions.append(prediction)
+            matching_strategies.append(datapoint_matching_strategies)
+            inference_ids.append(inference_id)
+        if len(images) == 0:
+            return None
+        batch_name = generate_batch_name(configuration=self._configuration)
+        reserved_capacity = self._batch_capacity_cache.reserve_capacity(
+            requested_images=len(images),
+            batch_name=batch_name,
+            workspace_id=self._configuration.workspace_id,
+            dataset_id=self._configuration.dataset_id,
+            max_batch_images=self._configuration.max_batch_images,
+            api_key=self._api_key,
+        )
+        if reserved_capacity < len(images):
+            logger.debug(f"Limit on Active Learning batch size reached.")
+        if reserved_capacity == 0:
+            return None
+        submitted = [False] * reserved_capacity
+        try:
+            submitted = execute_batch_of_datapoints_registration(
+                cache=self._cache,
+                matching_strategies=matching_strategies[:reserved_capacity],
+                images=images[:reserved_capacity],
+                predictions=predictions[:reserved_capacity],
+                prediction_type=prediction_type,
+                configuration=self._configuration,
+                api_key=self._api_key,
+                batch_name=batch_name,
+                inference_ids=inference_ids[:reserved_capacity],
+                upload_executor=self._upload_executor,
+                max_upload_attempts=self._max_upload_attempts,
+            )
+        finally:
+            self._batch_capacity_cache.release_capacity(
+                released_images=reserved_capacity - sum(submitted),
+                batch_name=batch_name,
+                workspace_id=self._configuration.workspace_id,
+                dataset_id=self._configuration.dataset_id,
+                max_batch_images=self._configuration.max_batch_images,
+            )
+        if self._deduplicator is None:
+            return None
+        for image_hash, was_submitted in zip(image_hashes, submitted):
+            if was_submitted:
+                self._deduplicator.remember(image_hash=image_hash)
+
+    def __enter__(self) -> "BatchingActiveLearningMiddleware":
+        self.start_registration_thread()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop_registration_thread()
+
+
+def _load_image_for_registration(
+    inference_input: Any, disable_preproc_auto_orient: bool
+) -> np.ndarray:
+    if isinstance(inference_input, np.ndarray):
+        return inference_input
+    image, is_bgr = load_image(
+        value=inference_input,
+        disable_preproc_auto_orient=disable_preproc_auto_orient,
+    )
+    if not is_bgr:
+        image = image[:, :, ::-1]
+    return image
@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
 from inference.core import logger
 
@@ -50,6 +50,18 @@ class BaseCache:
         """
         raise NotImplementedError()
 
+    def zadd_many(self, items: List[Tuple[str, Any, float, Optional[float]]]) -> None:
+        """
+        Adds multiple members to sorted sets. Subclasses may override this method to
+        add all members at once.
+
+        Args:
+            items (List[Tuple[str, Any, float, Optional[float]]]): Tuples of key of the sorted set,
+                value to add, its score and (optional) expire time in seconds.
+        """
+        for key, value, score, expire in items:
+            self.zadd(key=key, value=value, score=score, expire=expire)
+
     def zrangebyscore(
         self,
         key: str,
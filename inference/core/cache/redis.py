@@ -6,7 +6,7 @@ import threading
 import time
 from contextlib import asynccontextmanager
 from copy import copy
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
 import redis
 
@@ -121,6 +121,25 @@ class RedisCache(BaseCache):
         if expire:
             self.zexpires[(key, score)] = expire + time.time()
 
+    def zadd_many(self, items: List[Tuple[str, Any, float, Optional[float]]]) -> None:
+        """
+        Adds multiple members to sorted sets in single round trip to Redis.
+
+        Args:
+            items (List[Tuple[str, Any, float, Optional[float]]]): Tuples of key of the sorted set,
+                value to add, its score and (optional) expire time in seconds.
+        """
+        if not items:
+            return None
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value, score, _ in items:
+            pipeline.zadd(key, {json.dumps(value): score})
+        pipeline.execute()
+        now = time.time()
+        for key, _, score, expire in items:
+            if expire:
+                self.zexpires[(key, score)] = expire + now
+
     def zrangebyscore(
         self,
         key: str,
@@ -1,8 +1,12 @@
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from inference.core.entities.common import ApiKey, ModelID, ModelType
+from inference.core.env import (
+    SAMPLING_PROFILER_FREQUENCY,
+    SAMPLING_PROFILER_MAX_DURATION,
+)
 
 
 class AddModelRequest(BaseModel):
@@ -29,3 +33,27 @@ class ClearModelRequest(BaseModel):
 
     model_config = ConfigDict(protected_namespaces=())
     model_id: str = ModelID
+
+
+class SamplingProfilerStartRequest(BaseModel):
+    """Request to start sampling profiler of the inference server.
+
+    Attributes:
+        duration (float): Duration of profiling session in seconds.
+        frequency (float): Number of stack samples taken per second.
+    """
+
+    duration: float = Field(
+        gt=0,
+        le=SAMPLING_PROFILER_MAX_DURATION,
+        description="Duration of profiling session in seconds",
+        examples=[30],
+    )
+    frequency: float = Field(
+        default=SAMPLING_PROFILER_FREQUENCY,
+        gt=0,
+        le=1000,
+        description="Number of stack samples taken per second - effective frequency "
+        "may be lower, as sampling is throttled to keep its overhead bounded",
+        examples=[100],
+    )
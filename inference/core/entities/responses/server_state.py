@@ -3,6 +3,7 @@ from typing import List, Optional, Union
 from pydantic import BaseModel, ConfigDict, Field
 
 from inference.core.managers.entities import ModelDescription
+from inference.core.utils.sampling_profiler import SamplingProfilerStatus
 
 
 class ServerVersionInfo(BaseModel):
@@ -40,6 +41,26 @@ class ModelDescriptionEntity(BaseModel):
         None,
         description="Image input width accepted by the model (if registered).",
     )
+    shared_memory_bytes: Optional[int] = Field(
+        None,
+        description="Size of model weights memory-mapped from file, which is shared "
+        "between processes loading the same model (if registered).",
+    )
+    private_memory_bytes: Optional[int] = Field(
+        None,
+        description="Estimated private memory of the process allocated while loading "
+        "the model (if registered).",
+    )
+    weights_variant: Optional[str] = Field(
+        None,
+        description="Variant of model weights in use - `fp32` or quantized variant, "
+        "like `dynamic-int8` (if registered).",
+    )
+    quantization_speedup: Optional[float] = Field(
+        None,
+        description="Speedup of quantized variant of the model against FP32 weights, "
+        "measured during quantization (if registered).",
+    )
 
     @classmethod
     def from_model_description(
@@ -51,6 +72,10 @@ class ModelDescriptionEntity(BaseModel):
             batch_size=model_description.batch_size,
             input_height=model_description.input_height,
             input_width=model_description.input_width,
+            shared_memory_bytes=model_description.shared_memory_bytes,
+            private_memory_bytes=model_description.private_memory_bytes,
+            weights_variant=model_description.weights_variant,
+            quantization_speedup=model_description.quantization_speedup,
         )
 
 
@@ -71,3 +96,34 @@ class ModelsDescriptions(BaseModel):
                 for model_description in models_descriptions
             ]
         )
+
+
+class SamplingProfilerStatusResponse(BaseModel):
+    running: bool = Field(description="Flag to denote if profiling session is running")
+    frequency: float = Field(
+        description="Requested number of stack samples per second", examples=[100]
+    )
+    duration: float = Field(
+        description="Requested duration of profiling session in seconds", examples=[30]
+    )
+    elapsed: float = Field(description="Seconds elapsed since session start")
+    samples: int = Field(description="Number of samples taken in the session")
+    unique_stacks: int = Field(description="Number of unique stacks collected")
+    overhead: float = Field(
+        description="Fraction of wall time spent by profiler on taking samples",
+        examples=[0.01],
+    )
+
+    @classmethod
+    def from_status(
+        cls, status: SamplingProfilerStatus
+    ) -> "SamplingProfilerStatusResponse":
+        return cls(
+            running=status.running,
+            frequency=status.frequency,
+            duration=status.duration,
+            elapsed=status.elapsed,
+            samples=status.samples,
+            unique_stacks=status.unique_stacks,
+            overhead=status.overhead,
+        )
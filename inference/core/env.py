@@ -180,6 +180,9 @@ ENABLE_BYTE_TRACK = str2bool(os.getenv("ENABLE_BYTE_TRACK", False))
 
 ENABLE_PROMETHEUS = str2bool(os.getenv("ENABLE_PROMETHEUS", False))
 
+# Flag to return durations of inference stages of each request in Server-Timing header
+ENABLE_SERVER_TIMING_HEADER = str2bool(os.getenv("ENABLE_SERVER_TIMING_HEADER", False))
+
 # Flag to enforce FPS, default is False
 ENFORCE_FPS = str2bool(os.getenv("ENFORCE_FPS", False))
 MAX_FPS = os.getenv("MAX_FPS")
@@ -249,6 +252,31 @@ if LAMBDA:
 # Interval for metrics aggregation, default is 60
 METRICS_INTERVAL = int(os.getenv("METRICS_INTERVAL", 60))
 
+# Flag to save inference metrics in cache by background thread, default is True
+INFERENCE_METRICS_WRITE_BEHIND = str2bool(
+    os.getenv("INFERENCE_METRICS_WRITE_BEHIND", True)
+)
+
+# Max number of inference metrics records waiting to be saved, default is 4096
+INFERENCE_METRICS_MAX_PENDING_RECORDS = int(
+    os.getenv("INFERENCE_METRICS_MAX_PENDING_RECORDS", 4096)
+)
+
+# Interval (in seconds) of saving inference metrics records, default is 0.5
+INFERENCE_METRICS_FLUSH_INTERVAL = float(
+    os.getenv("INFERENCE_METRICS_FLUSH_INTERVAL", 0.5)
+)
+
+# Max number of inference metrics records saved at once, default is 256
+INFERENCE_METRICS_FLUSH_BATCH_SIZE = int(
+    os.getenv("INFERENCE_METRICS_FLUSH_BATCH_SIZE", 256)
+)
+
+# Max time (in seconds) of saving pending inference metrics records on server shutdown, default is 5
+INFERENCE_METRICS_SHUTDOWN_FLUSH_TIMEOUT = float(
+    os.getenv("INFERENCE_METRICS_SHUTDOWN_FLUSH_TIMEOUT", 5.0)
+)
+
 # URL for posting metrics to Roboflow API, default is "{API_BASE_URL}/inference-stats"
 METRICS_URL = os.getenv("METRICS_URL", f"{API_BASE_URL}/inference-stats")
 
@@ -275,12 +303,60 @@ ONNXRUNTIME_EXECUTION_PROVIDERS = os.getenv(
     "[CUDAExecutionProvider,OpenVINOExecutionProvider,CoreMLExecutionProvider,CPUExecutionProvider]",
 )
 
+# Flag to memory-map weights of ONNX models - processes loading the same model share
+# the weights through OS page cache. Not applied for TensorRT execution provider.
+ONNXRUNTIME_MMAP_WEIGHTS = str2bool(os.getenv("ONNXRUNTIME_MMAP_WEIGHTS", "False"))
+
+# Flag to disable pre-packing of weights by onnxruntime - pre-packed weights are private
+# copies of the process, disabling saves memory at the cost of slower inference
+ONNXRUNTIME_DISABLE_PREPACKING = str2bool(
+    os.getenv("ONNXRUNTIME_DISABLE_PREPACKING", "False")
+)
+
+# Profile of onnxruntime sessions (threading and memory settings) - one of: default,
+# latency, throughput, shared or auto (profile tuned for the model on the host)
+ONNXRUNTIME_SESSION_PROFILE = os.getenv("ONNXRUNTIME_SESSION_PROFILE", "default")
+
+# Quantization of ONNX models running on CPU - one of: none, dynamic, static
+ONNXRUNTIME_QUANTIZATION = os.getenv("ONNXRUNTIME_QUANTIZATION", "none").lower()
+
+# Number of images used to calibrate quantized model and to validate its accuracy
+ONNXRUNTIME_QUANTIZATION_CALIBRATION_SAMPLES = int(
+    os.getenv("ONNXRUNTIME_QUANTIZATION_CALIBRATION_SAMPLES", "32")
+)
+
+# Directory with calibration images - if not given, images of requests are used
+ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR = os.getenv(
+    "ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR"
+)
+
+# Max mean relative difference between outputs of quantized and FP32 model
+ONNXRUNTIME_QUANTIZATION_MAX_OUTPUT_DRIFT = float(
+    os.getenv("ONNXRUNTIME_QUANTIZATION_MAX_OUTPUT_DRIFT", "0.05")
+)
+
 # Port, default is 9001
 PORT = int(os.getenv("PORT", 9001))
 
 # Profile flag, default is False
 PROFILE = str2bool(os.getenv("PROFILE", False))
 
+# Flag to enable endpoints controlling sampling profiler, default is False
+ENABLE_SAMPLING_PROFILER = str2bool(os.getenv("ENABLE_SAMPLING_PROFILER", False))
+
+# Default frequency (Hz) of stack samples taken by sampling profiler
+SAMPLING_PROFILER_FREQUENCY = float(os.getenv("SAMPLING_PROFILER_FREQUENCY", "100"))
+
+# Maximum duration (seconds) of single session of sampling profiler
+SAMPLING_PROFILER_MAX_DURATION = float(
+    os.getenv("SAMPLING_PROFILER_MAX_DURATION", "600")
+)
+
+# Maximum fraction of wall time spent by sampling profiler on taking samples
+SAMPLING_PROFILER_MAX_OVERHEAD = float(
+    os.getenv("SAMPLING_PROFILER_MAX_OVERHEAD", "0.02")
+)
+
 # Redis host, default is None
 REDIS_HOST = os.getenv("REDIS_HOST", None)
 
@@ -357,6 +433,27 @@ INFER_BUCKET = os.getenv(
 
 ACTIVE_LEARNING_ENABLED = str2bool(os.getenv("ACTIVE_LEARNING_ENABLED", True))
 ACTIVE_LEARNING_TAGS = safe_split_value(os.getenv("ACTIVE_LEARNING_TAGS", None))
+ACTIVE_LEARNING_REGISTRATION_BATCH_SIZE = int(
+    os.getenv("ACTIVE_LEARNING_REGISTRATION_BATCH_SIZE", "16")
+)
+ACTIVE_LEARNING_MAX_CONCURRENT_UPLOADS = int(
+    os.getenv("ACTIVE_LEARNING_MAX_CONCURRENT_UPLOADS", "4")
+)
+ACTIVE_LEARNING_MAX_UPLOAD_ATTEMPTS = int(
+    os.getenv("ACTIVE_LEARNING_MAX_UPLOAD_ATTEMPTS", "3")
+)
+ACTIVE_LEARNING_BATCH_CAPACITY_CACHE_TTL = float(
+    os.getenv("ACTIVE_LEARNING_BATCH_CAPACITY_CACHE_TTL", "60")
+)
+ACTIVE_LEARNING_DEDUPLICATION_ENABLED = str2bool(
+    os.getenv("ACTIVE_LEARNING_DEDUPLICATION_ENABLED", True)
+)
+ACTIVE_LEARNING_DEDUPLICATION_MAX_HAMMING_DISTANCE = int(
+    os.getenv("ACTIVE_LEARNING_DEDUPLICATION_MAX_HAMMING_DISTANCE", "4")
+)
+ACTIVE_LEARNING_DEDUPLICATION_HISTORY_SIZE = int(
+    os.getenv("ACTIVE_LEARNING_DEDUPLICATION_HISTORY_SIZE", "256")
+)
 
 # Number inflight async tasks for async model manager
 NUM_PARALLEL_TASKS = int(os.getenv("NUM_PARALLEL_TASKS", 512))
@@ -383,6 +480,17 @@ DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW = int(
 ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING = str2bool(
     os.getenv("ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING", "False")
 )
+VIDEO_FILE_DECODING_BACKEND = os.getenv("VIDEO_FILE_DECODING_BACKEND", "opencv")
+VIDEO_FILE_SEEK_MIN_FRAMES_TO_SKIP = int(
+    os.getenv("VIDEO_FILE_SEEK_MIN_FRAMES_TO_SKIP", "0")
+)
+VIDEO_FILE_DECODING_MAX_DIMENSION = os.getenv("VIDEO_FILE_DECODING_MAX_DIMENSION")
+if VIDEO_FILE_DECODING_MAX_DIMENSION is not None:
+    VIDEO_FILE_DECODING_MAX_DIMENSION = int(VIDEO_FILE_DECODING_MAX_DIMENSION)
+
+SINKS_WRITER_MAX_PENDING_TASKS = int(os.getenv("SINKS_WRITER_MAX_PENDING_TASKS", "128"))
+SINKS_WRITER_FULL_QUEUE_POLICY = os.getenv("SINKS_WRITER_FULL_QUEUE_POLICY", "block")
+LOCAL_FILE_SINK_FSYNC = str2bool(os.getenv("LOCAL_FILE_SINK_FSYNC", "False"))
 
 NUM_CELERY_WORKERS = os.getenv("NUM_CELERY_WORKERS", 4)
 CELERY_LOG_LEVEL = os.getenv("CELERY_LOG_LEVEL", "WARNING")
@@ -414,6 +522,24 @@ DISABLE_WORKFLOW_ENDPOINTS = str2bool(os.getenv("DISABLE_WORKFLOW_ENDPOINTS", Fa
 WORKFLOWS_STEP_EXECUTION_MODE = os.getenv("WORKFLOWS_STEP_EXECUTION_MODE", "local")
 WORKFLOWS_REMOTE_API_TARGET = os.getenv("WORKFLOWS_REMOTE_API_TARGET", "hosted")
 WORKFLOWS_MAX_CONCURRENT_STEPS = int(os.getenv("WORKFLOWS_MAX_CONCURRENT_STEPS", "8"))
+WORKFLOWS_MODEL_CALLS_COALESCING_ENABLED = str2bool(
+    os.getenv("WORKFLOWS_MODEL_CALLS_COALESCING_ENABLED", "False")
+)
+WORKFLOWS_MODEL_CALLS_COALESCING_MAX_WAIT = float(
+    os.getenv("WORKFLOWS_MODEL_CALLS_COALESCING_MAX_WAIT", "0.05")
+)
+WORKFLOWS_STEP_OUTPUTS_MEMOIZATION_ENABLED = str2bool(
+    os.getenv("WORKFLOWS_STEP_OUTPUTS_MEMOIZATION_ENABLED", "False")
+)
+WORKFLOWS_BYTE_TRACKER_IDLE_VIDEO_TIMEOUT = float(
+    os.getenv("WORKFLOWS_BYTE_TRACKER_IDLE_VIDEO_TIMEOUT", "300")
+)
+WORKFLOWS_BYTE_TRACKER_MAX_VIDEOS = int(
+    os.getenv("WORKFLOWS_BYTE_TRACKER_MAX_VIDEOS", "1024")
+)
+WORKFLOWS_VISUALIZATION_ANNOTATORS_CACHE_SIZE = int(
+    os.getenv("WORKFLOWS_VISUALIZATION_ANNOTATORS_CACHE_SIZE", "256")
+)
 WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_BATCH_SIZE = int(
     os.getenv("WORKFLOWS_REMOTE_EXECUTION_MAX_STEP_BATCH_SIZE", "1")
 )
@@ -439,6 +565,12 @@ DEVICE = os.getenv("DEVICE")
 DEDICATED_DEPLOYMENT_WORKSPACE_URL = os.environ.get(
     "DEDICATED_DEPLOYMENT_WORKSPACE_URL", None
 )
+DEDICATED_DEPLOYMENT_AUTH_CACHE_TTL = float(
+    os.getenv("DEDICATED_DEPLOYMENT_AUTH_CACHE_TTL", "3600")
+)
+DEDICATED_DEPLOYMENT_AUTH_CACHE_MAX_SIZE = int(
+    os.getenv("DEDICATED_DEPLOYMENT_AUTH_CACHE_MAX_SIZE", "1024")
+)
 
 ENABLE_STREAM_API = str2bool(os.getenv("ENABLE_STREAM_API", "False"))
 STREAM_API_PRELOADED_PROCESSES = int(os.getenv("STREAM_API_PRELOADED_PROCESSES", "0"))
@@ -99,5 +99,17 @@ class VideoFrameProducer:
     def initialize_source_properties(self, properties: Dict[str, float]):
         pass
 
+    def skip(self, frames_number: int) -> int:
+        """Skips given number of frames without retrieving them.
+
+        Returns number of skipped frames - lower than requested only when source ended.
+        Default implementation grabs frames one by one - producers able to seek or
+        skip compressed data should override it.
+        """
+        skipped = 0
+        while skipped < frames_number and self.grab():
+            skipped += 1
+        return skipped
+
 
 VideoSourceIdentifier = Union[str, int, Callable[[], VideoFrameProducer]]
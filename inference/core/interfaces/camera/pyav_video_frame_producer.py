@@ -0,0 +1,151 @@
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import av
+import numpy as np
+
+from inference.core import logger
+from inference.core.interfaces.camera.entities import (
+    SourceProperties,
+    VideoFrameProducer,
+)
+
+
+class PyAVVideoFrameProducer(VideoFrameProducer):
+    """Video files producer decoding with PyAV, optimised for sub-sampled consumption.
+
+    * `grab()` decodes the frame, but conversion into BGR `np.ndarray` is only
+    done in `retrieve()` - optionally at reduced resolution (`max_dimension`), which
+    is done in the same pass as colour conversion.
+    * `skip(...)` works on the level of compressed packets - packets are demuxed
+    without decoding, and only packets starting from the last keyframe
+    encountered are decoded (with non-reference frames discarded by decoder), as those
+    are needed as references for frames to come. Frames are counted by packets,
+    so for streams with B-frames frames identifiers are approximate after skip
+    (total number of frames is preserved, as decoder is flushed at the end of stream).
+    """
+
+    def __init__(self, video: str, max_dimension: Optional[int] = None):
+        self._container = av.open(video)
+        self._stream = self._container.streams.video[0]
+        self._stream.thread_type = "AUTO"
+        self._packets: Iterator[av.Packet] = self._container.demux(self._stream)
+        self._decoded_frames: Deque[av.VideoFrame] = deque()
+        self._current_frame: Optional[av.VideoFrame] = None
+        self._packets_exhausted = False
+        self._max_dimension = max_dimension
+        self._is_opened = True
+
+    def isOpened(self) -> bool:
+        return self._is_opened
+
+    def grab(self) -> bool:
+        while not self._decoded_frames:
+            packet = self._next_packet()
+            if packet is None:
+                self._current_frame = None
+                return False
+            self._decoded_frames.extend(self._stream.codec_context.decode(packet))
+        self._current_frame = self._decoded_frames.popleft()
+        return True
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self._current_frame is None:
+            return False, None
+        width, height = self._get_output_size(
+            width=self._current_frame.width, height=self._current_frame.height
+        )
+        frame = self._current_frame.reformat(width=width, height=height, format="bgr24")
+        return True, frame.to_ndarray()
+
+    def skip(self, frames_number: int) -> int:
+        skipped = 0
+        while self._decoded_frames and skipped < frames_number:
+            self._decoded_frames.popleft()
+            skipped += 1
+        packets_to_decode: List[av.Packet] = []
+        while skipped < frames_number:
+            packet = self._next_packet()
+            if packet is None:
+                break
+            if packet.size == 0:
+                skipped += self._flush_decoder(
+                    packets=packets_to_decode + [packet],
+                    frames_to_skip=frames_number - skipped,
+                )
+                packets_to_decode = []
+                break
+            if packet.is_keyframe:
+                packets_to_decode = []
+            packets_to_decode.append(packet)
+            skipped += 1
+        self._decode_references(packets=packets_to_decode)
+        self._current_frame = None
+        return skipped
+
+    def discover_source_properties(self) -> SourceProperties:
+        codec_context = self._stream.codec_context
+        fps = float(self._stream.average_rate or 0.0)
+        total_frames = self._stream.frames
+        if not total_frames and self._container.duration and fps:
+            total_frames = int(self._container.duration / av.time_base * fps)
+        width, height = self._get_output_size(
+            width=codec_context.width, height=codec_context.height
+        )
+        return SourceProperties(
+            width=width,
+            height=height,
+            total_frames=total_frames,
+            is_file=total_frames > 0,
+            fps=fps,
+        )
+
+    def initialize_source_properties(self, properties: Dict[str, float]) -> None:
+        if properties:
+            logger.warning(
+                "Video source properties cannot be initialised for video decoded with PyAV."
+            )
+
+    def release(self) -> None:
+        self._is_opened = False
+        self._decoded_frames.clear()
+        self._current_frame = None
+        self._container.close()
+
+    def _next_packet(self) -> Optional[av.Packet]:
+        if self._packets_exhausted:
+            return None
+        packet = next(self._packets, None)
+        if packet is None:
+            self._packets_exhausted = True
+            return None
+        if packet.size == 0:
+            # empty packet flushes the decoder - it is always the last one
+            self._packets_exhausted = True
+        return packet
+
+    def _decode_references(self, packets: List[av.Packet]) -> None:
+        codec_context = self._stream.codec_context
+        codec_context.skip_frame = "NONREF"
+        try:
+            for packet in packets:
+                codec_context.decode(packet)
+        finally:
+            codec_context.skip_frame = "DEFAULT"
+
+    def _flush_decoder(self, packets: List[av.Packet], frames_to_skip: int) -> int:
+        # frames still held by decoder (due to frames reordering) were not yet
+        # accounted - they are skipped first, the rest is left to be grabbed
+        frames = []
+        for packet in packets:
+            frames.extend(self._stream.codec_context.decode(packet))
+        frames_in_decoder = frames[: max(len(frames) - len(packets) + 1, 0)]
+        skipped_frames = min(len(frames_in_decoder), frames_to_skip)
+        self._decoded_frames.extend(frames_in_decoder[skipped_frames:])
+        return skipped_frames
+
+    def _get_output_size(self, width: int, height: int) -> Tuple[int, int]:
+        if self._max_dimension is None or max(width, height) <= self._max_dimension:
+            return width, height
+        scale = self._max_dimension / max(width, height)
+        return max(round(width * scale), 1), max(round(height * scale), 1)
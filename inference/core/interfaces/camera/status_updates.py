@@ -0,0 +1,161 @@
+from collections import defaultdict
+from datetime import datetime
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from inference.core import logger
+from inference.core.interfaces.camera.entities import StatusUpdate, UpdateSeverity
+
+EVENTS_COUNT_KEY = "events_count"
+AGGREGATION_START_KEY = "aggregation_start"
+AGGREGATION_END_KEY = "aggregation_end"
+
+
+class StatusUpdateSubscription:
+    """Status updates handler declaring which updates it is interested in.
+
+    Can be placed in `status_update_handlers` list next to plain callables (which
+    receive all updates). Updates with severity below `min_severity` or with
+    event type not listed in `event_types` (if given) are not delivered to the
+    handler - and if no handler is interested in an update, its payload is never
+    even constructed.
+
+    Events listed in `aggregated_event_types` are not delivered one by one - instead,
+    occurrences are counted (regardless of `min_severity` and `event_types`) and
+    handler receives single update of given event type per `aggregation_interval`
+    seconds (and context), with payload holding `events_count`, `aggregation_start`
+    and `aggregation_end`. Such update has `aggregation_severity` (if given) or the
+    severity of the last occurrence. Counters are flushed when the event occurs after
+    the interval elapsed, as well as on `flush()` - which `InferencePipeline` calls
+    once its inference thread finishes.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[StatusUpdate], None],
+        min_severity: UpdateSeverity = UpdateSeverity.DEBUG,
+        event_types: Optional[Iterable[str]] = None,
+        aggregated_event_types: Optional[Iterable[str]] = None,
+        aggregation_interval: float = 1.0,
+        aggregation_severity: Optional[UpdateSeverity] = None,
+    ):
+        self._handler = handler
+        self._min_severity = min_severity.value
+        self._event_types = set(event_types) if event_types is not None else None
+        self._aggregated_event_types = set(aggregated_event_types or [])
+        self._aggregation_interval = aggregation_interval
+        self._aggregation_severity = aggregation_severity
+        self._counters: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._aggregation_starts: Dict[Tuple[str, str], datetime] = {}
+        self._severities: Dict[Tuple[str, str], UpdateSeverity] = {}
+        self._lock = Lock()
+
+    def accepts(self, severity: UpdateSeverity, event_type: str) -> bool:
+        if event_type in self._aggregated_event_types:
+            return True
+        if severity.value < self._min_severity:
+            return False
+        return self._event_types is None or event_type in self._event_types
+
+    def aggregates(self, event_type: str) -> bool:
+        return event_type in self._aggregated_event_types
+
+    def register_occurrence(
+        self, severity: UpdateSeverity, event_type: str, context: str
+    ) -> None:
+        key = (context, event_type)
+        now = datetime.now()
+        with self._lock:
+            self._counters[key] += 1
+            self._severities[key] = self._aggregation_severity or severity
+            aggregation_start = self._aggregation_starts.setdefault(key, now)
+            if (now - aggregation_start).total_seconds() < self._aggregation_interval:
+                return None
+            status_update = self._pop_aggregate(key=key, aggregation_end=now)
+        self._handler(status_update)
+
+    def flush(self) -> None:
+        now = datetime.now()
+        with self._lock:
+            status_updates = [
+                self._pop_aggregate(key=key, aggregation_end=now)
+                for key in list(self._counters.keys())
+            ]
+        for status_update in status_updates:
+            self._handler(status_update)
+
+    def _pop_aggregate(
+        self, key: Tuple[str, str], aggregation_end: datetime
+    ) -> StatusUpdate:
+        context, event_type = key
+        return StatusUpdate(
+            timestamp=aggregation_end,
+            severity=self._severities.pop(key),
+            event_type=event_type,
+            payload={
+                EVENTS_COUNT_KEY: self._counters.pop(key),
+                AGGREGATION_START_KEY: self._aggregation_starts.pop(key),
+                AGGREGATION_END_KEY: aggregation_end,
+            },
+            context=context,
+        )
+
+    def __call__(self, status_update: StatusUpdate) -> None:
+        self._handler(status_update)
+
+
+def flush_status_update_subscriptions(
+    status_update_handlers: List[Callable[[StatusUpdate], None]],
+) -> None:
+    for handler in status_update_handlers:
+        if not isinstance(handler, StatusUpdateSubscription):
+            continue
+        try:
+            handler.flush()
+        except Exception as error:
+            logger.warning(f"Could not execute handler update. Cause: {error}")
+
+
+def dispatch_status_update(
+    severity: UpdateSeverity,
+    event_type: str,
+    context: str,
+    status_update_handlers: List[Callable[[StatusUpdate], None]],
+    payload_factory: Optional[Callable[[], dict]] = None,
+) -> None:
+    """
+    Delivers status update to handlers interested in it. `StatusUpdate` object
+    (including its payload created with `payload_factory`) is only created when
+    there is at least one handler to receive it.
+    """
+    receivers = []
+    for handler in status_update_handlers:
+        if not isinstance(handler, StatusUpdateSubscription):
+            receivers.append(handler)
+            continue
+        if not handler.accepts(severity=severity, event_type=event_type):
+            continue
+        if not handler.aggregates(event_type=event_type):
+            receivers.append(handler)
+            continue
+        try:
+            handler.register_occurrence(
+                severity=severity, event_type=event_type, context=context
+            )
+        except Exception as error:
+            logger.warning(f"Could not execute handler update. Cause: {error}")
+    if not receivers:
+        return None
+    payload = payload_factory() if payload_factory is not None else {}
+    status_update = StatusUpdate(
+        timestamp=datetime.now(),
+        severity=severity,
+        event_type=event_type,
+        payload=payload,
+        context=context,
+    )
+    for handler in receivers:
+        try:
+            handler(status_update)
+        except Exception as error:
+            logger.warning(f"Could not execute handler update. Cause: {error}")
@@ -1,3 +1,4 @@
+import os
 import random
 import time
 from dataclasses import dataclass
@@ -19,6 +20,9 @@ from inference.core.env import (
     DEFAULT_MAXIMUM_ADAPTIVE_FRAMES_DROPPED_IN_ROW,
     DEFAULT_MINIMUM_ADAPTIVE_MODE_SAMPLES,
     RUNS_ON_JETSON,
+    VIDEO_FILE_DECODING_BACKEND,
+    VIDEO_FILE_DECODING_MAX_DIMENSION,
+    VIDEO_FILE_SEEK_MIN_FRAMES_TO_SKIP,
 )
 from inference.core.interfaces.camera.entities import (
     SourceProperties,
@@ -33,6 +37,7 @@ from inference.core.interfaces.camera.exceptions import (
     SourceConnectionError,
     StreamOperationNotAllowedError,
 )
+from inference.core.interfaces.camera.status_updates import dispatch_status_update
 
 VIDEO_SOURCE_CONTEXT = "video_source"
 VIDEO_CONSUMER_CONTEXT = "video_consumer"
@@ -116,6 +121,9 @@ class SourceMetadata:
     buffer_filling_strategy: Optional[BufferFillingStrategy]
     buffer_consumption_strategy: Optional[BufferConsumptionStrategy]
     source_id: Optional[int]
+    frames_grabbing_fps: Optional[float] = None
+    frames_decoding_fps: Optional[float] = None
+    frames_skipped: int = 0
 
 
 class VideoSourceMethod(Protocol):
@@ -148,6 +156,15 @@ class CV2VideoFrameProducer(VideoFrameProducer):
     def retrieve(self) -> Tuple[bool, ndarray]:
         return self.stream.retrieve()
 
+    def skip(self, frames_number: int) -> int:
+        if 0 < VIDEO_FILE_SEEK_MIN_FRAMES_TO_SKIP <= frames_number:
+            position = int(self.stream.get(cv2.CAP_PROP_POS_FRAMES))
+            total_frames = int(self.stream.get(cv2.CAP_PROP_FRAME_COUNT))
+            target_position = min(position + frames_number, total_frames)
+            if self.stream.set(cv2.CAP_PROP_POS_FRAMES, target_position):
+                return target_position - position
+        return super().skip(frames_number=frames_number)
+
     def initialize_source_properties(self, properties: Dict[str, float]) -> None:
         for property_id, value in properties.items():
             cv2_id = getattr(cv2, "CAP_PROP_" + property_id.upper())
@@ -170,6 +187,14 @@ class CV2VideoFrameProducer(VideoFrameProducer):
         self.stream.release()
 
 
+def _should_decode_with_pyav(video: Union[str, int]) -> bool:
+    return (
+        VIDEO_FILE_DECODING_BACKEND.lower() == "pyav"
+        and isinstance(video, str)
+        and os.path.isfile(video)
+    )
+
+
 def _consumes_camera_on_jetson(video: Union[str, int]) -> bool:
     if not RUNS_ON_JETSON:
         return False
@@ -545,7 +570,7 @@ class VideoSource:
             send_video_source_status_update(
                 severity=UpdateSeverity.DEBUG,
                 event_type=FRAME_CONSUMED_EVENT,
-                payload={
+                payload_factory=lambda: {
                     "frame_timestamp": video_frame.frame_timestamp,
                     "frame_id": video_frame.frame_id,
                     "source_id": video_frame.source_id,
@@ -566,6 +591,9 @@ class VideoSource:
             buffer_filling_strategy=self._video_consumer.buffer_filling_strategy,
             buffer_consumption_strategy=self._buffer_consumption_strategy,
             source_id=self._source_id,
+            frames_grabbing_fps=self._video_consumer.frames_grabbing_fps,
+            frames_decoding_fps=self._video_consumer.frames_decoding_fps,
+            frames_skipped=self._video_consumer.frames_skipped,
         )
 
     def _restart(
@@ -586,6 +614,22 @@ class VideoSource:
         self._change_state(target_state=StreamState.INITIALISING)
         if callable(self._stream_reference):
             self._video = self._stream_reference()
+        elif _should_decode_with_pyav(video=self._stream_reference):
+            try:
+                from inference.core.interfaces.camera.pyav_video_frame_producer import (
+                    PyAVVideoFrameProducer,
+                )
+            except ImportError as error:
+                self._change_state(target_state=StreamState.ERROR)
+                raise SourceConnectionError(
+                    f"Cannot decode video {self._stream_reference} with "
+                    f"VIDEO_FILE_DECODING_BACKEND=pyav, as `av` package is not installed. "
+                    f"Use `pip install av` or unset VIDEO_FILE_DECODING_BACKEND."
+                ) from error
+            self._video = PyAVVideoFrameProducer(
+                self._stream_reference,
+                max_dimension=VIDEO_FILE_DECODING_MAX_DIMENSION,
+            )
         else:
             self._video = CV2VideoFrameProducer(self._stream_reference)
         if not self._video.isOpened():
@@ -811,11 +855,24 @@ class VideoConsumer:
         self._is_source_video_file = None
         self._status_update_handlers = status_update_handlers
         self._next_frame_from_video_to_accept = 1
+        self._frames_skipped = 0
 
     @property
     def buffer_filling_strategy(self) -> Optional[BufferFillingStrategy]:
         return self._buffer_filling_strategy
 
+    @property
+    def frames_grabbing_fps(self) -> Optional[float]:
+        return _get_fps(monitor=self._stream_consumption_pace_monitor)
+
+    @property
+    def frames_decoding_fps(self) -> Optional[float]:
+        return _get_fps(monitor=self._decoding_pace_monitor)
+
+    @property
+    def frames_skipped(self) -> int:
+        return self._frames_skipped
+
     def reset(self, source_properties: SourceProperties) -> None:
         if source_properties.is_file:
             self._set_file_mode_buffering_strategies()
@@ -846,18 +903,21 @@ class VideoConsumer:
             source_properties = video.discover_source_properties()
             self._is_source_video_file = source_properties.is_file
             self._declared_source_fps = source_properties.fps
+        if not self._skip_video_file_frames_not_to_be_accepted(video=video):
+            return False
         frame_timestamp = datetime.now()
         success = video.grab()
         self._stream_consumption_pace_monitor.tick()
         if not success:
             return False
         self._frame_counter += 1
+        frame_id = self._frame_counter
         send_video_source_status_update(
             severity=UpdateSeverity.DEBUG,
             event_type=FRAME_CAPTURED_EVENT,
-            payload={
+            payload_factory=lambda: {
                 "frame_timestamp": frame_timestamp,
-                "frame_id": self._frame_counter,
+                "frame_id": frame_id,
                 "source_id": source_id,
             },
             status_update_handlers=self._status_update_handlers,
@@ -890,6 +950,24 @@ class VideoConsumer:
         if self._buffer_filling_strategy is None:
             self._buffer_filling_strategy = BufferFillingStrategy.ADAPTIVE_DROP_OLDEST
 
+    def _skip_video_file_frames_not_to_be_accepted(
+        self, video: VideoFrameProducer
+    ) -> bool:
+        """
+        Skips frames of video file which would be discarded by sub-sampling anyway,
+        letting producer avoid decoding them (if it is capable of). Returns False
+        if video ended while skipping.
+        """
+        if self._desired_fps is None or not self._is_source_video_file:
+            return True
+        frames_to_skip = self._next_frame_from_video_to_accept - self._frame_counter - 1
+        if frames_to_skip <= 0 or not hasattr(video, "skip"):
+            return True
+        skipped = video.skip(frames_number=frames_to_skip)
+        self._frame_counter += skipped
+        self._frames_skipped += skipped
+        return skipped == frames_to_skip
+
     def _video_fps_should_be_sub_sampled(self) -> bool:
         if self._desired_fps is None:
             return False
@@ -1119,7 +1197,7 @@ def send_frame_drop_update(
     send_video_source_status_update(
         severity=UpdateSeverity.DEBUG,
         event_type=FRAME_DROPPED_EVENT,
-        payload={
+        payload_factory=lambda: {
             "frame_timestamp": frame_timestamp,
             "frame_id": frame_id,
             "cause": cause,
@@ -1136,24 +1214,20 @@ def send_video_source_status_update(
     status_update_handlers: List[Callable[[StatusUpdate], None]],
     sub_context: Optional[str] = None,
     payload: Optional[dict] = None,
+    payload_factory: Optional[Callable[[], dict]] = None,
 ) -> None:
-    if payload is None:
-        payload = {}
+    if payload is not None:
+        payload_factory = lambda: payload
     context = VIDEO_SOURCE_CONTEXT
     if sub_context is not None:
         context = f"{context}.{sub_context}"
-    status_update = StatusUpdate(
-        timestamp=datetime.now(),
+    dispatch_status_update(
         severity=severity,
         event_type=event_type,
-        payload=payload,
         context=context,
+        status_update_handlers=status_update_handlers,
+        payload_factory=payload_factory,
     )
-    for handler in status_update_handlers:
-        try:
-            handler(status_update)
-        except Exception as error:
-            logger.warning(f"Could not execute handler update. Cause: {error}")
 
 
 def decode_video_frame_to_buffer(
@@ -1193,6 +1267,14 @@ def get_fps_if_tick_happens_now(fps_monitor: sv.FPSMonitor) -> float:
     return (len(fps_monitor.all_timestamps) + 1) / reader_taken_time
 
 
+def _get_fps(monitor: sv.FPSMonitor) -> Optional[float]:
+    if not monitor.all_timestamps:
+        return None
+    if hasattr(monitor, "fps"):
+        return monitor.fps
+    return monitor()
+
+
 def calculate_video_file_stride(
     actual_fps: Optional[Union[float, int]], desired_fps: Optional[Union[float, int]]
 ) -> int:
@@ -9,8 +9,14 @@ from typing import Any, Dict, List, Optional, Union
 import asgi_correlation_id
 import uvicorn
 from fastapi import BackgroundTasks, Depends, FastAPI, Path, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse, Response
+from fastapi.responses import (
+    JSONResponse,
+    PlainTextResponse,
+    RedirectResponse,
+    Response,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi_cprofile.profiler import CProfileMiddleware
 from pydantic import BaseModel
@@ -49,6 +55,7 @@ from inference.core.entities.requests.sam2 import (
 from inference.core.entities.requests.server_state import (
     AddModelRequest,
     ClearModelRequest,
+    SamplingProfilerStartRequest,
 )
 from inference.core.entities.requests.trocr import TrOCRInferenceRequest
 from inference.core.entities.requests.workflows import (
@@ -89,6 +96,7 @@ from inference.core.entities.responses.sam2 import (
 )
 from inference.core.entities.responses.server_state import (
     ModelsDescriptions,
+    SamplingProfilerStatusResponse,
     ServerVersionInfo,
 )
 from inference.core.entities.responses.workflows import (
@@ -113,12 +121,17 @@ from inference.core.env import (
     CORE_MODEL_TROCR_ENABLED,
     CORE_MODEL_YOLO_WORLD_ENABLED,
     CORE_MODELS_ENABLED,
+    DEDICATED_DEPLOYMENT_AUTH_CACHE_MAX_SIZE,
+    DEDICATED_DEPLOYMENT_AUTH_CACHE_TTL,
     DEDICATED_DEPLOYMENT_WORKSPACE_URL,
     DISABLE_WORKFLOW_ENDPOINTS,
     DOCKER_SOCKET_PATH,
     ENABLE_PROMETHEUS,
+    ENABLE_SAMPLING_PROFILER,
+    ENABLE_SERVER_TIMING_HEADER,
     ENABLE_STREAM_API,
     ENABLE_WORKFLOWS_PROFILING,
+    INFERENCE_METRICS_SHUTDOWN_FLUSH_TIMEOUT,
     LAMBDA,
     LEGACY_ROUTE_ENABLED,
     LMM_ENABLED,
@@ -130,6 +143,7 @@ from inference.core.env import (
     PRELOAD_MODELS,
     PROFILE,
     ROBOFLOW_SERVICE_SECRET,
+    SAMPLING_PROFILER_MAX_OVERHEAD,
     WORKFLOWS_MAX_CONCURRENT_STEPS,
     WORKFLOWS_PROFILER_BUFFER_SIZE,
     WORKFLOWS_STEP_EXECUTION_MODE,
@@ -154,6 +168,7 @@ from inference.core.exceptions import (
     RoboflowAPINotAuthorizedError,
     RoboflowAPINotNotFoundError,
     RoboflowAPIUnsuccessfulRequestError,
+    SamplingProfilerBusyError,
     ServiceConfigurationError,
     WorkspaceLoadError,
 )
@@ -163,7 +178,14 @@ from inference.core.interfaces.http.handlers.workflows import (
     handle_describe_workflows_blocks_request,
     handle_describe_workflows_interface,
 )
+from inference.core.interfaces.http.middlewares.dedicated_deployment_auth import (
+    DedicatedDeploymentAuthorizer,
+    retrieve_authorization_parameters,
+)
 from inference.core.interfaces.http.middlewares.gzip import gzip_response_if_requested
+from inference.core.interfaces.http.middlewares.stage_timing import (
+    StageTimingMiddleware,
+)
 from inference.core.interfaces.http.orjson_utils import orjson_response
 from inference.core.interfaces.stream_manager.api.entities import (
     CommandResponse,
@@ -193,14 +215,18 @@ from inference.core.interfaces.stream_manager.manager_app.errors import (
 )
 from inference.core.managers.base import ModelManager
 from inference.core.managers.metrics import get_container_stats
+from inference.core.managers.metrics_recorder import inference_metrics_recorder
 from inference.core.managers.prometheus import InferenceInstrumentator
-from inference.core.roboflow_api import (
-    get_roboflow_dataset_type,
-    get_roboflow_workspace,
-    get_workflow_specification,
-)
+from inference.core.roboflow_api import get_workflow_specification
 from inference.core.utils.container import is_docker_socket_mounted
 from inference.core.utils.notebooks import start_notebook
+from inference.core.utils.sampling_profiler import SamplingProfiler
+from inference.core.utils.stage_timing import (
+    MODEL_LOADING_STAGE,
+    REQUEST_PARSING_STAGE,
+    get_active_stage_timer,
+    measure_stage,
+)
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
 from inference.core.workflows.core_steps.common.query_language.errors import (
     InvalidInputTypeError,
@@ -242,8 +268,6 @@ if LAMBDA:
 if METLO_KEY:
     from metlo.fastapi import ASGIMiddleware
 
-import time
-
 from inference.core.version import __version__
 
 
@@ -373,6 +397,8 @@ def with_route_exceptions(route):
                 },
             )
             traceback.print_exc()
+        except SamplingProfilerBusyError as error:
+            resp = JSONResponse(status_code=409, content={"message": str(error)})
         except (
             InvalidEnvironmentVariableError,
             MissingServiceSecretError,
@@ -511,10 +537,21 @@ class HttpInterface(BaseInterface):
             root_path=root_path,
         )
 
+        instrumentator = None
         if ENABLE_PROMETHEUS:
-            InferenceInstrumentator(
+            instrumentator = InferenceInstrumentator(
                 app, model_manager=model_manager, endpoint="/metrics"
             )
+        if ENABLE_PROMETHEUS or ENABLE_SERVER_TIMING_HEADER:
+            app.add_middleware(
+                StageTimingMiddleware,
+                observe_durations=(
+                    instrumentator.observe_stage_durations
+                    if instrumentator is not None
+                    else None
+                ),
+                server_timing_header=ENABLE_SERVER_TIMING_HEADER,
+            )
 
         if METLO_KEY:
             app.add_middleware(
@@ -544,6 +581,16 @@ class HttpInterface(BaseInterface):
             )
         app.add_middleware(asgi_correlation_id.CorrelationIdMiddleware)
 
+        @app.on_event("shutdown")
+        def flush_inference_metrics():
+            """Saves inference metrics records pending in write-behind buffer."""
+            if not inference_metrics_recorder.flush(
+                timeout=INFERENCE_METRICS_SHUTDOWN_FLUSH_TIMEOUT
+            ):
+                logger.warning(
+                    "Could not save all pending inference metrics before shutdown"
+                )
+
         if METRICS_ENABLED:
 
             @app.middleware("http")
@@ -588,9 +635,69 @@ class HttpInterface(BaseInterface):
                 )
                 return JSONResponse(status_code=200, content=container_stats)
 
+        if ENABLE_SAMPLING_PROFILER and not LAMBDA:
+            sampling_profiler = SamplingProfiler(
+                max_overhead=SAMPLING_PROFILER_MAX_OVERHEAD
+            )
+
+            @app.post(
+                "/profiler/start",
+                response_model=SamplingProfilerStatusResponse,
+                summary="Start sampling profiler",
+                description="Start sampling stacks of server threads for given time",
+            )
+            @with_route_exceptions
+            async def start_sampling_profiler(request: SamplingProfilerStartRequest):
+                status = sampling_profiler.start(
+                    duration=request.duration, frequency=request.frequency
+                )
+                return SamplingProfilerStatusResponse.from_status(status=status)
+
+            @app.post(
+                "/profiler/stop",
+                response_model=SamplingProfilerStatusResponse,
+                summary="Stop sampling profiler",
+                description="Stop running session of sampling profiler",
+            )
+            @with_route_exceptions
+            async def stop_sampling_profiler():
+                # stopping joins the sampling thread - not to be done in event loop
+                status = await run_in_threadpool(sampling_profiler.stop)
+                return SamplingProfilerStatusResponse.from_status(status=status)
+
+            @app.get(
+                "/profiler/status",
+                response_model=SamplingProfilerStatusResponse,
+                summary="Get status of sampling profiler",
+                description="Get status of the last session of sampling profiler",
+            )
+            @with_route_exceptions
+            async def get_sampling_profiler_status():
+                status = sampling_profiler.status()
+                return SamplingProfilerStatusResponse.from_status(status=status)
+
+            @app.get(
+                "/profiler/stacks",
+                response_class=PlainTextResponse,
+                summary="Download collapsed stacks",
+                description="Download stacks collected by sampling profiler in "
+                "collapsed format, accepted by flame graph tools",
+            )
+            @with_route_exceptions
+            async def download_sampling_profiler_stacks():
+                return PlainTextResponse(
+                    content=sampling_profiler.export_collapsed_stacks(),
+                    headers={
+                        "Content-Disposition": 'attachment; filename="profile.collapsed"'
+                    },
+                )
+
         if DEDICATED_DEPLOYMENT_WORKSPACE_URL:
-            cached_api_keys = dict()
-            cached_projects = dict()
+            dedicated_deployment_authorizer = DedicatedDeploymentAuthorizer(
+                workspace_url=DEDICATED_DEPLOYMENT_WORKSPACE_URL,
+                cache_ttl=DEDICATED_DEPLOYMENT_AUTH_CACHE_TTL,
+                cache_max_size=DEDICATED_DEPLOYMENT_AUTH_CACHE_MAX_SIZE,
+            )
 
             @app.middleware("http")
             async def check_authorization(request: Request, call_next):
@@ -619,57 +726,21 @@ class HttpInterface(BaseInterface):
                         },
                     )
 
-                # check api_key
-                req_params = request.query_params
-                json_params = dict()
-                if (
-                    request.headers.get("content-type", None) == "application/json"
-                    and int(request.headers.get("content-length", 0)) > 0
-                ):
-                    json_params = await request.json()
-                api_key = req_params.get("api_key", None) or json_params.get(
-                    "api_key", None
-                )
-
-                if cached_api_keys.get(api_key, 0) < time.time():
-                    try:
-                        workspace_url = (
-                            get_roboflow_workspace(api_key)
-                            if api_key is not None
-                            else None
-                        )
-
-                        if workspace_url != DEDICATED_DEPLOYMENT_WORKSPACE_URL:
-                            return _unauthorized_response("Unauthorized api_key")
-
-                        cached_api_keys[api_key] = (
-                            time.time() + 3600
-                        )  # expired after 1 hour
-                    except RoboflowAPINotAuthorizedError as e:
-                        return _unauthorized_response("Unauthorized api_key")
-
-                # check project_url
-                model_id = json_params.get("model_id", "")
-                project_url = (
-                    req_params.get("project", None)
-                    or json_params.get("project", None)
-                    or model_id.split("/")[0]
+                api_key, project_url = await retrieve_authorization_parameters(
+                    request=request
                 )
+                if not await dedicated_deployment_authorizer.is_api_key_authorized(
+                    api_key=api_key
+                ):
+                    return _unauthorized_response("Unauthorized api_key")
                 # only check when project_url is not None
                 if (
                     project_url is not None
-                    and cached_projects.get(project_url, 0) < time.time()
+                    and not await dedicated_deployment_authorizer.is_project_authorized(
+                        api_key=api_key, project_url=project_url
+                    )
                 ):
-                    try:
-                        _ = get_roboflow_dataset_type(
-                            api_key, DEDICATED_DEPLOYMENT_WORKSPACE_URL, project_url
-                        )
-
-                        cached_projects[project_url] = (
-                            time.time() + 3600
-                        )  # expired after 1 hour
-                    except RoboflowAPINotNotFoundError as e:
-                        return _unauthorized_response("Unauthorized project")
+                    return _unauthorized_response("Unauthorized project")
 
                 return await call_next(request)
 
@@ -698,10 +769,16 @@ class HttpInterface(BaseInterface):
             Returns:
                 InferenceResponse: The response containing the inference results.
             """
+            stage_timer = get_active_stage_timer()
+            if stage_timer is not None:
+                stage_timer.record_since_start(name=REQUEST_PARSING_STAGE)
             de_aliased_model_id = resolve_roboflow_model_alias(
                 model_id=inference_request.model_id
             )
-            self.model_manager.add_model(de_aliased_model_id, inference_request.api_key)
+            with measure_stage(name=MODEL_LOADING_STAGE):
+                self.model_manager.add_model(
+                    de_aliased_model_id, inference_request.api_key
+                )
             resp = await self.model_manager.infer_from_request(
                 de_aliased_model_id, inference_request, **kwargs
             )
@@ -0,0 +1,273 @@
+import asyncio
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+
+from inference.core.exceptions import (
+    RoboflowAPINotAuthorizedError,
+    RoboflowAPINotNotFoundError,
+)
+from inference.core.roboflow_api import (
+    get_roboflow_dataset_type,
+    get_roboflow_workspace,
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+AUTHORIZATION_FIELDS = frozenset({"api_key", "model_id", "project"})
+_WHITESPACES = b" \t\r\n"
+_STRUCTURE_TOKENS = re.compile(rb'["\[\]{}]')
+_SCALAR_END_TOKENS = re.compile(rb"[,\]}]")
+
+
+class SingleFlightTTLCache(Generic[K, V]):
+    """
+    Size-bounded (LRU) cache of results of async lookups, each result valid for `ttl`
+    seconds. Concurrent lookups of the same key (made while there is no valid entry)
+    are merged into single call of `compute` - all callers await its result (or error).
+    Only results accepted by `should_cache` are stored.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_size: int,
+        should_cache: Callable[[V], bool] = lambda _: True,
+    ):
+        self._ttl = ttl
+        self._max_size = max(max_size, 1)
+        self._should_cache = should_cache
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._in_flight: Dict[K, asyncio.Future] = {}
+
+    async def get(self, key: K, compute: Callable[[], Awaitable[V]]) -> V:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at >= time.monotonic():
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await compute()
+        except BaseException as error:
+            future.set_exception(error)
+            # retrieving the exception, not to get it reported when nobody awaits the future
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if self._should_cache(value):
+                self._put(key=key, value=value)
+            return value
+        finally:
+            del self._in_flight[key]
+
+    def _put(self, key: K, value: V) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+class DedicatedDeploymentAuthorizer:
+    """
+    Verifies that `api_key` belongs to the workspace of dedicated deployment and that the
+    project referred by request is accessible. Verification calls to Roboflow API are
+    made in threads, so that they do not block the event loop. Successful verifications
+    are cached.
+    """
+
+    def __init__(self, workspace_url: str, cache_ttl: float, cache_max_size: int):
+        self._workspace_url = workspace_url
+        self._api_keys = SingleFlightTTLCache[Optional[str], bool](
+            ttl=cache_ttl, max_size=cache_max_size, should_cache=bool
+        )
+        self._projects = SingleFlightTTLCache[str, bool](
+            ttl=cache_ttl, max_size=cache_max_size, should_cache=bool
+        )
+
+    async def is_api_key_authorized(self, api_key: Optional[str]) -> bool:
+        if api_key is None:
+            return False
+        return await self._api_keys.get(
+            key=api_key, compute=lambda: self._verify_api_key(api_key=api_key)
+        )
+
+    async def is_project_authorized(self, api_key: str, project_url: str) -> bool:
+        return await self._projects.get(
+            key=project_url,
+            compute=lambda: self._verify_project(
+                api_key=api_key, project_url=project_url
+            ),
+        )
+
+    async def _verify_api_key(self, api_key: str) -> bool:
+        try:
+            workspace_url = await run_in_threadpool(get_roboflow_workspace, api_key)
+        except RoboflowAPINotAuthorizedError:
+            return False
+        return workspace_url == self._workspace_url
+
+    async def _verify_project(self, api_key: str, project_url: str) -> bool:
+        try:
+            _ = await run_in_threadpool(
+                get_roboflow_dataset_type, api_key, self._workspace_url, project_url
+            )
+        except RoboflowAPINotNotFoundError:
+            return False
+        return True
+
+
+async def retrieve_authorization_parameters(
+    request: Request,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Retrieves `api_key` and project of request - from query parameters or (when not given
+    in query) from top-level fields of JSON body, which is only scanned (not parsed).
+    """
+    query_params = request.query_params
+    api_key = query_params.get("api_key")
+    project_url = query_params.get("project")
+    body_fields = {}
+    if (api_key is None or project_url is None) and _has_json_body(request=request):
+        body = await request.body()
+        body_fields = extract_top_level_json_fields(
+            body=body, fields=AUTHORIZATION_FIELDS
+        )
+    api_key = api_key or body_fields.get("api_key")
+    model_id = body_fields.get("model_id") or ""
+    project_url = project_url or body_fields.get("project") or model_id.split("/")[0]
+    return api_key, project_url
+
+
+def _has_json_body(request: Request) -> bool:
+    content_type = request.headers.get("content-type", "")
+    return (
+        content_type.split(";")[0].strip() == "application/json"
+        and int(request.headers.get("content-length", 0)) > 0
+    )
+
+
+def extract_top_level_json_fields(
+    body: bytes, fields: FrozenSet[str]
+) -> Dict[str, Any]:
+    """
+    Extracts string values of selected top-level fields of JSON object without parsing
+    the whole document - values of other fields (like base64-encoded images) are skipped
+    with the cost of searching for the closing quote / bracket. The whole object is
+    scanned and the last occurrence of duplicated key wins (like in `json.loads(...)`),
+    such that authorised values are the ones seen by endpoints. Malformed documents
+    yield fields found before the error.
+    """
+    result = {}
+    position = _skip_whitespaces(body=body, position=0)
+    if body[position : position + 1] != b"{":
+        return result
+    position += 1
+    while True:
+        position = _skip_whitespaces(body=body, position=position)
+        if body[position : position + 1] != b'"':
+            return result
+        key_end = _find_string_end(body=body, position=position)
+        if key_end < 0:
+            return result
+        key = _decode_string(encoded=body[position : key_end + 1])
+        if key is None:
+            return result
+        position = _skip_whitespaces(body=body, position=key_end + 1)
+        if body[position : position + 1] != b":":
+            return result
+        position = _skip_whitespaces(body=body, position=position + 1)
+        value_end = _find_value_end(body=body, position=position)
+        if value_end < 0:
+            return result
+        if key in fields:
+            # non-string value overrides previous occurrence of the key as well
+            result.pop(key, None)
+        if key in fields and body[position : position + 1] == b'"':
+            value = _decode_string(encoded=body[position:value_end])
+            if value is None:
+                return result
+            result[key] = value
+        position = _skip_whitespaces(body=body, position=value_end)
+        if body[position : position + 1] != b",":
+            return result
+        position += 1
+    return result
+
+
+def _decode_string(encoded: bytes) -> Optional[str]:
+    try:
+        return json.loads(encoded)
+    except ValueError:
+        return None
+
+
+def _skip_whitespaces(body: bytes, position: int) -> int:
+    while position < len(body) and body[position] in _WHITESPACES:
+        position += 1
+    return position
+
+
+def _find_string_end(body: bytes, position: int) -> int:
+    # position points to opening quote, returned is the position of closing quote
+    search_from = position + 1
+    while True:
+        quote_position = body.find(b'"', search_from)
+        if quote_position < 0:
+            return -1
+        backslashes = 0
+        while body[quote_position - 1 - backslashes] == ord("\\"):
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return quote_position
+        search_from = quote_position + 1
+
+
+def _find_value_end(body: bytes, position: int) -> int:
+    # returned is the position right after the value
+    first_character = body[position : position + 1]
+    if first_character == b'"':
+        string_end = _find_string_end(body=body, position=position)
+        return string_end + 1 if string_end >= 0 else -1
+    if first_character not in (b"{", b"["):
+        match = _SCALAR_END_TOKENS.search(body, position)
+        return match.start() if match is not None else -1
+    depth = 0
+    while True:
+        match = _STRUCTURE_TOKENS.search(body, position)
+        if match is None:
+            return -1
+        token = match.group()
+        if token == b'"':
+            string_end = _find_string_end(body=body, position=match.start())
+            if string_end < 0:
+                return -1
+            position = string_end + 1
+            continue
+        depth += 1 if token in (b"{", b"[") else -1
+        position = match.end()
+        if depth == 0:
+            return position
@@ -0,0 +1,45 @@
+from typing import Callable, Optional
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
+
+from inference.core.utils.stage_timing import (
+    TOTAL_STAGE,
+    RequestStageTimer,
+    format_server_timing_header,
+    stage_timing,
+)
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class StageTimingMiddleware(BaseHTTPMiddleware):
+    """
+    Starts timer of inference stages for each request. Durations of stages measured while
+    handling the request are passed to `observe_durations` (e.g. Prometheus histograms)
+    and optionally returned in `Server-Timing` header.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        observe_durations: Optional[Callable[[RequestStageTimer], None]] = None,
+        server_timing_header: bool = False,
+    ):
+        super().__init__(app)
+        self._observe_durations = observe_durations
+        self._server_timing_header = server_timing_header
+
+    async def dispatch(self, request: Request, call_next):
+        stage_timer = RequestStageTimer()
+        with stage_timing(timer=stage_timer):
+            response = await call_next(request)
+        stage_timer.record_since_start(name=TOTAL_STAGE)
+        if self._observe_durations is not None:
+            self._observe_durations(stage_timer)
+        if self._server_timing_header:
+            response.headers[SERVER_TIMING_HEADER] = format_server_timing_header(
+                durations=stage_timer.durations
+            )
+        return response
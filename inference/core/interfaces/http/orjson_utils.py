@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.utils.function import deprecated
 from inference.core.utils.image_utils import ImageType
+from inference.core.utils.stage_timing import SERIALIZATION_STAGE, measure_stage
 from inference.core.workflows.core_steps.common.serializers import (
     serialize_wildcard_kind,
 )
@@ -34,11 +35,12 @@ def default(obj: Any) -> JSON:
 def orjson_response(
     response: Union[List[InferenceResponse], InferenceResponse, BaseModel]
 ) -> ORJSONResponseBytes:
-    if isinstance(response, list):
-        content = [r.model_dump(by_alias=True, exclude_none=True) for r in response]
-    else:
-        content = response.model_dump(by_alias=True, exclude_none=True)
-    return ORJSONResponseBytes(content=content)
+    with measure_stage(name=SERIALIZATION_STAGE):
+        if isinstance(response, list):
+            content = [r.model_dump(by_alias=True, exclude_none=True) for r in response]
+        else:
+            content = response.model_dump(by_alias=True, exclude_none=True)
+        return ORJSONResponseBytes(content=content)
 
 
 @deprecated(
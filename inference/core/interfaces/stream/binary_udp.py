@@ -0,0 +1,358 @@
+"""
+Compact binary protocol used by `BinaryUDPSink` to send `InferencePipeline` predictions
+over UDP, together with the reference receiver.
+
+Single message carries predictions for one or more video frames and is split into
+datagrams not exceeding `max_datagram_size` (to stay below MTU - otherwise IP
+fragmentation makes whole message lost with any single lost fragment):
+
+* datagram: `magic (2s) | version (B) | message_id (I) | fragment_index (H) | fragments_count (H) | chunk`
+* message (concatenated chunks): `emission_time (d) | records_count (H) | (record_size (I) | record) * records_count`
+* record: `source_id (i, -1 for None) | frame_id (q) | frame_decoding_time (d) | detections_count (I) |
+  extras_size (I) | boxes (float32, detections_count x 4 - x, y, width, height) |
+  confidence (float32, detections_count) | class_id (int32, detections_count) | extras (utf-8 JSON)`
+
+Boxes, confidences and class ids of object-detection-like predictions are packed
+into arrays - remaining content of prediction (including class names and keys of
+detections that are not packed) is sent as compact JSON. Predictions that do not
+follow the format of detections are sent as JSON entirely. All numbers are little-endian.
+"""
+
+import json
+import socket
+import struct
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.interfaces.camera.entities import VideoFrame
+
+MAGIC = b"RF"
+PROTOCOL_VERSION = 1
+DEFAULT_MAX_DATAGRAM_SIZE = 1400
+MAX_UDP_PAYLOAD_SIZE = 65507
+DATAGRAM_HEADER = struct.Struct("<2sBIHH")
+MESSAGE_HEADER = struct.Struct("<dH")
+RECORD_SIZE = struct.Struct("<I")
+RECORD_HEADER = struct.Struct("<iqdII")
+NO_SOURCE_ID = -1
+PACKED_DETECTION_KEYS = ("x", "y", "width", "height", "confidence", "class_id")
+CLASS_NAMES_KEY = "__class_names__"
+DETECTIONS_EXTRAS_KEY = "__detections_extras__"
+MAX_MESSAGE_ID = 2**32 - 1
+MAX_RECORDS_IN_MESSAGE = 2**16 - 1
+
+
+@dataclass(frozen=True)
+class ReceivedPrediction:
+    source_id: Optional[int]
+    frame_id: int
+    frame_decoding_time: datetime
+    emission_time: datetime
+    predictions: Optional[dict]
+
+
+def encode_frame_predictions(
+    predictions: Optional[dict], video_frame: VideoFrame
+) -> bytes:
+    extras = predictions
+    detections_arrays = []
+    detections_count = 0
+    detections = (
+        predictions.get("predictions") if isinstance(predictions, dict) else None
+    )
+    if _can_pack_detections(detections=detections):
+        extras, detections_arrays = _pack_detections(
+            predictions=predictions, detections=detections
+        )
+        detections_count = len(detections)
+    serialised_extras = json.dumps(extras, separators=(",", ":")).encode("utf-8")
+    header = RECORD_HEADER.pack(
+        video_frame.source_id if video_frame.source_id is not None else NO_SOURCE_ID,
+        video_frame.frame_id,
+        video_frame.frame_timestamp.timestamp(),
+        detections_count,
+        len(serialised_extras),
+    )
+    return b"".join(
+        [header] + [a.tobytes() for a in detections_arrays] + [serialised_extras]
+    )
+
+
+def decode_frame_predictions(record: bytes, emission_time: float) -> ReceivedPrediction:
+    (
+        source_id,
+        frame_id,
+        frame_decoding_time,
+        detections_count,
+        extras_size,
+    ) = RECORD_HEADER.unpack_from(record)
+    offset = RECORD_HEADER.size
+    boxes = np.frombuffer(
+        record, dtype="<f4", count=detections_count * 4, offset=offset
+    )
+    offset += boxes.nbytes
+    confidence = np.frombuffer(
+        record, dtype="<f4", count=detections_count, offset=offset
+    )
+    offset += confidence.nbytes
+    class_id = np.frombuffer(record, dtype="<i4", count=detections_count, offset=offset)
+    offset += class_id.nbytes
+    predictions = json.loads(record[offset : offset + extras_size].decode("utf-8"))
+    if detections_count > 0:
+        predictions = _unpack_detections(
+            predictions=predictions,
+            boxes=boxes.reshape(-1, 4),
+            confidence=confidence,
+            class_id=class_id,
+        )
+    return ReceivedPrediction(
+        source_id=source_id if source_id != NO_SOURCE_ID else None,
+        frame_id=frame_id,
+        frame_decoding_time=datetime.fromtimestamp(frame_decoding_time),
+        emission_time=datetime.fromtimestamp(emission_time),
+        predictions=predictions,
+    )
+
+
+def encode_message(records: List[bytes], emission_time: float) -> bytes:
+    chunks = [MESSAGE_HEADER.pack(emission_time, len(records))]
+    for record in records:
+        chunks.append(RECORD_SIZE.pack(len(record)))
+        chunks.append(record)
+    return b"".join(chunks)
+
+
+def decode_message(message: bytes) -> List[ReceivedPrediction]:
+    emission_time, records_count = MESSAGE_HEADER.unpack_from(message)
+    offset = MESSAGE_HEADER.size
+    result = []
+    for _ in range(records_count):
+        (record_size,) = RECORD_SIZE.unpack_from(message, offset)
+        offset += RECORD_SIZE.size
+        record = message[offset : offset + record_size]
+        offset += record_size
+        result.append(
+            decode_frame_predictions(record=record, emission_time=emission_time)
+        )
+    return result
+
+
+def get_message_size(records: List[bytes]) -> int:
+    return MESSAGE_HEADER.size + sum(RECORD_SIZE.size + len(r) for r in records)
+
+
+def split_into_datagrams(
+    message: bytes, message_id: int, max_datagram_size: int
+) -> List[bytes]:
+    chunk_size = max_datagram_size - DATAGRAM_HEADER.size
+    if chunk_size <= 0:
+        raise ValueError(
+            f"Datagram size must exceed size of datagram header ({DATAGRAM_HEADER.size} bytes)"
+        )
+    fragments_count = max((len(message) + chunk_size - 1) // chunk_size, 1)
+    if fragments_count > 2**16 - 1:
+        raise ValueError("Message is too large to be sent")
+    return [
+        DATAGRAM_HEADER.pack(
+            MAGIC, PROTOCOL_VERSION, message_id, fragment_index, fragments_count
+        )
+        + message[fragment_index * chunk_size : (fragment_index + 1) * chunk_size]
+        for fragment_index in range(fragments_count)
+    ]
+
+
+class MessagesReassembler:
+    """Reassembles messages from datagrams, which may be delivered out of order.
+
+    Messages which were not completed within `reassembly_timeout` (because some
+    datagrams were lost), as well as the oldest ones when more than
+    `max_pending_messages` are incomplete, are discarded.
+    """
+
+    def __init__(
+        self, reassembly_timeout: float = 1.0, max_pending_messages: int = 256
+    ):
+        self._reassembly_timeout = reassembly_timeout
+        self._max_pending_messages = max_pending_messages
+        self._pending: (
+            "OrderedDict[Tuple[Any, int], Tuple[float, Dict[int, bytes]]]"
+        ) = OrderedDict()
+        self.discarded_messages = 0
+
+    def add(self, datagram: bytes, sender: Any = None) -> Optional[bytes]:
+        if len(datagram) < DATAGRAM_HEADER.size:
+            logger.warning("Received datagram too short to be decoded")
+            return None
+        magic, version, message_id, fragment_index, fragments_count = (
+            DATAGRAM_HEADER.unpack_from(datagram)
+        )
+        if magic != MAGIC or version != PROTOCOL_VERSION:
+            logger.warning(f"Received datagram of unknown protocol: {magic}, {version}")
+            return None
+        chunk = datagram[DATAGRAM_HEADER.size :]
+        if fragments_count == 1:
+            return chunk
+        now = time.monotonic()
+        self._discard_stale_messages(now=now)
+        key = (sender, message_id)
+        _, fragments = self._pending.setdefault(key, (now, {}))
+        fragments[fragment_index] = chunk
+        if len(fragments) < fragments_count:
+            return None
+        del self._pending[key]
+        return b"".join(fragments[index] for index in range(fragments_count))
+
+    def _discard_stale_messages(self, now: float) -> None:
+        while self._pending:
+            key, (started, _) = next(iter(self._pending.items()))
+            if (
+                now - started < self._reassembly_timeout
+                and len(self._pending) < self._max_pending_messages
+            ):
+                return None
+            del self._pending[key]
+            self.discarded_messages += 1
+
+
+class BinaryUDPReceiver:
+    @classmethod
+    def init(
+        cls,
+        ip_address: str,
+        port: int,
+        reassembly_timeout: float = 1.0,
+        receive_buffer_size: int = 4 * 1024 * 1024,
+    ) -> "BinaryUDPReceiver":
+        """
+        Creates reference receiver of predictions sent by `BinaryUDPSink`.
+
+        Args:
+            ip_address (str): IP address to bind to
+            port (int): Port to bind to (use 0 to let OS pick free port - see `port` property)
+            reassembly_timeout (float): Time (in seconds) to wait for missing fragments of message
+            receive_buffer_size (int): Size of socket receive buffer - should be large enough to
+                absorb bursts of datagrams
+
+        Returns: Initialised object of `BinaryUDPReceiver` class.
+
+        Example:
+            ```python
+            from inference.core.interfaces.stream.binary_udp import BinaryUDPReceiver
+
+            receiver = BinaryUDPReceiver.init(ip_address="127.0.0.1", port=9090)
+            while True:
+                for prediction in receiver.receive():
+                    print(prediction.frame_id, prediction.predictions)
+            ```
+        """
+        udp_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer_size)
+        udp_socket.bind((ip_address, port))
+        return cls(
+            udp_socket=udp_socket,
+            reassembler=MessagesReassembler(reassembly_timeout=reassembly_timeout),
+        )
+
+    def __init__(self, udp_socket: socket.socket, reassembler: MessagesReassembler):
+        self._socket = udp_socket
+        self._reassembler = reassembler
+
+    @property
+    def port(self) -> int:
+        return self._socket.getsockname()[1]
+
+    def receive(self, timeout: Optional[float] = None) -> List[ReceivedPrediction]:
+        """
+        Waits for the next complete message and returns predictions of all frames
+        it carries. Empty list is returned if no message was completed within `timeout`.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                self._socket.settimeout(remaining)
+            try:
+                datagram, sender = self._socket.recvfrom(MAX_UDP_PAYLOAD_SIZE)
+            except socket.timeout:
+                return []
+            message = self._reassembler.add(datagram=datagram, sender=sender)
+            if message is not None:
+                return decode_message(message=message)
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+def _can_pack_detections(detections: Any) -> bool:
+    if not isinstance(detections, list) or len(detections) == 0:
+        return False
+    return all(
+        isinstance(detection, dict)
+        and all(key in detection for key in PACKED_DETECTION_KEYS)
+        for detection in detections
+    )
+
+
+def _pack_detections(
+    predictions: dict, detections: List[dict]
+) -> Tuple[dict, List[np.ndarray]]:
+    boxes = np.array(
+        [[d["x"], d["y"], d["width"], d["height"]] for d in detections], dtype="<f4"
+    )
+    confidence = np.array([d["confidence"] for d in detections], dtype="<f4")
+    class_id = np.array([d["class_id"] for d in detections], dtype="<i4")
+    class_names = {}
+    detections_extras = []
+    for detection in detections:
+        if "class" in detection:
+            class_names[str(detection["class_id"])] = detection["class"]
+        detections_extras.append(
+            {
+                key: value
+                for key, value in detection.items()
+                if key not in PACKED_DETECTION_KEYS and key != "class"
+            }
+        )
+    extras = {key: value for key, value in predictions.items() if key != "predictions"}
+    extras[CLASS_NAMES_KEY] = class_names
+    if any(detections_extras):
+        extras[DETECTIONS_EXTRAS_KEY] = detections_extras
+    return extras, [boxes, confidence, class_id]
+
+
+def _unpack_detections(
+    predictions: dict,
+    boxes: np.ndarray,
+    confidence: np.ndarray,
+    class_id: np.ndarray,
+) -> dict:
+    class_names = predictions.pop(CLASS_NAMES_KEY, {})
+    detections_extras = predictions.pop(DETECTIONS_EXTRAS_KEY, None)
+    detections = []
+    for index, (box, detection_confidence, detection_class_id) in enumerate(
+        zip(boxes.tolist(), confidence.tolist(), class_id.tolist())
+    ):
+        detection = {
+            "x": box[0],
+            "y": box[1],
+            "width": box[2],
+            "height": box[3],
+            "confidence": detection_confidence,
+            "class_id": detection_class_id,
+        }
+        class_name = class_names.get(str(detection_class_id))
+        if class_name is not None:
+            detection["class"] = class_name
+        if detections_extras is not None:
+            detection.update(detections_extras[index])
+        detections.append(detection)
+    predictions["predictions"] = detections
+    return predictions
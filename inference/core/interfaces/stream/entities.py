@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Union
 
@@ -15,6 +15,7 @@ from inference.core.env import (
 )
 from inference.core.interfaces.camera.entities import StatusUpdate, VideoFrame
 from inference.core.interfaces.camera.video_source import SourceMetadata
+from inference.core.utils.background_writer import BackgroundWriterReport
 from inference.core.utils.environment import safe_env_to_type, str2bool
 
 AnyPrediction = Any
@@ -118,6 +119,7 @@ class PipelineStateReport:
     latency_reports: List[LatencyMonitorReport]
     inference_throughput: float
     sources_metadata: List[SourceMetadata]
+    background_writers: List[BackgroundWriterReport] = field(default_factory=list)
 
 
 InferenceHandler = Callable[[List[VideoFrame]], List[AnyPrediction]]
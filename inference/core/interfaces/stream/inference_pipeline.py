@@ -1,5 +1,4 @@
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
 from enum import Enum
 from functools import partial
 from queue import Queue
@@ -8,8 +7,8 @@ from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 from inference.core import logger
 from inference.core.active_learning.middlewares import (
+    BatchingActiveLearningMiddleware,
     NullActiveLearningMiddleware,
-    ThreadingActiveLearningMiddleware,
 )
 from inference.core.cache import cache
 from inference.core.env import (
@@ -29,6 +28,10 @@ from inference.core.interfaces.camera.entities import (
     VideoFrame,
     VideoSourceIdentifier,
 )
+from inference.core.interfaces.camera.status_updates import (
+    dispatch_status_update,
+    flush_status_update_subscriptions,
+)
 from inference.core.interfaces.camera.utils import multiplex_videos
 from inference.core.interfaces.camera.video_source import (
     BufferConsumptionStrategy,
@@ -61,6 +64,7 @@ from inference.core.workflows.core_steps.common.entities import StepExecutionMod
 from inference.core.workflows.execution_engine.profiling.core import (
     BaseWorkflowsProfiler,
     NullWorkflowsProfiler,
+    WorkflowsProfiler,
 )
 from inference.models.aliases import resolve_roboflow_model_alias
 from inference.models.utils import ROBOFLOW_MODEL_TYPES, get_model
@@ -264,7 +268,7 @@ class InferencePipeline:
             target_dataset = (
                 active_learning_target_dataset or resolved_model_id.split("/")[0]
             )
-            active_learning_middleware = ThreadingActiveLearningMiddleware.init(
+            active_learning_middleware = BatchingActiveLearningMiddleware.init(
                 api_key=api_key,
                 target_dataset=target_dataset,
                 model_id=resolved_model_id,
@@ -467,6 +471,7 @@ class InferencePipeline:
         profiling_directory: str = "./inference_profiling",
         use_workflow_definition_cache: bool = True,
         serialize_results: bool = False,
+        workflows_profiler: Optional[WorkflowsProfiler] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from given workflow against video stream.
@@ -521,7 +526,8 @@ class InferencePipeline:
                 Example valid properties are: {"frame_width": 1920, "frame_height": 1080, "fps": 30.0}
             workflow_init_parameters (Optional[Dict[str, Any]]): Additional init parameters to be used by
                 workflows Execution Engine to init steps of your workflow - may be required when running workflows
-                with custom plugins.
+                with custom plugins. If `workflows_core.model_manager` is given, models are served by that manager
+                (which allows models to be shared between pipelines), otherwise new manager is created.
             workflows_thread_pool_workers (int): Number of workers for workflows thread pool which is used
                 by workflows blocks to run background tasks.
             cancel_thread_pool_tasks_on_exit (bool): Flag to decide if unstated background tasks should be
@@ -543,6 +549,11 @@ class InferencePipeline:
                 newest version for the request. Only applies for Workflows definitions saved on Roboflow platform.
             serialize_results (bool): Boolean flag to decide if ExecutionEngine run should serialize workflow
                 results for each frame. If that is set true, sinks will receive serialized workflow responses.
+            workflows_profiler (Optional[WorkflowsProfiler]): Profiler to be used by Execution Engine instead of
+                the one selected by `ENABLE_WORKFLOWS_PROFILING` - for instance `StreamingWorkflowsProfiler`,
+                which aggregates metrics of workflow steps over rolling window and periodically saves trace
+                snapshots, to be used while processing long streams. Report of the profiler may be retrieved
+                with its `get_report()` method.
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
@@ -558,7 +569,9 @@ class InferencePipeline:
             * MissingApiKeyError - if API key is not provided in situation when retrieving workflow definition
                 from Roboflow API is needed
         """
-        if ENABLE_WORKFLOWS_PROFILING:
+        if workflows_profiler is not None:
+            profiler = workflows_profiler
+        elif ENABLE_WORKFLOWS_PROFILING:
             profiler = BaseWorkflowsProfiler.init(
                 max_runs_in_buffer=WORKFLOWS_PROFILER_BUFFER_SIZE
             )
@@ -599,20 +612,22 @@ class InferencePipeline:
                         workflow_id=workflow_id,
                         use_cache=use_workflow_definition_cache,
                     )
-            model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
-            model_manager = BackgroundTaskActiveLearningManager(
-                model_registry=model_registry, cache=cache
-            )
-            model_manager = WithFixedSizeCache(
-                model_manager,
-                max_size=MAX_ACTIVE_MODELS,
-            )
             if workflow_init_parameters is None:
                 workflow_init_parameters = {}
+            workflow_init_parameters = dict(workflow_init_parameters)
+            if "workflows_core.model_manager" not in workflow_init_parameters:
+                model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
+                model_manager = BackgroundTaskActiveLearningManager(
+                    model_registry=model_registry, cache=cache
+                )
+                model_manager = WithFixedSizeCache(
+                    model_manager,
+                    max_size=MAX_ACTIVE_MODELS,
+                )
+                workflow_init_parameters["workflows_core.model_manager"] = model_manager
             thread_pool_executor = ThreadPoolExecutor(
                 max_workers=workflows_thread_pool_workers
             )
-            workflow_init_parameters["workflows_core.model_manager"] = model_manager
             workflow_init_parameters["workflows_core.api_key"] = api_key
             workflow_init_parameters["workflows_core.thread_pool_executor"] = (
                 thread_pool_executor
@@ -756,7 +771,9 @@ class InferencePipeline:
             watchdog = NullPipelineWatchdog()
         if status_update_handlers is None:
             status_update_handlers = []
-        status_update_handlers.append(watchdog.on_status_update)
+        watchdog_subscription = watchdog.get_status_updates_subscription()
+        if watchdog_subscription is not None:
+            status_update_handlers.append(watchdog_subscription)
         desired_source_fps = None
         if ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING:
             desired_source_fps = max_fps
@@ -879,11 +896,9 @@ class InferencePipeline:
                 send_inference_pipeline_status_update(
                     severity=UpdateSeverity.DEBUG,
                     event_type=INFERENCE_COMPLETED_EVENT,
-                    payload={
-                        "frames_ids": [f.frame_id for f in video_frames],
-                        "frames_timestamps": [f.frame_timestamp for f in video_frames],
-                        "sources_id": [f.source_id for f in video_frames],
-                    },
+                    payload_factory=partial(
+                        describe_inference_completed_frames, video_frames=video_frames
+                    ),
                     status_update_handlers=self._status_update_handlers,
                 )
 
@@ -902,6 +917,9 @@ class InferencePipeline:
             logger.exception(f"Encountered inference error: {error}")
         finally:
             self._predictions_queue.put(None)
+            flush_status_update_subscriptions(
+                status_update_handlers=self._status_update_handlers
+            )
             send_inference_pipeline_status_update(
                 severity=UpdateSeverity.INFO,
                 event_type=INFERENCE_THREAD_FINISHED_EVENT,
@@ -1000,27 +1018,31 @@ class InferencePipeline:
         )
 
 
+def describe_inference_completed_frames(video_frames: List[VideoFrame]) -> dict:
+    return {
+        "frames_ids": [f.frame_id for f in video_frames],
+        "frames_timestamps": [f.frame_timestamp for f in video_frames],
+        "sources_id": [f.source_id for f in video_frames],
+    }
+
+
 def send_inference_pipeline_status_update(
     severity: UpdateSeverity,
     event_type: str,
     status_update_handlers: List[Callable[[StatusUpdate], None]],
     payload: Optional[dict] = None,
     sub_context: Optional[str] = None,
+    payload_factory: Optional[Callable[[], dict]] = None,
 ) -> None:
-    if payload is None:
-        payload = {}
+    if payload is not None:
+        payload_factory = lambda: payload
     context = INFERENCE_PIPELINE_CONTEXT
     if sub_context is not None:
         context = f"{context}.{sub_context}"
-    status_update = StatusUpdate(
-        timestamp=datetime.now(),
+    dispatch_status_update(
         severity=severity,
         event_type=event_type,
-        payload=payload,
         context=context,
+        status_update_handlers=status_update_handlers,
+        payload_factory=payload_factory,
     )
-    for handler in status_update_handlers:
-        try:
-            handler(status_update)
-        except Exception as error:
-            logger.warning(f"Could not execute handler update. Cause: {error}")
@@ -0,0 +1,341 @@
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from glob import glob
+from queue import Empty
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import cv2
+
+from inference.core import logger
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream.sinks import multi_sink
+
+VIDEO_FILES_EXTENSIONS = {".avi", ".mkv", ".mov", ".mp4", ".mpeg", ".mpg", ".webm"}
+PROGRESS_REPORT_INTERVAL = 1.0
+# each worker holds its own copy of models - which is why only few of them are
+# spawned unless requested explicitly
+DEFAULT_WORKERS = 2
+
+PipelineFactory = Callable[..., Any]
+SinkFactory = Callable[[str], Any]
+
+
+@dataclass(frozen=True)
+class VideoFileProcessingResult:
+    video_path: str
+    frames_processed: int
+    processing_time: float
+    error: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        if self.processing_time <= 0:
+            return 0.0
+        return self.frames_processed / self.processing_time
+
+
+@dataclass(frozen=True)
+class OfflineProcessingProgress:
+    files_total: int
+    files_completed: int
+    frames_processed: int
+    total_frames: Optional[int]
+    elapsed: float
+    frames_processed_by_file: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        if self.elapsed <= 0:
+            return 0.0
+        return self.frames_processed / self.elapsed
+
+
+@dataclass(frozen=True)
+class OfflineProcessingReport:
+    results: List[VideoFileProcessingResult]
+    duration: float
+
+    @property
+    def frames_processed(self) -> int:
+        return sum(result.frames_processed for result in self.results)
+
+    @property
+    def throughput(self) -> float:
+        if self.duration <= 0:
+            return 0.0
+        return self.frames_processed / self.duration
+
+    @property
+    def failed(self) -> List[VideoFileProcessingResult]:
+        return [result for result in self.results if result.error is not None]
+
+
+@dataclass(frozen=True)
+class _FramesProcessed:
+    video_path: str
+    frames_processed: int
+
+
+def process_video_files(
+    video_files: Union[str, List[str]],
+    pipeline_factory: PipelineFactory,
+    sink_factory: Optional[SinkFactory] = None,
+    workers: Optional[int] = None,
+    on_progress: Optional[Callable[[OfflineProcessingProgress], None]] = None,
+) -> OfflineProcessingReport:
+    """
+    Processes video files offline - as fast as possible, without real-time pacing.
+    Instead of multiplexing all files into single `InferencePipeline` (which is what
+    happens when multiple `video_reference` entries are given), files are sharded
+    across `workers` processes, each running its own pipeline (with its own `VideoSource`
+    and model) for one file at a time. Files are handed to workers dynamically, so
+    that files of uneven length do not leave workers idle.
+
+    Args:
+        video_files (Union[str, List[str]]): list of video files paths, directory with
+            video files or glob pattern (lists may mix all of those)
+        pipeline_factory (Callable[..., InferencePipeline]): callable creating
+            pipeline, called with `video_reference` and `on_prediction` keyword arguments -
+            for instance `partial(InferencePipeline.init, model_id="yolov8n-640")`. For
+            `workers > 1` it must be picklable (top-level function, method, `partial` or
+            instance of top-level class). Each worker holds single copy of the factory and
+            calls it for all files it processes - stateful factory may keep models loaded
+            between files.
+        sink_factory (Optional[Callable[[str], Any]]): callable creating results sink for
+            video file of given path - object exposing `on_prediction(...)` and
+            `release()` methods (like `VideoFileSink`). Must be picklable for `workers > 1`.
+        workers (Optional[int]): number of worker processes - defaults to `DEFAULT_WORKERS`
+            (limited by number of CPUs and files), as each worker loads its own models.
+            With single worker, files are processed in the calling process.
+        on_progress (Optional[Callable[[OfflineProcessingProgress], None]]): callback
+            receiving progress aggregated across workers (called in the calling process)
+
+    Returns: OfflineProcessingReport with results for each file (in order of `video_files`)
+    """
+    video_paths = resolve_video_files(video_files=video_files)
+    if workers is None:
+        workers = min(DEFAULT_WORKERS, os.cpu_count() or 1)
+    workers = max(min(workers, len(video_paths)), 1)
+    tracker = _ProgressTracker(video_paths=video_paths, on_progress=on_progress)
+    if workers == 1:
+        for video_path in video_paths:
+            _process_video_file(
+                video_path=video_path,
+                pipeline_factory=pipeline_factory,
+                sink_factory=sink_factory,
+                on_event=tracker.on_event,
+            )
+        return tracker.build_report()
+    context = multiprocessing.get_context("spawn")
+    tasks_queue = context.Queue()
+    events_queue = context.Queue()
+    for video_path in video_paths:
+        tasks_queue.put(video_path)
+    for _ in range(workers):
+        tasks_queue.put(None)
+    processes = [
+        context.Process(
+            target=_run_worker,
+            kwargs={
+                "tasks_queue": tasks_queue,
+                "events_queue": events_queue,
+                "pipeline_factory": pipeline_factory,
+                "sink_factory": sink_factory,
+            },
+            daemon=True,
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        while not tracker.all_completed():
+            try:
+                event = events_queue.get(timeout=PROGRESS_REPORT_INTERVAL)
+            except Empty:
+                if not any(process.is_alive() for process in processes):
+                    logger.error("All offline processing workers exited prematurely")
+                    break
+                continue
+            tracker.on_event(event)
+    finally:
+        for process in processes:
+            process.join(timeout=PROGRESS_REPORT_INTERVAL)
+            if process.is_alive():
+                process.terminate()
+    return tracker.build_report()
+
+
+def resolve_video_files(video_files: Union[str, List[str]]) -> List[str]:
+    if isinstance(video_files, str):
+        video_files = [video_files]
+    video_paths = []
+    for reference in video_files:
+        if os.path.isdir(reference):
+            video_paths.extend(
+                sorted(
+                    os.path.join(reference, file_name)
+                    for file_name in os.listdir(reference)
+                    if os.path.splitext(file_name)[1].lower() in VIDEO_FILES_EXTENSIONS
+                )
+            )
+        elif os.path.isfile(reference):
+            video_paths.append(reference)
+        else:
+            video_paths.extend(sorted(glob(reference)))
+    if not video_paths:
+        raise ValueError(f"Could not find any video file matching: {video_files}")
+    return list(dict.fromkeys(video_paths))
+
+
+def _run_worker(
+    tasks_queue: multiprocessing.Queue,
+    events_queue: multiprocessing.Queue,
+    pipeline_factory: PipelineFactory,
+    sink_factory: Optional[SinkFactory],
+) -> None:
+    while True:
+        video_path = tasks_queue.get()
+        if video_path is None:
+            return None
+        _process_video_file(
+            video_path=video_path,
+            pipeline_factory=pipeline_factory,
+            sink_factory=sink_factory,
+            on_event=events_queue.put,
+        )
+
+
+def _process_video_file(
+    video_path: str,
+    pipeline_factory: PipelineFactory,
+    sink_factory: Optional[SinkFactory],
+    on_event: Callable[[Any], None],
+) -> None:
+    frames_counter = _FramesCounter(video_path=video_path, on_event=on_event)
+    sinks = [frames_counter.on_prediction]
+    sink = None
+    error = None
+    start = time.monotonic()
+    try:
+        if sink_factory is not None:
+            sink = sink_factory(video_path)
+            sinks.append(sink.on_prediction)
+        pipeline = pipeline_factory(
+            video_reference=video_path,
+            on_prediction=partial(multi_sink, sinks=sinks),
+        )
+        pipeline.start(use_main_thread=True)
+        pipeline.join()
+    except Exception as processing_error:
+        logger.exception(f"Could not process video file: {video_path}")
+        error = f"{type(processing_error).__name__}: {processing_error}"
+    finally:
+        if sink is not None:
+            sink.release()
+    on_event(
+        VideoFileProcessingResult(
+            video_path=video_path,
+            frames_processed=frames_counter.frames_processed,
+            processing_time=time.monotonic() - start,
+            error=error,
+        )
+    )
+
+
+class _FramesCounter:
+
+    def __init__(self, video_path: str, on_event: Callable[[Any], None]):
+        self._video_path = video_path
+        self._on_event = on_event
+        self._last_report = time.monotonic()
+        self.frames_processed = 0
+
+    def on_prediction(
+        self,
+        predictions: Union[Optional[dict], List[Optional[dict]]],
+        video_frames: Union[Optional[VideoFrame], List[Optional[VideoFrame]]],
+    ) -> None:
+        if not isinstance(video_frames, list):
+            video_frames = [video_frames]
+        self.frames_processed += sum(frame is not None for frame in video_frames)
+        now = time.monotonic()
+        if now - self._last_report < PROGRESS_REPORT_INTERVAL:
+            return None
+        self._last_report = now
+        self._on_event(
+            _FramesProcessed(
+                video_path=self._video_path,
+                frames_processed=self.frames_processed,
+            )
+        )
+
+
+class _ProgressTracker:
+
+    def __init__(
+        self,
+        video_paths: List[str],
+        on_progress: Optional[Callable[[OfflineProcessingProgress], None]],
+    ):
+        self._video_paths = video_paths
+        self._on_progress = on_progress
+        self._total_frames = _count_total_frames(video_paths=video_paths)
+        self._frames_processed: Dict[str, int] = {}
+        self._results: Dict[str, VideoFileProcessingResult] = {}
+        self._start = time.monotonic()
+
+    def on_event(self, event: Any) -> None:
+        if isinstance(event, VideoFileProcessingResult):
+            self._results[event.video_path] = event
+        self._frames_processed[event.video_path] = event.frames_processed
+        if self._on_progress is None:
+            return None
+        self._on_progress(
+            OfflineProcessingProgress(
+                files_total=len(self._video_paths),
+                files_completed=len(self._results),
+                frames_processed=sum(self._frames_processed.values()),
+                total_frames=self._total_frames,
+                elapsed=time.monotonic() - self._start,
+                frames_processed_by_file=dict(self._frames_processed),
+            )
+        )
+
+    def all_completed(self) -> bool:
+        return len(self._results) == len(self._video_paths)
+
+    def build_report(self) -> OfflineProcessingReport:
+        results = [
+            self._results.get(
+                video_path,
+                VideoFileProcessingResult(
+                    video_path=video_path,
+                    frames_processed=self._frames_processed.get(video_path, 0),
+                    processing_time=0.0,
+                    error="Worker processing the file exited prematurely",
+                ),
+            )
+            for video_path in self._video_paths
+        ]
+        return OfflineProcessingReport(
+            results=results,
+            duration=time.monotonic() - self._start,
+        )
+
+
+def _count_total_frames(video_paths: List[str]) -> Optional[int]:
+    total_frames = 0
+    for video_path in video_paths:
+        video = cv2.VideoCapture(video_path)
+        try:
+            frames = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
+        finally:
+            video.release()
+        if frames <= 0:
+            return None
+        total_frames += frames
+    return total_frames
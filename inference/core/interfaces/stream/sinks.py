@@ -1,5 +1,6 @@
 import json
 import socket
+import time
 from collections import deque
 from datetime import datetime
 from functools import partial
@@ -12,9 +13,23 @@ from supervision.annotators.base import BaseAnnotator
 
 from inference.core import logger
 from inference.core.active_learning.middlewares import ActiveLearningMiddleware
+from inference.core.env import (
+    SINKS_WRITER_FULL_QUEUE_POLICY,
+    SINKS_WRITER_MAX_PENDING_TASKS,
+)
 from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream.binary_udp import (
+    DEFAULT_MAX_DATAGRAM_SIZE,
+    MAX_MESSAGE_ID,
+    MAX_RECORDS_IN_MESSAGE,
+    encode_frame_predictions,
+    encode_message,
+    get_message_size,
+    split_into_datagrams,
+)
 from inference.core.interfaces.stream.entities import SinkHandler
 from inference.core.interfaces.stream.utils import wrap_in_list
+from inference.core.utils.background_writer import BackgroundWriter, FullQueuePolicy
 from inference.core.utils.drawing import create_tiles
 from inference.core.utils.preprocess import letterbox_image
 
@@ -318,6 +333,155 @@ class UDPSink:
             )
 
 
+class BinaryUDPSink:
+    @classmethod
+    def init(
+        cls,
+        ip_address: str,
+        port: int,
+        max_datagram_size: int = DEFAULT_MAX_DATAGRAM_SIZE,
+        max_batch_size: int = 1,
+        max_batch_delay: float = 0.05,
+    ) -> "BinaryUDPSink":
+        """
+        Creates `InferencePipeline` predictions sink sending predictions over UDP in compact binary
+        format (see `inference.core.interfaces.stream.binary_udp`) - boxes, confidences and class ids
+        are packed into arrays, instead of being serialised to JSON. Messages exceeding
+        `max_datagram_size` are split into fragments (reassembled by receiver), such that large
+        sets of detections are not lost due to IP fragmentation. Predictions of multiple frames
+        can be batched into single message to reduce number of datagrams sent.
+
+        Predictions can be received with `BinaryUDPReceiver` (also in
+        `inference.core.interfaces.stream.binary_udp`).
+
+        As an `inference` user, please use .init() method instead of constructor to instantiate objects.
+        Args:
+            ip_address (str): IP address to send predictions
+            port (int): Port to send predictions
+            max_datagram_size (int): Maximum size of single datagram - should fit into MTU of network
+            max_batch_size (int): Maximum number of frames which predictions are sent in single message
+            max_batch_delay (float): Maximum time (in seconds) the predictions may wait for batch to be
+                filled - checked when predictions are delivered to sink (use `flush()` to send immediately)
+
+        Returns: Initialised object of `BinaryUDPSink` class.
+
+        Example:
+            ```python
+            from inference.core.interfaces.stream.inference_pipeline import InferencePipeline
+            from inference.core.interfaces.stream.sinks import BinaryUDPSink
+
+            udp_sink = BinaryUDPSink.init(ip_address="127.0.0.1", port=9090, max_batch_size=4)
+
+            pipeline = InferencePipeline.init(
+                 model_id="your-model/3",
+                 video_reference="./some_file.mp4",
+                 on_prediction=udp_sink.send_predictions,
+            )
+            pipeline.start()
+            pipeline.join()
+            udp_sink.release()
+            ```
+        """
+        udp_socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1024 * 1024)
+        return cls(
+            ip_address=ip_address,
+            port=port,
+            udp_socket=udp_socket,
+            max_datagram_size=max_datagram_size,
+            max_batch_size=max_batch_size,
+            max_batch_delay=max_batch_delay,
+        )
+
+    def __init__(
+        self,
+        ip_address: str,
+        port: int,
+        udp_socket: socket.socket,
+        max_datagram_size: int,
+        max_batch_size: int,
+        max_batch_delay: float,
+    ):
+        self._ip_address = ip_address
+        self._port = port
+        self._socket = udp_socket
+        self._max_datagram_size = max_datagram_size
+        self._max_batch_size = min(max(max_batch_size, 1), MAX_RECORDS_IN_MESSAGE)
+        self._max_batch_delay = max_batch_delay
+        self._pending_records: List[bytes] = []
+        self._batch_started: Optional[float] = None
+        self._message_id = 0
+
+    def send_predictions(
+        self,
+        predictions: Union[dict, List[Optional[dict]]],
+        video_frame: Union[VideoFrame, List[Optional[VideoFrame]]],
+    ) -> None:
+        """
+        Method to send predictions via UDP socket. Useful in combination with `InferencePipeline` as
+        a sink for predictions. Contrary to `UDPSink`, `predictions` are not mutated.
+
+        Args:
+            predictions (Union[dict, List[Optional[dict]]]): Roboflow predictions, single or batch
+            video_frame (Union[VideoFrame, List[Optional[VideoFrame]]]): frame of video with its basic metadata
+                emitted by `VideoSource` or list of frames (order is expected to match with `predictions`)
+
+        Returns: None
+        Side effects: Sends predictions (together with `video_frame` metadata) via the UDP socket, once
+            batch is filled or `max_batch_delay` elapsed.
+        """
+        video_frame = wrap_in_list(element=video_frame)
+        predictions = wrap_in_list(element=predictions)
+        for single_frame, frame_predictions in zip(video_frame, predictions):
+            if single_frame is None:
+                continue
+            record = encode_frame_predictions(
+                predictions=frame_predictions, video_frame=single_frame
+            )
+            if self._pending_records and (
+                get_message_size(records=self._pending_records + [record])
+                > self._max_datagram_size
+            ):
+                # not to fragment messages which would fit into single datagram if sent separately
+                self.flush()
+            if not self._pending_records:
+                self._batch_started = time.monotonic()
+            self._pending_records.append(record)
+            if (
+                len(self._pending_records) >= self._max_batch_size
+                or get_message_size(records=self._pending_records)
+                >= self._max_datagram_size
+            ):
+                self.flush()
+        if (
+            self._batch_started is not None
+            and time.monotonic() - self._batch_started >= self._max_batch_delay
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending_records:
+            return None
+        message = encode_message(
+            records=self._pending_records, emission_time=time.time()
+        )
+        self._pending_records = []
+        self._batch_started = None
+        datagrams = split_into_datagrams(
+            message=message,
+            message_id=self._message_id,
+            max_datagram_size=self._max_datagram_size,
+        )
+        self._message_id = (self._message_id + 1) % (MAX_MESSAGE_ID + 1)
+        for datagram in datagrams:
+            self._socket.sendto(datagram, (self._ip_address, self._port))
+
+    def release(self) -> None:
+        self.flush()
+        self._socket.close()
+
+
 def multi_sink(
     predictions: Union[dict, List[Optional[dict]]],
     video_frame: Union[VideoFrame, List[Optional[VideoFrame]]],
@@ -415,11 +579,17 @@ class VideoFileSink:
         output_fps: int = 25,
         quiet: bool = False,
         video_frame_size: Tuple[int, int] = (1280, 720),
+        max_pending_frames: int = SINKS_WRITER_MAX_PENDING_TASKS,
+        full_queue_policy: Union[FullQueuePolicy, str] = SINKS_WRITER_FULL_QUEUE_POLICY,
     ) -> "VideoFileSink":
         """
         Creates `InferencePipeline` predictions sink capable of saving model predictions into video file.
         It works both for pipelines with single input video and multiple ones.
 
+        Annotation and encoding of frames happens in background thread, such that slow disk or encoder
+        does not stall the pipeline. When the background writer falls behind by `max_pending_frames`,
+        frames are either dropped or the pipeline waits - depending on `full_queue_policy`.
+
         As an `inference` user, please use .init() method instead of constructor to instantiate objects.
         Args:
             video_file_name (str): name of the video file to save predictions
@@ -435,6 +605,9 @@ class VideoFileSink:
             output_fps (int): desired FPS of output file
             quiet (bool): Flag to decide whether to log progress
             video_frame_size (Tuple[int, int]): The size of frame in target video file.
+            max_pending_frames (int): Maximum number of frames waiting for annotation and encoding
+            full_queue_policy (Union[FullQueuePolicy, str]): What to do with frames when `max_pending_frames`
+                is reached - "block" makes the pipeline wait, "drop" skips frames in output video
 
         Attributes:
             on_prediction (Callable[[dict, VideoFrame], None]): callable to be used as a sink for predictions
@@ -470,6 +643,8 @@ class VideoFileSink:
             output_fps=output_fps,
             quiet=quiet,
             video_frame_size=video_frame_size,
+            max_pending_frames=max_pending_frames,
+            full_queue_policy=full_queue_policy,
         )
 
     def __init__(
@@ -482,6 +657,8 @@ class VideoFileSink:
         output_fps: int,
         quiet: bool,
         video_frame_size: Tuple[int, int],
+        max_pending_frames: int = SINKS_WRITER_MAX_PENDING_TASKS,
+        full_queue_policy: Union[FullQueuePolicy, str] = SINKS_WRITER_FULL_QUEUE_POLICY,
     ):
         self._video_file_name = video_file_name
         self._annotator = annotator
@@ -493,7 +670,12 @@ class VideoFileSink:
         self._frame_idx = 0
         self._video_frame_size = video_frame_size
         self._video_writer: Optional[cv2.VideoWriter] = None
-        self.on_prediction = partial(
+        self._background_writer = BackgroundWriter(
+            name=f"video_file_sink:{video_file_name}",
+            max_pending_tasks=max_pending_frames,
+            full_queue_policy=full_queue_policy,
+        )
+        self._render_boxes = partial(
             render_boxes,
             annotator=self._annotator,
             display_size=self._display_size,
@@ -502,10 +684,22 @@ class VideoFileSink:
             on_frame_rendered=self._save_predictions,
         )
 
+    def on_prediction(
+        self,
+        predictions: Union[dict, List[Optional[dict]]],
+        video_frame: Union[VideoFrame, List[Optional[VideoFrame]]],
+    ) -> None:
+        self._background_writer.submit(
+            partial(self._render_boxes, predictions, video_frame)
+        )
+
     def release(self) -> None:
         """
-        Releases VideoWriter object.
+        Waits for pending frames to be written, stops the writer thread and releases
+        VideoWriter object.
         """
+        self._background_writer.flush()
+        self._background_writer.close()
         if self._video_writer is not None and self._video_writer.isOpened():
             self._video_writer.release()
 
@@ -15,6 +15,9 @@ from inference.core.interfaces.camera.video_source import (
     VideoSource,
 )
 from inference.core.workflows.execution_engine.profiling.core import WorkflowsProfiler
+from inference.core.workflows.execution_engine.profiling.streaming import (
+    StreamingWorkflowsProfiler,
+)
 
 T = TypeVar("T")
 
@@ -99,7 +102,9 @@ def on_pipeline_end(
     profiler: WorkflowsProfiler,
     profiling_directory: str,
 ) -> None:
-    if ENABLE_WORKFLOWS_PROFILING:
+    if isinstance(profiler, StreamingWorkflowsProfiler):
+        profiler.close()
+    elif ENABLE_WORKFLOWS_PROFILING:
         save_workflows_profiler_trace(
             directory=profiling_directory,
             profiler_trace=profiler.export_trace(),
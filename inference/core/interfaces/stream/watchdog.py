@@ -15,12 +15,17 @@ from inference.core.interfaces.camera.entities import (
     UpdateSeverity,
     VideoFrame,
 )
-from inference.core.interfaces.camera.video_source import VideoSource
+from inference.core.interfaces.camera.status_updates import StatusUpdateSubscription
+from inference.core.interfaces.camera.video_source import (
+    FRAME_DROPPED_EVENT,
+    VideoSource,
+)
 from inference.core.interfaces.stream.entities import (
     LatencyMonitorReport,
     ModelActivityEvent,
     PipelineStateReport,
 )
+from inference.core.utils.background_writer import describe_background_writers
 
 T = TypeVar("T")
 
@@ -40,6 +45,9 @@ class PipelineWatchDog(ABC):
     def on_status_update(self, status_update: StatusUpdate) -> None:
         pass
 
+    def get_status_updates_subscription(self) -> Optional[StatusUpdateSubscription]:
+        return StatusUpdateSubscription(handler=self.on_status_update)
+
     @abstractmethod
     def on_model_inference_started(
         self,
@@ -66,6 +74,9 @@ class NullPipelineWatchdog(PipelineWatchDog):
     def on_status_update(self, status_update: StatusUpdate) -> None:
         pass
 
+    def get_status_updates_subscription(self) -> Optional[StatusUpdateSubscription]:
+        return None
+
     def on_model_inference_started(self, frames: List[VideoFrame]) -> None:
         pass
 
@@ -222,6 +233,16 @@ class BasePipelineWatchDog(PipelineWatchDog):
             return None
         self._stream_updates.append(status_update)
 
+    def get_status_updates_subscription(self) -> Optional[StatusUpdateSubscription]:
+        # frame drops are reported per frame with DEBUG severity - counters of drops
+        # are kept in the report instead
+        return StatusUpdateSubscription(
+            handler=self.on_status_update,
+            min_severity=UpdateSeverity.INFO,
+            aggregated_event_types=[FRAME_DROPPED_EVENT],
+            aggregation_severity=UpdateSeverity.INFO,
+        )
+
     def on_model_inference_started(self, frames: List[VideoFrame]) -> None:
         for frame in frames:
             self._latency_monitors[frame.source_id].register_inference_start(
@@ -253,4 +274,5 @@ class BasePipelineWatchDog(PipelineWatchDog):
             latency_reports=latency_reports,
             inference_throughput=_inference_throughput_fps,
             sources_metadata=sources_metadata,
+            background_writers=describe_background_writers(),
         )
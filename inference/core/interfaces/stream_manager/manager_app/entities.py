@@ -76,6 +76,15 @@ class WorkflowConfiguration(BaseModel):
     video_metadata_input_name: str = "video_metadata"
 
 
+class WorkflowsProfilingConfiguration(BaseModel):
+    type: Literal["WorkflowsProfilingConfiguration"]
+    window_size: int = 1000
+    snapshots_directory: Optional[str] = "./inference_profiling"
+    snapshot_interval: float = 10.0
+    max_snapshots: int = 10
+    track_allocations: bool = False
+
+
 class InitialisePipelinePayload(BaseModel):
     video_configuration: VideoConfiguration
     processing_configuration: WorkflowConfiguration
@@ -84,6 +93,7 @@ class InitialisePipelinePayload(BaseModel):
     )
     consumption_timeout: Optional[float] = None
     api_key: Optional[str] = None
+    profiling_configuration: Optional[WorkflowsProfilingConfiguration] = None
 
 
 class WebRTCOffer(BaseModel):
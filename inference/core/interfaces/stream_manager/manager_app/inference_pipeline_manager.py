@@ -38,6 +38,7 @@ from inference.core.interfaces.stream_manager.manager_app.entities import (
     InitialisePipelinePayload,
     InitialiseWebRTCPipelinePayload,
     OperationStatus,
+    WorkflowsProfilingConfiguration,
 )
 from inference.core.interfaces.stream_manager.manager_app.serialisation import (
     describe_error,
@@ -49,6 +50,9 @@ from inference.core.interfaces.stream_manager.manager_app.webrtc import (
 )
 from inference.core.utils.async_utils import Queue as SyncAsyncQueue
 from inference.core.workflows.execution_engine.entities.base import WorkflowImageData
+from inference.core.workflows.execution_engine.profiling.streaming import (
+    StreamingWorkflowsProfiler,
+)
 
 
 def ignore_signal(signal_number: int, frame: FrameType) -> None:
@@ -76,6 +80,7 @@ class InferencePipelineManager(Process):
         self._responses_queue = responses_queue
         self._inference_pipeline: Optional[InferencePipeline] = None
         self._watchdog: Optional[PipelineWatchDog] = None
+        self._workflows_profiler: Optional[StreamingWorkflowsProfiler] = None
         self._stop = False
         self._buffer_sink: Optional[InMemoryBufferSink] = None
         self._last_consume_time = (
@@ -168,6 +173,9 @@ class InferencePipelineManager(Process):
         try:
             parsed_payload = InitialisePipelinePayload.model_validate(payload)
             watchdog = BasePipelineWatchDog()
+            workflows_profiler = init_workflows_profiler(
+                configuration=parsed_payload.profiling_configuration
+            )
             buffer_sink = InMemoryBufferSink.init(
                 queue_size=parsed_payload.sink_configuration.results_buffer_size,
             )
@@ -190,8 +198,10 @@ class InferencePipelineManager(Process):
                 cancel_thread_pool_tasks_on_exit=parsed_payload.processing_configuration.cancel_thread_pool_tasks_on_exit,
                 video_metadata_input_name=parsed_payload.processing_configuration.video_metadata_input_name,
                 batch_collection_timeout=parsed_payload.video_configuration.batch_collection_timeout,
+                workflows_profiler=workflows_profiler,
             )
             self._watchdog = watchdog
+            self._workflows_profiler = workflows_profiler
             self._consumption_timeout = parsed_payload.consumption_timeout
             self._last_consume_time = time.monotonic()
             self._inference_pipeline.start(use_main_thread=False)
@@ -232,6 +242,9 @@ class InferencePipelineManager(Process):
         try:
             parsed_payload = InitialiseWebRTCPipelinePayload.model_validate(payload)
             watchdog = BasePipelineWatchDog()
+            workflows_profiler = init_workflows_profiler(
+                configuration=parsed_payload.profiling_configuration
+            )
 
             def start_loop(loop: asyncio.AbstractEventLoop):
                 asyncio.set_event_loop(loop)
@@ -305,8 +318,10 @@ class InferencePipelineManager(Process):
                 cancel_thread_pool_tasks_on_exit=parsed_payload.processing_configuration.cancel_thread_pool_tasks_on_exit,
                 video_metadata_input_name=parsed_payload.processing_configuration.video_metadata_input_name,
                 batch_collection_timeout=parsed_payload.video_configuration.batch_collection_timeout,
+                workflows_profiler=workflows_profiler,
             )
             self._watchdog = watchdog
+            self._workflows_profiler = workflows_profiler
             self._inference_pipeline.start(use_main_thread=False)
             self._responses_queue.put(
                 (
@@ -443,9 +458,12 @@ class InferencePipelineManager(Process):
                     error_type=ErrorType.OPERATION_ERROR,
                     public_error_message="Cannot retrieve InferencePipeline status. Try again later.",
                 )
+            report = asdict(report)
+            if self._workflows_profiler is not None:
+                report["workflows_profiling"] = self._workflows_profiler.get_report()
             response_payload = {
                 STATUS_KEY: OperationStatus.SUCCESS,
-                "report": asdict(report),
+                "report": report,
             }
             self._responses_queue.put((request_id, response_payload))
             logger.info(f"Pipeline status returned. request_id={request_id}...")
@@ -522,3 +540,17 @@ class InferencePipelineManager(Process):
             error, error_type=error_type, public_error_message=public_error_message
         )
         self._responses_queue.put((request_id, response_payload))
+
+
+def init_workflows_profiler(
+    configuration: Optional[WorkflowsProfilingConfiguration],
+) -> Optional[StreamingWorkflowsProfiler]:
+    if configuration is None:
+        return None
+    return StreamingWorkflowsProfiler.init(
+        window_size=configuration.window_size,
+        snapshots_directory=configuration.snapshots_directory,
+        snapshot_interval=configuration.snapshot_interval,
+        max_snapshots=configuration.max_snapshots,
+        track_allocations=configuration.track_allocations,
+    )
@@ -2,25 +2,24 @@ import time
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
-from fastapi.encoders import jsonable_encoder
 
-from inference.core.cache import cache
-from inference.core.cache.serializers import to_cachable_inference_item
-from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.env import (
     DISABLE_INFERENCE_CACHE,
     METRICS_ENABLED,
-    METRICS_INTERVAL,
     ROBOFLOW_SERVER_UUID,
 )
 from inference.core.exceptions import InferenceModelNotFound
 from inference.core.logger import logger
+from inference.core.managers.coalescing import get_active_coalescing_group
 from inference.core.managers.entities import ModelDescription
+from inference.core.managers.metrics_recorder import inference_metrics_recorder
 from inference.core.managers.pingback import PingbackInfo
 from inference.core.models.base import Model, PreprocessReturnMetadata
+from inference.core.models.types import ModelMemoryUsage, QuantizationReport
 from inference.core.registries.base import ModelRegistry
+from inference.core.utils.stage_timing import QUEUE_WAIT_STAGE, get_active_stage_timer
 
 
 class ModelManager:
@@ -95,6 +94,7 @@ class ModelManager:
         if METRICS_ENABLED and self.pingback:
             logger.debug("ModelManager - setting pingback fallback api key...")
             self.pingback.fallback_api_key = request.api_key
+        self._start_stage_timing(model_id=model_id)
         try:
             rtn_val = await self.model_infer(
                 model_id=model_id, request=request, **kwargs
@@ -102,52 +102,15 @@ class ModelManager:
             logger.debug(
                 f"ModelManager - inference from request finished for model_id={model_id}."
             )
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                logger.debug(
-                    f"ModelManager - caching inference request started for model_id={model_id}"
-                )
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                if (
-                    hasattr(request, "image")
-                    and hasattr(request.image, "type")
-                    and request.image.type == "numpy"
-                ):
-                    request.image.value = str(request.image.value)
-                cache.zadd(
-                    f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value=to_cachable_inference_item(request, rtn_val),
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                logger.debug(
-                    f"ModelManager - caching inference request finished for model_id={model_id}"
+                inference_metrics_recorder.record_inference(
+                    model_id=model_id, request=request, response=rtn_val
                 )
             return rtn_val
         except Exception as e:
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                cache.zadd(
-                    f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value={
-                        "request": jsonable_encoder(
-                            request.dict(exclude={"image", "subject", "prompt"})
-                        ),
-                        "error": str(e),
-                    },
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+                inference_metrics_recorder.record_error(
+                    model_id=model_id, request=request, error=e
                 )
             raise
 
@@ -169,6 +132,7 @@ class ModelManager:
         if METRICS_ENABLED and self.pingback:
             logger.debug("ModelManager - setting pingback fallback api key...")
             self.pingback.fallback_api_key = request.api_key
+        self._start_stage_timing(model_id=model_id)
         try:
             rtn_val = self.model_infer_sync(
                 model_id=model_id, request=request, **kwargs
@@ -176,55 +140,27 @@ class ModelManager:
             logger.debug(
                 f"ModelManager - inference from request finished for model_id={model_id}."
             )
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                logger.debug(
-                    f"ModelManager - caching inference request started for model_id={model_id}"
-                )
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                if (
-                    hasattr(request, "image")
-                    and hasattr(request.image, "type")
-                    and request.image.type == "numpy"
-                ):
-                    request.image.value = str(request.image.value)
-                cache.zadd(
-                    f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value=to_cachable_inference_item(request, rtn_val),
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                logger.debug(
-                    f"ModelManager - caching inference request finished for model_id={model_id}"
+                inference_metrics_recorder.record_inference(
+                    model_id=model_id, request=request, response=rtn_val
                 )
             return rtn_val
         except Exception as e:
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                cache.zadd(
-                    f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value={
-                        "request": jsonable_encoder(
-                            request.dict(exclude={"image", "subject", "prompt"})
-                        ),
-                        "error": str(e),
-                    },
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+                inference_metrics_recorder.record_error(
+                    model_id=model_id, request=request, error=e
                 )
             raise
 
+    def _start_stage_timing(self, model_id: str) -> None:
+        stage_timer = get_active_stage_timer()
+        if stage_timer is None:
+            return None
+        stage_timer.model_id = model_id
+        stage_timer.task_type = getattr(self._models.get(model_id), "task_type", None)
+        # waiting ends once the model starts processing the request
+        stage_timer.mark(name=QUEUE_WAIT_STAGE)
+
     async def model_infer(self, model_id: str, request: InferenceRequest, **kwargs):
         self.check_for_model(model_id)
         return self._models[model_id].infer_from_request(request)
@@ -233,6 +169,13 @@ class ModelManager:
         self, model_id: str, request: InferenceRequest, **kwargs
     ) -> Union[List[InferenceResponse], InferenceResponse]:
         self.check_for_model(model_id)
+        coalescing_group = get_active_coalescing_group()
+        if coalescing_group is not None:
+            return coalescing_group.infer(
+                model_id=model_id,
+                request=request,
+                infer_from_request=self._models[model_id].infer_from_request,
+            )
         return self._models[model_id].infer_from_request(request)
 
     def make_response(
@@ -397,13 +340,34 @@ class ModelManager:
         return self._models
 
     def describe_models(self) -> List[ModelDescription]:
-        return [
-            ModelDescription(
-                model_id=model_id,
-                task_type=model.task_type,
-                batch_size=getattr(model, "batch_size", None),
-                input_width=getattr(model, "img_size_w", None),
-                input_height=getattr(model, "img_size_h", None),
+        descriptions = []
+        for model_id, model in self._models.items():
+            memory_usage = getattr(model, "memory_usage", None)
+            if not isinstance(memory_usage, ModelMemoryUsage):
+                memory_usage = None
+            weights_variant = getattr(model, "weights_variant", None)
+            quantization_report = getattr(model, "quantization_report", None)
+            descriptions.append(
+                ModelDescription(
+                    model_id=model_id,
+                    task_type=model.task_type,
+                    batch_size=getattr(model, "batch_size", None),
+                    input_width=getattr(model, "img_size_w", None),
+                    input_height=getattr(model, "img_size_h", None),
+                    shared_memory_bytes=(
+                        memory_usage.shared_bytes if memory_usage else None
+                    ),
+                    private_memory_bytes=(
+                        memory_usage.private_bytes if memory_usage else None
+                    ),
+                    weights_variant=(
+                        weights_variant if isinstance(weights_variant, str) else None
+                    ),
+                    quantization_speedup=(
+                        quantization_report.speedup
+                        if isinstance(quantization_report, QuantizationReport)
+                        else None
+                    ),
+                )
             )
-            for model_id, model in self._models.items()
-        ]
+        return descriptions
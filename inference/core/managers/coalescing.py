@@ -0,0 +1,258 @@
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
+
+from inference.core import logger
+from inference.core.entities.requests.inference import (
+    InferenceRequest,
+    KeypointsDetectionInferenceRequest,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.entities.responses.inference import InferenceResponse
+
+InferenceResult = Union[InferenceResponse, List[InferenceResponse]]
+
+REQUEST_FIELDS_IGNORED_WHILE_COALESCING = {"id", "image", "start"}
+
+_active_coalescing_group: ContextVar[Optional["ModelCallsCoalescingGroup"]] = (
+    ContextVar("active_coalescing_group", default=None)
+)
+
+
+@dataclass
+class PendingModelCall:
+    model_id: str
+    request: InferenceRequest
+    infer_from_request: Callable[[InferenceRequest], InferenceResult]
+    scheduled: Event = field(default_factory=Event)
+    batch: Optional[List["PendingModelCall"]] = None
+    done: Event = field(default_factory=Event)
+    result: Optional[InferenceResult] = None
+    error: Optional[Exception] = None
+
+
+class ModelCallsCoalescingGroup:
+    """Merges model calls issued concurrently by a known group of participants.
+
+    Each participant (in practice - workflow step executed in its own thread) either
+    submits a model call or leaves the group once it is done. As soon as every
+    participant still in the group is waiting for its call, calls are split into
+    batches of calls targeting the same model with the same preprocessing. Each batch
+    is executed as single inference by the thread of its first call, so batches (and
+    calls not matching any other) still run concurrently - results are fanned back
+    out, with postprocessing of each call applied to its own results.
+    Participant waiting longer than `max_wait` executes its call on its own, so
+    that coalescing never blocks progress.
+    """
+
+    def __init__(self, participants: int, max_wait: float):
+        self._active_participants = participants
+        self._max_wait = max_wait
+        self._pending: List[PendingModelCall] = []
+        self._lock = Lock()
+
+    def infer(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        infer_from_request: Callable[[InferenceRequest], InferenceResult],
+    ) -> InferenceResult:
+        if not is_request_coalescible(request=request):
+            return infer_from_request(request)
+        call = PendingModelCall(
+            model_id=model_id,
+            request=request,
+            infer_from_request=infer_from_request,
+        )
+        with self._lock:
+            self._pending.append(call)
+            calls_to_schedule = self._collect_calls_if_all_participants_waiting()
+        schedule_coalesced_calls(calls=calls_to_schedule)
+        if not call.scheduled.wait(timeout=self._max_wait):
+            with self._lock:
+                executes_alone = call in self._pending
+                if executes_alone:
+                    self._pending.remove(call)
+            if executes_alone:
+                schedule_coalesced_calls(calls=[call])
+            call.scheduled.wait()
+        if call.batch is not None:
+            execute_coalesced_calls(calls=call.batch)
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def leave(self) -> None:
+        with self._lock:
+            self._active_participants -= 1
+            calls_to_schedule = self._collect_calls_if_all_participants_waiting()
+        schedule_coalesced_calls(calls=calls_to_schedule)
+
+    def _collect_calls_if_all_participants_waiting(self) -> List[PendingModelCall]:
+        if not self._pending or len(self._pending) < self._active_participants:
+            return []
+        calls = self._pending
+        self._pending = []
+        return calls
+
+
+@contextmanager
+def coalescing_group_participation(
+    group: Optional[ModelCallsCoalescingGroup],
+) -> Generator[None, None, None]:
+    if group is None:
+        yield None
+        return None
+    token = _active_coalescing_group.set(group)
+    try:
+        yield None
+    finally:
+        _active_coalescing_group.reset(token)
+        group.leave()
+
+
+def get_active_coalescing_group() -> Optional[ModelCallsCoalescingGroup]:
+    return _active_coalescing_group.get()
+
+
+def is_request_coalescible(request: InferenceRequest) -> bool:
+    return hasattr(request, "image") and not getattr(
+        request, "visualize_predictions", False
+    )
+
+
+def schedule_coalesced_calls(calls: List[PendingModelCall]) -> None:
+    """Splits calls into batches and hands each batch to the thread of its first call."""
+    calls_by_key: Dict[Tuple[str, str, str], List[PendingModelCall]] = {}
+    for call in calls:
+        calls_by_key.setdefault(get_coalescing_key(call=call), []).append(call)
+    for matching_calls in calls_by_key.values():
+        matching_calls[0].batch = matching_calls
+        for call in matching_calls:
+            call.scheduled.set()
+
+
+def execute_coalesced_calls(calls: List[PendingModelCall]) -> None:
+    try:
+        if len(calls) == 1:
+            call = calls[0]
+            call.result = call.infer_from_request(call.request)
+        else:
+            execute_batched_call(calls=calls)
+    except Exception as error:
+        for call in calls:
+            call.error = error
+    finally:
+        for call in calls:
+            call.done.set()
+
+
+def get_coalescing_key(call: PendingModelCall) -> Tuple[str, str, str]:
+    parameters = call.request.model_dump(
+        exclude=REQUEST_FIELDS_IGNORED_WHILE_COALESCING
+    )
+    if _supports_predictions_filtering(request=call.request):
+        # filters applied after NMS may differ between merged calls - only the fact
+        # of using model default confidence (which is not known here) must match
+        parameters.pop("class_filter", None)
+        parameters["confidence"] = parameters.get("confidence") is None
+    return (
+        call.model_id,
+        type(call.request).__name__,
+        json.dumps(parameters, sort_keys=True, default=str),
+    )
+
+
+def execute_batched_call(calls: List[PendingModelCall]) -> None:
+    images, images_positions, calls_positions = [], {}, []
+    for call in calls:
+        call_images = _as_list(call.request.image)
+        positions = []
+        for image in call_images:
+            image_key = _get_image_identity(image=image)
+            if image_key not in images_positions:
+                images_positions[image_key] = len(images)
+                images.append(image)
+            positions.append(images_positions[image_key])
+        calls_positions.append(positions)
+    logger.debug(
+        f"Coalescing {len(calls)} calls to model {calls[0].model_id} into single "
+        f"batch of {len(images)} images."
+    )
+    batched_request = calls[0].request.model_copy(
+        update={"image": images, **_get_merged_filters(calls=calls)}
+    )
+    responses = _as_list(calls[0].infer_from_request(batched_request))
+    for call, positions in zip(calls, calls_positions):
+        call_responses = [
+            _filter_predictions(response=responses[position], request=call.request)
+            for position in positions
+        ]
+        if isinstance(call.request.image, list):
+            call.result = call_responses
+        else:
+            call.result = call_responses[0]
+
+
+def _supports_predictions_filtering(request: InferenceRequest) -> bool:
+    # confidence threshold and class filter of those requests select predictions
+    # after NMS, so they can be applied to results of inference with looser filters;
+    # class filter of instance segmentation models has different semantics
+    return type(request) in {
+        ObjectDetectionInferenceRequest,
+        KeypointsDetectionInferenceRequest,
+    }
+
+
+def _get_merged_filters(calls: List[PendingModelCall]) -> Dict[str, Any]:
+    request = calls[0].request
+    if not _supports_predictions_filtering(request=request):
+        return {}
+    class_filters = [call.request.class_filter for call in calls]
+    merged_class_filter = None
+    if all(class_filters):
+        merged_class_filter = list(
+            dict.fromkeys(class_name for f in class_filters for class_name in f)
+        )
+    confidences = [call.request.confidence for call in calls]
+    merged_confidence = None
+    if all(confidence is not None for confidence in confidences):
+        merged_confidence = min(confidences)
+    return {"confidence": merged_confidence, "class_filter": merged_class_filter}
+
+
+def _filter_predictions(
+    response: InferenceResponse, request: InferenceRequest
+) -> InferenceResponse:
+    update = {"inference_id": request.id}
+    if _supports_predictions_filtering(request=request):
+        update["predictions"] = [
+            prediction
+            for prediction in response.predictions
+            if (
+                request.confidence is None
+                or prediction.confidence >= request.confidence
+            )
+            and (
+                not request.class_filter
+                or prediction.class_name in request.class_filter
+            )
+        ]
+    return response.model_copy(update=update)
+
+
+def _as_list(value: Any) -> list:
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _get_image_identity(image: Any) -> Tuple[str, int]:
+    value = getattr(image, "value", image)
+    if value is None:
+        return "object", id(image)
+    return "value", id(value)
@@ -9,3 +9,7 @@ class ModelDescription:
     batch_size: Optional[int]
     input_height: Optional[int]
     input_width: Optional[int]
+    shared_memory_bytes: Optional[int] = None
+    private_memory_bytes: Optional[int] = None
+    weights_variant: Optional[str] = None
+    quantization_speedup: Optional[float] = None
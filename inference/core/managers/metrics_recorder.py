@@ -0,0 +1,260 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Condition, Thread
+from typing import Any, Deque, List, Optional, Tuple, Union
+
+from fastapi.encoders import jsonable_encoder
+
+from inference.core.cache import cache
+from inference.core.cache.base import BaseCache
+from inference.core.cache.serializers import to_cachable_inference_item
+from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
+from inference.core.entities.requests.inference import InferenceRequest
+from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import (
+    INFERENCE_METRICS_FLUSH_BATCH_SIZE,
+    INFERENCE_METRICS_FLUSH_INTERVAL,
+    INFERENCE_METRICS_MAX_PENDING_RECORDS,
+    INFERENCE_METRICS_WRITE_BEHIND,
+    METRICS_INTERVAL,
+    TINY_CACHE,
+)
+from inference.core.logger import logger
+
+CacheItem = Tuple[str, Any, float, Optional[float]]
+
+# fields of requests which may carry images - they do not land in cache entries of
+# errors (and of results, when TINY_CACHE is enabled)
+IMAGE_REQUEST_FIELDS = {"image", "subject", "prompt"}
+
+
+@dataclass(frozen=True)
+class InferenceMetricsRecord:
+    model_id: str
+    request: InferenceRequest
+    finish_time: float
+    response: Optional[Union[InferenceResponse, List[InferenceResponse]]] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class InferenceMetricsRecorderReport:
+    pending_records: int
+    max_pending_records: int
+    recorded_records: int
+    flushed_records: int
+    dropped_records: int
+    failed_records: int
+
+
+class InferenceMetricsRecorder:
+    """Records results of inferences (used by pingback and `get_model_metrics(...)`) in cache.
+
+    In write-behind mode, `record_*(...)` methods only put lightweight record (shallow copy
+    of request, stripped of images not needed by cache entries, and reference to the
+    response) into bounded in-memory buffer - encoding of records and
+    writes to the cache are performed by background thread, in batches (pipelined when
+    cache supports that). When the buffer is full, the oldest pending record is dropped.
+    Without write-behind, records are written to the cache by the calling thread.
+    """
+
+    def __init__(
+        self,
+        cache: BaseCache,
+        write_behind: bool = INFERENCE_METRICS_WRITE_BEHIND,
+        max_pending_records: int = INFERENCE_METRICS_MAX_PENDING_RECORDS,
+        flush_interval: float = INFERENCE_METRICS_FLUSH_INTERVAL,
+        flush_batch_size: int = INFERENCE_METRICS_FLUSH_BATCH_SIZE,
+    ):
+        self._cache = cache
+        self._write_behind = write_behind
+        self._max_pending_records = max(max_pending_records, 1)
+        self._flush_interval = flush_interval
+        self._flush_batch_size = max(flush_batch_size, 1)
+        self._pending_records: Deque[InferenceMetricsRecord] = deque(
+            maxlen=self._max_pending_records
+        )
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+        self._records_in_flush = 0
+        self._flush_requested = False
+        self._recorded_records = 0
+        self._flushed_records = 0
+        self._dropped_records = 0
+        self._failed_records = 0
+
+    def record_inference(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        response: Union[InferenceResponse, List[InferenceResponse]],
+        finish_time: Optional[float] = None,
+    ) -> None:
+        self._record(
+            InferenceMetricsRecord(
+                model_id=model_id,
+                request=_detach_request(request=request, keep_images=not TINY_CACHE),
+                response=response,
+                finish_time=finish_time or time.time(),
+            )
+        )
+
+    def record_error(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        error: Exception,
+        finish_time: Optional[float] = None,
+    ) -> None:
+        self._record(
+            InferenceMetricsRecord(
+                model_id=model_id,
+                request=_detach_request(request=request, keep_images=False),
+                error=str(error),
+                finish_time=finish_time or time.time(),
+            )
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until records pending at the time of call are written to the cache."""
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: not self._pending_records and not self._records_in_flush,
+                timeout=timeout,
+            )
+
+    def describe(self) -> InferenceMetricsRecorderReport:
+        with self._condition:
+            return InferenceMetricsRecorderReport(
+                pending_records=len(self._pending_records),
+                max_pending_records=self._max_pending_records,
+                recorded_records=self._recorded_records,
+                flushed_records=self._flushed_records,
+                dropped_records=self._dropped_records,
+                failed_records=self._failed_records,
+            )
+
+    def _record(self, record: InferenceMetricsRecord) -> None:
+        if not self._write_behind:
+            with self._condition:
+                self._recorded_records += 1
+            self._write_records(records=[record])
+            return None
+        with self._condition:
+            self._recorded_records += 1
+            if len(self._pending_records) == self._max_pending_records:
+                self._dropped_records += 1
+            self._pending_records.append(record)
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+            if len(self._pending_records) >= self._flush_batch_size:
+                self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._flush_requested
+                    or len(self._pending_records) >= self._flush_batch_size,
+                    timeout=self._flush_interval,
+                )
+                batch_size = min(len(self._pending_records), self._flush_batch_size)
+                records = [self._pending_records.popleft() for _ in range(batch_size)]
+                if not self._pending_records:
+                    self._flush_requested = False
+                self._records_in_flush = len(records)
+            if records:
+                self._write_records(records=records)
+            with self._condition:
+                self._records_in_flush = 0
+                self._condition.notify_all()
+
+    def _write_records(self, records: List[InferenceMetricsRecord]) -> None:
+        try:
+            items = prepare_cache_items(records=records)
+            self._cache.zadd_many(items=items)
+            with self._condition:
+                self._flushed_records += len(records)
+        except Exception as error:
+            logger.warning(f"Could not save inference metrics in cache: {error}")
+            with self._condition:
+                self._failed_records += len(records)
+
+
+def prepare_cache_items(records: List[InferenceMetricsRecord]) -> List[CacheItem]:
+    """
+    Converts records into entries of cache sorted sets. Each record registers its model
+    in `models` set (only the latest usage of the model matters, so those entries are
+    deduplicated within the batch) and result of inference (or error) in model-specific set.
+    """
+    expire = METRICS_INTERVAL * 2
+    latest_models_usage = {}
+    results_items = []
+    for record in records:
+        model_entry = (
+            f"{GLOBAL_INFERENCE_SERVER_ID}:{record.request.api_key}:{record.model_id}"
+        )
+        latest_models_usage[model_entry] = max(
+            record.finish_time, latest_models_usage.get(model_entry, record.finish_time)
+        )
+        if record.error is None:
+            results_items.append(
+                (
+                    f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{record.model_id}",
+                    to_cachable_inference_item(record.request, record.response),
+                    record.finish_time,
+                    expire,
+                )
+            )
+        else:
+            results_items.append(
+                (
+                    f"error:{GLOBAL_INFERENCE_SERVER_ID}:{record.model_id}",
+                    {
+                        "request": jsonable_encoder(
+                            record.request.dict(exclude={"image", "subject", "prompt"})
+                        ),
+                        "error": record.error,
+                    },
+                    record.finish_time,
+                    expire,
+                )
+            )
+    models_items = [
+        ("models", model_entry, finish_time, expire)
+        for model_entry, finish_time in latest_models_usage.items()
+    ]
+    return models_items + results_items
+
+
+def _detach_request(request: InferenceRequest, keep_images: bool) -> InferenceRequest:
+    # records wait for the flush in memory, so they must not keep alive images which
+    # would be dropped while building cache entries anyway
+    if keep_images:
+        return _with_serialisable_image(request)
+    images = {
+        field: None
+        for field in IMAGE_REQUEST_FIELDS
+        if getattr(request, field, None) is not None
+    }
+    if not images:
+        return request
+    # request is not modified in place, as it is still owned by the caller
+    return request.copy(update=images)
+
+
+def _with_serialisable_image(request: InferenceRequest) -> InferenceRequest:
+    image = getattr(request, "image", None)
+    if getattr(image, "type", None) != "numpy":
+        return request
+    # request is not modified in place, as it is still owned by the caller
+    return request.copy(
+        update={"image": image.copy(update={"value": str(image.value)})}
+    )
+
+
+inference_metrics_recorder = InferenceMetricsRecorder(cache=cache)
@@ -2,6 +2,7 @@ import re
 import time
 from typing import Callable
 
+from prometheus_client import Histogram
 from prometheus_client.core import REGISTRY, CounterMetricFamily, GaugeMetricFamily
 from prometheus_client.registry import Collector
 from prometheus_fastapi_instrumentator import Instrumentator
@@ -9,6 +10,25 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.logger import logger
 from inference.core.managers.metrics import get_model_metrics
+from inference.core.utils.stage_timing import RequestStageTimer
+
+STAGE_DURATION_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+UNKNOWN_TASK_TYPE = "unknown"
 
 
 class InferenceInstrumentator:
@@ -24,6 +44,30 @@ class InferenceInstrumentator:
         self.instrumentator.instrument(app).expose(app, endpoint)
         self.collector = CustomCollector(model_manager)
         REGISTRY.register(self.collector)
+        self.stage_durations = Histogram(
+            "inference_stage_duration_seconds",
+            "Duration of stages of inference requests (excluding nested stages)",
+            labelnames=("model_id", "task_type", "stage"),
+            buckets=STAGE_DURATION_BUCKETS,
+            registry=REGISTRY,
+        )
+
+    def observe_stage_durations(self, stage_timer: RequestStageTimer) -> None:
+        observe_stage_durations(histogram=self.stage_durations, stage_timer=stage_timer)
+
+
+def observe_stage_durations(
+    histogram: Histogram, stage_timer: RequestStageTimer
+) -> None:
+    # requests not hitting any model (health checks, workflows builder, etc.) are skipped
+    if stage_timer.model_id is None:
+        return None
+    for stage, duration in stage_timer.durations.items():
+        histogram.labels(
+            model_id=stage_timer.model_id,
+            task_type=stage_timer.task_type or UNKNOWN_TASK_TYPE,
+            stage=stage,
+        ).observe(duration)
 
 
 class CustomCollector(Collector):
@@ -7,6 +7,14 @@ from inference.core import logger
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.utils.stage_timing import (
+    POSTPROCESS_STAGE,
+    PREDICT_STAGE,
+    PREPROCESS_STAGE,
+    QUEUE_WAIT_STAGE,
+    get_active_stage_timer,
+    measure_stage,
+)
 from inference.usage_tracking.collector import usage_collector
 
 
@@ -22,12 +30,20 @@ class BaseInference:
         - image:
             can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
         """
-        preproc_image, returned_metadata = self.preprocess(image, **kwargs)
+        stage_timer = get_active_stage_timer()
+        if stage_timer is not None:
+            stage_timer.record_since_mark(name=QUEUE_WAIT_STAGE)
+        with measure_stage(name=PREPROCESS_STAGE):
+            preproc_image, returned_metadata = self.preprocess(image, **kwargs)
         logger.debug(
             f"Preprocessed input shape: {getattr(preproc_image, 'shape', None)}"
         )
-        predicted_arrays = self.predict(preproc_image, **kwargs)
-        postprocessed = self.postprocess(predicted_arrays, returned_metadata, **kwargs)
+        with measure_stage(name=PREDICT_STAGE):
+            predicted_arrays = self.predict(preproc_image, **kwargs)
+        with measure_stage(name=POSTPROCESS_STAGE):
+            postprocessed = self.postprocess(
+                predicted_arrays, returned_metadata, **kwargs
+            )
 
         return postprocessed
 
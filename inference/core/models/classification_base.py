@@ -18,6 +18,7 @@ from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
 from inference.core.utils.image_utils import load_image_rgb
+from inference.core.utils.stage_timing import RESPONSE_BUILDING_STAGE, measure_stage
 
 
 class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
@@ -173,9 +174,10 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         **kwargs,
     ) -> Union[ClassificationInferenceResponse, List[ClassificationInferenceResponse]]:
         predictions = predictions[0]
-        return self.make_response(
-            predictions, preprocess_return_metadata["img_dims"], **kwargs
-        )
+        with measure_stage(name=RESPONSE_BUILDING_STAGE):
+            return self.make_response(
+                predictions, preprocess_return_metadata["img_dims"], **kwargs
+            )
 
     def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray]:
         predictions = self.onnx_session.run(None, {self.input_name: img_in})
@@ -23,6 +23,11 @@ from inference.core.utils.postprocess import (
     process_mask_fast,
     process_mask_tradeoff,
 )
+from inference.core.utils.stage_timing import (
+    NMS_STAGE,
+    RESPONSE_BUILDING_STAGE,
+    measure_stage,
+)
 
 DEFAULT_CONFIDENCE = 0.4
 DEFAULT_IOU_THRESH = 0.3
@@ -120,15 +125,16 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
         List[InstanceSegmentationInferenceResponse],
     ]:
         predictions, protos = predictions
-        predictions = w_np_non_max_suppression(
-            predictions,
-            conf_thresh=kwargs["confidence"],
-            iou_thresh=kwargs["iou_threshold"],
-            class_agnostic=kwargs["class_agnostic_nms"],
-            max_detections=kwargs["max_detections"],
-            max_candidate_detections=kwargs["max_candidates"],
-            num_masks=self.num_masks,
-        )
+        with measure_stage(name=NMS_STAGE):
+            predictions = w_np_non_max_suppression(
+                predictions,
+                conf_thresh=kwargs["confidence"],
+                iou_thresh=kwargs["iou_threshold"],
+                class_agnostic=kwargs["class_agnostic_nms"],
+                max_detections=kwargs["max_detections"],
+                max_candidate_detections=kwargs["max_candidates"],
+                num_masks=self.num_masks,
+            )
         infer_shape = (self.img_size_h, self.img_size_w)
         masks = []
         mask_decode_mode = kwargs["mask_decode_mode"]
@@ -189,9 +195,10 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
                 resize_method=self.resize_method,
             )
             masks.append(polys)
-        return self.make_response(
-            predictions, masks, preprocess_return_metadata["img_dims"], **kwargs
-        )
+        with measure_stage(name=RESPONSE_BUILDING_STAGE):
+            return self.make_response(
+                predictions, masks, preprocess_return_metadata["img_dims"], **kwargs
+            )
 
     def preprocess(
         self, image: Any, **kwargs
@@ -19,6 +19,11 @@ from inference.core.models.utils.validate import (
 )
 from inference.core.nms import w_np_non_max_suppression
 from inference.core.utils.postprocess import post_process_bboxes, post_process_keypoints
+from inference.core.utils.stage_timing import (
+    NMS_STAGE,
+    RESPONSE_BUILDING_STAGE,
+    measure_stage,
+)
 
 DEFAULT_CONFIDENCE = 0.4
 DEFAULT_IOU_THRESH = 0.3
@@ -74,15 +79,16 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
         predictions = predictions[0]
         number_of_classes = len(self.get_class_names)
         num_masks = predictions.shape[2] - 5 - number_of_classes
-        predictions = w_np_non_max_suppression(
-            predictions,
-            conf_thresh=confidence,
-            iou_thresh=iou_threshold,
-            class_agnostic=class_agnostic_nms,
-            max_detections=max_detections,
-            max_candidate_detections=max_candidates,
-            num_masks=num_masks,
-        )
+        with measure_stage(name=NMS_STAGE):
+            predictions = w_np_non_max_suppression(
+                predictions,
+                conf_thresh=confidence,
+                iou_thresh=iou_threshold,
+                class_agnostic=class_agnostic_nms,
+                max_detections=max_detections,
+                max_candidate_detections=max_candidates,
+                num_masks=num_masks,
+            )
 
         infer_shape = (self.img_size_h, self.img_size_w)
         img_dims = preproc_return_metadata["img_dims"]
@@ -107,7 +113,8 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
                 "disable_preproc_static_crop"
             ],
         )
-        return self.make_response(predictions, img_dims, **kwargs)
+        with measure_stage(name=RESPONSE_BUILDING_STAGE):
+            return self.make_response(predictions, img_dims, **kwargs)
 
     def make_response(
         self,
@@ -23,6 +23,11 @@ from inference.core.models.utils.validate import (
 )
 from inference.core.nms import w_np_non_max_suppression
 from inference.core.utils.postprocess import post_process_bboxes
+from inference.core.utils.stage_timing import (
+    NMS_STAGE,
+    RESPONSE_BUILDING_STAGE,
+    measure_stage,
+)
 
 
 class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
@@ -168,15 +173,16 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
             List[ObjectDetectionInferenceResponse]: The post-processed predictions.
         """
         predictions = predictions[0]
-        predictions = w_np_non_max_suppression(
-            predictions,
-            conf_thresh=confidence,
-            iou_thresh=iou_threshold,
-            class_agnostic=class_agnostic_nms,
-            max_detections=max_detections,
-            max_candidate_detections=max_candidates,
-            box_format=self.box_format,
-        )
+        with measure_stage(name=NMS_STAGE):
+            predictions = w_np_non_max_suppression(
+                predictions,
+                conf_thresh=confidence,
+                iou_thresh=iou_threshold,
+                class_agnostic=class_agnostic_nms,
+                max_detections=max_detections,
+                max_candidate_detections=max_candidates,
+                box_format=self.box_format,
+            )
 
         infer_shape = (self.img_size_h, self.img_size_w)
         img_dims = preproc_return_metadata["img_dims"]
@@ -190,7 +196,8 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
                 "disable_preproc_static_crop"
             ],
         )
-        return self.make_response(predictions, img_dims, **kwargs)
+        with measure_stage(name=RESPONSE_BUILDING_STAGE):
+            return self.make_response(predictions, img_dims, **kwargs)
 
     def preprocess(
         self,
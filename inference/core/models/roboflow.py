@@ -1,11 +1,22 @@
 import itertools
 import json
 import os
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from threading import Lock, Thread
 from time import perf_counter
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import cv2
 import numpy as np
@@ -42,15 +53,49 @@ from inference.core.env import (
     MAX_BATCH_SIZE,
     MODEL_CACHE_DIR,
     MODEL_VALIDATION_DISABLED,
+    ONNXRUNTIME_DISABLE_PREPACKING,
     ONNXRUNTIME_EXECUTION_PROVIDERS,
+    ONNXRUNTIME_MMAP_WEIGHTS,
+    ONNXRUNTIME_QUANTIZATION,
+    ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR,
+    ONNXRUNTIME_QUANTIZATION_CALIBRATION_SAMPLES,
+    ONNXRUNTIME_QUANTIZATION_MAX_OUTPUT_DRIFT,
+    ONNXRUNTIME_SESSION_PROFILE,
     REQUIRED_ONNX_PROVIDERS,
     TENSORRT_CACHE_PATH,
 )
 from inference.core.exceptions import ModelArtefactError, OnnxProviderNotAvailable
 from inference.core.logger import logger
 from inference.core.models.base import Model
+from inference.core.models.types import ModelMemoryUsage, QuantizationReport
 from inference.core.models.utils.batching import create_batches
 from inference.core.models.utils.onnx import has_trt
+from inference.core.models.utils.onnx_quantization import (
+    FP32_WEIGHTS_VARIANT,
+    QUANTIZATION_MODES,
+    QUANTIZATION_REPORT_FILE,
+    calibrate_and_quantize,
+    get_quantized_weights_file,
+    get_weights_variant_name,
+    load_calibration_images,
+    load_quantization_report,
+    runs_on_cpu_only,
+    save_quantization_report,
+)
+from inference.core.models.utils.onnx_session import (
+    SESSION_PROFILE_FILE,
+    OnnxSessionProfile,
+    SessionProfileBenchmarkResult,
+    apply_session_profile,
+    benchmark_session_profiles,
+    get_session_profiles,
+    resolve_session_profile,
+    save_session_profile,
+)
+from inference.core.models.utils.onnx_weights import (
+    MemoryMappedWeights,
+    get_private_memory_bytes,
+)
 from inference.core.roboflow_api import (
     ModelEndpointType,
     get_from_url,
@@ -59,6 +104,7 @@ from inference.core.roboflow_api import (
 from inference.core.utils.image_utils import load_image
 from inference.core.utils.onnx import get_onnxruntime_execution_providers
 from inference.core.utils.preprocess import letterbox_image, prepare
+from inference.core.utils.stage_timing import IMAGE_DECODING_STAGE, measure_stage
 from inference.core.utils.visualisation import draw_detection_predictions
 from inference.models.aliases import resolve_roboflow_model_alias
 from inference.hailo.infer.hailort import HailoRTInference
@@ -385,12 +431,41 @@ class RoboflowInferenceModel(Model):
         Returns:
             Tuple[np.ndarray, Tuple[int, int]]: A tuple containing a numpy array of the preprocessed image pixel data and a tuple of the images original size.
         """
-        np_image, is_bgr = load_image(
+        resized, img_dims = self.resize_image_for_inference(
             image,
-            disable_preproc_auto_orient=disable_preproc_auto_orient
-            or "auto-orient" not in self.preproc.keys()
-            or DISABLE_PREPROC_AUTO_ORIENT,
+            disable_preproc_auto_orient=disable_preproc_auto_orient,
+            disable_preproc_contrast=disable_preproc_contrast,
+            disable_preproc_grayscale=disable_preproc_grayscale,
+            disable_preproc_static_crop=disable_preproc_static_crop,
         )
+        img_in = np.transpose(resized, (2, 0, 1))
+        img_in = img_in.astype(np.float32)
+        img_in = np.expand_dims(img_in, axis=0)
+
+        return img_in, img_dims
+
+    def resize_image_for_inference(
+        self,
+        image: Union[Any, InferenceRequestImage],
+        disable_preproc_auto_orient: bool = False,
+        disable_preproc_contrast: bool = False,
+        disable_preproc_grayscale: bool = False,
+        disable_preproc_static_crop: bool = False,
+    ) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        Loads the image, applies Roboflow platform pre-processing and scales it to the inference input
+        dimensions - without converting it into input tensor.
+
+        Returns:
+            Tuple[np.ndarray, Tuple[int, int]]: RGB image in HWC layout and a tuple of the images original size.
+        """
+        with measure_stage(name=IMAGE_DECODING_STAGE):
+            np_image, is_bgr = load_image(
+                image,
+                disable_preproc_auto_orient=disable_preproc_auto_orient
+                or "auto-orient" not in self.preproc.keys()
+                or DISABLE_PREPROC_AUTO_ORIENT,
+            )
         preprocessed_image, img_dims = self.preprocess_image(
             np_image,
             disable_preproc_contrast=disable_preproc_contrast,
@@ -421,11 +496,7 @@ class RoboflowInferenceModel(Model):
 
         if is_bgr:
             resized = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
-        img_in = np.transpose(resized, (2, 0, 1))
-        img_in = img_in.astype(np.float32)
-        img_in = np.expand_dims(img_in, axis=0)
-
-        return img_in, img_dims
+        return resized, img_dims
 
     def preprocess_image(
         self,
@@ -572,6 +643,22 @@ class RoboflowCoreModel(RoboflowInferenceModel):
         return CORE_MODEL_BUCKET
 
 
+def _estimate_memory_usage(
+    mapped_weights: Optional[MemoryMappedWeights],
+    private_memory_before_load: Optional[int],
+) -> ModelMemoryUsage:
+    # private memory is measured for the whole process, so loads happening concurrently
+    # in other threads inflate the estimate
+    private_bytes = None
+    private_memory_after_load = get_private_memory_bytes()
+    if private_memory_before_load is not None and private_memory_after_load is not None:
+        private_bytes = max(private_memory_after_load - private_memory_before_load, 0)
+    return ModelMemoryUsage(
+        shared_bytes=mapped_weights.size if mapped_weights is not None else 0,
+        private_bytes=private_bytes,
+    )
+
+
 class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
     """Roboflow Inference Model that operates using an ONNX model file."""
 
@@ -611,6 +698,15 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             self.onnxruntime_execution_providers = expanded_execution_providers
 
         self.hailoProvider = get_optimal_providen()
+        self.memory_usage: Optional[ModelMemoryUsage] = None
+        self.weights_variant = FP32_WEIGHTS_VARIANT
+        self.quantization_report: Optional[QuantizationReport] = None
+        self._mapped_weights: Dict[str, MemoryMappedWeights] = {}
+        self._calibration_images: Deque[Any] = deque(
+            maxlen=max(ONNXRUNTIME_QUANTIZATION_CALIBRATION_SAMPLES, 1)
+        )
+        self._quantization_lock = Lock()
+        self._quantization_pending = False
         self.initialize_model()
         self.image_loader_threadpool = ThreadPoolExecutor(max_workers=None)
         try:
@@ -619,12 +715,23 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
             logger.error(f"Unable to validate model artifacts, clearing cache: {e}")
             self.clear_cache()
             raise ModelArtefactError from e
+        if self._quantization_pending and ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR:
+            # images are loaded by quantization thread, not to delay the model load
+            self._start_quantization(
+                images_loader=partial(
+                    load_calibration_images,
+                    directory=ONNXRUNTIME_QUANTIZATION_CALIBRATION_DIR,
+                    max_images=ONNXRUNTIME_QUANTIZATION_CALIBRATION_SAMPLES,
+                )
+            )
 
     def infer(self, image: Any, **kwargs) -> Any:
         """Runs inference on given data.
         - image:
             can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
         """
+        if self._quantization_pending:
+            self._collect_calibration_images(image=image)
         input_elements = len(image) if isinstance(image, list) else 1
         max_batch_size = MAX_BATCH_SIZE if self.batching_enabled else self.batch_size
         if (input_elements == 1) or (max_batch_size == float("inf")):
@@ -705,6 +812,10 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
 
             if not self.load_weights:
                 providers = ["OpenVINOExecutionProvider", "CPUExecutionProvider"]
+            session_profile = resolve_session_profile(
+                profile_name=ONNXRUNTIME_SESSION_PROFILE,
+                tuned_profile_path=self.cache_file(SESSION_PROFILE_FILE),
+            )
             try:
                 if self.hailoProvider:
                     # convert onnx to hailort
@@ -713,16 +824,16 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                         arch=self.hailoProvider,
                     )
                 else:
-                    session_options = onnxruntime.SessionOptions()
-                    # TensorRT does better graph optimization for its EP than onnx
-                    if has_trt(providers):
-                        session_options.graph_optimization_level = (
-                            onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
-                        )
-                    self.onnx_session = onnxruntime.InferenceSession(
-                        self.cache_file(self.weights_file),
+                    weights_path = self._select_weights_variant(providers=providers)
+                    private_memory_before_load = get_private_memory_bytes()
+                    self.onnx_session = self._create_onnx_session(
                         providers=providers,
-                        sess_options=session_options,
+                        session_profile=session_profile,
+                        weights_path=weights_path,
+                    )
+                    self.memory_usage = _estimate_memory_usage(
+                        mapped_weights=self._mapped_weights.get(weights_path),
+                        private_memory_before_load=private_memory_before_load,
                     )
             except Exception as e:
                 self.clear_cache()
@@ -798,6 +909,183 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                 )
         logger.debug("Model initialisation finished.")
 
+    def _create_onnx_session(
+        self,
+        providers: List[Union[str, Tuple[str, Dict[str, Any]]]],
+        session_profile: OnnxSessionProfile,
+        weights_path: Optional[str] = None,
+    ) -> onnxruntime.InferenceSession:
+        weights_path = weights_path or self.cache_file(self.weights_file)
+        session_options = onnxruntime.SessionOptions()
+        apply_session_profile(session_options=session_options, profile=session_profile)
+        # TensorRT does better graph optimization for its EP than onnx
+        if has_trt(providers):
+            session_options.graph_optimization_level = (
+                onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+            )
+        elif ONNXRUNTIME_MMAP_WEIGHTS:
+            # mapping must outlive all sessions created from it
+            if weights_path not in self._mapped_weights:
+                self._mapped_weights[weights_path] = MemoryMappedWeights.load(
+                    weights_path=weights_path
+                )
+            self._mapped_weights[weights_path].register_in(session_options)
+        if ONNXRUNTIME_DISABLE_PREPACKING:
+            session_options.add_session_config_entry("session.disable_prepacking", "1")
+        return onnxruntime.InferenceSession(
+            weights_path,
+            providers=providers,
+            sess_options=session_options,
+        )
+
+    def _select_weights_variant(
+        self, providers: List[Union[str, Tuple[str, Dict[str, Any]]]]
+    ) -> str:
+        # quantized variant is selected if it was accepted during previous loads - if
+        # the model was not quantized yet, quantization starts once calibration
+        # images are gathered
+        weights_path = self.cache_file(self.weights_file)
+        if (
+            ONNXRUNTIME_QUANTIZATION not in QUANTIZATION_MODES
+            or not self.load_weights
+            or not runs_on_cpu_only(providers=providers)
+        ):
+            return weights_path
+        report = load_quantization_report(
+            path=self.cache_file(QUANTIZATION_REPORT_FILE)
+        )
+        if report is None or report.mode != ONNXRUNTIME_QUANTIZATION:
+            self._quantization_pending = True
+            return weights_path
+        self.quantization_report = report
+        quantized_weights_path = self.cache_file(report.weights_file)
+        if not report.accepted or not os.path.isfile(quantized_weights_path):
+            return weights_path
+        self.weights_variant = get_weights_variant_name(mode=report.mode)
+        return quantized_weights_path
+
+    def _collect_calibration_images(self, image: Any) -> None:
+        images = image if isinstance(image, list) else [image]
+        with self._quantization_lock:
+            if not self._quantization_pending:
+                return None
+            self._calibration_images.extend(images)
+            if len(self._calibration_images) < self._calibration_images.maxlen:
+                return None
+            calibration_images = list(self._calibration_images)
+            self._calibration_images.clear()
+        self._start_quantization(images_loader=lambda: calibration_images)
+
+    def _start_quantization(self, images_loader: Callable[[], List[Any]]) -> None:
+        with self._quantization_lock:
+            if not self._quantization_pending:
+                return None
+            self._quantization_pending = False
+        Thread(target=self._quantize, args=(images_loader,), daemon=True).start()
+
+    def _quantize(self, images_loader: Callable[[], List[Any]]) -> None:
+        try:
+            images = images_loader()
+            if not images:
+                # falling back to calibration on images of requests
+                with self._quantization_lock:
+                    self._quantization_pending = True
+                return None
+            calibration_inputs = [
+                {self.input_name: self.preprocess(image)[0]} for image in images
+            ]
+            mode = ONNXRUNTIME_QUANTIZATION
+            session_profile = resolve_session_profile(
+                profile_name=ONNXRUNTIME_SESSION_PROFILE,
+                tuned_profile_path=self.cache_file(SESSION_PROFILE_FILE),
+            )
+            report = calibrate_and_quantize(
+                weights_path=self.cache_file(self.weights_file),
+                quantized_weights_path=self.cache_file(
+                    get_quantized_weights_file(mode=mode)
+                ),
+                mode=mode,
+                calibration_inputs=calibration_inputs,
+                max_output_drift=ONNXRUNTIME_QUANTIZATION_MAX_OUTPUT_DRIFT,
+                create_session=lambda weights_path: self._create_onnx_session(
+                    providers=self.onnxruntime_execution_providers,
+                    session_profile=session_profile,
+                    weights_path=weights_path,
+                ),
+            )
+            save_quantization_report(
+                path=self.cache_file(QUANTIZATION_REPORT_FILE), report=report
+            )
+            self.quantization_report = report
+            logger.info(
+                f"Quantization of model {self.endpoint} finished - variant accepted: "
+                f"{report.accepted}, output drift: {report.output_drift:.4f}, "
+                f"speedup: {report.speedup:.2f}"
+            )
+            if report.accepted:
+                self.onnx_session = self._create_onnx_session(
+                    providers=self.onnxruntime_execution_providers,
+                    session_profile=session_profile,
+                    weights_path=self.cache_file(report.weights_file),
+                )
+                self.weights_variant = get_weights_variant_name(mode=mode)
+        except Exception as error:
+            logger.warning(f"Quantization of model {self.endpoint} failed: {error}")
+
+    def tune_session_profile(
+        self,
+        concurrency: int = 1,
+        warm_up_runs: int = 5,
+        benchmark_runs: int = 50,
+        profiles: Optional[List[OnnxSessionProfile]] = None,
+    ) -> List[SessionProfileBenchmarkResult]:
+        """Benchmarks session profiles for the model on the host and saves the best one in
+        model cache - to be used when `ONNXRUNTIME_SESSION_PROFILE=auto`.
+
+        Args:
+            concurrency (int): Number of inferences running at the same time during benchmark.
+            warm_up_runs (int): Number of session runs before measurements.
+            benchmark_runs (int): Number of measured session runs for each profile.
+            profiles (Optional[List[OnnxSessionProfile]]): Profiles to compare - all predefined if not given.
+
+        Returns:
+            List[SessionProfileBenchmarkResult]: Results sorted from the best profile.
+        """
+        if self.hailoProvider or not self.load_weights:
+            raise ModelArtefactError(
+                "Session profiles can only be tuned for models loaded with onnxruntime."
+            )
+        session_input = self.onnx_session.get_inputs()[0]
+        input_shape = [
+            dim if isinstance(dim, int) else default
+            for dim, default in zip(
+                session_input.shape, [1, 3, self.img_size_h, self.img_size_w]
+            )
+        ]
+        input_type = (
+            np.float16 if session_input.type == "tensor(float16)" else np.float32
+        )
+        input_feed = {
+            session_input.name: np.random.rand(*input_shape).astype(input_type)
+        }
+        results = benchmark_session_profiles(
+            create_session=lambda profile: self._create_onnx_session(
+                providers=self.onnxruntime_execution_providers,
+                session_profile=profile,
+            ),
+            input_feed=input_feed,
+            profiles=profiles or get_session_profiles(),
+            warm_up_runs=warm_up_runs,
+            benchmark_runs=benchmark_runs,
+            concurrency=concurrency,
+        )
+        save_session_profile(
+            path=self.cache_file(SESSION_PROFILE_FILE),
+            profile=results[0].profile,
+            results=results,
+        )
+        return results
+
     def load_image(
         self,
         image: Any,
@@ -807,16 +1095,18 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
         disable_preproc_static_crop: bool = False,
     ) -> Tuple[np.ndarray, Tuple[int, int]]:
         if isinstance(image, list):
-            preproc_image = partial(
-                self.preproc_image,
+            resize_image_for_inference = partial(
+                self.resize_image_for_inference,
                 disable_preproc_auto_orient=disable_preproc_auto_orient,
                 disable_preproc_contrast=disable_preproc_contrast,
                 disable_preproc_grayscale=disable_preproc_grayscale,
                 disable_preproc_static_crop=disable_preproc_static_crop,
             )
-            imgs_with_dims = self.image_loader_threadpool.map(preproc_image, image)
+            imgs_with_dims = self.image_loader_threadpool.map(
+                resize_image_for_inference, image
+            )
             imgs, img_dims = zip(*imgs_with_dims)
-            img_in = np.concatenate(imgs, axis=0)
+            img_in = pack_images_into_batch(images=imgs)
         else:
             img_in, img_dims = self.preproc_image(
                 image,
@@ -898,3 +1188,15 @@ def parse_keypoints_metadata(metadata: list) -> dict:
         e["object_class_id"]: {int(key): value for key, value in e["keypoints"].items()}
         for e in metadata
     }
+
+
+def pack_images_into_batch(images: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Writes HWC images directly into single NCHW float32 tensor - avoiding
+    intermediate per-image tensors and their concatenation.
+    """
+    height, width, channels = images[0].shape
+    batch = np.empty((len(images), channels, height, width), dtype=np.float32)
+    for image, destination in zip(images, batch):
+        np.copyto(destination, np.transpose(image, (2, 0, 1)), casting="unsafe")
+    return batch
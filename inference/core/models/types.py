@@ -1,3 +1,28 @@
-from typing import Dict, NewType
+from dataclasses import dataclass
+from typing import Dict, NewType, Optional
 
 PreprocessReturnMetadata = NewType("PreprocessReturnMetadata", Dict)
+
+
+@dataclass(frozen=True)
+class ModelMemoryUsage:
+    shared_bytes: int
+    private_bytes: Optional[int]
+
+
+@dataclass(frozen=True)
+class QuantizationReport:
+    mode: str
+    weights_file: str
+    calibration_samples: int
+    output_drift: float
+    max_output_drift: float
+    reference_latency: float
+    quantized_latency: float
+    accepted: bool
+
+    @property
+    def speedup(self) -> float:
+        if self.quantized_latency <= 0:
+            return 0.0
+        return self.reference_latency / self.quantized_latency
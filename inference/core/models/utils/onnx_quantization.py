@@ -0,0 +1,237 @@
+"""
+Quantization of ONNX models for CPU execution.
+
+INT8 variant of model weights is created with `onnxruntime.quantization` (requires `onnx`
+package - `pip install inference[quantization]`) - either dynamically (weights only) or
+statically (weights and activations, calibrated on sample of model inputs). Variant is
+accepted only when its outputs do not drift from FP32 outputs more than allowed and when
+it is actually faster on the host. Decision is saved in model cache, such that next loads
+of the model select the variant without repeating calibration.
+
+FP16 variant is not created - CPU kernels of `onnxruntime` mostly cast FP16 tensors back
+to FP32, so such variant would not be faster on CPU, while GPU sessions running with
+TensorRT already execute in FP16 (`trt_fp16_enable`).
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+import cv2
+import numpy as np
+import onnxruntime
+
+from inference.core.exceptions import ModelArtefactError
+from inference.core.logger import logger
+from inference.core.models.types import QuantizationReport
+
+DYNAMIC_QUANTIZATION = "dynamic"
+STATIC_QUANTIZATION = "static"
+QUANTIZATION_MODES = {DYNAMIC_QUANTIZATION, STATIC_QUANTIZATION}
+QUANTIZATION_REPORT_FILE = "quantization.json"
+FP32_WEIGHTS_VARIANT = "fp32"
+CALIBRATION_IMAGES_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+CPU_EXECUTION_PROVIDERS = {"CPUExecutionProvider", "OpenVINOExecutionProvider"}
+DRIFT_EPSILON = 1e-6
+
+ModelInputs = Dict[str, np.ndarray]
+
+
+def get_quantized_weights_file(mode: str) -> str:
+    return f"weights.{mode}.int8.onnx"
+
+
+def get_weights_variant_name(mode: str) -> str:
+    return f"{mode}-int8"
+
+
+def load_calibration_images(directory: str, max_images: int) -> List[np.ndarray]:
+    """Loads most recent images from directory (e.g. where images are saved by sinks)."""
+    if not os.path.isdir(directory):
+        logger.warning(f"Directory with calibration images does not exist: {directory}")
+        return []
+    paths = [
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if os.path.splitext(name)[1].lower() in CALIBRATION_IMAGES_EXTENSIONS
+    ]
+    paths = sorted(paths, key=os.path.getmtime, reverse=True)
+    images = []
+    for path in paths:
+        if len(images) >= max_images:
+            break
+        image = cv2.imread(path)
+        if image is not None:
+            images.append(image)
+    if not images:
+        logger.warning(f"No calibration images could be loaded from: {directory}")
+    return images
+
+
+def runs_on_cpu_only(
+    providers: List[Union[str, tuple]], available_providers: Optional[List[str]] = None
+) -> bool:
+    """Checks if session with given providers would run on CPU - quantized models are
+    only beneficial (and validated) there."""
+    if available_providers is None:
+        available_providers = onnxruntime.get_available_providers()
+    provider_names = [p[0] if isinstance(p, tuple) else p for p in providers]
+    return all(
+        name in CPU_EXECUTION_PROVIDERS
+        for name in provider_names
+        if name in available_providers
+    )
+
+
+def quantize_onnx_model(
+    source_path: str,
+    target_path: str,
+    mode: str,
+    calibration_inputs: List[ModelInputs],
+) -> None:
+    try:
+        from onnxruntime.quantization import (
+            CalibrationDataReader,
+            QuantFormat,
+            QuantType,
+            quantize_dynamic,
+            quantize_static,
+        )
+    except ImportError as error:
+        raise ModelArtefactError(
+            "Quantization of models requires `onnx` package. Use pip install "
+            "inference[quantization] to install missing dependencies and try again."
+        ) from error
+
+    class _InputsReader(CalibrationDataReader):
+        def __init__(self, inputs: List[ModelInputs]):
+            self._inputs: Iterator[ModelInputs] = iter(inputs)
+
+        def get_next(self) -> Optional[ModelInputs]:
+            return next(self._inputs, None)
+
+    temporary_path = f"{target_path}.{os.getpid()}.tmp"
+    if mode == DYNAMIC_QUANTIZATION:
+        quantize_dynamic(
+            model_input=source_path,
+            model_output=temporary_path,
+            weight_type=QuantType.QInt8,
+        )
+    elif mode == STATIC_QUANTIZATION:
+        quantize_static(
+            model_input=source_path,
+            model_output=temporary_path,
+            calibration_data_reader=_InputsReader(inputs=calibration_inputs),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=True,
+        )
+    else:
+        raise ModelArtefactError(
+            f"Quantization mode `{mode}` is not supported. "
+            f"Supported modes: {sorted(QUANTIZATION_MODES)}"
+        )
+    os.replace(temporary_path, target_path)
+
+
+def calibrate_and_quantize(
+    weights_path: str,
+    quantized_weights_path: str,
+    mode: str,
+    calibration_inputs: List[ModelInputs],
+    max_output_drift: float,
+    create_session: Callable[[str], onnxruntime.InferenceSession],
+) -> QuantizationReport:
+    """
+    Quantizes the model and compares quantized variant against FP32 model on
+    `calibration_inputs` - variant is accepted when mean relative drift of outputs does
+    not exceed `max_output_drift` and its mean latency is lower.
+    """
+    quantize_onnx_model(
+        source_path=weights_path,
+        target_path=quantized_weights_path,
+        mode=mode,
+        calibration_inputs=calibration_inputs,
+    )
+    reference_session = create_session(weights_path)
+    quantized_session = create_session(quantized_weights_path)
+    output_drift = measure_output_drift(
+        reference_session=reference_session,
+        candidate_session=quantized_session,
+        inputs=calibration_inputs,
+    )
+    reference_latency = measure_latency(
+        session=reference_session, inputs=calibration_inputs
+    )
+    quantized_latency = measure_latency(
+        session=quantized_session, inputs=calibration_inputs
+    )
+    return QuantizationReport(
+        mode=mode,
+        weights_file=os.path.basename(quantized_weights_path),
+        calibration_samples=len(calibration_inputs),
+        output_drift=output_drift,
+        max_output_drift=max_output_drift,
+        reference_latency=reference_latency,
+        quantized_latency=quantized_latency,
+        accepted=output_drift <= max_output_drift
+        and quantized_latency < reference_latency,
+    )
+
+
+def measure_output_drift(
+    reference_session: onnxruntime.InferenceSession,
+    candidate_session: onnxruntime.InferenceSession,
+    inputs: List[ModelInputs],
+) -> float:
+    """Returns mean (over inputs and model outputs) relative L2 error of candidate outputs."""
+    drifts = []
+    for model_inputs in inputs:
+        reference_outputs = reference_session.run(None, model_inputs)
+        candidate_outputs = candidate_session.run(None, model_inputs)
+        for reference, candidate in zip(reference_outputs, candidate_outputs):
+            reference = np.asarray(reference, dtype=np.float64)
+            candidate = np.asarray(candidate, dtype=np.float64)
+            drifts.append(
+                np.linalg.norm(candidate - reference)
+                / (np.linalg.norm(reference) + DRIFT_EPSILON)
+            )
+    if not drifts:
+        return 0.0
+    return float(np.mean(drifts))
+
+
+def measure_latency(
+    session: onnxruntime.InferenceSession,
+    inputs: List[ModelInputs],
+    warm_up_runs: int = 2,
+) -> float:
+    for model_inputs in inputs[:warm_up_runs]:
+        session.run(None, model_inputs)
+    latencies = []
+    for model_inputs in inputs:
+        start = time.perf_counter()
+        session.run(None, model_inputs)
+        latencies.append(time.perf_counter() - start)
+    if not latencies:
+        return 0.0
+    return sum(latencies) / len(latencies)
+
+
+def save_quantization_report(path: str, report: QuantizationReport) -> None:
+    with open(path, "w") as f:
+        json.dump(asdict(report), f, indent=4)
+
+
+def load_quantization_report(path: str) -> Optional[QuantizationReport]:
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path) as f:
+            return QuantizationReport(**json.load(f))
+    except (ValueError, TypeError) as error:
+        logger.warning(f"Could not load quantization report {path}: {error}")
+        return None
@@ -0,0 +1,204 @@
+"""
+Tuning profiles of onnxruntime sessions.
+
+By default, each session gets intra-op thread pool spanning all cores, so processes
+holding multiple models (accompanied by thread pools of workflows and image loaders)
+oversubscribe the CPU. Profiles define threading and memory settings of sessions suited
+for different deployments - the best one for given model and host may be selected by
+benchmarking (see `benchmark_session_profiles(...)`) and persisted in model cache.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import onnxruntime
+
+from inference.core.exceptions import InvalidEnvironmentVariableError
+from inference.core.logger import logger
+
+SESSION_PROFILE_FILE = "session_profile.json"
+DEFAULT_PROFILE = "default"
+LATENCY_PROFILE = "latency"
+THROUGHPUT_PROFILE = "throughput"
+SHARED_PROFILE = "shared"
+AUTO_PROFILE = "auto"
+THROUGHPUT_PROFILE_MAX_THREADS = 4
+
+
+@dataclass(frozen=True)
+class OnnxSessionProfile:
+    name: str
+    intra_op_num_threads: int = 0
+    inter_op_num_threads: int = 0
+    parallel_execution: bool = False
+    enable_cpu_mem_arena: bool = True
+    enable_mem_pattern: bool = True
+    allow_spinning: bool = True
+
+
+@dataclass(frozen=True)
+class SessionProfileBenchmarkResult:
+    profile: OnnxSessionProfile
+    average_latency: float
+    throughput: float
+
+
+def get_session_profiles(cpu_count: Optional[int] = None) -> List[OnnxSessionProfile]:
+    """
+    Returns predefined profiles for the host:
+    * `default` - settings of onnxruntime (thread pool spanning all cores in each session)
+    * `latency` - all cores used by single inference, with threads spinning between runs
+    * `throughput` - small thread pools, which do not spin - for concurrent requests
+    * `shared` - single-threaded sessions - for processes holding many models, where
+    parallelism comes from concurrent requests (onnxruntime Python API does not expose
+    global thread pools, which would be shared by sessions)
+    """
+    cpu_count = cpu_count or os.cpu_count() or 1
+    return [
+        OnnxSessionProfile(name=DEFAULT_PROFILE),
+        OnnxSessionProfile(
+            name=LATENCY_PROFILE,
+            intra_op_num_threads=cpu_count,
+            inter_op_num_threads=1,
+        ),
+        OnnxSessionProfile(
+            name=THROUGHPUT_PROFILE,
+            intra_op_num_threads=max(
+                min(cpu_count // 2, THROUGHPUT_PROFILE_MAX_THREADS), 1
+            ),
+            inter_op_num_threads=1,
+            allow_spinning=False,
+        ),
+        OnnxSessionProfile(
+            name=SHARED_PROFILE,
+            intra_op_num_threads=1,
+            inter_op_num_threads=1,
+            enable_cpu_mem_arena=False,
+            allow_spinning=False,
+        ),
+    ]
+
+
+def resolve_session_profile(
+    profile_name: str, tuned_profile_path: str
+) -> OnnxSessionProfile:
+    """
+    Resolves profile by name - `auto` selects profile tuned for the model (stored under
+    `tuned_profile_path`), falling back to `default` when model was not tuned on the host.
+    """
+    profile_name = profile_name.lower()
+    if profile_name == AUTO_PROFILE:
+        tuned_profile = load_session_profile(path=tuned_profile_path)
+        if tuned_profile is not None:
+            return tuned_profile
+        profile_name = DEFAULT_PROFILE
+    profiles = {profile.name: profile for profile in get_session_profiles()}
+    if profile_name not in profiles:
+        raise InvalidEnvironmentVariableError(
+            f"Could not resolve onnxruntime session profile: `{profile_name}`. "
+            f"Supported profiles: {list(profiles.keys()) + [AUTO_PROFILE]}"
+        )
+    return profiles[profile_name]
+
+
+def apply_session_profile(
+    session_options: onnxruntime.SessionOptions, profile: OnnxSessionProfile
+) -> None:
+    if profile.intra_op_num_threads:
+        session_options.intra_op_num_threads = profile.intra_op_num_threads
+    if profile.inter_op_num_threads:
+        session_options.inter_op_num_threads = profile.inter_op_num_threads
+    if profile.parallel_execution:
+        session_options.execution_mode = onnxruntime.ExecutionMode.ORT_PARALLEL
+    session_options.enable_cpu_mem_arena = profile.enable_cpu_mem_arena
+    session_options.enable_mem_pattern = profile.enable_mem_pattern
+    if not profile.allow_spinning:
+        session_options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+        session_options.add_session_config_entry("session.inter_op.allow_spinning", "0")
+
+
+def save_session_profile(
+    path: str,
+    profile: OnnxSessionProfile,
+    results: List[SessionProfileBenchmarkResult],
+) -> None:
+    content = {
+        "cpu_count": os.cpu_count(),
+        "profile": asdict(profile),
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w") as f:
+        json.dump(content, f, indent=4)
+
+
+def load_session_profile(path: str) -> Optional[OnnxSessionProfile]:
+    """Loads tuned profile - ignoring profiles tuned on host with different number of cores."""
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path) as f:
+            content = json.load(f)
+        if content["cpu_count"] != os.cpu_count():
+            logger.warning(
+                f"Ignoring onnxruntime session profile {path} - it was tuned for host "
+                f"with different number of cores."
+            )
+            return None
+        return OnnxSessionProfile(**content["profile"])
+    except (ValueError, KeyError, TypeError) as error:
+        logger.warning(f"Could not load onnxruntime session profile {path}: {error}")
+        return None
+
+
+def benchmark_session_profiles(
+    create_session: Callable[[OnnxSessionProfile], onnxruntime.InferenceSession],
+    input_feed: Dict[str, np.ndarray],
+    profiles: List[OnnxSessionProfile],
+    warm_up_runs: int = 5,
+    benchmark_runs: int = 50,
+    concurrency: int = 1,
+) -> List[SessionProfileBenchmarkResult]:
+    """
+    Measures latency and throughput of session created with each profile - `concurrency`
+    threads run the session at the same time, to reflect load expected in deployment.
+    Results are sorted from the highest throughput.
+    """
+    results = []
+    for profile in profiles:
+        session = create_session(profile)
+        for _ in range(warm_up_runs):
+            session.run(None, input_feed)
+        latencies = []
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            futures = [
+                executor.submit(_run_session, session, input_feed, latencies)
+                for _ in range(benchmark_runs)
+            ]
+            for future in futures:
+                future.result()
+        duration = time.perf_counter() - start
+        results.append(
+            SessionProfileBenchmarkResult(
+                profile=profile,
+                average_latency=sum(latencies) / max(len(latencies), 1),
+                throughput=len(latencies) / duration if duration > 0 else 0.0,
+            )
+        )
+        del session
+    return sorted(results, key=lambda result: result.throughput, reverse=True)
+
+
+def _run_session(
+    session: onnxruntime.InferenceSession,
+    input_feed: Dict[str, np.ndarray],
+    latencies: List[float],
+) -> None:
+    start = time.perf_counter()
+    session.run(None, input_feed)
+    latencies.append(time.perf_counter() - start)
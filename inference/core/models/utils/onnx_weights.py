@@ -0,0 +1,320 @@
+"""
+Memory-mapped weights of ONNX models.
+
+Initializers (weights) of ONNX model are extracted (once) into the file placed next to
+model weights in MODEL_CACHE_DIR, in which each tensor is aligned, such that it can be
+memory-mapped and handed to onnxruntime without copying (`SessionOptions.add_initializer(...)`).
+Pages of mapped file live in OS page cache - processes that load the same model
+(uvicorn workers, stream processing, parallel workers) share single copy of weights,
+instead of holding private copies in their heaps.
+"""
+
+import json
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+import onnxruntime
+
+from inference.core.logger import logger
+
+SHARED_WEIGHTS_FILE_SUFFIX = ".shared"
+SHARED_WEIGHTS_FILE_MAGIC = b"RFSHWv01"
+TENSORS_ALIGNMENT = 64
+MIN_SHARED_TENSOR_SIZE = 1024
+
+# ONNX protobuf fields - see onnx/onnx.proto
+MODEL_GRAPH_FIELD = 7
+GRAPH_INITIALIZER_FIELD = 5
+TENSOR_DIMS_FIELD = 1
+TENSOR_DATA_TYPE_FIELD = 2
+TENSOR_NAME_FIELD = 8
+TENSOR_RAW_DATA_FIELD = 9
+TENSOR_DATA_LOCATION_FIELD = 14
+VARINT_WIRE_TYPE = 0
+FIXED_64_WIRE_TYPE = 1
+LENGTH_DELIMITED_WIRE_TYPE = 2
+FIXED_32_WIRE_TYPE = 5
+
+ONNX_DATA_TYPES = {
+    1: np.float32,
+    2: np.uint8,
+    3: np.int8,
+    4: np.uint16,
+    5: np.int16,
+    6: np.int32,
+    7: np.int64,
+    9: np.bool_,
+    10: np.float16,
+    11: np.float64,
+    12: np.uint32,
+    13: np.uint64,
+}
+
+
+@dataclass(frozen=True)
+class OnnxInitializer:
+    name: str
+    data_type: int
+    dims: Tuple[int, ...]
+    offset: int
+    length: int
+
+
+class MemoryMappedWeights:
+    """
+    Initializers of ONNX model, backed by memory-mapped shared weights file. Object must
+    outlive the sessions it was registered in, as sessions use mapped memory directly.
+    """
+
+    @classmethod
+    def load(cls, weights_path: str) -> "MemoryMappedWeights":
+        shared_weights_path = ensure_shared_weights_file(weights_path=weights_path)
+        with open(shared_weights_path, "rb") as f:
+            mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _, initializers = _read_shared_weights_header(buffer=mapped_file)
+        return cls(mapped_file=mapped_file, initializers=initializers)
+
+    def __init__(self, mapped_file: mmap.mmap, initializers: List[OnnxInitializer]):
+        self._mapped_file = mapped_file
+        self._initializers = initializers
+        self._values = [
+            onnxruntime.OrtValue.ortvalue_from_numpy(
+                np.frombuffer(
+                    mapped_file,
+                    dtype=ONNX_DATA_TYPES[initializer.data_type],
+                    count=initializer.length
+                    // np.dtype(ONNX_DATA_TYPES[initializer.data_type]).itemsize,
+                    offset=initializer.offset,
+                ).reshape(initializer.dims)
+            )
+            for initializer in initializers
+        ]
+
+    @property
+    def size(self) -> int:
+        return sum(initializer.length for initializer in self._initializers)
+
+    def register_in(self, session_options: onnxruntime.SessionOptions) -> None:
+        for initializer, value in zip(self._initializers, self._values):
+            session_options.add_initializer(initializer.name, value)
+
+
+def ensure_shared_weights_file(weights_path: str) -> str:
+    """
+    Returns path of shared weights file for given ONNX model, creating it when it does
+    not exist or is outdated. File is written to temporary location and atomically moved,
+    such that processes loading the same model concurrently never see partial file.
+    """
+    shared_weights_path = f"{weights_path}{SHARED_WEIGHTS_FILE_SUFFIX}"
+    source_stats = os.stat(weights_path)
+    source_signature = [source_stats.st_size, source_stats.st_mtime_ns]
+    if _read_shared_weights_signature(path=shared_weights_path) == source_signature:
+        return shared_weights_path
+    logger.debug(f"Creating shared weights file for model: {weights_path}")
+    with open(weights_path, "rb") as f:
+        source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        initializers = [
+            initializer
+            for initializer in find_onnx_initializers(buffer=source)
+            if initializer.data_type in ONNX_DATA_TYPES
+            and initializer.length >= MIN_SHARED_TENSOR_SIZE
+        ]
+        temporary_path = f"{shared_weights_path}.{os.getpid()}.tmp"
+        _write_shared_weights_file(
+            path=temporary_path,
+            source=source,
+            source_signature=source_signature,
+            initializers=initializers,
+        )
+        os.replace(temporary_path, shared_weights_path)
+    finally:
+        source.close()
+    return shared_weights_path
+
+
+def find_onnx_initializers(buffer: bytes) -> List[OnnxInitializer]:
+    """
+    Finds initializers of the main graph of serialised ONNX model (`ModelProto`) which
+    keep their values in `raw_data` - offset and length of the data within `buffer`
+    are returned, such that values can be read without deserialising the model.
+    """
+    result = []
+    for field, _, graph_start, graph_end in _iterate_protobuf_fields(
+        buffer=buffer, start=0, end=len(buffer)
+    ):
+        if field != MODEL_GRAPH_FIELD:
+            continue
+        for field, _, tensor_start, tensor_end in _iterate_protobuf_fields(
+            buffer=buffer, start=graph_start, end=graph_end
+        ):
+            if field != GRAPH_INITIALIZER_FIELD:
+                continue
+            initializer = _parse_onnx_tensor(
+                buffer=buffer, start=tensor_start, end=tensor_end
+            )
+            if initializer is not None:
+                result.append(initializer)
+    return result
+
+
+def get_private_memory_bytes() -> Optional[int]:
+    """Returns size of private (anonymous) resident memory of the process - Linux only."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _parse_onnx_tensor(
+    buffer: bytes, start: int, end: int
+) -> Optional[OnnxInitializer]:
+    dims, data_type, name, raw_data = [], None, None, None
+    for field, wire_type, value_start, value_end in _iterate_protobuf_fields(
+        buffer=buffer, start=start, end=end
+    ):
+        if field == TENSOR_DIMS_FIELD and wire_type == VARINT_WIRE_TYPE:
+            dims.append(value_start)
+        elif field == TENSOR_DIMS_FIELD and wire_type == LENGTH_DELIMITED_WIRE_TYPE:
+            position = value_start
+            while position < value_end:
+                dim, position = _read_varint(buffer=buffer, position=position)
+                dims.append(dim)
+        elif field == TENSOR_DATA_TYPE_FIELD:
+            data_type = value_start
+        elif field == TENSOR_NAME_FIELD:
+            name = bytes(buffer[value_start:value_end]).decode("utf-8")
+        elif field == TENSOR_RAW_DATA_FIELD:
+            raw_data = (value_start, value_end)
+        elif field == TENSOR_DATA_LOCATION_FIELD and value_start != 0:
+            # external data is not supported
+            return None
+    if name is None or data_type is None or raw_data is None:
+        return None
+    return OnnxInitializer(
+        name=name,
+        data_type=data_type,
+        dims=tuple(dims),
+        offset=raw_data[0],
+        length=raw_data[1] - raw_data[0],
+    )
+
+
+def _iterate_protobuf_fields(
+    buffer: bytes, start: int, end: int
+) -> Iterator[Tuple[int, int, int, Optional[int]]]:
+    # yields (field number, wire type, value or start of value, end of value)
+    position = start
+    while position < end:
+        key, position = _read_varint(buffer=buffer, position=position)
+        field, wire_type = key >> 3, key & 0x07
+        if wire_type == VARINT_WIRE_TYPE:
+            value, position = _read_varint(buffer=buffer, position=position)
+            yield field, wire_type, value, None
+        elif wire_type == LENGTH_DELIMITED_WIRE_TYPE:
+            length, position = _read_varint(buffer=buffer, position=position)
+            yield field, wire_type, position, position + length
+            position += length
+        elif wire_type == FIXED_64_WIRE_TYPE:
+            yield field, wire_type, position, position + 8
+            position += 8
+        elif wire_type == FIXED_32_WIRE_TYPE:
+            yield field, wire_type, position, position + 4
+            position += 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type: {wire_type}")
+
+
+def _read_varint(buffer: bytes, position: int) -> Tuple[int, int]:
+    result, shift = 0, 0
+    while True:
+        byte = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+def _write_shared_weights_file(
+    path: str,
+    source: bytes,
+    source_signature: List[int],
+    initializers: List[OnnxInitializer],
+) -> None:
+    # layout: magic | header length | JSON header | aligned tensors
+    entries = []
+    offset = 0
+    for initializer in initializers:
+        entries.append(
+            {
+                "name": initializer.name,
+                "data_type": initializer.data_type,
+                "dims": list(initializer.dims),
+                "offset": offset,
+                "length": initializer.length,
+            }
+        )
+        offset = _align(offset + initializer.length)
+    header = json.dumps(
+        {"source_signature": source_signature, "initializers": entries}
+    ).encode("utf-8")
+    data_start = _align(len(SHARED_WEIGHTS_FILE_MAGIC) + 8 + len(header))
+    with open(path, "wb") as f:
+        f.write(SHARED_WEIGHTS_FILE_MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for initializer, entry in zip(initializers, entries):
+            f.seek(data_start + entry["offset"])
+            f.write(
+                source[initializer.offset : initializer.offset + initializer.length]
+            )
+        f.truncate(data_start + offset)
+
+
+def _read_shared_weights_signature(path: str) -> Optional[List[int]]:
+    try:
+        with open(path, "rb") as f:
+            mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            signature, _ = _read_shared_weights_header(buffer=mapped_file)
+        finally:
+            mapped_file.close()
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+    return signature
+
+
+def _read_shared_weights_header(
+    buffer: bytes,
+) -> Tuple[List[int], List[OnnxInitializer]]:
+    magic_length = len(SHARED_WEIGHTS_FILE_MAGIC)
+    if bytes(buffer[:magic_length]) != SHARED_WEIGHTS_FILE_MAGIC:
+        raise ValueError("Not a shared weights file")
+    (header_length,) = struct.unpack("<Q", buffer[magic_length : magic_length + 8])
+    header_end = magic_length + 8 + header_length
+    header = json.loads(bytes(buffer[magic_length + 8 : header_end]))
+    data_start = _align(header_end)
+    initializers = [
+        OnnxInitializer(
+            name=entry["name"],
+            data_type=entry["data_type"],
+            dims=tuple(entry["dims"]),
+            offset=data_start + entry["offset"],
+            length=entry["length"],
+        )
+        for entry in header["initializers"]
+    ]
+    return header["source_signature"], initializers
+
+
+def _align(value: int) -> int:
+    return (value + TENSORS_ALIGNMENT - 1) // TENSORS_ALIGNMENT * TENSORS_ALIGNMENT
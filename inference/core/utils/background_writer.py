@@ -0,0 +1,198 @@
+import atexit
+import time
+from dataclasses import dataclass
+from enum import Enum
+from queue import Empty, Full, Queue
+from threading import Lock, Thread
+from typing import Callable, List, Optional, Tuple, Union
+from weakref import WeakSet
+
+from inference.core import logger
+from inference.core.env import (
+    SINKS_WRITER_FULL_QUEUE_POLICY,
+    SINKS_WRITER_MAX_PENDING_TASKS,
+)
+
+WriterTask = Callable[[], None]
+
+# writer thread is stopped when idle, such that no reference to the writer (and
+# objects referred by its tasks) is held when sink stays unused
+WRITER_THREAD_IDLE_TIMEOUT = 1.0
+
+
+class FullQueuePolicy(Enum):
+    BLOCK = "block"
+    DROP = "drop"
+
+
+@dataclass(frozen=True)
+class BackgroundWriterReport:
+    name: str
+    pending_tasks: int
+    max_pending_tasks: int
+    lag: float
+    completed_tasks: int
+    dropped_tasks: int
+    failed_tasks: int
+
+
+class BackgroundWriter:
+    """Executes I/O tasks (encoding, writing files) of sinks in single background thread.
+
+    Tasks are executed in order of submission. Queue of pending tasks is bounded -
+    when the writer falls behind, `submit(...)` either blocks the caller until
+    there is space in the queue (`FullQueuePolicy.BLOCK`) or drops the task
+    (`FullQueuePolicy.DROP`). `on_idle` callback is executed each time the queue
+    gets drained, which lets sinks batch costly operations (like `fsync`) instead
+    of performing them for each task.
+
+    Writer lag (age of the oldest task not yet completed) is reported by
+    `describe()` and - for all writers alive in the process - by
+    `describe_background_writers()`, which is used by `InferencePipeline` watchdog.
+    Writer thread is started on demand and stopped after a period of inactivity.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_pending_tasks: int = SINKS_WRITER_MAX_PENDING_TASKS,
+        full_queue_policy: Union[FullQueuePolicy, str] = SINKS_WRITER_FULL_QUEUE_POLICY,
+        on_idle: Optional[Callable[[], None]] = None,
+    ):
+        self._name = name
+        self._max_pending_tasks = max_pending_tasks
+        self._full_queue_policy = FullQueuePolicy(full_queue_policy)
+        self._on_idle = on_idle
+        self._queue: "Queue[Tuple[float, Optional[WriterTask]]]" = Queue(
+            maxsize=max_pending_tasks
+        )
+        self._thread: Optional[Thread] = None
+        self._thread_lock = Lock()
+        self._stats_lock = Lock()
+        self._in_progress_since: Optional[float] = None
+        self._completed_tasks = 0
+        self._dropped_tasks = 0
+        self._failed_tasks = 0
+        self._closed = False
+        _ACTIVE_WRITERS.add(self)
+
+    def submit(self, task: WriterTask) -> bool:
+        with self._thread_lock:
+            if self._closed:
+                raise RuntimeError(f"Background writer {self._name} is closed")
+            self._ensure_started()
+            item = (time.monotonic(), task)
+            if self._full_queue_policy is FullQueuePolicy.BLOCK:
+                self._queue.put(item)
+                return True
+            try:
+                self._queue.put_nowait(item)
+                return True
+            except Full:
+                pass
+        with self._stats_lock:
+            self._dropped_tasks += 1
+        return False
+
+    def flush(self) -> None:
+        """Waits until all tasks submitted so far are completed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Completes pending tasks and stops the writer thread."""
+        with self._thread_lock:
+            if self._closed:
+                return None
+            self._closed = True
+            _ACTIVE_WRITERS.discard(self)
+            thread = self._thread
+            if thread is None:
+                return None
+            self._queue.put((time.monotonic(), None))
+        thread.join()
+
+    def describe(self) -> BackgroundWriterReport:
+        now = time.monotonic()
+        with self._queue.mutex:
+            oldest_pending = self._queue.queue[0][0] if self._queue.queue else None
+            pending_tasks = len(self._queue.queue)
+        oldest = self._in_progress_since
+        if oldest is None or (oldest_pending is not None and oldest_pending < oldest):
+            oldest = oldest_pending
+        with self._stats_lock:
+            return BackgroundWriterReport(
+                name=self._name,
+                pending_tasks=pending_tasks,
+                max_pending_tasks=self._max_pending_tasks,
+                lag=now - oldest if oldest is not None else 0.0,
+                completed_tasks=self._completed_tasks,
+                dropped_tasks=self._dropped_tasks,
+                failed_tasks=self._failed_tasks,
+            )
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return None
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                submitted_at, task = self._queue.get(timeout=WRITER_THREAD_IDLE_TIMEOUT)
+            except Empty:
+                with self._thread_lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return None
+                continue
+            if task is None:
+                self._thread = None
+                self._queue.task_done()
+                return None
+            self._in_progress_since = submitted_at
+            try:
+                task()
+                with self._stats_lock:
+                    self._completed_tasks += 1
+            except Exception as error:
+                logger.warning(
+                    f"Task of background writer {self._name} failed: {error}"
+                )
+                with self._stats_lock:
+                    self._failed_tasks += 1
+            finally:
+                if self._queue.empty():
+                    self._execute_on_idle()
+                self._in_progress_since = None
+                self._queue.task_done()
+
+    def _execute_on_idle(self) -> None:
+        if self._on_idle is None:
+            return None
+        try:
+            self._on_idle()
+        except Exception as error:
+            logger.warning(
+                f"Idle callback of background writer {self._name} failed: {error}"
+            )
+
+
+_ACTIVE_WRITERS: "WeakSet[BackgroundWriter]" = WeakSet()
+
+
+def describe_background_writers() -> List[BackgroundWriterReport]:
+    return [writer.describe() for writer in list(_ACTIVE_WRITERS)]
+
+
+def close_background_writers() -> None:
+    """Completes pending tasks of all writers alive in the process.
+
+    Registered to run at interpreter exit - writer threads are daemons, so pending
+    tasks would be lost otherwise.
+    """
+    for writer in list(_ACTIVE_WRITERS):
+        writer.close()
+
+
+atexit.register(close_background_writers)
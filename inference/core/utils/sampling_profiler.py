@@ -0,0 +1,182 @@
+"""
+Sampling profiler of the running process.
+
+Background thread periodically snapshots stacks of all Python threads
+(`sys._current_frames()`) and aggregates them into collapsed stacks - format consumed
+by flame graph tools (`flamegraph.pl`, speedscope, etc.) - one line per unique stack:
+`thread;module:function;module:function <number of samples>`. Threads are not
+interrupted, so the cost is the time sampling thread holds GIL - interval between
+samples is stretched when needed, such that this time does not exceed `max_overhead`
+fraction of wall time.
+"""
+
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from inference.core.exceptions import SamplingProfilerBusyError
+from inference.core.logger import logger
+
+# leaf frames of threads waiting for work - those samples are skipped unless idle
+# threads are explicitly requested
+IDLE_FRAMES = {
+    "threading:wait",
+    "threading:_wait_for_tstate_lock",
+    "selectors:select",
+    "queue:get",
+    "concurrent.futures.thread:_worker",
+}
+MAX_STACK_DEPTH = 128
+_THREAD_NUMBER = re.compile(r"[-_]\d+")
+
+
+@dataclass(frozen=True)
+class SamplingProfilerStatus:
+    running: bool
+    frequency: float
+    duration: float
+    elapsed: float
+    samples: int
+    unique_stacks: int
+    overhead: float
+
+
+class SamplingProfiler:
+    def __init__(
+        self,
+        max_overhead: float = 0.02,
+        include_idle_threads: bool = False,
+        max_stack_depth: int = MAX_STACK_DEPTH,
+    ):
+        self._max_overhead = max_overhead
+        self._include_idle_threads = include_idle_threads
+        self._max_stack_depth = max_stack_depth
+        self._lock = threading.Lock()
+        self._stacks: Counter = Counter()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._frequency = 0.0
+        self._duration = 0.0
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._samples = 0
+        self._sampling_time = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration: float, frequency: float) -> SamplingProfilerStatus:
+        """Starts profiling session lasting `duration` seconds - results of previous
+        session are discarded."""
+        with self._lock:
+            if self.running:
+                raise SamplingProfilerBusyError(
+                    "Sampling profiler is already running - wait until it finishes or "
+                    "stop it before starting new session."
+                )
+            self._stacks = Counter()
+            self._frequency = frequency
+            self._duration = duration
+            self._started_at = time.perf_counter()
+            self._finished_at = None
+            self._samples = 0
+            self._sampling_time = 0.0
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stop_event,),
+                name="SamplingProfiler",
+                daemon=True,
+            )
+            self._thread.start()
+        logger.info(
+            f"Sampling profiler started for {duration}s with frequency {frequency}Hz."
+        )
+        return self.status()
+
+    def stop(self) -> SamplingProfilerStatus:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+        return self.status()
+
+    def status(self) -> SamplingProfilerStatus:
+        with self._lock:
+            if self._started_at is None:
+                elapsed = 0.0
+            else:
+                elapsed = (self._finished_at or time.perf_counter()) - self._started_at
+            return SamplingProfilerStatus(
+                running=self.running,
+                frequency=self._frequency,
+                duration=self._duration,
+                elapsed=elapsed,
+                samples=self._samples,
+                unique_stacks=len(self._stacks),
+                overhead=self._sampling_time / elapsed if elapsed > 0 else 0.0,
+            )
+
+    def export_collapsed_stacks(self) -> str:
+        with self._lock:
+            stacks = self._stacks.most_common()
+        return "".join(f"{stack} {count}\n" for stack, count in stacks)
+
+    def _run(self, stop_event: threading.Event) -> None:
+        interval = 1.0 / self._frequency
+        deadline = self._started_at + self._duration
+        wait_time = interval
+        while not stop_event.wait(timeout=wait_time):
+            sampling_start = time.perf_counter()
+            if sampling_start >= deadline:
+                break
+            stacks = self._take_sample()
+            sampling_time = time.perf_counter() - sampling_start
+            with self._lock:
+                self._stacks.update(stacks)
+                self._samples += 1
+                self._sampling_time += sampling_time
+            # sampling_time / (sampling_time + wait_time) <= max_overhead
+            wait_time = max(
+                interval - sampling_time,
+                sampling_time * (1 - self._max_overhead) / self._max_overhead,
+            )
+        with self._lock:
+            self._finished_at = time.perf_counter()
+        logger.info("Sampling profiler finished.")
+
+    def _take_sample(self) -> List[str]:
+        own_thread_id = threading.get_ident()
+        thread_names = _get_threads_names()
+        stacks = []
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread_id:
+                continue
+            frames = []
+            while frame is not None and len(frames) < self._max_stack_depth:
+                frames.append(
+                    f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+                )
+                frame = frame.f_back
+            if not frames:
+                continue
+            if not self._include_idle_threads and frames[0] in IDLE_FRAMES:
+                continue
+            frames.append(thread_names.get(thread_id, "unknown"))
+            stacks.append(";".join(reversed(frames)))
+        return stacks
+
+
+def _get_threads_names() -> Dict[int, str]:
+    # numbers of pool threads are dropped, such that stacks of the pool are aggregated
+    return {
+        thread.ident: _THREAD_NUMBER.sub("", thread.name).replace(";", "_")
+        or thread.name
+        for thread in threading.enumerate()
+        if thread.ident is not None
+    }
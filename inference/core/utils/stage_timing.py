@@ -0,0 +1,119 @@
+"""
+Per-request timing of inference stages.
+
+Timer of the request (started by HTTP middleware) is held in context variable, such that
+stages can be measured deep in the call stack (model manager, models, serialisers)
+without threading it through signatures. When there is no active timer, measuring is
+no-op. Stages may nest - time of nested stage is excluded from the enclosing one,
+such that durations of stages do not overlap.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Dict, Generator, List, Optional
+
+REQUEST_PARSING_STAGE = "request_parsing"
+MODEL_LOADING_STAGE = "model_loading"
+QUEUE_WAIT_STAGE = "queue_wait"
+IMAGE_DECODING_STAGE = "image_decoding"
+PREPROCESS_STAGE = "preprocess"
+PREDICT_STAGE = "predict"
+NMS_STAGE = "nms"
+POSTPROCESS_STAGE = "postprocess"
+RESPONSE_BUILDING_STAGE = "response_building"
+SERIALIZATION_STAGE = "serialization"
+TOTAL_STAGE = "total"
+
+_active_stage_timer: ContextVar[Optional["RequestStageTimer"]] = ContextVar(
+    "active_stage_timer", default=None
+)
+
+
+@dataclass
+class _StageFrame:
+    name: str
+    start: float
+    nested_time: float = 0.0
+
+
+class RequestStageTimer:
+    """Accumulates durations (in seconds) of stages of single request."""
+
+    def __init__(self):
+        self.start = perf_counter()
+        self.model_id: Optional[str] = None
+        self.task_type: Optional[str] = None
+        self._durations: Dict[str, float] = {}
+        self._marks: Dict[str, float] = {}
+        self._stacks: Dict[int, List[_StageFrame]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._durations)
+
+    @contextmanager
+    def stage(self, name: str) -> Generator[None, None, None]:
+        stack = self._stacks.setdefault(threading.get_ident(), [])
+        frame = _StageFrame(name=name, start=perf_counter())
+        stack.append(frame)
+        try:
+            yield None
+        finally:
+            stack.pop()
+            elapsed = perf_counter() - frame.start
+            if stack:
+                stack[-1].nested_time += elapsed
+            self.record(name=name, duration=elapsed - frame.nested_time)
+
+    def record(self, name: str, duration: float) -> None:
+        with self._lock:
+            self._durations[name] = self._durations.get(name, 0.0) + duration
+
+    def mark(self, name: str) -> None:
+        """Marks beginning of stage, which ends in different place of the code."""
+        self._marks[name] = perf_counter()
+
+    def record_since_mark(self, name: str) -> None:
+        start = self._marks.pop(name, None)
+        if start is not None:
+            self.record(name=name, duration=perf_counter() - start)
+
+    def record_since_start(self, name: str) -> None:
+        self.record(name=name, duration=perf_counter() - self.start)
+
+
+@contextmanager
+def stage_timing(
+    timer: RequestStageTimer,
+) -> Generator[RequestStageTimer, None, None]:
+    token = _active_stage_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _active_stage_timer.reset(token)
+
+
+def get_active_stage_timer() -> Optional[RequestStageTimer]:
+    return _active_stage_timer.get()
+
+
+@contextmanager
+def measure_stage(name: str) -> Generator[None, None, None]:
+    timer = _active_stage_timer.get()
+    if timer is None:
+        yield None
+        return None
+    with timer.stage(name=name):
+        yield None
+
+
+def format_server_timing_header(durations: Dict[str, float]) -> str:
+    """Formats durations as `Server-Timing` header value (durations in milliseconds)."""
+    return ", ".join(
+        f"{name};dur={duration * 1000:.2f}" for name, duration in durations.items()
+    )
@@ -0,0 +1,423 @@
+"""
+Compilation of Roboflow Query Language statements evaluated against each element of
+`sv.Detections` into NumPy mask expressions.
+
+Statement is lowered into functions operating on whole arrays of detections
+properties (computed once per `sv.Detections`), instead of being evaluated
+for every detection separately. Only subset of the language can be lowered -
+statements referring detection properties through single `ExtractDetectionProperty`
+operation and operators with well-defined vectorized counterparts. For everything
+else, builder returns `None` and caller is expected to use Python evaluation engine.
+The same applies at runtime - compiled function returns `None` for inputs it cannot
+handle in the exact same way as Python evaluation would do.
+"""
+
+from functools import partial
+from operator import eq, ge, gt, le, lt, ne
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import shapely
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.query_language.entities.enums import (
+    DetectionsProperty,
+    StatementsGroupsOperator,
+)
+from inference.core.workflows.core_steps.common.query_language.entities.operations import (
+    DEFAULT_OPERAND_NAME,
+    BinaryStatement,
+    DynamicOperand,
+    ExtractDetectionProperty,
+    StatementGroup,
+    StaticOperand,
+    UnaryStatement,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
+    BINARY_OPERATORS,
+    UNARY_OPERATORS,
+    create_operand_builder,
+)
+
+NUMBER_KIND = "number"
+STRING_KIND = "string"
+POINT_KIND = "point"
+
+NON_VECTORIZABLE_OPERATIONS = {"RandomNumber"}
+
+DetectionsMaskFunction = Callable[[sv.Detections, Dict[str, Any]], Optional[np.ndarray]]
+
+
+class NotVectorizableError(Exception):
+    pass
+
+
+class VectorOperand:
+    def __init__(self, value: np.ndarray, kind: str):
+        self.value = value
+        self.kind = kind
+
+
+def _get_box_coordinate(detections: sv.Detections, index: int) -> np.ndarray:
+    return detections.xyxy[:, index].astype(np.float64)
+
+
+def _get_boxes_sizes(detections: sv.Detections) -> np.ndarray:
+    xyxy = detections.xyxy
+    sizes = (xyxy[:, 3] - xyxy[:, 1]) * (xyxy[:, 2] - xyxy[:, 0])
+    return sizes.astype(np.float64)
+
+
+def _get_boxes_centers(detections: sv.Detections) -> np.ndarray:
+    xyxy = detections.xyxy
+    centers_x = xyxy[:, 0] + (xyxy[:, 2] - xyxy[:, 0]) / 2
+    centers_y = xyxy[:, 1] + (xyxy[:, 3] - xyxy[:, 1]) / 2
+    return np.stack([centers_x, centers_y], axis=1).astype(np.float64)
+
+
+def _get_confidence(detections: sv.Detections) -> np.ndarray:
+    if detections.confidence is None:
+        raise NotVectorizableError("Detections do not provide confidence")
+    return detections.confidence.astype(np.float64)
+
+
+def _get_class_id(detections: sv.Detections) -> np.ndarray:
+    if detections.class_id is None:
+        raise NotVectorizableError("Detections do not provide class_id")
+    return detections.class_id.astype(np.int64)
+
+
+def _get_class_name(detections: sv.Detections) -> np.ndarray:
+    class_name = detections.data.get("class_name")
+    if not isinstance(class_name, np.ndarray) or class_name.dtype.kind != "U":
+        raise NotVectorizableError("Detections do not provide class_name as strings")
+    return class_name
+
+
+VECTORIZED_PROPERTIES_EXTRACTORS = {
+    DetectionsProperty.X_MIN: (partial(_get_box_coordinate, index=0), NUMBER_KIND),
+    DetectionsProperty.Y_MIN: (partial(_get_box_coordinate, index=1), NUMBER_KIND),
+    DetectionsProperty.X_MAX: (partial(_get_box_coordinate, index=2), NUMBER_KIND),
+    DetectionsProperty.Y_MAX: (partial(_get_box_coordinate, index=3), NUMBER_KIND),
+    DetectionsProperty.CONFIDENCE: (_get_confidence, NUMBER_KIND),
+    DetectionsProperty.CLASS_ID: (_get_class_id, NUMBER_KIND),
+    DetectionsProperty.CLASS_NAME: (_get_class_name, STRING_KIND),
+    DetectionsProperty.SIZE: (_get_boxes_sizes, NUMBER_KIND),
+    DetectionsProperty.CENTER: (_get_boxes_centers, POINT_KIND),
+}
+
+
+def build_detections_mask_function(
+    definition: Union[BinaryStatement, UnaryStatement, StatementGroup],
+    execution_context: str = "<root>",
+) -> Optional[DetectionsMaskFunction]:
+    """
+    Compiles statement into function returning boolean mask of detections for which
+    the statement holds, or `None` if statement cannot be vectorized.
+    """
+    try:
+        mask_function = compile_statement(
+            definition=definition, execution_context=execution_context
+        )
+    except NotVectorizableError:
+        return None
+    return partial(evaluate_detections_mask, mask_function=mask_function)
+
+
+def evaluate_detections_mask(
+    detections: sv.Detections,
+    global_parameters: Dict[str, Any],
+    mask_function: Callable[[sv.Detections, Dict[str, Any]], np.ndarray],
+) -> Optional[np.ndarray]:
+    try:
+        return mask_function(detections, global_parameters)
+    except Exception:
+        # Python evaluation is responsible for handling (and reporting) anything
+        # that cannot be evaluated using vectorized expressions
+        return None
+
+
+def compile_statement(
+    definition: Union[BinaryStatement, UnaryStatement, StatementGroup],
+    execution_context: str,
+) -> Callable[[sv.Detections, Dict[str, Any]], np.ndarray]:
+    if isinstance(definition, BinaryStatement):
+        return compile_binary_statement(
+            definition=definition, execution_context=execution_context
+        )
+    if isinstance(definition, UnaryStatement):
+        return compile_unary_statement(
+            definition=definition, execution_context=execution_context
+        )
+    if not definition.statements:
+        raise NotVectorizableError("Empty statements group")
+    if definition.operator not in STATEMENTS_GROUPS_COMBINERS:
+        raise NotVectorizableError(f"Unknown operator {definition.operator}")
+    statements_functions = [
+        compile_statement(
+            definition=statement,
+            execution_context=f"{execution_context}.statements[{statement_id}]",
+        )
+        for statement_id, statement in enumerate(definition.statements)
+    ]
+    return partial(
+        group_eval,
+        statements_functions=statements_functions,
+        combiner=STATEMENTS_GROUPS_COMBINERS[definition.operator],
+    )
+
+
+def group_eval(
+    detections: sv.Detections,
+    global_parameters: Dict[str, Any],
+    statements_functions: List[Callable[[sv.Detections, Dict[str, Any]], np.ndarray]],
+    combiner: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> np.ndarray:
+    result = statements_functions[0](detections, global_parameters)
+    for statement_function in statements_functions[1:]:
+        result = combiner(result, statement_function(detections, global_parameters))
+    return result
+
+
+def compile_binary_statement(
+    definition: BinaryStatement,
+    execution_context: str,
+) -> Callable[[sv.Detections, Dict[str, Any]], np.ndarray]:
+    comparator_type = definition.comparator.type
+    if comparator_type not in VECTORIZED_BINARY_OPERATORS:
+        raise NotVectorizableError(f"Operator {comparator_type} is not vectorized")
+    return partial(
+        binary_eval,
+        left_operand_builder=compile_operand(
+            definition=definition.left_operand, execution_context=execution_context
+        ),
+        right_operand_builder=compile_operand(
+            definition=definition.right_operand, execution_context=execution_context
+        ),
+        operator=VECTORIZED_BINARY_OPERATORS[comparator_type],
+        scalar_operator=BINARY_OPERATORS[comparator_type],
+        negate=definition.negate,
+    )
+
+
+def binary_eval(
+    detections: sv.Detections,
+    global_parameters: Dict[str, Any],
+    left_operand_builder: Callable[[sv.Detections, Dict[str, Any]], Any],
+    right_operand_builder: Callable[[sv.Detections, Dict[str, Any]], Any],
+    operator: Callable[[Any, Any], np.ndarray],
+    scalar_operator: Callable[[Any, Any], bool],
+    negate: bool,
+) -> np.ndarray:
+    left_operand = left_operand_builder(detections, global_parameters)
+    right_operand = right_operand_builder(detections, global_parameters)
+    if isinstance(left_operand, VectorOperand) or isinstance(
+        right_operand, VectorOperand
+    ):
+        result = operator(left_operand, right_operand)
+    else:
+        result = np.full(
+            (len(detections),), bool(scalar_operator(left_operand, right_operand))
+        )
+    if negate:
+        return np.logical_not(result)
+    return result
+
+
+def compile_unary_statement(
+    definition: UnaryStatement,
+    execution_context: str,
+) -> Callable[[sv.Detections, Dict[str, Any]], np.ndarray]:
+    if (
+        is_detection_operand(definition=definition.operand)
+        and definition.operator.type not in VECTORIZED_PROPERTIES_EXISTENCE
+    ):
+        raise NotVectorizableError(
+            f"Operator {definition.operator.type} is not vectorized"
+        )
+    return partial(
+        unary_eval,
+        operand_builder=compile_operand(
+            definition=definition.operand, execution_context=execution_context
+        ),
+        operator_type=definition.operator.type,
+        negate=definition.negate,
+    )
+
+
+def unary_eval(
+    detections: sv.Detections,
+    global_parameters: Dict[str, Any],
+    operand_builder: Callable[[sv.Detections, Dict[str, Any]], Any],
+    operator_type: str,
+    negate: bool,
+) -> np.ndarray:
+    operand = operand_builder(detections, global_parameters)
+    if isinstance(operand, VectorOperand):
+        result = VECTORIZED_PROPERTIES_EXISTENCE[operator_type]
+    else:
+        result = bool(UNARY_OPERATORS[operator_type](operand))
+    result = np.full((len(detections),), result)
+    if negate:
+        return np.logical_not(result)
+    return result
+
+
+def compile_operand(
+    definition: Union[StaticOperand, DynamicOperand],
+    execution_context: str,
+) -> Callable[[sv.Detections, Dict[str, Any]], Any]:
+    if is_detection_operand(definition=definition):
+        return compile_detection_property_operand(definition=definition)
+    if any(o.type in NON_VECTORIZABLE_OPERATIONS for o in definition.operations):
+        raise NotVectorizableError("Operand must be evaluated for each detection")
+    operand_builder = create_operand_builder(
+        definition=definition, execution_context=execution_context
+    )
+    return partial(scalar_operand_eval, operand_builder=operand_builder)
+
+
+def is_detection_operand(definition: Union[StaticOperand, DynamicOperand]) -> bool:
+    return (
+        isinstance(definition, DynamicOperand)
+        and definition.operand_name == DEFAULT_OPERAND_NAME
+    )
+
+
+def compile_detection_property_operand(
+    definition: DynamicOperand,
+) -> Callable[[sv.Detections, Dict[str, Any]], VectorOperand]:
+    if len(definition.operations) != 1 or not isinstance(
+        definition.operations[0], ExtractDetectionProperty
+    ):
+        raise NotVectorizableError("Detection operand must only extract its property")
+    property_name = definition.operations[0].property_name
+    if property_name not in VECTORIZED_PROPERTIES_EXTRACTORS:
+        raise NotVectorizableError(f"Property {property_name} is not vectorized")
+    extractor, kind = VECTORIZED_PROPERTIES_EXTRACTORS[property_name]
+    return partial(detection_property_operand_eval, extractor=extractor, kind=kind)
+
+
+def detection_property_operand_eval(
+    detections: sv.Detections,
+    global_parameters: Dict[str, Any],
+    extractor: Callable[[sv.Detections], np.ndarray],
+    kind: str,
+) -> VectorOperand:
+    return VectorOperand(value=extractor(detections), kind=kind)
+
+
+def scalar_operand_eval(
+    detections: sv.Detections,
+    global_parameters: Dict[str, Any],
+    operand_builder: Callable[[Dict[str, Any]], Any],
+) -> Any:
+    return operand_builder(global_parameters)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+
+
+def _unpack_operands(
+    left: Any, right: Any, kind: str, scalar_check: Callable[[Any], bool]
+) -> Tuple[Any, Any]:
+    unpacked = []
+    for operand in (left, right):
+        if isinstance(operand, VectorOperand):
+            if operand.kind != kind:
+                raise NotVectorizableError(f"Expected operand of kind {kind}")
+            unpacked.append(operand.value)
+        elif scalar_check(operand):
+            unpacked.append(operand)
+        else:
+            raise NotVectorizableError(f"Expected operand of kind {kind}")
+    return unpacked[0], unpacked[1]
+
+
+def vectorized_comparison(
+    left: Any, right: Any, comparator: Callable[[Any, Any], Any]
+) -> np.ndarray:
+    vector_kind = left.kind if isinstance(left, VectorOperand) else right.kind
+    if vector_kind == NUMBER_KIND:
+        left, right = _unpack_operands(
+            left=left, right=right, kind=NUMBER_KIND, scalar_check=_is_number
+        )
+    elif vector_kind == STRING_KIND and comparator in (eq, ne):
+        left, right = _unpack_operands(
+            left=left,
+            right=right,
+            kind=STRING_KIND,
+            scalar_check=lambda v: isinstance(v, str),
+        )
+    else:
+        raise NotVectorizableError("Comparison is not vectorized for operands")
+    return np.asarray(comparator(left, right), dtype=bool)
+
+
+def vectorized_string_operation(
+    left: Any, right: Any, operation: Callable[[np.ndarray, str], np.ndarray]
+) -> np.ndarray:
+    if (
+        not isinstance(left, VectorOperand)
+        or left.kind != STRING_KIND
+        or not isinstance(right, str)
+    ):
+        raise NotVectorizableError("String operation is not vectorized for operands")
+    return operation(left.value, right)
+
+
+def vectorized_in_sequence(left: Any, right: Any) -> np.ndarray:
+    if not isinstance(left, VectorOperand) or not isinstance(right, (list, tuple, set)):
+        raise NotVectorizableError("Membership check is not vectorized for operands")
+    elements = list(right)
+    if left.kind == NUMBER_KIND and all(_is_number(e) for e in elements):
+        return np.isin(left.value, np.array(elements, dtype=np.float64))
+    if left.kind == STRING_KIND and all(isinstance(e, str) for e in elements):
+        return np.isin(left.value, np.array(elements, dtype=str))
+    raise NotVectorizableError("Membership check is not vectorized for operands")
+
+
+def vectorized_point_in_zone(left: Any, right: Any) -> np.ndarray:
+    if not isinstance(left, VectorOperand) or left.kind != POINT_KIND:
+        raise NotVectorizableError("Zone check is not vectorized for operands")
+    polygon = shapely.geometry.Polygon(
+        [(zone_point[0], zone_point[1]) for zone_point in right]
+    )
+    if len(left.value) == 0:
+        return np.zeros((0,), dtype=bool)
+    points = shapely.points(left.value)
+    return np.asarray(shapely.within(points, polygon), dtype=bool)
+
+
+VECTORIZED_BINARY_OPERATORS = {
+    "==": partial(vectorized_comparison, comparator=eq),
+    "(Number) ==": partial(vectorized_comparison, comparator=eq),
+    "(Number) !=": partial(vectorized_comparison, comparator=ne),
+    "!=": partial(vectorized_comparison, comparator=ne),
+    "(Number) >": partial(vectorized_comparison, comparator=gt),
+    "(Number) >=": partial(vectorized_comparison, comparator=ge),
+    "(Number) <": partial(vectorized_comparison, comparator=lt),
+    "(Number) <=": partial(vectorized_comparison, comparator=le),
+    "(String) startsWith": partial(
+        vectorized_string_operation, operation=np.char.startswith
+    ),
+    "(String) endsWith": partial(
+        vectorized_string_operation, operation=np.char.endswith
+    ),
+    "(String) contains": partial(
+        vectorized_string_operation, operation=lambda a, b: np.char.find(a, b) >= 0
+    ),
+    "in (Sequence)": vectorized_in_sequence,
+    "(Detection) in zone": vectorized_point_in_zone,
+}
+
+VECTORIZED_PROPERTIES_EXISTENCE = {
+    "Exists": True,
+    "DoesNotExist": False,
+}
+
+STATEMENTS_GROUPS_COMBINERS = {
+    StatementsGroupsOperator.AND: np.logical_and,
+    StatementsGroupsOperator.OR: np.logical_or,
+}
@@ -1,4 +1,8 @@
+import hashlib
+import json
+from collections import OrderedDict
 from functools import partial
+from threading import Lock
 from typing import Any, Callable, Dict, List, Optional
 
 from inference.core.workflows.core_steps.common.query_language.entities.operations import (
@@ -82,6 +86,80 @@ def identity(value: Any, **kwargs) -> Any:
     return value
 
 
+class OperationsChainsCache:
+    """Memoizes compiled operations chains by hash of their definitions.
+
+    Intended to be held by block instances, such that chains declared in block
+    manifest are compiled once, instead of at each `run(...)`.
+    """
+
+    def __init__(self, max_size: int = 64):
+        self._chains: "OrderedDict[str, Callable[[T, Dict[str, Any]], V]]" = (
+            OrderedDict()
+        )
+        self._max_size = max_size
+        self._lock = Lock()
+
+    def get_or_build(
+        self,
+        operations: List[OperationDefinition],
+        execution_context: str = "<root>",
+    ) -> Callable[[T, Dict[str, Any]], V]:
+        key = hash_operations_chain_definition(
+            operations=operations, execution_context=execution_context
+        )
+        if key is None:
+            return build_operations_chain(
+                operations=operations, execution_context=execution_context
+            )
+        with self._lock:
+            if key in self._chains:
+                self._chains.move_to_end(key)
+                return self._chains[key]
+        operations_chain = build_operations_chain(
+            operations=operations, execution_context=execution_context
+        )
+        with self._lock:
+            self._chains[key] = operations_chain
+            if len(self._chains) > self._max_size:
+                self._chains.popitem(last=False)
+        return operations_chain
+
+    def __len__(self) -> int:
+        return len(self._chains)
+
+
+def hash_operations_chain_definition(
+    operations: List[OperationDefinition], execution_context: str
+) -> Optional[str]:
+    try:
+        serialised = json.dumps(
+            [
+                operation.model_dump(mode="json", by_alias=True)
+                for operation in operations
+            ]
+            + [execution_context],
+            sort_keys=True,
+        )
+    except (TypeError, ValueError, AttributeError):
+        return None
+    return hashlib.md5(serialised.encode("utf-8")).hexdigest()
+
+
+def get_operations_chain(
+    operations: List[OperationDefinition],
+    operations_chains_cache: Optional[OperationsChainsCache] = None,
+    execution_context: str = "<root>",
+) -> Callable[[T, Dict[str, Any]], V]:
+    if operations_chains_cache is None:
+        return build_operations_chain(
+            operations=operations, execution_context=execution_context
+        )
+    return operations_chains_cache.get_or_build(
+        operations=operations, execution_context=execution_context
+    )
+
+
 def build_operations_chain(
     operations: List[OperationDefinition], execution_context: str = "<root>"
 ) -> Callable[[T, Dict[str, Any]], V]:
@@ -161,12 +239,19 @@ def build_detections_filter_operation(
     from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
         build_eval_function,
     )
+    from inference.core.workflows.core_steps.common.query_language.evaluation_engine.vectorized import (
+        build_detections_mask_function,
+    )
 
     filtering_fun = build_eval_function(
         definition=definition.filter_operation,
         execution_context=execution_context,
     )
-    return partial(filter_detections, filtering_fun=filtering_fun)
+    mask_fun = build_detections_mask_function(
+        definition=definition.filter_operation,
+        execution_context=execution_context,
+    )
+    return partial(filter_detections, filtering_fun=filtering_fun, mask_fun=mask_fun)
 
 
 REGISTERED_SIMPLE_OPERATIONS = {
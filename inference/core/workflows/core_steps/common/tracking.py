@@ -0,0 +1,643 @@
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Tuple
+
+import numpy as np
+import supervision as sv
+from packaging.version import Version
+from scipy.optimize import linear_sum_assignment
+
+TRACK_STATE_NEW = 0
+TRACK_STATE_TRACKED = 1
+TRACK_STATE_LOST = 2
+TRACK_STATE_REMOVED = 3
+
+LOW_CONFIDENCE_THRESHOLD = 0.1
+SECOND_ASSOCIATION_THRESHOLD = 0.5
+UNCONFIRMED_ASSOCIATION_THRESHOLD = 0.7
+OUTPUT_ASSOCIATION_THRESHOLD = 0.5
+NO_ID = -1
+
+STD_WEIGHT_POSITION = 1.0 / 20
+STD_WEIGHT_VELOCITY = 1.0 / 160
+MOTION_MATRIX = np.eye(8) + np.eye(8, k=4)
+UPDATE_MATRIX = np.eye(4, 8)
+
+
+@dataclass(frozen=True)
+class ByteTrackParameters:
+    track_activation_threshold: float
+    lost_track_buffer: int
+    minimum_matching_threshold: float
+    minimum_consecutive_frames: int
+    frame_rate: float
+
+    @property
+    def max_time_lost(self) -> int:
+        return int(self.frame_rate / 30.0 * self.lost_track_buffer)
+
+
+@dataclass(frozen=True)
+class ByteTrackCompatibility:
+    """Details of `sv.ByteTrack` behaviour which differ between supported releases of
+    `supervision` - tracker follows the installed release, such that tracker IDs are
+    the same as produced by `sv.ByteTrack`."""
+
+    initial_tracklet_length: int
+    external_id_on_track_creation: bool
+    first_frame_activation_requires_consecutive_frames: bool
+    inclusive_activation_threshold: bool
+    capped_detection_threshold: bool
+    duplicated_tracks_iou_distance: float
+    float32_costs: bool
+
+    @classmethod
+    def for_supervision_version(cls, version: str) -> "ByteTrackCompatibility":
+        release = Version(Version(version).base_version)
+        return cls(
+            initial_tracklet_length=1 if release >= Version("0.30.0") else 0,
+            external_id_on_track_creation=release < Version("0.28.0"),
+            first_frame_activation_requires_consecutive_frames=release
+            >= Version("0.30.0"),
+            inclusive_activation_threshold=release >= Version("0.30.0"),
+            capped_detection_threshold=release >= Version("0.30.0"),
+            duplicated_tracks_iou_distance=(
+                0.15 if release < Version("0.28.0") else 0.05
+            ),
+            float32_costs=release >= Version("0.30.0"),
+        )
+
+
+SUPERVISION_COMPATIBILITY = ByteTrackCompatibility.for_supervision_version(
+    version=sv.__version__
+)
+
+
+class TracksArrays:
+    """Struct-of-arrays storage of all tracks for single video stream.
+
+    Kalman state is kept in `(x, y, a, h, vx, vy, va, vh)` space, where `(x, y)` is
+    the box center, `a` is aspect ratio and `h` is box height. Tracks marked as `fresh`
+    were not processed by Kalman filter yet - `sv.ByteTrack` keeps their state in
+    `float32`, which is reproduced when boxes of those tracks are computed.
+    """
+
+    def __init__(self, size: int = 0):
+        self.mean = np.zeros((size, 8), dtype=np.float64)
+        self.covariance = np.zeros((size, 8, 8), dtype=np.float64)
+        self.fresh = np.zeros((size,), dtype=bool)
+        self.score = np.zeros((size,), dtype=np.float64)
+        self.state = np.full((size,), TRACK_STATE_NEW, dtype=np.int8)
+        self.is_activated = np.zeros((size,), dtype=bool)
+        self.external_id = np.full((size,), NO_ID, dtype=np.int64)
+        self.tracklet_length = np.zeros((size,), dtype=np.int64)
+        self.frame_id = np.zeros((size,), dtype=np.int64)
+        self.start_frame = np.zeros((size,), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.score.shape[0]
+
+    def select(self, indices: np.ndarray) -> "TracksArrays":
+        result = TracksArrays()
+        for name, value in vars(self).items():
+            setattr(result, name, value[indices])
+        return result
+
+    def concatenate(self, other: "TracksArrays") -> "TracksArrays":
+        result = TracksArrays()
+        for name, value in vars(self).items():
+            setattr(result, name, np.concatenate([value, getattr(other, name)]))
+        return result
+
+    def xyxy(self, indices: np.ndarray) -> np.ndarray:
+        xyah = self.mean[indices, :4]
+        fresh = self.fresh[indices]
+        if not fresh.any():
+            return xyah_to_xyxy(xyah)
+        fresh_xyxy = xyah_to_xyxy(xyah[fresh].astype(np.float32))
+        if fresh.all():
+            return fresh_xyxy
+        result = xyah_to_xyxy(xyah)
+        result[fresh] = fresh_xyxy
+        return result
+
+
+class VideoTracker:
+    """ByteTrack algorithm operating on `TracksArrays`, producing the same results as
+    `sv.ByteTrack` of installed `supervision` release.
+
+    Kalman filter steps and IoU computations are vectorized over all tracks of the video.
+    Tracks are stored in the order of `sv.ByteTrack` lists - tracked ones first, then
+    lost ones - as the order decides about ties in assignments and order of new IDs.
+    """
+
+    def __init__(
+        self,
+        parameters: ByteTrackParameters,
+        compatibility: ByteTrackCompatibility = SUPERVISION_COMPATIBILITY,
+    ):
+        self._parameters = parameters
+        self._compatibility = compatibility
+        self._tracks = TracksArrays()
+        self._tracked_count = 0
+        self._frame_id = 0
+        self._external_id_counter = 1
+        self.last_update = time.monotonic()
+
+    @property
+    def parameters(self) -> ByteTrackParameters:
+        return self._parameters
+
+    @property
+    def tracks(self) -> TracksArrays:
+        return self._tracks
+
+    @property
+    def detection_threshold(self) -> float:
+        threshold = self._parameters.track_activation_threshold + 0.1
+        if threshold > 1.0 and self._compatibility.capped_detection_threshold:
+            return self._parameters.track_activation_threshold
+        return threshold
+
+    def update(self, detections: sv.Detections) -> sv.Detections:
+        if detections.confidence is None:
+            raise ValueError("Detections confidence must be provided for tracking.")
+        self.last_update = time.monotonic()
+        # boxes and scores are stacked into single array by `sv.ByteTrack`
+        dtype = np.result_type(detections.xyxy, detections.confidence)
+        xyxy = detections.xyxy.astype(dtype)
+        self._update_tracks(xyxy=xyxy, scores=detections.confidence.astype(dtype))
+        output = np.flatnonzero(self._tracks.is_activated[: self._tracked_count])
+        if len(output) == 0:
+            tracked_detections = sv.Detections.empty()
+            tracked_detections.tracker_id = np.array([], dtype=int)
+            return tracked_detections
+        # tracks are assigned to detections by IoU of boxes, as in `sv.ByteTrack`
+        matches, _, _ = linear_assignment(
+            cost_matrix=1 - sv.box_iou_batch(xyxy, self._tracks.xyxy(output)),
+            threshold=OUTPUT_ASSOCIATION_THRESHOLD,
+        )
+        tracker_ids = np.full((len(detections),), NO_ID, dtype=int)
+        tracker_ids[matches[:, 0]] = self._tracks.external_id[output[matches[:, 1]]]
+        tracked_mask = tracker_ids != NO_ID
+        tracked_detections = detections[tracked_mask]
+        tracked_detections.tracker_id = tracker_ids[tracked_mask]
+        return tracked_detections
+
+    def _update_tracks(self, xyxy: np.ndarray, scores: np.ndarray) -> None:
+        parameters = self._parameters
+        float32_costs = self._compatibility.float32_costs
+        self._frame_id += 1
+        valid = _valid_boxes_mask(xyxy=xyxy, scores=scores)
+        xyxy, scores = xyxy[valid], scores[valid]
+        if self._compatibility.inclusive_activation_threshold:
+            high_mask = scores >= parameters.track_activation_threshold
+        else:
+            high_mask = scores > parameters.track_activation_threshold
+        second_mask = (scores > LOW_CONFIDENCE_THRESHOLD) & (
+            scores < parameters.track_activation_threshold
+        )
+        high_indices = np.flatnonzero(high_mask)
+        second_indices = np.flatnonzero(second_mask)
+        tlwh = xyxy_to_tlwh(xyxy=xyxy)
+        boxes = tlwh_to_xyxy(tlwh=tlwh)
+        measurements = tlwh_to_xyah(tlwh=tlwh)
+        tracks = self._tracks
+        rows = np.arange(len(tracks))
+        tracked, lost = rows[: self._tracked_count], rows[self._tracked_count :]
+        # tracks removed in previous frame are still kept with lost ones by
+        # `sv.ByteTrack` - they take part in association one more time
+        removed_before = tracks.state[lost] == TRACK_STATE_REMOVED
+        unconfirmed = tracked[~tracks.is_activated[tracked]]
+        pool = np.concatenate([tracked[tracks.is_activated[tracked]], lost])
+        self._predict(indices=pool)
+        distances = fuse_score(
+            cost_matrix=iou_distance(
+                tracks.xyxy(pool), boxes[high_indices], float32_costs=float32_costs
+            ),
+            scores=scores[high_indices],
+            float32_costs=float32_costs,
+        )
+        matches, unmatched_pool, unmatched_high = linear_assignment(
+            cost_matrix=distances, threshold=parameters.minimum_matching_threshold
+        )
+        matched_pool = pool[matches[:, 0]]
+        refound = matched_pool[tracks.state[matched_pool] != TRACK_STATE_TRACKED]
+        self._apply_matches(
+            indices=matched_pool,
+            measurements=measurements[high_indices[matches[:, 1]]],
+            scores=scores[high_indices[matches[:, 1]]],
+        )
+        remaining_tracked = pool[unmatched_pool]
+        remaining_tracked = remaining_tracked[
+            tracks.state[remaining_tracked] == TRACK_STATE_TRACKED
+        ]
+        distances = iou_distance(
+            tracks.xyxy(remaining_tracked),
+            boxes[second_indices],
+            float32_costs=float32_costs,
+        )
+        matches, unmatched_tracked, _ = linear_assignment(
+            cost_matrix=distances, threshold=SECOND_ASSOCIATION_THRESHOLD
+        )
+        self._apply_matches(
+            indices=remaining_tracked[matches[:, 0]],
+            measurements=measurements[second_indices[matches[:, 1]]],
+            scores=scores[second_indices[matches[:, 1]]],
+        )
+        newly_lost = remaining_tracked[unmatched_tracked]
+        tracks.state[newly_lost] = TRACK_STATE_LOST
+        high_indices = high_indices[unmatched_high]
+        distances = fuse_score(
+            cost_matrix=iou_distance(
+                tracks.xyxy(unconfirmed),
+                boxes[high_indices],
+                float32_costs=float32_costs,
+            ),
+            scores=scores[high_indices],
+            float32_costs=float32_costs,
+        )
+        matches, unmatched_unconfirmed, unmatched_high = linear_assignment(
+            cost_matrix=distances, threshold=UNCONFIRMED_ASSOCIATION_THRESHOLD
+        )
+        self._apply_matches(
+            indices=unconfirmed[matches[:, 0]],
+            measurements=measurements[high_indices[matches[:, 1]]],
+            scores=scores[high_indices[matches[:, 1]]],
+        )
+        tracks.state[unconfirmed[unmatched_unconfirmed]] = TRACK_STATE_REMOVED
+        new_boxes = high_indices[unmatched_high]
+        new_boxes = new_boxes[scores[new_boxes] >= self.detection_threshold]
+        new_tracks = self._create_tracks(
+            measurements=measurements[new_boxes], scores=scores[new_boxes]
+        )
+        expired = lost[
+            self._frame_id - tracks.frame_id[lost] > parameters.max_time_lost
+        ]
+        tracks.state[expired] = TRACK_STATE_REMOVED
+        still_lost = lost[(tracks.state[lost] != TRACK_STATE_TRACKED) & ~removed_before]
+        tracked_order = np.concatenate(
+            [
+                tracked[tracks.state[tracked] == TRACK_STATE_TRACKED],
+                len(tracks) + np.arange(len(new_tracks)),
+                refound,
+            ]
+        )
+        lost_order = np.concatenate([still_lost, newly_lost])
+        self._tracks = tracks.concatenate(new_tracks)
+        self._remove_duplicated_tracks(
+            tracked_order=tracked_order, lost_order=lost_order
+        )
+
+    def _predict(self, indices: np.ndarray) -> None:
+        if len(indices) == 0:
+            return None
+        tracks = self._tracks
+        mean = tracks.mean[indices].copy()
+        if tracks.fresh[indices].all():
+            mean = mean.astype(np.float32)
+        mean[tracks.state[indices] != TRACK_STATE_TRACKED, 7] = 0
+        tracks.mean[indices], tracks.covariance[indices] = kalman_predict(
+            mean=mean, covariance=tracks.covariance[indices]
+        )
+        tracks.fresh[indices] = False
+
+    def _apply_matches(
+        self, indices: np.ndarray, measurements: np.ndarray, scores: np.ndarray
+    ) -> None:
+        if len(indices) == 0:
+            return None
+        tracks = self._tracks
+        tracks.mean[indices], tracks.covariance[indices] = kalman_update(
+            mean=tracks.mean[indices],
+            covariance=tracks.covariance[indices],
+            measurement=measurements,
+        )
+        tracks.fresh[indices] = False
+        re_activated = tracks.state[indices] != TRACK_STATE_TRACKED
+        tracks.tracklet_length[indices] = np.where(
+            re_activated, 0, tracks.tracklet_length[indices] + 1
+        )
+        tracks.state[indices] = TRACK_STATE_TRACKED
+        tracks.frame_id[indices] = self._frame_id
+        tracks.score[indices] = scores
+        to_be_activated = indices[
+            ~re_activated
+            & (
+                tracks.tracklet_length[indices]
+                >= self._parameters.minimum_consecutive_frames
+            )
+        ]
+        tracks.is_activated[to_be_activated] = True
+        without_external_id = to_be_activated[
+            tracks.external_id[to_be_activated] == NO_ID
+        ]
+        tracks.external_id[without_external_id] = self._generate_external_ids(
+            count=len(without_external_id)
+        )
+
+    def _create_tracks(
+        self, measurements: np.ndarray, scores: np.ndarray
+    ) -> TracksArrays:
+        new_tracks = TracksArrays(size=len(measurements))
+        if len(measurements) == 0:
+            return new_tracks
+        compatibility = self._compatibility
+        minimum_consecutive_frames = self._parameters.minimum_consecutive_frames
+        new_tracks.mean, new_tracks.covariance = kalman_initiate(
+            measurement=measurements.astype(np.float64)
+        )
+        new_tracks.fresh[:] = True
+        new_tracks.score[:] = scores
+        new_tracks.state[:] = TRACK_STATE_TRACKED
+        new_tracks.tracklet_length[:] = compatibility.initial_tracklet_length
+        new_tracks.frame_id[:] = self._frame_id
+        new_tracks.start_frame[:] = self._frame_id
+        is_activated = self._frame_id == 1 and (
+            not compatibility.first_frame_activation_requires_consecutive_frames
+            or compatibility.initial_tracklet_length >= minimum_consecutive_frames
+        )
+        new_tracks.is_activated[:] = is_activated
+        if compatibility.external_id_on_track_creation:
+            with_external_id = minimum_consecutive_frames == 1
+        else:
+            with_external_id = is_activated and (
+                compatibility.first_frame_activation_requires_consecutive_frames
+                or minimum_consecutive_frames == 1
+            )
+        if with_external_id:
+            new_tracks.external_id[:] = self._generate_external_ids(
+                count=len(measurements)
+            )
+        return new_tracks
+
+    def _remove_duplicated_tracks(
+        self, tracked_order: np.ndarray, lost_order: np.ndarray
+    ) -> None:
+        tracks = self._tracks
+        distances = iou_distance(
+            tracks.xyxy(tracked_order),
+            tracks.xyxy(lost_order),
+            float32_costs=self._compatibility.float32_costs,
+        )
+        tracked_pairs, lost_pairs = np.nonzero(
+            distances < self._compatibility.duplicated_tracks_iou_distance
+        )
+        age = tracks.frame_id - tracks.start_frame
+        tracked_older = age[tracked_order[tracked_pairs]] > age[lost_order[lost_pairs]]
+        tracked_keep = np.ones((len(tracked_order),), dtype=bool)
+        tracked_keep[tracked_pairs[~tracked_older]] = False
+        lost_keep = np.ones((len(lost_order),), dtype=bool)
+        lost_keep[lost_pairs[tracked_older]] = False
+        self._tracked_count = int(tracked_keep.sum())
+        self._tracks = tracks.select(
+            np.concatenate([tracked_order[tracked_keep], lost_order[lost_keep]])
+        )
+
+    def _generate_external_ids(self, count: int) -> np.ndarray:
+        ids = np.arange(self._external_id_counter, self._external_id_counter + count)
+        self._external_id_counter += count
+        return ids
+
+
+class ByteTrackEngine:
+    """Keeps ByteTrack state for multiple video streams.
+
+    Trackers of video streams that were not updated for `idle_timeout` seconds are
+    evicted, when the number of trackers exceeds `max_videos` - least recently updated
+    ones are dropped.
+    """
+
+    def __init__(self, idle_timeout: float, max_videos: int):
+        self._idle_timeout = idle_timeout
+        self._max_videos = max(max_videos, 1)
+        self._trackers: Dict[str, VideoTracker] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._trackers)
+
+    def __contains__(self, video_identifier: str) -> bool:
+        return video_identifier in self._trackers
+
+    def update(
+        self,
+        video_identifier: str,
+        detections: sv.Detections,
+        parameters: ByteTrackParameters,
+    ) -> sv.Detections:
+        return self.update_batch(
+            video_identifiers=[video_identifier],
+            detections=[detections],
+            parameters=[parameters],
+        )[0]
+
+    def update_batch(
+        self,
+        video_identifiers: List[str],
+        detections: List[sv.Detections],
+        parameters: List[ByteTrackParameters],
+    ) -> List[sv.Detections]:
+        with self._lock:
+            self._evict_idle_trackers(active_video_identifiers=set(video_identifiers))
+            results = []
+            for video_identifier, video_detections, video_parameters in zip(
+                video_identifiers, detections, parameters
+            ):
+                tracker = self._get_tracker(
+                    video_identifier=video_identifier, parameters=video_parameters
+                )
+                results.append(tracker.update(detections=video_detections))
+            return results
+
+    def evict(self, video_identifier: str) -> None:
+        with self._lock:
+            self._trackers.pop(video_identifier, None)
+
+    def _get_tracker(
+        self, video_identifier: str, parameters: ByteTrackParameters
+    ) -> VideoTracker:
+        tracker = self._trackers.get(video_identifier)
+        if tracker is None:
+            tracker = VideoTracker(parameters=parameters)
+            self._trackers[video_identifier] = tracker
+        return tracker
+
+    def _evict_idle_trackers(self, active_video_identifiers: set) -> None:
+        now = time.monotonic()
+        for video_identifier, tracker in list(self._trackers.items()):
+            if video_identifier in active_video_identifiers:
+                continue
+            if now - tracker.last_update > self._idle_timeout:
+                del self._trackers[video_identifier]
+        excess = (
+            len(set(self._trackers).union(active_video_identifiers)) - self._max_videos
+        )
+        if excess <= 0:
+            return None
+        candidates = sorted(
+            (
+                (tracker.last_update, video_identifier)
+                for video_identifier, tracker in self._trackers.items()
+                if video_identifier not in active_video_identifiers
+            )
+        )
+        for _, video_identifier in candidates[:excess]:
+            del self._trackers[video_identifier]
+
+
+def linear_assignment(
+    cost_matrix: np.ndarray, threshold: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rows, columns = cost_matrix.shape
+    if cost_matrix.size == 0:
+        return np.empty((0, 2), dtype=int), np.arange(rows), np.arange(columns)
+    assignment_cost_matrix = cost_matrix.copy()
+    assignment_cost_matrix[assignment_cost_matrix > threshold] = threshold + 1e-4
+    row_indices, column_indices = linear_sum_assignment(assignment_cost_matrix)
+    matches = np.stack([row_indices, column_indices], axis=1)
+    matches = matches[cost_matrix[row_indices, column_indices] <= threshold]
+    # unmatched indices are ordered as iteration over python set, the way
+    # `sv.ByteTrack` orders them - it decides about the order of new tracks
+    unmatched_rows = tuple(set(range(rows)) - set(matches[:, 0].tolist()))
+    unmatched_columns = tuple(set(range(columns)) - set(matches[:, 1].tolist()))
+    return (
+        matches.astype(int),
+        np.array(unmatched_rows, dtype=int),
+        np.array(unmatched_columns, dtype=int),
+    )
+
+
+def iou_distance(
+    xyxy_a: np.ndarray, xyxy_b: np.ndarray, float32_costs: bool
+) -> np.ndarray:
+    if len(xyxy_a) == 0 or len(xyxy_b) == 0:
+        return np.empty((len(xyxy_a), len(xyxy_b)), dtype=np.float32)
+    if float32_costs:
+        ious = sv.box_iou_batch(xyxy_a.astype(np.float32), xyxy_b.astype(np.float32))
+        return np.asarray(1 - ious, dtype=np.float32)
+    return 1 - sv.box_iou_batch(xyxy_a, xyxy_b)
+
+
+def fuse_score(
+    cost_matrix: np.ndarray, scores: np.ndarray, float32_costs: bool
+) -> np.ndarray:
+    if cost_matrix.size == 0:
+        return cost_matrix
+    if float32_costs:
+        fused = 1 - (1 - cost_matrix) * scores.astype(np.float32)[np.newaxis, :]
+        return np.asarray(fused, dtype=np.float32)
+    return 1 - (1 - cost_matrix) * scores[np.newaxis, :]
+
+
+def xyxy_to_tlwh(xyxy: np.ndarray) -> np.ndarray:
+    # detections are kept in `float32` by `sv.ByteTrack`
+    tlwh = xyxy.copy()
+    tlwh[:, 2:] -= tlwh[:, :2]
+    return tlwh.astype(np.float32)
+
+
+def tlwh_to_xyxy(tlwh: np.ndarray) -> np.ndarray:
+    xyxy = tlwh.copy()
+    xyxy[:, 2:] += xyxy[:, :2]
+    return xyxy
+
+
+def tlwh_to_xyah(tlwh: np.ndarray) -> np.ndarray:
+    xyah = tlwh.copy()
+    xyah[:, :2] += xyah[:, 2:] / 2
+    xyah[:, 2] /= xyah[:, 3]
+    return xyah
+
+
+def xyah_to_xyxy(xyah: np.ndarray) -> np.ndarray:
+    xyxy = xyah.copy()
+    xyxy[:, 2] *= xyxy[:, 3]
+    xyxy[:, :2] -= xyxy[:, 2:] / 2
+    xyxy[:, 2:] += xyxy[:, :2]
+    return xyxy
+
+
+def kalman_initiate(measurement: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    mean = np.concatenate([measurement, np.zeros_like(measurement)], axis=1)
+    height = measurement[:, 3]
+    std = np.stack(
+        [
+            2 * STD_WEIGHT_POSITION * height,
+            2 * STD_WEIGHT_POSITION * height,
+            np.full_like(height, 1e-2),
+            2 * STD_WEIGHT_POSITION * height,
+            10 * STD_WEIGHT_VELOCITY * height,
+            10 * STD_WEIGHT_VELOCITY * height,
+            np.full_like(height, 1e-5),
+            10 * STD_WEIGHT_VELOCITY * height,
+        ],
+        axis=1,
+    )
+    return mean, _batch_diagonal(np.square(std))
+
+
+def kalman_predict(
+    mean: np.ndarray, covariance: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    height = mean[:, 3]
+    std = np.stack(
+        [
+            STD_WEIGHT_POSITION * height,
+            STD_WEIGHT_POSITION * height,
+            np.full_like(height, 1e-2),
+            STD_WEIGHT_POSITION * height,
+            STD_WEIGHT_VELOCITY * height,
+            STD_WEIGHT_VELOCITY * height,
+            np.full_like(height, 1e-5),
+            STD_WEIGHT_VELOCITY * height,
+        ],
+        axis=1,
+    )
+    mean = mean @ MOTION_MATRIX.T
+    covariance = MOTION_MATRIX @ covariance @ MOTION_MATRIX.T + _batch_diagonal(
+        np.square(std)
+    )
+    return mean, covariance
+
+
+def kalman_update(
+    mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    height = mean[:, 3]
+    std = np.stack(
+        [
+            STD_WEIGHT_POSITION * height,
+            STD_WEIGHT_POSITION * height,
+            np.full_like(height, 1e-1),
+            STD_WEIGHT_POSITION * height,
+        ],
+        axis=1,
+    )
+    projected_mean = mean @ UPDATE_MATRIX.T
+    projected_covariance = (
+        UPDATE_MATRIX @ covariance @ UPDATE_MATRIX.T + _batch_diagonal(np.square(std))
+    )
+    covariance_times_update = covariance @ UPDATE_MATRIX.T
+    kalman_gain = np.linalg.solve(
+        projected_covariance, covariance_times_update.transpose(0, 2, 1)
+    ).transpose(0, 2, 1)
+    innovation = measurement - projected_mean
+    new_mean = mean + (kalman_gain @ innovation[:, :, np.newaxis])[:, :, 0]
+    new_covariance = covariance - kalman_gain @ projected_covariance @ (
+        kalman_gain.transpose(0, 2, 1)
+    )
+    return new_mean, new_covariance
+
+
+def _batch_diagonal(values: np.ndarray) -> np.ndarray:
+    result = np.zeros(values.shape + (values.shape[1],), dtype=values.dtype)
+    diagonal = np.arange(values.shape[1])
+    result[:, diagonal, diagonal] = values
+    return result
+
+
+def _valid_boxes_mask(xyxy: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    finite = np.isfinite(xyxy).all(axis=1) & np.isfinite(scores)
+    return finite & (xyxy[:, 2] - xyxy[:, 0] > 0) & (xyxy[:, 3] - xyxy[:, 1] > 0)
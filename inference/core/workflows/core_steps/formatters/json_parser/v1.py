@@ -89,6 +89,10 @@ class BlockManifest(WorkflowBlockManifest):
             result.append(OutputDefinition(name=field_name))
         return result
 
+    @classmethod
+    def has_deterministic_outputs(cls) -> bool:
+        return True
+
     @classmethod
     def get_execution_engine_compatibility(cls) -> Optional[str]:
         return ">=1.3.0,<2.0.0"
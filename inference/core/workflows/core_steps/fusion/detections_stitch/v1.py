@@ -1,10 +1,10 @@
-from copy import deepcopy
+from dataclasses import replace
 from typing import Dict, List, Literal, Optional, Tuple, Type, Union
 
 import numpy as np
 import supervision as sv
 from pydantic import ConfigDict, Field
-from supervision import OverlapFilter, move_boxes, move_masks
+from supervision import OverlapFilter
 
 from inference.core.workflows.execution_engine.constants import (
     PARENT_COORDINATES_KEY,
@@ -127,26 +127,13 @@ class DetectionsStitchBlockV1(WorkflowBlock):
         overlap_filtering_strategy: Optional[Literal["none", "nms", "nmm"]],
         iou_threshold: Optional[float],
     ) -> BlockResult:
-        re_aligned_predictions = []
-        for detections in predictions:
-            detections_copy = deepcopy(detections)
-            resolution_wh = retrieve_crop_wh(detections=detections_copy)
-            offset = retrieve_crop_offset(detections=detections_copy)
-            detections_copy = manage_crops_metadata(
-                detections=detections_copy,
-                offset=offset,
-                parent_id=reference_image.parent_metadata.parent_id,
-            )
-            re_aligned_detections = move_detections(
-                detections=detections_copy,
-                offset=offset,
-                resolution_wh=resolution_wh,
-            )
-            re_aligned_predictions.append(re_aligned_detections)
+        merged = stitch_detections(
+            detections_list=list(predictions),
+            parent_id=reference_image.parent_metadata.parent_id,
+        )
         overlap_filter = choose_overlap_filter_strategy(
             overlap_filtering_strategy=overlap_filtering_strategy,
         )
-        merged = sv.Detections.merge(detections_list=re_aligned_predictions)
         if overlap_filter is OverlapFilter.NONE:
             return {"predictions": merged}
         if overlap_filter is OverlapFilter.NON_MAX_SUPPRESSION:
@@ -154,6 +141,72 @@ class DetectionsStitchBlockV1(WorkflowBlock):
         return {"predictions": merged.with_nmm(threshold=iou_threshold)}
 
 
+def stitch_detections(
+    detections_list: List[sv.Detections],
+    parent_id: str,
+) -> sv.Detections:
+    """
+    Merges detections made against crops of the same image into single detections
+    object expressed in coordinates of the parent image.
+
+    Crops are merged once and offsets are applied to all boxes at once, instead of
+    re-aligning copy of each crop separately - only masks need to be pasted per crop,
+    as crops may differ in size.
+    """
+    crops = []
+    for detections in detections_list:
+        if len(detections) == 0:
+            continue
+        resolution_wh = retrieve_crop_wh(detections=detections)
+        offset = retrieve_crop_offset(detections=detections)
+        ensure_detections_not_scaled(detections=detections)
+        crops.append((detections, offset, resolution_wh))
+    if not crops:
+        return sv.Detections.merge(detections_list=detections_list)
+    merged = sv.Detections.merge(
+        detections_list=[replace(detections, mask=None) for detections, _, _ in crops]
+    )
+    offsets = np.repeat(
+        np.stack([offset for _, offset, _ in crops]),
+        [len(detections) for detections, _, _ in crops],
+        axis=0,
+    )
+    merged.xyxy = merged.xyxy + np.hstack([offsets, offsets])
+    if PARENT_COORDINATES_KEY in merged.data:
+        merged.data[PARENT_COORDINATES_KEY] -= offsets
+    if ROOT_PARENT_COORDINATES_KEY in merged.data:
+        merged.data[ROOT_PARENT_COORDINATES_KEY] -= offsets
+    merged.data[PARENT_ID_KEY] = np.array([parent_id] * len(merged))
+    if any(detections.mask is not None for detections, _, _ in crops):
+        merged.mask = paste_masks(crops=crops)
+    return merged
+
+
+def paste_masks(
+    crops: List[Tuple[sv.Detections, np.ndarray, Tuple[int, int]]],
+) -> np.ndarray:
+    if any(detections.mask is None for detections, _, _ in crops):
+        raise ValueError("All or none of the crops predictions must contain masks")
+    resolution_w, resolution_h = crops[0][2]
+    total_detections = sum(len(detections) for detections, _, _ in crops)
+    result = np.zeros((total_detections, resolution_h, resolution_w), dtype=bool)
+    start = 0
+    for detections, offset, _ in crops:
+        end = start + len(detections)
+        masks = detections.mask
+        x_min, y_min = max(offset[0], 0), max(offset[1], 0)
+        x_max = min(offset[0] + masks.shape[2], resolution_w)
+        y_max = min(offset[1] + masks.shape[1], resolution_h)
+        if x_max > x_min and y_max > y_min:
+            result[start:end, y_min:y_max, x_min:x_max] = masks[
+                :,
+                y_min - offset[1] : y_max - offset[1],
+                x_min - offset[0] : x_max - offset[0],
+            ]
+        start = end
+    return result
+
+
 def retrieve_crop_wh(detections: sv.Detections) -> Optional[Tuple[int, int]]:
     if len(detections) == 0:
         return None
@@ -181,17 +234,7 @@ def retrieve_crop_offset(detections: sv.Detections) -> Optional[np.ndarray]:
     return detections.data[PARENT_COORDINATES_KEY][0][:2].copy()
 
 
-def manage_crops_metadata(
-    detections: sv.Detections,
-    offset: Optional[np.ndarray],
-    parent_id: str,
-) -> sv.Detections:
-    if len(detections) == 0:
-        return detections
-    if offset is None:
-        raise ValueError(
-            "To process non-empty detections offset is needed, but not given"
-        )
+def ensure_detections_not_scaled(detections: sv.Detections) -> None:
     if SCALING_RELATIVE_TO_PARENT_KEY in detections.data:
         scale = detections[SCALING_RELATIVE_TO_PARENT_KEY][0]
         if abs(scale - 1.0) > 1e-4:
@@ -202,38 +245,6 @@ def manage_crops_metadata(
                 f"scaling cannot be used in the meantime. This error probably indicate "
                 f"wrong step output plugged as input of this step."
             )
-    if PARENT_COORDINATES_KEY in detections.data:
-        detections.data[PARENT_COORDINATES_KEY] -= offset
-    if ROOT_PARENT_COORDINATES_KEY in detections.data:
-        detections.data[ROOT_PARENT_COORDINATES_KEY] -= offset
-    detections.data[PARENT_ID_KEY] = np.array([parent_id] * len(detections))
-    return detections
-
-
-def move_detections(
-    detections: sv.Detections,
-    offset: Optional[np.ndarray],
-    resolution_wh: Optional[Tuple[int, int]],
-) -> sv.Detections:
-    """
-    Copied from: https://github.com/roboflow/supervision/blob/5123085037ec594524fc8f9d9b71b1cd9f487e8d/supervision/detection/tools/inference_slicer.py#L17-L16
-    to avoid fragile contract with supervision, as this function is not element of public
-    API.
-    """
-    if len(detections) == 0:
-        return detections
-    if offset is None:
-        raise ValueError("To move non-empty detections offset is needed, but not given")
-    detections.xyxy = move_boxes(xyxy=detections.xyxy, offset=offset)
-    if detections.mask is not None:
-        if resolution_wh is None:
-            raise ValueError(
-                "To move non-empty detections with segmentation mask, resolution_wh is needed, but not given."
-            )
-        detections.mask = move_masks(
-            masks=detections.mask, offset=offset, resolution_wh=resolution_wh
-        )
-    return detections
 
 
 def choose_overlap_filter_strategy(
@@ -278,6 +278,9 @@ from inference.core.workflows.core_steps.transformations.byte_tracker.v2 import
 from inference.core.workflows.core_steps.transformations.byte_tracker.v3 import (
     ByteTrackerBlockV3,
 )
+from inference.core.workflows.core_steps.transformations.byte_tracker.v4 import (
+    ByteTrackerBlockV4,
+)
 from inference.core.workflows.core_steps.transformations.detection_offset.v1 import (
     DetectionOffsetBlockV1,
 )
@@ -586,6 +589,7 @@ def load_blocks() -> List[Type[WorkflowBlock]]:
         TraceVisualizationBlockV1,
         ReferencePathVisualizationBlockV1,
         ByteTrackerBlockV3,
+        ByteTrackerBlockV4,
         WebhookSinkBlockV1,
         RoboflowInstanceSegmentationModelBlockV2,
         RoboflowKeypointDetectionModelBlockV2,
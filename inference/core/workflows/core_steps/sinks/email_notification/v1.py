@@ -20,7 +20,8 @@ from inference.core.workflows.core_steps.common.query_language.entities.operatio
     AllOperationsType,
 )
 from inference.core.workflows.core_steps.common.query_language.operations.core import (
-    build_operations_chain,
+    OperationsChainsCache,
+    get_operations_chain,
 )
 from inference.core.workflows.execution_engine.entities.base import OutputDefinition
 from inference.core.workflows.execution_engine.entities.types import (
@@ -320,6 +321,7 @@ class EmailNotificationBlockV1(WorkflowBlock):
         self._background_tasks = background_tasks
         self._thread_pool_executor = thread_pool_executor
         self._last_notification_fired: Optional[datetime] = None
+        self._operations_chains_cache = OperationsChainsCache()
 
     @classmethod
     def get_init_parameters(cls) -> List[str]:
@@ -369,6 +371,7 @@ class EmailNotificationBlockV1(WorkflowBlock):
             message=message,
             message_parameters=message_parameters,
             message_parameters_operations=message_parameters_operations,
+            operations_chains_cache=self._operations_chains_cache,
         )
         receiver_email = (
             receiver_email if isinstance(receiver_email, list) else [receiver_email]
@@ -425,6 +428,7 @@ def format_email_message(
     message: str,
     message_parameters: Dict[str, Any],
     message_parameters_operations: Dict[str, List[AllOperationsType]],
+    operations_chains_cache: Optional[OperationsChainsCache] = None,
 ) -> str:
     matching_parameters = PARAMETER_REGEX.findall(message)
     parameters_to_get_values = {
@@ -437,7 +441,9 @@ def format_email_message(
         if not operations:
             parameters_values[parameter_name] = parameter_value
             continue
-        operations_chain = build_operations_chain(operations=operations)
+        operations_chain = get_operations_chain(
+            operations=operations, operations_chains_cache=operations_chains_cache
+        )
         parameters_values[parameter_name] = operations_chain(
             parameter_value, global_parameters={}
         )
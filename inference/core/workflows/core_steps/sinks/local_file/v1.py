@@ -2,11 +2,15 @@ import json
 import logging
 import os.path
 from datetime import datetime
+from functools import partial
 from io import TextIOWrapper
-from typing import Any, List, Literal, Optional, Type, Union
+from threading import Lock
+from typing import Any, Callable, List, Literal, Optional, Type, Union
 
 from pydantic import ConfigDict, Field, field_validator
 
+from inference.core.env import LOCAL_FILE_SINK_FSYNC
+from inference.core.utils.background_writer import BackgroundWriter
 from inference.core.workflows.execution_engine.entities.base import OutputDefinition
 from inference.core.workflows.execution_engine.entities.types import (
     BOOLEAN_KIND,
@@ -52,6 +56,18 @@ passed to `content` input up to `max_entries_per_file`. In this mode it is impor
     consecutive updates into the content of already created file.
     
 
+### Async execution
+
+Configure the `fire_and_forget` property. Set it to True if you want the content to be written in the 
+background, allowing the Workflow to proceed without waiting on disk. Writes are executed in order by single 
+background writer with bounded queue - if the writer falls behind, Workflow execution either waits or content 
+gets dropped (configured with environmental variables `SINKS_WRITER_MAX_PENDING_TASKS` and 
+`SINKS_WRITER_FULL_QUEUE_POLICY` - `block` or `drop`). In `append_log` mode, file is flushed (and `fsync`-ed 
+if `LOCAL_FILE_SINK_FSYNC=True`) once the writer has no more pending entries, not after each entry. 
+In this mode `error_status` output reports dropped content and failures of background writes which 
+happened since the previous run of the block (not the failure of content passed in the current run), so 
+we **recommend setting the `fire_and_forget=False` for debugging purposes**.
+
 !!! warning "Security considerations"
 
     The block has an ability to write to the file system. If you find this unintended in your system, 
@@ -127,6 +143,14 @@ class BlockManifest(WorkflowBlockManifest):
         },
     )
 
+    fire_and_forget: Union[bool, Selector(kind=[BOOLEAN_KIND])] = Field(
+        default=False,
+        description="Boolean flag dictating if content is supposed to be written in the background, "
+        "not waiting for file system operations before end of workflow run. Use `True` if best-effort "
+        "saving is needed, use `False` while debugging and if error handling is needed",
+        examples=["$inputs.fire_and_forget", True],
+    )
+
     @field_validator("max_entries_per_file")
     @classmethod
     def ensure_max_entries_per_file_is_correct(cls, value: Any) -> Any:
@@ -155,6 +179,10 @@ class LocalFileSinkBlockV1(WorkflowBlock):
         self._entries_in_file = 0
         self._allow_access_to_file_system = allow_access_to_file_system
         self._allowed_write_directory = allowed_write_directory
+        self._background_writer: Optional[BackgroundWriter] = None
+        self._background_errors: List[str] = []
+        self._background_errors_lock = Lock()
+        self._file_lock = Lock()
 
     @classmethod
     def get_init_parameters(cls) -> List[str]:
@@ -172,6 +200,7 @@ class LocalFileSinkBlockV1(WorkflowBlock):
         target_directory: str,
         file_name_prefix: str,
         max_entries_per_file: int,
+        fire_and_forget: bool,
     ) -> BlockResult:
         if not self._allow_access_to_file_system:
             raise RuntimeError(
@@ -181,19 +210,63 @@ class LocalFileSinkBlockV1(WorkflowBlock):
             )
         self._verify_write_access_to_directory(target_directory=target_directory)
         if output_mode == "separate_files":
-            return self._save_to_separate_file(
+            saving_handler = partial(
+                self._save_to_separate_file,
                 content=content,
                 file_type=file_type,
                 target_directory=target_directory,
                 file_name_prefix=file_name_prefix,
             )
-        return self._append_to_file(
-            content=content,
-            file_type=file_type,
-            target_directory=target_directory,
-            file_name_prefix=file_name_prefix,
-            max_entries_per_file=max_entries_per_file,
+        else:
+            saving_handler = partial(
+                self._append_to_file,
+                content=content,
+                file_type=file_type,
+                target_directory=target_directory,
+                file_name_prefix=file_name_prefix,
+                max_entries_per_file=max_entries_per_file,
+                flush=not fire_and_forget,
+            )
+        if not fire_and_forget:
+            return saving_handler()
+        submitted = self._get_background_writer().submit(
+            partial(self._save_in_background, saving_handler=saving_handler)
         )
+        background_errors = self._pop_background_errors()
+        if not submitted:
+            return {
+                "error_status": True,
+                "message": "Content dropped, as writer is not keeping up with the load",
+            }
+        if background_errors:
+            return {
+                "error_status": True,
+                "message": f"Data scheduled to be saved, but previous writes failed: "
+                f"{'; '.join(background_errors)}",
+            }
+        return {"error_status": False, "message": "Data scheduled to be saved"}
+
+    def _save_in_background(self, saving_handler: Callable[[], BlockResult]) -> None:
+        try:
+            result = saving_handler()
+        except Exception as error:
+            result = {"error_status": True, "message": str(error)}
+        if result["error_status"]:
+            with self._background_errors_lock:
+                self._background_errors.append(result["message"])
+
+    def _pop_background_errors(self) -> List[str]:
+        with self._background_errors_lock:
+            errors, self._background_errors = self._background_errors, []
+        return list(dict.fromkeys(errors))
+
+    def _get_background_writer(self) -> BackgroundWriter:
+        if self._background_writer is None:
+            self._background_writer = BackgroundWriter(
+                name="local_file_sink",
+                on_idle=self._flush_active_file,
+            )
+        return self._background_writer
 
     def _verify_write_access_to_directory(self, target_directory: str) -> None:
         if self._allowed_write_directory is None:
@@ -224,6 +297,7 @@ class LocalFileSinkBlockV1(WorkflowBlock):
             target_path=target_path,
             file_operation_mode="w",
             content=content,
+            fsync=LOCAL_FILE_SINK_FSYNC,
         )
 
     def _append_to_file(
@@ -233,6 +307,26 @@ class LocalFileSinkBlockV1(WorkflowBlock):
         target_directory: str,
         file_name_prefix: str,
         max_entries_per_file: int,
+        flush: bool = True,
+    ) -> BlockResult:
+        with self._file_lock:
+            return self._append_to_active_file(
+                content=content,
+                file_type=file_type,
+                target_directory=target_directory,
+                file_name_prefix=file_name_prefix,
+                max_entries_per_file=max_entries_per_file,
+                flush=flush,
+            )
+
+    def _append_to_active_file(
+        self,
+        content: str,
+        file_type: Literal["csv", "json", "txt"],
+        target_directory: str,
+        file_name_prefix: str,
+        max_entries_per_file: int,
+        flush: bool,
     ) -> BlockResult:
         if file_type == "json":
             try:
@@ -245,8 +339,7 @@ class LocalFileSinkBlockV1(WorkflowBlock):
             or self._entries_in_file >= max_entries_per_file
         ):
             if self._active_file_descriptor is not None:
-                self._active_file_descriptor.close()
-                self._active_file_descriptor = None
+                self._close_active_file()
                 self._entries_in_file = 0
             try:
                 self._active_file_descriptor = self._open_new_append_log_file(
@@ -268,7 +361,8 @@ class LocalFileSinkBlockV1(WorkflowBlock):
             content = f"{content}\n"
         try:
             self._active_file_descriptor.write(content)
-            self._active_file_descriptor.flush()
+            if flush:
+                self._flush_file(file_descriptor=self._active_file_descriptor)
         except Exception as error:
             logging.warning(f"Could not append content to append log: {error}")
             return {
@@ -294,9 +388,27 @@ class LocalFileSinkBlockV1(WorkflowBlock):
         os.makedirs(parent_dir, exist_ok=True)
         return open(file_path, "w")
 
+    def _flush_active_file(self) -> None:
+        with self._file_lock:
+            if self._active_file_descriptor is not None:
+                self._flush_file(file_descriptor=self._active_file_descriptor)
+
+    def _close_active_file(self) -> None:
+        if LOCAL_FILE_SINK_FSYNC:
+            self._flush_file(file_descriptor=self._active_file_descriptor)
+        self._active_file_descriptor.close()
+        self._active_file_descriptor = None
+
+    def _flush_file(self, file_descriptor: TextIOWrapper) -> None:
+        file_descriptor.flush()
+        if LOCAL_FILE_SINK_FSYNC:
+            os.fsync(file_descriptor.fileno())
+
     def __del__(self):
+        if self._background_writer is not None:
+            self._background_writer.close()
         if self._active_file_descriptor is not None:
-            self._active_file_descriptor.close()
+            self._close_active_file()
 
 
 def generate_new_file_path(
@@ -311,22 +423,28 @@ def handle_content_saving(
     target_path: str,
     file_operation_mode: str,
     content: str,
+    fsync: bool = False,
 ) -> dict:
     try:
-        save_to_file(path=target_path, mode=file_operation_mode, content=content)
+        save_to_file(
+            path=target_path, mode=file_operation_mode, content=content, fsync=fsync
+        )
         return {"error_status": False, "message": "Data saved successfully"}
     except Exception as error:
         logging.warning(f"Could not save local file: {error}")
         return {"error_status": True, "message": str(error)}
 
 
-def save_to_file(path: str, mode: str, content: str) -> None:
+def save_to_file(path: str, mode: str, content: str, fsync: bool = False) -> None:
     parent_dir = os.path.dirname(path)
     os.makedirs(parent_dir, exist_ok=True)
     if not content.endswith("\n"):
         content = f"{content}\n"
     with open(path, mode=mode) as f:
         f.write(content)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
 
 
 def deduct_csv_header(content: str) -> str:
@@ -17,7 +17,8 @@ from inference.core.workflows.core_steps.common.query_language.entities.operatio
     AllOperationsType,
 )
 from inference.core.workflows.core_steps.common.query_language.operations.core import (
-    build_operations_chain,
+    OperationsChainsCache,
+    get_operations_chain,
 )
 from inference.core.workflows.execution_engine.entities.base import OutputDefinition
 from inference.core.workflows.execution_engine.entities.types import (
@@ -185,6 +186,7 @@ class SlackNotificationBlockV1(WorkflowBlock):
         self._background_tasks = background_tasks
         self._thread_pool_executor = thread_pool_executor
         self._clients: Dict[str, WebClient] = {}
+        self._operations_chains_cache = OperationsChainsCache()
 
     @classmethod
     def get_init_parameters(cls) -> List[str]:
@@ -239,6 +241,7 @@ class SlackNotificationBlockV1(WorkflowBlock):
             message=message,
             message_parameters=message_parameters,
             message_parameters_operations=message_parameters_operations,
+            operations_chains_cache=self._operations_chains_cache,
         )
         send_notification_handler = partial(
             send_slack_notification,
@@ -284,6 +287,7 @@ def format_message(
     message: str,
     message_parameters: Dict[str, Any],
     message_parameters_operations: Dict[str, List[AllOperationsType]],
+    operations_chains_cache: Optional[OperationsChainsCache] = None,
 ) -> str:
     matching_parameters = PARAMETER_REGEX.findall(message)
     parameters_to_get_values = {
@@ -296,7 +300,9 @@ def format_message(
         if not operations:
             parameters_values[parameter_name] = parameter_value
             continue
-        operations_chain = build_operations_chain(operations=operations)
+        operations_chain = get_operations_chain(
+            operations=operations, operations_chains_cache=operations_chains_cache
+        )
         parameters_values[parameter_name] = operations_chain(
             parameter_value, global_parameters={}
         )
@@ -16,7 +16,8 @@ from inference.core.workflows.core_steps.common.query_language.entities.operatio
     AllOperationsType,
 )
 from inference.core.workflows.core_steps.common.query_language.operations.core import (
-    build_operations_chain,
+    OperationsChainsCache,
+    get_operations_chain,
 )
 from inference.core.workflows.execution_engine.entities.base import OutputDefinition
 from inference.core.workflows.execution_engine.entities.types import (
@@ -206,6 +207,7 @@ class TwilioSMSNotificationBlockV1(WorkflowBlock):
         self._background_tasks = background_tasks
         self._thread_pool_executor = thread_pool_executor
         self._clients: Dict[str, Client] = {}
+        self._operations_chains_cache = OperationsChainsCache()
 
     @classmethod
     def get_init_parameters(cls) -> List[str]:
@@ -271,6 +273,7 @@ class TwilioSMSNotificationBlockV1(WorkflowBlock):
             message_parameters=message_parameters,
             message_parameters_operations=message_parameters_operations,
             length_limit=length_limit,
+            operations_chains_cache=self._operations_chains_cache,
         )
         send_notification_handler = partial(
             send_sms_notification,
@@ -323,6 +326,7 @@ def format_message(
     message_parameters: Dict[str, Any],
     message_parameters_operations: Dict[str, List[AllOperationsType]],
     length_limit: int,
+    operations_chains_cache: Optional[OperationsChainsCache] = None,
 ) -> str:
     matching_parameters = PARAMETER_REGEX.findall(message)
     parameters_to_get_values = {
@@ -335,7 +339,9 @@ def format_message(
         if not operations:
             parameters_values[parameter_name] = parameter_value
             continue
-        operations_chain = build_operations_chain(operations=operations)
+        operations_chain = get_operations_chain(
+            operations=operations, operations_chains_cache=operations_chains_cache
+        )
         parameters_values[parameter_name] = operations_chain(
             parameter_value, global_parameters={}
         )
@@ -13,7 +13,8 @@ from inference.core.workflows.core_steps.common.query_language.entities.operatio
     AllOperationsType,
 )
 from inference.core.workflows.core_steps.common.query_language.operations.core import (
-    build_operations_chain,
+    OperationsChainsCache,
+    get_operations_chain,
 )
 from inference.core.workflows.execution_engine.entities.base import OutputDefinition
 from inference.core.workflows.execution_engine.entities.types import (
@@ -347,6 +348,7 @@ class WebhookSinkBlockV1(WorkflowBlock):
         self._background_tasks = background_tasks
         self._thread_pool_executor = thread_pool_executor
         self._last_notification_fired: Optional[datetime] = None
+        self._operations_chains_cache = OperationsChainsCache()
 
     @classmethod
     def get_init_parameters(cls) -> List[str]:
@@ -394,14 +396,17 @@ class WebhookSinkBlockV1(WorkflowBlock):
         json_payload = execute_operations_on_parameters(
             parameters=json_payload,
             operations=json_payload_operations,
+            operations_chains_cache=self._operations_chains_cache,
         )
         multi_part_encoded_files = execute_operations_on_parameters(
             parameters=multi_part_encoded_files,
             operations=multi_part_encoded_files_operations,
+            operations_chains_cache=self._operations_chains_cache,
         )
         form_data = execute_operations_on_parameters(
             parameters=form_data,
             operations=form_data_operations,
+            operations_chains_cache=self._operations_chains_cache,
         )
         request_handler = partial(
             execute_request,
@@ -440,12 +445,15 @@ class WebhookSinkBlockV1(WorkflowBlock):
 def execute_operations_on_parameters(
     parameters: Dict[str, Any],
     operations: Dict[str, List[AllOperationsType]],
+    operations_chains_cache: Optional[OperationsChainsCache] = None,
 ) -> Dict[str, Any]:
     parameters = copy(parameters)
     for parameter_name, operations in operations.items():
         if not operations or parameter_name not in parameters:
             continue
-        operations_chain = build_operations_chain(operations=operations)
+        operations_chain = get_operations_chain(
+            operations=operations, operations_chains_cache=operations_chains_cache
+        )
         parameters[parameter_name] = operations_chain(
             parameters[parameter_name], global_parameters={}
         )
@@ -7,6 +7,9 @@ from inference.core.workflows.core_steps.common.query_language.entities.operatio
     AllOperationsType,
     OperationDefinition,
 )
+from inference.core.workflows.core_steps.common.query_language.operations.core import (
+    OperationsChainsCache,
+)
 from inference.core.workflows.core_steps.transformations.detections_transformation.v1 import (
     execute_transformation,
 )
@@ -119,6 +122,9 @@ class BlockManifest(WorkflowBlockManifest):
 
 class DetectionsFilterBlockV1(WorkflowBlock):
 
+    def __init__(self):
+        self._operations_chains_cache = OperationsChainsCache()
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
@@ -133,4 +139,5 @@ class DetectionsFilterBlockV1(WorkflowBlock):
             predictions=predictions,
             operations=operations,
             operations_parameters=operations_parameters,
+            operations_chains_cache=self._operations_chains_cache,
         )
@@ -10,7 +10,8 @@ from inference.core.workflows.core_steps.common.query_language.entities.operatio
     OperationDefinition,
 )
 from inference.core.workflows.core_steps.common.query_language.operations.core import (
-    build_operations_chain,
+    OperationsChainsCache,
+    get_operations_chain,
 )
 from inference.core.workflows.core_steps.common.utils import (
     grab_batch_parameters,
@@ -138,6 +139,9 @@ class BlockManifest(WorkflowBlockManifest):
 
 class DetectionsTransformationBlockV1(WorkflowBlock):
 
+    def __init__(self):
+        self._operations_chains_cache = OperationsChainsCache()
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
@@ -152,6 +156,7 @@ class DetectionsTransformationBlockV1(WorkflowBlock):
             predictions=predictions,
             operations=operations,
             operations_parameters=operations_parameters,
+            operations_chains_cache=self._operations_chains_cache,
         )
 
 
@@ -159,13 +164,16 @@ def execute_transformation(
     predictions: Batch[sv.Detections],
     operations: List[OperationDefinition],
     operations_parameters: Dict[str, Any],
+    operations_chains_cache: Optional[OperationsChainsCache] = None,
 ) -> BlockResult:
     if DEFAULT_OPERAND_NAME in operations_parameters:
         raise ValueError(
             f"Detected reserved parameter name: {DEFAULT_OPERAND_NAME} declared in `operations_parameters` "
             f"of `DetectionsTransformation` block."
         )
-    operations_chain = build_operations_chain(operations=operations)
+    operations_chain = get_operations_chain(
+        operations=operations, operations_chains_cache=operations_chains_cache
+    )
     batch_parameters = grab_batch_parameters(
         operations_parameters=operations_parameters,
         main_batch_size=len(predictions),
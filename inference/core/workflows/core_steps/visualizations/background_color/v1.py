@@ -65,7 +65,6 @@ class BackgroundColorManifest(PredictionsVisualizationManifest):
 class BackgroundColorVisualizationBlockV1(PredictionsVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -86,14 +85,14 @@ class BackgroundColorVisualizationBlockV1(PredictionsVisualizationBlock):
             )
         )
 
-        if key not in self.annotatorCache:
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             background_color = str_to_color(color)
-            self.annotatorCache[key] = BackgroundColorAnnotator(
+            return BackgroundColorAnnotator(
                 color=background_color,
                 opacity=opacity,
             )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
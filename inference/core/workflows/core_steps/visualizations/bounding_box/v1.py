@@ -60,7 +60,6 @@ class BoundingBoxManifest(ColorableVisualizationManifest):
 class BoundingBoxVisualizationBlockV1(ColorableVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -76,26 +75,37 @@ class BoundingBoxVisualizationBlockV1(ColorableVisualizationBlock):
         roundness: float,
     ) -> sv.annotators.base.BaseAnnotator:
         key = "_".join(
-            map(str, [color_palette, palette_size, color_axis, thickness, roundness])
+            map(
+                str,
+                [
+                    color_palette,
+                    palette_size,
+                    custom_colors,
+                    color_axis,
+                    thickness,
+                    roundness,
+                ],
+            )
         )
 
-        if key not in self.annotatorCache:
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             palette = self.getPalette(color_palette, palette_size, custom_colors)
 
             if roundness == 0:
-                self.annotatorCache[key] = sv.BoxAnnotator(
+                return sv.BoxAnnotator(
                     color=palette,
                     color_lookup=getattr(sv.ColorLookup, color_axis),
                     thickness=thickness,
                 )
             else:
-                self.annotatorCache[key] = sv.RoundBoxAnnotator(
+                return sv.RoundBoxAnnotator(
                     color=palette,
                     color_lookup=getattr(sv.ColorLookup, color_axis),
                     thickness=thickness,
                     roundness=roundness,
                 )
-        return self.annotatorCache[key]
+
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
@@ -52,7 +52,6 @@ class CircleManifest(ColorableVisualizationManifest):
 class CircleVisualizationBlockV1(ColorableVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -72,22 +71,23 @@ class CircleVisualizationBlockV1(ColorableVisualizationBlock):
                 [
                     color_palette,
                     palette_size,
+                    custom_colors,
                     color_axis,
                     thickness,
                 ],
             )
         )
 
-        if key not in self.annotatorCache:
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             palette = self.getPalette(color_palette, palette_size, custom_colors)
 
-            self.annotatorCache[key] = sv.CircleAnnotator(
+            return sv.CircleAnnotator(
                 color=palette,
                 color_lookup=getattr(sv.ColorLookup, color_axis),
                 thickness=thickness,
             )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
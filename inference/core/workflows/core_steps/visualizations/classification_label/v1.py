@@ -163,7 +163,6 @@ class ClassificationLabelManifest(ColorableVisualizationManifest):
 class ClassificationLabelVisualizationBlockV1(ColorableVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -188,6 +187,7 @@ class ClassificationLabelVisualizationBlockV1(ColorableVisualizationBlock):
                 [
                     color_palette,
                     palette_size,
+                    custom_colors,
                     color_axis,
                     text_position,
                     text_color,
@@ -199,23 +199,21 @@ class ClassificationLabelVisualizationBlockV1(ColorableVisualizationBlock):
             )
         )
 
-        if key not in self.annotatorCache:
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             palette = self.getPalette(color_palette, palette_size, custom_colors)
 
-            text_color = str_to_color(text_color)
-
-            self.annotatorCache[key] = sv.LabelAnnotator(
+            return sv.LabelAnnotator(
                 color=palette,
                 color_lookup=getattr(sv.ColorLookup, color_axis),
                 text_position=getattr(sv.Position, text_position),
-                text_color=text_color,
+                text_color=str_to_color(text_color),
                 text_scale=text_scale,
                 text_thickness=text_thickness,
                 text_padding=text_padding,
                 border_radius=border_radius,
             )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
@@ -53,7 +53,6 @@ class ColorManifest(ColorableVisualizationManifest):
 class ColorVisualizationBlockV1(ColorableVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -73,22 +72,23 @@ class ColorVisualizationBlockV1(ColorableVisualizationBlock):
                 [
                     color_palette,
                     palette_size,
+                    custom_colors,
                     color_axis,
                     opacity,
                 ],
             )
         )
 
-        if key not in self.annotatorCache:
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             palette = self.getPalette(color_palette, palette_size, custom_colors)
 
-            self.annotatorCache[key] = sv.ColorAnnotator(
+            return sv.ColorAnnotator(
                 color=palette,
                 color_lookup=getattr(sv.ColorLookup, color_axis),
                 opacity=opacity,
             )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
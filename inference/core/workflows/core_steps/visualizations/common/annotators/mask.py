@@ -0,0 +1,94 @@
+from typing import Optional, Tuple, Union
+
+import cv2
+import numpy as np
+from supervision import Color, Detections
+from supervision.annotators.base import BaseAnnotator
+from supervision.annotators.utils import ColorLookup, resolve_color
+from supervision.draw.color import ColorPalette
+from supervision.utils.conversion import ensure_cv2_image_for_annotation
+
+
+class MaskAnnotator(BaseAnnotator):
+    """
+    A class for drawing masks on an image using provided detections - producing
+    the same results as `sv.MaskAnnotator`, but painting and blending only the region
+    of the image covered by masks, instead of the whole frame.
+
+    !!! warning
+
+        This annotator uses `sv.Detections.mask`.
+    """
+
+    def __init__(
+        self,
+        color: Union[Color, ColorPalette] = ColorPalette.DEFAULT,
+        opacity: float = 0.5,
+        color_lookup: ColorLookup = ColorLookup.CLASS,
+    ):
+        """
+        Args:
+            color (Union[Color, ColorPalette]): The color or color palette to use for
+                annotating detections.
+            opacity (float): Opacity of the overlay mask. Must be between `0` and `1`.
+            color_lookup (ColorLookup): Strategy for mapping colors to annotations.
+                Options are `INDEX`, `CLASS`, `TRACK`.
+        """
+        self.color: Union[Color, ColorPalette] = color
+        self.opacity = opacity
+        self.color_lookup: ColorLookup = color_lookup
+
+    @ensure_cv2_image_for_annotation
+    def annotate(
+        self,
+        scene: np.ndarray,
+        detections: Detections,
+        custom_color_lookup: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Annotates the given scene with masks based on the provided detections.
+
+        Args:
+            scene (np.ndarray): The image where masks will be drawn.
+            detections (Detections): Object detections to annotate.
+            custom_color_lookup (Optional[np.ndarray]): Custom color lookup array.
+                Allows to override the default color mapping strategy.
+
+        Returns:
+            The annotated image (modified in place)
+        """
+        assert isinstance(scene, np.ndarray)
+        if detections.mask is None or len(detections) == 0:
+            return scene
+        roi = _get_masks_roi(masks=detections.mask)
+        if roi is None:
+            return scene
+        x_min, y_min, x_max, y_max = roi
+        scene_roi = scene[y_min:y_max, x_min:x_max]
+        colored_mask = np.array(scene_roi, copy=True, dtype=np.uint8)
+        for detection_idx in np.flip(np.argsort(detections.area)):
+            color = resolve_color(
+                color=self.color,
+                detections=detections,
+                detection_idx=detection_idx,
+                color_lookup=(
+                    self.color_lookup
+                    if custom_color_lookup is None
+                    else custom_color_lookup
+                ),
+            )
+            mask = detections.mask[detection_idx, y_min:y_max, x_min:x_max]
+            colored_mask[mask] = color.as_bgr()
+        cv2.addWeighted(
+            colored_mask, self.opacity, scene_roi, 1 - self.opacity, 0, dst=scene_roi
+        )
+        return scene
+
+
+def _get_masks_roi(masks: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+    masks_union = np.any(masks, axis=0)
+    rows = np.flatnonzero(np.any(masks_union, axis=1))
+    if len(rows) == 0:
+        return None
+    columns = np.flatnonzero(np.any(masks_union, axis=0))
+    return columns[0], rows[0], columns[-1] + 1, rows[-1] + 1
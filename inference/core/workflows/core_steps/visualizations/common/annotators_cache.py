@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Hashable, Tuple
+
+import supervision as sv
+
+from inference.core.env import WORKFLOWS_VISUALIZATION_ANNOTATORS_CACHE_SIZE
+
+_ANNOTATORS: "OrderedDict[Tuple[str, Hashable], sv.annotators.base.BaseAnnotator]" = (
+    OrderedDict()
+)
+_ANNOTATORS_LOCK = Lock()
+
+
+class SharedAnnotatorsCache:
+    """
+    View of process-wide, LRU cache of annotators, namespaced by visualization
+    block type. Annotators are stateless, so instances of visualization blocks (in all
+    workflows running in the process) may share the ones created for the same
+    configuration, instead of re-creating palettes and annotators per block instance.
+    Blocks with stateful annotators (like trace) must keep their own caches.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_size: int = WORKFLOWS_VISUALIZATION_ANNOTATORS_CACHE_SIZE,
+    ):
+        self._namespace = namespace
+        self._max_size = max_size
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], sv.annotators.base.BaseAnnotator],
+    ) -> sv.annotators.base.BaseAnnotator:
+        """Returns annotator cached under `key`, creating it with `factory` when missing.
+        Lookup, creation and insertion happen under the lock, so the annotator cannot be
+        evicted by other thread before it is returned."""
+        cache_key = (self._namespace, key)
+        with _ANNOTATORS_LOCK:
+            if cache_key in _ANNOTATORS:
+                _ANNOTATORS.move_to_end(cache_key)
+                return _ANNOTATORS[cache_key]
+            annotator = factory()
+            _ANNOTATORS[cache_key] = annotator
+            while len(_ANNOTATORS) > self._max_size:
+                _ANNOTATORS.popitem(last=False)
+            return annotator
+
+
+def clear_annotators_cache() -> None:
+    with _ANNOTATORS_LOCK:
+        _ANNOTATORS.clear()
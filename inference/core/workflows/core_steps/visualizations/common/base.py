@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Type, Union
+from typing import List, Optional, Type, Union
 
 import supervision as sv
 from pydantic import AliasChoices, ConfigDict, Field
 
+from inference.core.workflows.core_steps.visualizations.common.annotators_cache import (
+    SharedAnnotatorsCache,
+)
 from inference.core.workflows.execution_engine.entities.base import (
     OutputDefinition,
     WorkflowImageData,
@@ -55,10 +58,15 @@ class VisualizationManifest(WorkflowBlockManifest, ABC):
             ),
         ]
 
+    @classmethod
+    def get_image_copy_property(cls) -> Optional[str]:
+        return "copy_image"
+
 
 class VisualizationBlock(WorkflowBlock, ABC):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.annotatorCache = SharedAnnotatorsCache(namespace=type(self).__name__)
 
     @classmethod
     @abstractmethod
@@ -58,7 +58,6 @@ class CornerManifest(ColorableVisualizationManifest):
 class CornerVisualizationBlockV1(ColorableVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -79,6 +78,7 @@ class CornerVisualizationBlockV1(ColorableVisualizationBlock):
                 [
                     color_palette,
                     palette_size,
+                    custom_colors,
                     color_axis,
                     thickness,
                     corner_length,
@@ -86,17 +86,17 @@ class CornerVisualizationBlockV1(ColorableVisualizationBlock):
             )
         )
 
-        if key not in self.annotatorCache:
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             palette = self.getPalette(color_palette, palette_size, custom_colors)
 
-            self.annotatorCache[key] = sv.BoxCornerAnnotator(
+            return sv.BoxCornerAnnotator(
                 color=palette,
                 color_lookup=getattr(sv.ColorLookup, color_axis),
                 thickness=thickness,
                 corner_length=corner_length,
             )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
@@ -80,7 +80,6 @@ class CropManifest(ColorableVisualizationManifest):
 class CropVisualizationBlockV1(ColorableVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -102,6 +101,7 @@ class CropVisualizationBlockV1(ColorableVisualizationBlock):
                 [
                     color_palette,
                     palette_size,
+                    custom_colors,
                     color_axis,
                     position,
                     scale_factor,
@@ -110,10 +110,10 @@ class CropVisualizationBlockV1(ColorableVisualizationBlock):
             )
         )
 
-        if key not in self.annotatorCache:
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             palette = self.getPalette(color_palette, palette_size, custom_colors)
 
-            self.annotatorCache[key] = sv.CropAnnotator(
+            return sv.CropAnnotator(
                 border_color=palette,
                 border_color_lookup=getattr(sv.ColorLookup, color_axis),
                 position=getattr(sv.Position, position),
@@ -121,7 +121,7 @@ class CropVisualizationBlockV1(ColorableVisualizationBlock):
                 border_thickness=border_thickness,
             )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
@@ -81,7 +81,6 @@ class DotManifest(ColorableVisualizationManifest):
 class DotVisualizationBlockV1(ColorableVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -103,6 +102,7 @@ class DotVisualizationBlockV1(ColorableVisualizationBlock):
                 [
                     color_palette,
                     palette_size,
+                    custom_colors,
                     color_axis,
                     position,
                     radius,
@@ -111,10 +111,10 @@ class DotVisualizationBlockV1(ColorableVisualizationBlock):
             )
         )
 
-        if key not in self.annotatorCache:
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             palette = self.getPalette(color_palette, palette_size, custom_colors)
 
-            self.annotatorCache[key] = sv.DotAnnotator(
+            return sv.DotAnnotator(
                 color=palette,
                 color_lookup=getattr(sv.ColorLookup, color_axis),
                 position=getattr(sv.Position, position),
@@ -122,7 +122,7 @@ class DotVisualizationBlockV1(ColorableVisualizationBlock):
                 outline_thickness=outline_thickness,
             )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
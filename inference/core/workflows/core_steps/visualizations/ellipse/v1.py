@@ -64,7 +64,6 @@ class EllipseManifest(ColorableVisualizationManifest):
 class EllipseVisualizationBlockV1(ColorableVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -86,6 +85,7 @@ class EllipseVisualizationBlockV1(ColorableVisualizationBlock):
                 [
                     color_palette,
                     palette_size,
+                    custom_colors,
                     color_axis,
                     thickness,
                     start_angle,
@@ -94,10 +94,10 @@ class EllipseVisualizationBlockV1(ColorableVisualizationBlock):
             )
         )
 
-        if key not in self.annotatorCache:
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             palette = self.getPalette(color_palette, palette_size, custom_colors)
 
-            self.annotatorCache[key] = sv.EllipseAnnotator(
+            return sv.EllipseAnnotator(
                 color=palette,
                 color_lookup=getattr(sv.ColorLookup, color_axis),
                 thickness=thickness,
@@ -105,7 +105,7 @@ class EllipseVisualizationBlockV1(ColorableVisualizationBlock):
                 end_angle=end_angle,
             )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
@@ -153,7 +153,6 @@ class KeypointManifest(VisualizationManifest):
 class KeypointVisualizationBlockV1(VisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -186,31 +185,28 @@ class KeypointVisualizationBlockV1(VisualizationBlock):
             )
         )
 
-        if key not in self.annotatorCache:
-            color = str_to_color(color)
-            text_color = str_to_color(text_color)
-
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             if annotator_type == "edge":
-                self.annotatorCache[key] = sv.EdgeAnnotator(
-                    color=color,
+                return sv.EdgeAnnotator(
+                    color=str_to_color(color),
                     thickness=thickness,
                 )
             elif annotator_type == "vertex":
-                self.annotatorCache[key] = sv.VertexAnnotator(
-                    color=color,
+                return sv.VertexAnnotator(
+                    color=str_to_color(color),
                     radius=radius,
                 )
             elif annotator_type == "vertex_label":
-                self.annotatorCache[key] = sv.VertexLabelAnnotator(
-                    color=color,
-                    text_color=text_color,
+                return sv.VertexLabelAnnotator(
+                    color=str_to_color(color),
+                    text_color=str_to_color(text_color),
                     text_scale=text_scale,
                     text_thickness=text_thickness,
                     text_padding=text_padding,
                     border_radius=radius,
                 )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     # Function to convert detections to keypoints
     def convert_detections_to_keypoints(self, detections):
@@ -105,7 +105,6 @@ class ModelComparisonManifest(VisualizationManifest):
 class ModelComparisonVisualizationBlockV1(PredictionsVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -130,18 +129,15 @@ class ModelComparisonVisualizationBlockV1(PredictionsVisualizationBlock):
             )
         )
 
-        if key not in self.annotatorCache:
-            color_a = str_to_color(color_a)
-            color_b = str_to_color(color_b)
-            background_color = str_to_color(background_color)
-            self.annotatorCache[key] = ModelComparisonAnnotator(
-                color_a=color_a,
-                color_b=color_b,
-                background_color=background_color,
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
+            return ModelComparisonAnnotator(
+                color_a=str_to_color(color_a),
+                color_b=str_to_color(color_b),
+                background_color=str_to_color(background_color),
                 opacity=opacity,
             )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
@@ -50,7 +50,6 @@ class PixelateManifest(PredictionsVisualizationManifest):
 class PixelateVisualizationBlockV1(PredictionsVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -62,9 +61,10 @@ class PixelateVisualizationBlockV1(PredictionsVisualizationBlock):
     ) -> sv.annotators.base.BaseAnnotator:
         key = "_".join(map(str, [pixel_size]))
 
-        if key not in self.annotatorCache:
-            self.annotatorCache[key] = sv.PixelateAnnotator(pixel_size=pixel_size)
-        return self.annotatorCache[key]
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
+            return sv.PixelateAnnotator(pixel_size=pixel_size)
+
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
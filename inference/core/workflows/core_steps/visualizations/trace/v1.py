@@ -141,6 +141,7 @@ class TraceVisualizationBlockV1(ColorableVisualizationBlock):
                 [
                     color_palette,
                     palette_size,
+                    custom_colors,
                     color_axis,
                     position,
                     trace_length,
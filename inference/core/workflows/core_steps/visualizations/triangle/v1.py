@@ -85,7 +85,6 @@ class TriangleManifest(ColorableVisualizationManifest):
 class TriangleVisualizationBlockV1(ColorableVisualizationBlock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.annotatorCache = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -108,6 +107,7 @@ class TriangleVisualizationBlockV1(ColorableVisualizationBlock):
                 [
                     color_palette,
                     palette_size,
+                    custom_colors,
                     color_axis,
                     position,
                     base,
@@ -117,10 +117,10 @@ class TriangleVisualizationBlockV1(ColorableVisualizationBlock):
             )
         )
 
-        if key not in self.annotatorCache:
+        def create_annotator() -> sv.annotators.base.BaseAnnotator:
             palette = self.getPalette(color_palette, palette_size, custom_colors)
 
-            self.annotatorCache[key] = sv.TriangleAnnotator(
+            return sv.TriangleAnnotator(
                 color=palette,
                 color_lookup=getattr(sv.ColorLookup, color_axis),
                 position=getattr(sv.Position, position),
@@ -129,7 +129,7 @@ class TriangleVisualizationBlockV1(ColorableVisualizationBlock):
                 outline_thickness=outline_thickness,
             )
 
-        return self.annotatorCache[key]
+        return self.annotatorCache.get_or_create(key=key, factory=create_annotator)
 
     def run(
         self,
@@ -0,0 +1,239 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Deque, Dict, Generator, List, Optional, Union
+
+import numpy as np
+
+from inference.core.logger import logger
+from inference.core.workflows.execution_engine.profiling.core import (
+    BaseWorkflowsProfiler,
+)
+
+STEP_EXECUTION_PHASE = "step_execution"
+STEPS_GROUP_EXECUTION_PHASE = "group_of_steps_execution"
+WALL_TIME_METRIC = "wall_time"
+CPU_TIME_METRIC = "cpu_time"
+QUEUE_TIME_METRIC = "queue_time"
+ALLOCATED_BYTES_METRIC = "allocated_bytes"
+SNAPSHOT_FILE_PREFIX = "workflow_profile"
+REPORTED_PERCENTILES = (50, 90, 99)
+
+
+class StreamingWorkflowsProfiler(BaseWorkflowsProfiler):
+    """
+    Profiler for long-running processing (like `InferencePipeline`), which - on top of
+    the trace of last workflow runs - aggregates metrics of each step over rolling window
+    of its last executions:
+    * `wall_time` - duration of step execution
+    * `cpu_time` - CPU time of the thread executing the step (work offloaded to native
+    thread pools - like onnxruntime intra-op threads - is not included)
+    * `queue_time` - time step waited for a worker of execution engine thread pool
+    * `allocated_bytes` - growth of memory traced by `tracemalloc` during step execution
+    (only when `track_allocations=True`, as tracing allocations is expensive and global
+    for the process - steps executed concurrently affect each other's results)
+
+    When `snapshots_directory` is given, trace of buffered runs (accompanied by the
+    report) is periodically saved there in Chrome trace format (`chrome://tracing`,
+    Perfetto) - only `max_snapshots` most recent files are kept.
+    """
+
+    @classmethod
+    def init(
+        cls,
+        max_runs_in_buffer: int = 32,
+        window_size: int = 1000,
+        snapshots_directory: Optional[str] = None,
+        snapshot_interval: float = 10.0,
+        max_snapshots: int = 10,
+        track_allocations: bool = False,
+        **kwargs,
+    ) -> "StreamingWorkflowsProfiler":
+        runs_buffer = deque(maxlen=max_runs_in_buffer)
+        return cls(
+            runs_buffer=runs_buffer,
+            window_size=window_size,
+            snapshots_directory=snapshots_directory,
+            snapshot_interval=snapshot_interval,
+            max_snapshots=max_snapshots,
+            track_allocations=track_allocations,
+        )
+
+    def __init__(
+        self,
+        runs_buffer: Deque[List[dict]],
+        window_size: int,
+        snapshots_directory: Optional[str],
+        snapshot_interval: float,
+        max_snapshots: int,
+        track_allocations: bool,
+    ):
+        super().__init__(runs_buffer=runs_buffer)
+        self._window_size = max(window_size, 1)
+        self._snapshots_directory = snapshots_directory
+        self._snapshot_interval = snapshot_interval
+        self._max_snapshots = max(max_snapshots, 1)
+        self._track_allocations = track_allocations
+        self._lock = threading.Lock()
+        self._steps_metrics: Dict[str, Dict[str, Deque[float]]] = {}
+        self._runs_wall_time: Deque[float] = deque(maxlen=self._window_size)
+        self._runs = 0
+        self._run_start: Optional[float] = None
+        self._steps_group_start: Optional[float] = None
+        self._last_snapshot_time = time.monotonic()
+        self._started_tracemalloc = False
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def start_workflow_run(self) -> None:
+        super().start_workflow_run()
+        self._run_start = time.perf_counter()
+
+    def end_workflow_run(self) -> None:
+        super().end_workflow_run()
+        if self._run_start is not None:
+            with self._lock:
+                self._runs_wall_time.append(time.perf_counter() - self._run_start)
+                self._runs += 1
+            self._run_start = None
+        if (
+            self._snapshots_directory is not None
+            and time.monotonic() - self._last_snapshot_time >= self._snapshot_interval
+        ):
+            self.save_snapshot()
+
+    @contextmanager
+    def profile_execution_phase(
+        self,
+        name: str,
+        categories: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Union[str, int, float, bool, list, dict]]] = None,
+    ) -> Generator[None, None, None]:
+        if name == STEPS_GROUP_EXECUTION_PHASE:
+            # steps of the group are submitted to thread pool at once
+            self._steps_group_start = time.perf_counter()
+        if name != STEP_EXECUTION_PHASE:
+            with super().profile_execution_phase(
+                name=name, categories=categories, metadata=metadata
+            ):
+                yield None
+            return None
+        step = str((metadata or {}).get("step_selector"))
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        memory_start = self._get_traced_memory()
+        group_start = self._steps_group_start
+        try:
+            with super().profile_execution_phase(
+                name=name, categories=categories, metadata=metadata
+            ):
+                yield None
+        finally:
+            measurements = {
+                WALL_TIME_METRIC: time.perf_counter() - wall_start,
+                CPU_TIME_METRIC: time.thread_time() - cpu_start,
+            }
+            if group_start is not None:
+                measurements[QUEUE_TIME_METRIC] = max(wall_start - group_start, 0.0)
+            if memory_start is not None:
+                measurements[ALLOCATED_BYTES_METRIC] = float(
+                    self._get_traced_memory() - memory_start
+                )
+            self._register_step_measurements(step=step, measurements=measurements)
+
+    def get_report(self) -> dict:
+        with self._lock:
+            steps_metrics = {
+                step: {metric: list(values) for metric, values in metrics.items()}
+                for step, metrics in self._steps_metrics.items()
+            }
+            runs_wall_time = list(self._runs_wall_time)
+            runs = self._runs
+        return {
+            "runs": runs,
+            "window_size": self._window_size,
+            "workflow_run": {WALL_TIME_METRIC: summarise_measurements(runs_wall_time)},
+            "steps": {
+                step: {
+                    metric: summarise_measurements(values)
+                    for metric, values in metrics.items()
+                }
+                for step, metrics in steps_metrics.items()
+            },
+        }
+
+    def save_snapshot(self) -> Optional[str]:
+        self._last_snapshot_time = time.monotonic()
+        if self._snapshots_directory is None:
+            return None
+        directory = os.path.abspath(self._snapshots_directory)
+        formatted_time = datetime.now().strftime("%Y_%m_%d_%H_%M_%S_%f")
+        prefix = f"{SNAPSHOT_FILE_PREFIX}_{os.getpid()}_"
+        path = os.path.join(directory, f"{prefix}{formatted_time}.json")
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(
+                    {
+                        "traceEvents": self.export_trace(),
+                        "displayTimeUnit": "ms",
+                        "otherData": self.get_report(),
+                    },
+                    f,
+                )
+            _remove_old_snapshots(
+                directory=directory, prefix=prefix, max_snapshots=self._max_snapshots
+            )
+        except OSError as error:
+            logger.warning(f"Could not save workflow profiler snapshot: {error}")
+            return None
+        return path
+
+    def close(self) -> None:
+        self.save_snapshot()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _get_traced_memory(self) -> Optional[int]:
+        if not self._track_allocations or not tracemalloc.is_tracing():
+            return None
+        current, _ = tracemalloc.get_traced_memory()
+        return current
+
+    def _register_step_measurements(
+        self, step: str, measurements: Dict[str, float]
+    ) -> None:
+        with self._lock:
+            step_metrics = self._steps_metrics.setdefault(step, {})
+            for metric, value in measurements.items():
+                if metric not in step_metrics:
+                    step_metrics[metric] = deque(maxlen=self._window_size)
+                step_metrics[metric].append(value)
+
+
+def summarise_measurements(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {"samples": 0}
+    percentiles = np.percentile(values, REPORTED_PERCENTILES)
+    result = {"samples": len(values), "mean": float(np.mean(values))}
+    for percentile, value in zip(REPORTED_PERCENTILES, percentiles):
+        result[f"p{percentile}"] = float(value)
+    result["max"] = float(np.max(values))
+    return result
+
+
+def _remove_old_snapshots(directory: str, prefix: str, max_snapshots: int) -> None:
+    snapshots = sorted(
+        name
+        for name in os.listdir(directory)
+        if name.startswith(prefix) and name.endswith(".json")
+    )
+    for name in snapshots[:-max_snapshots]:
+        os.remove(os.path.join(directory, name))
@@ -56,3 +56,8 @@ class BasicWorkflowsCache(Generic[V]):
                 del self._cache[to_pop]
             self._keys_buffer.append(key)
             self._cache[key] = value
+
+    def clear(self) -> None:
+        with self._cache_lock:
+            self._keys_buffer.clear()
+            self._cache.clear()
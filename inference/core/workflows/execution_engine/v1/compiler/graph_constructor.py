@@ -109,6 +109,7 @@ def prepare_execution_graph(
             f"never end if executed.",
             context="workflow_compilation | execution_graph_construction",
         )
+    execution_graph = disable_redundant_image_copies(execution_graph=execution_graph)
     return denote_data_flow_in_workflow(
         execution_graph=execution_graph,
         parsed_workflow_definition=workflow_definition,
@@ -141,6 +142,53 @@ def construct_graph(
     )
 
 
+def disable_redundant_image_copies(execution_graph: DiGraph) -> DiGraph:
+    # Steps declaring `get_image_copy_property()` (like visualizations) copy input image
+    # to preserve the original. When the image is produced by another such step and the
+    # step is its only consumer, nobody can observe the original - so the chain of
+    # steps may share single image buffer instead of copying full frame at each step.
+    step_nodes = get_nodes_of_specific_category(
+        execution_graph=execution_graph,
+        category=NodeCategory.STEP_NODE,
+    )
+    for step_node in step_nodes:
+        step_manifest = node_as(
+            execution_graph=execution_graph,
+            node=step_node,
+            expected_type=StepNode,
+        ).step_manifest
+        copy_property = step_manifest.get_image_copy_property()
+        if (
+            copy_property is None
+            or getattr(step_manifest, copy_property, None) is not True
+        ):
+            continue
+        image_selector = getattr(step_manifest, "image", None)
+        if not is_step_output_selector(selector_or_value=image_selector):
+            continue
+        if get_last_chunk_of_selector(selector=image_selector) != "image":
+            continue
+        image_producer = get_step_selector_from_its_output(
+            step_output_selector=image_selector
+        )
+        if image_producer not in execution_graph.nodes:
+            continue
+        producer_manifest = node_as(
+            execution_graph=execution_graph,
+            node=image_producer,
+            expected_type=StepNode,
+        ).step_manifest
+        if producer_manifest.get_image_copy_property() is None:
+            continue
+        if set(execution_graph.successors(image_producer)) != {step_node}:
+            continue
+        logger.debug(
+            f"Step {step_node} modifies image produced by {image_producer} in place"
+        )
+        setattr(step_manifest, copy_property, False)
+    return execution_graph
+
+
 def add_input_nodes_for_graph(
     inputs: List[InputType],
     execution_graph: DiGraph,
@@ -20,6 +20,9 @@ from inference.core.workflows.execution_engine.v1.executor.runtime_input_assembl
 from inference.core.workflows.execution_engine.v1.executor.runtime_input_validator import (
     validate_runtime_input,
 )
+from inference.core.workflows.execution_engine.v1.executor.step_outputs_memoization import (
+    StepOutputsCache,
+)
 
 EXECUTION_ENGINE_V1_VERSION = Version("1.4.0")
 
@@ -67,6 +70,7 @@ class ExecutionEngineV1(BaseExecutionEngine):
         self._prevent_local_images_loading = prevent_local_images_loading
         self._workflow_id = workflow_id
         self._profiler = profiler
+        self._step_outputs_cache = StepOutputsCache()
 
     def run(
         self,
@@ -98,6 +102,7 @@ class ExecutionEngineV1(BaseExecutionEngine):
             kinds_serializers=self._compiled_workflow.kinds_serializers,
             serialize_results=serialize_results,
             profiler=self._profiler,
+            step_outputs_cache=self._step_outputs_cache,
         )
         self._profiler.end_workflow_run()
         return result
@@ -3,6 +3,15 @@ from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Set
 
 from inference.core import logger
+from inference.core.env import (
+    WORKFLOWS_MODEL_CALLS_COALESCING_ENABLED,
+    WORKFLOWS_MODEL_CALLS_COALESCING_MAX_WAIT,
+    WORKFLOWS_STEP_OUTPUTS_MEMOIZATION_ENABLED,
+)
+from inference.core.managers.coalescing import (
+    ModelCallsCoalescingGroup,
+    coalescing_group_participation,
+)
 from inference.core.workflows.errors import (
     ExecutionEngineRuntimeError,
     StepExecutionError,
@@ -25,13 +34,24 @@ from inference.core.workflows.execution_engine.v1.executor.execution_data_manage
 from inference.core.workflows.execution_engine.v1.executor.flow_coordinator import (
     ParallelStepExecutionCoordinator,
 )
+from inference.core.workflows.execution_engine.v1.executor.model_calls_coalescing import (
+    order_steps_by_coalescing_groups,
+    plan_model_calls_coalescing,
+)
 from inference.core.workflows.execution_engine.v1.executor.output_constructor import (
     construct_workflow_output,
 )
+from inference.core.workflows.execution_engine.v1.executor.step_outputs_memoization import (
+    StepOutputsCache,
+    fingerprint_step_input,
+)
 from inference.core.workflows.execution_engine.v1.executor.utils import (
     run_steps_in_parallel,
 )
-from inference.core.workflows.prototypes.block import WorkflowBlock
+from inference.core.workflows.prototypes.block import (
+    WorkflowBlock,
+    WorkflowBlockManifest,
+)
 from inference.usage_tracking.collector import usage_collector
 
 
@@ -47,6 +67,7 @@ def run_workflow(
     kinds_serializers: Optional[Dict[str, Callable[[Any], Any]]],
     serialize_results: bool = False,
     profiler: Optional[WorkflowsProfiler] = None,
+    step_outputs_cache: Optional[StepOutputsCache] = None,
 ) -> List[Dict[str, Any]]:
     execution_data_manager = ExecutionDataManager.init(
         execution_graph=workflow.execution_graph,
@@ -63,6 +84,7 @@ def run_workflow(
             execution_data_manager=execution_data_manager,
             max_concurrent_steps=max_concurrent_steps,
             profiler=profiler,
+            step_outputs_cache=step_outputs_cache,
         )
         next_steps = execution_coordinator.get_steps_to_execute_next(profiler=profiler)
     with profiler.profile_execution_phase(
@@ -89,8 +111,21 @@ def execute_steps(
     execution_data_manager: ExecutionDataManager,
     max_concurrent_steps: int,
     profiler: Optional[WorkflowsProfiler] = None,
+    step_outputs_cache: Optional[StepOutputsCache] = None,
 ) -> None:
     logger.info(f"Executing steps: {next_steps}.")
+    coalescing_groups = {}
+    if WORKFLOWS_MODEL_CALLS_COALESCING_ENABLED:
+        coalescing_groups = plan_model_calls_coalescing(
+            steps=next_steps,
+            workflow=workflow,
+            max_concurrent_steps=max_concurrent_steps,
+            max_wait=WORKFLOWS_MODEL_CALLS_COALESCING_MAX_WAIT,
+        )
+        next_steps = order_steps_by_coalescing_groups(
+            steps=next_steps,
+            coalescing_groups=coalescing_groups,
+        )
     steps_functions = [
         partial(
             safe_execute_step,
@@ -98,6 +133,8 @@ def execute_steps(
             workflow=workflow,
             execution_data_manager=execution_data_manager,
             profiler=profiler,
+            coalescing_group=coalescing_groups.get(step_selector),
+            step_outputs_cache=step_outputs_cache,
         )
         for step_selector in next_steps
     ]
@@ -114,6 +151,8 @@ def safe_execute_step(
     workflow: CompiledWorkflow,
     execution_data_manager: ExecutionDataManager,
     profiler: Optional[WorkflowsProfiler] = None,
+    coalescing_group: Optional[ModelCallsCoalescingGroup] = None,
+    step_outputs_cache: Optional[StepOutputsCache] = None,
 ) -> None:
     if profiler is None:
         profiler = NullWorkflowsProfiler.init()
@@ -121,12 +160,14 @@ def safe_execute_step(
         logger.info(
             f"started execution of: {step_selector} - {datetime.now().isoformat()}"
         )
-        run_step(
-            step_selector=step_selector,
-            workflow=workflow,
-            execution_data_manager=execution_data_manager,
-            profiler=profiler,
-        )
+        with coalescing_group_participation(group=coalescing_group):
+            run_step(
+                step_selector=step_selector,
+                workflow=workflow,
+                execution_data_manager=execution_data_manager,
+                profiler=profiler,
+                step_outputs_cache=step_outputs_cache,
+            )
         logger.info(
             f"finished execution of: {step_selector} - {datetime.now().isoformat()}"
         )
@@ -146,6 +187,7 @@ def run_step(
     workflow: CompiledWorkflow,
     execution_data_manager: ExecutionDataManager,
     profiler: WorkflowsProfiler,
+    step_outputs_cache: Optional[StepOutputsCache] = None,
 ) -> None:
     if execution_data_manager.is_step_simd(step_selector=step_selector):
         return run_simd_step(
@@ -159,6 +201,7 @@ def run_step(
         workflow=workflow,
         execution_data_manager=execution_data_manager,
         profiler=profiler,
+        step_outputs_cache=step_outputs_cache,
     )
 
 
@@ -269,6 +312,7 @@ def run_non_simd_step(
     workflow: CompiledWorkflow,
     execution_data_manager: ExecutionDataManager,
     profiler: Optional[WorkflowsProfiler] = None,
+    step_outputs_cache: Optional[StepOutputsCache] = None,
 ) -> None:
     with profiler.profile_execution_phase(
         name="step_input_assembly",
@@ -283,14 +327,44 @@ def run_non_simd_step(
         return None
     step_name = get_last_chunk_of_selector(selector=step_selector)
     step_instance = workflow.steps[step_name].step
-    with profiler.profile_execution_phase(
-        name="step_code_execution",
-        categories=["workflow_block_operation"],
-        metadata={
-            "step": step_selector,
-        },
+    if not is_step_output_memoizable(
+        step_manifest=workflow.steps[step_name].manifest,
+        step_outputs_cache=step_outputs_cache,
     ):
-        step_result = step_instance.run(**step_input)
+        step_outputs_cache = None
+    memoized_output, input_fingerprint = None, None
+    if step_outputs_cache is not None:
+        input_fingerprint = fingerprint_step_input(step_input=step_input)
+    if input_fingerprint is not None:
+        memoized_output = step_outputs_cache.get(
+            step_selector=step_selector, input_fingerprint=input_fingerprint
+        )
+        profiler.notify_event(
+            name="step_output_memoization",
+            categories=["execution_engine_operation"],
+            metadata={
+                "step": step_selector,
+                "hit": memoized_output is not None,
+                "hits": memoized_output.hits if memoized_output is not None else 0,
+            },
+        )
+    if memoized_output is not None:
+        step_result = memoized_output.output
+    else:
+        with profiler.profile_execution_phase(
+            name="step_code_execution",
+            categories=["workflow_block_operation"],
+            metadata={
+                "step": step_selector,
+            },
+        ):
+            step_result = step_instance.run(**step_input)
+        if input_fingerprint is not None and not isinstance(step_result, list):
+            step_outputs_cache.put(
+                step_selector=step_selector,
+                input_fingerprint=input_fingerprint,
+                output=step_result,
+            )
     if isinstance(step_result, list):
         raise ExecutionEngineRuntimeError(
             public_message=f"Error in execution engine. Non-SIMD step {step_name} "
@@ -309,3 +383,14 @@ def run_non_simd_step(
             step_selector=step_selector,
             output=step_result,
         )
+
+
+def is_step_output_memoizable(
+    step_manifest: WorkflowBlockManifest,
+    step_outputs_cache: Optional[StepOutputsCache],
+) -> bool:
+    return (
+        step_outputs_cache is not None
+        and WORKFLOWS_STEP_OUTPUTS_MEMOIZATION_ENABLED
+        and step_manifest.has_deterministic_outputs()
+    )
@@ -0,0 +1,80 @@
+from typing import Dict, List, Optional
+
+from inference.core.managers.coalescing import ModelCallsCoalescingGroup
+from inference.core.models.utils.batching import create_batches
+from inference.core.workflows.execution_engine.v1.compiler.entities import (
+    CompiledWorkflow,
+)
+from inference.core.workflows.execution_engine.v1.compiler.utils import (
+    get_last_chunk_of_selector,
+)
+
+
+def plan_model_calls_coalescing(
+    steps: List[str],
+    workflow: CompiledWorkflow,
+    max_concurrent_steps: int,
+    max_wait: float,
+) -> Dict[str, ModelCallsCoalescingGroup]:
+    """
+    Assigns steps of the same execution layer that refer the same model (the same
+    `model_id` value or selector in step manifest) into coalescing groups - steps
+    from one group merge their model calls into batched inference when executed.
+
+    Groups are never larger than `max_concurrent_steps`, as all members must be
+    executed at the same time for the calls to be merged.
+    """
+    if max_concurrent_steps < 2:
+        return {}
+    steps_by_model: Dict[str, List[str]] = {}
+    for step_selector in steps:
+        model_id = get_step_model_id(step_selector=step_selector, workflow=workflow)
+        if model_id is None:
+            continue
+        steps_by_model.setdefault(model_id, []).append(step_selector)
+    result = {}
+    for model_steps in steps_by_model.values():
+        for group_steps in create_batches(
+            sequence=model_steps, batch_size=max_concurrent_steps
+        ):
+            if len(group_steps) < 2:
+                continue
+            group = ModelCallsCoalescingGroup(
+                participants=len(group_steps),
+                max_wait=max_wait,
+            )
+            for step_selector in group_steps:
+                result[step_selector] = group
+    return result
+
+
+def get_step_model_id(step_selector: str, workflow: CompiledWorkflow) -> Optional[str]:
+    step_name = get_last_chunk_of_selector(selector=step_selector)
+    model_id = getattr(workflow.steps[step_name].manifest, "model_id", None)
+    if not isinstance(model_id, str):
+        return None
+    return model_id
+
+
+def order_steps_by_coalescing_groups(
+    steps: List[str],
+    coalescing_groups: Dict[str, ModelCallsCoalescingGroup],
+) -> List[str]:
+    """
+    Places members of each coalescing group next to each other (at the position of
+    the first member), so that they get scheduled for execution together.
+    """
+    steps_by_group: Dict[int, List[str]] = {}
+    for step_selector in steps:
+        if step_selector in coalescing_groups:
+            group_id = id(coalescing_groups[step_selector])
+            steps_by_group.setdefault(group_id, []).append(step_selector)
+    result = []
+    for step_selector in steps:
+        if step_selector not in coalescing_groups:
+            result.append(step_selector)
+            continue
+        group_id = id(coalescing_groups[step_selector])
+        if group_id in steps_by_group:
+            result.extend(steps_by_group.pop(group_id))
+    return result
@@ -0,0 +1,150 @@
+import dataclasses
+import hashlib
+from copy import deepcopy
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+from typing import Any, Dict, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from inference.core import logger
+
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, Enum)
+
+
+@dataclass
+class MemoizedStepOutput:
+    input_fingerprint: bytes
+    output: Any
+    hits: int = 0
+
+
+class StepOutputsCache:
+    """Keeps last output of each memoized step together with fingerprint of inputs
+    it was computed for.
+
+    Entry of a step is invalidated as soon as the step is executed with different
+    inputs. Output is frozen once when put into the cache - numpy arrays become
+    read-only and other mutable leaves are copied - and each hit receives fresh
+    containers sharing frozen leaves, such that modifications made by downstream
+    steps cannot leak into the cache without copying the whole output on each run.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, MemoizedStepOutput] = {}
+        self._lock = Lock()
+
+    def get(
+        self, step_selector: str, input_fingerprint: bytes
+    ) -> Optional[MemoizedStepOutput]:
+        with self._lock:
+            entry = self._entries.get(step_selector)
+            if entry is None or entry.input_fingerprint != input_fingerprint:
+                return None
+            entry.hits += 1
+            hits = entry.hits
+        return MemoizedStepOutput(
+            input_fingerprint=entry.input_fingerprint,
+            output=share_frozen_value(value=entry.output),
+            hits=hits,
+        )
+
+    def put(self, step_selector: str, input_fingerprint: bytes, output: Any) -> None:
+        try:
+            entry = MemoizedStepOutput(
+                input_fingerprint=input_fingerprint,
+                output=freeze_value(value=output),
+            )
+        except Exception as error:
+            logger.debug(f"Could not memoize output of step {step_selector}: {error}")
+            return None
+        with self._lock:
+            self._entries[step_selector] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def fingerprint_step_input(step_input: Dict[str, Any]) -> Optional[bytes]:
+    """Returns digest of step input, or `None` if input holds values which cannot
+    be fingerprinted reliably (making the step not memoizable in that run)."""
+    digest = hashlib.blake2b(digest_size=16)
+    if not _update_fingerprint(digest=digest, value=step_input):
+        return None
+    return digest.digest()
+
+
+def _update_fingerprint(digest: "hashlib.blake2b", value: Any) -> bool:
+    digest.update(f"{type(value).__qualname__}:".encode("utf-8"))
+    if isinstance(value, np.ndarray):
+        digest.update(f"{value.dtype.str}{value.shape}\0".encode("utf-8"))
+        if value.dtype.hasobject:
+            return _update_fingerprint(digest=digest, value=value.tolist())
+        digest.update(np.ascontiguousarray(value).data)
+        return True
+    if isinstance(value, np.generic):
+        digest.update(value.tobytes())
+        return True
+    if isinstance(value, IMMUTABLE_TYPES):
+        digest.update(f"{value!r}\0".encode("utf-8"))
+        return True
+    if isinstance(value, dict):
+        digest.update(f"{len(value)}\0".encode("utf-8"))
+        for key, item in value.items():
+            if not _update_fingerprint(digest=digest, value=key):
+                return False
+            if not _update_fingerprint(digest=digest, value=item):
+                return False
+        return True
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+        if isinstance(value, (set, frozenset)):
+            try:
+                items = sorted(value)
+            except TypeError:
+                return False
+        digest.update(f"{len(items)}\0".encode("utf-8"))
+        return all(_update_fingerprint(digest=digest, value=item) for item in items)
+    if isinstance(value, BaseModel):
+        return _update_fingerprint(digest=digest, value=value.model_dump())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _update_fingerprint(
+            digest=digest,
+            value={
+                field.name: getattr(value, field.name)
+                for field in dataclasses.fields(value)
+            },
+        )
+    return False
+
+
+def freeze_value(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        frozen = value.copy()
+        frozen.flags.writeable = False
+        return frozen
+    if isinstance(value, IMMUTABLE_TYPES) or isinstance(value, np.generic):
+        return value
+    if isinstance(value, dict):
+        return {key: freeze_value(value=item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [freeze_value(value=item) for item in value]
+    if isinstance(value, tuple) and not hasattr(value, "_fields"):
+        return tuple(freeze_value(value=item) for item in value)
+    return deepcopy(value)
+
+
+def share_frozen_value(value: Any) -> Any:
+    if isinstance(value, (np.ndarray, np.generic)) or isinstance(
+        value, IMMUTABLE_TYPES
+    ):
+        return value
+    if isinstance(value, dict):
+        return {key: share_frozen_value(value=item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [share_frozen_value(value=item) for item in value]
+    if isinstance(value, tuple) and not hasattr(value, "_fields"):
+        return tuple(share_frozen_value(value=item) for item in value)
+    return deepcopy(value)
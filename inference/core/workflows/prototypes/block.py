@@ -73,6 +73,28 @@ class WorkflowBlockManifest(BaseModel, ABC):
     def accepts_empty_values(cls) -> bool:
         return False
 
+    @classmethod
+    def has_deterministic_outputs(cls) -> bool:
+        """
+        Declares that block outputs depend solely on its inputs - block has no internal
+        state nor side effects. When `WORKFLOWS_STEP_OUTPUTS_MEMOIZATION_ENABLED=True`,
+        Execution Engine re-uses outputs of such non-batch steps across workflow runs
+        as long as their inputs do not change - numpy arrays of re-used outputs are
+        read-only.
+        """
+        return False
+
+    @classmethod
+    def get_image_copy_property(cls) -> Optional[str]:
+        """
+        Declares name of boolean property deciding if block works on the copy of its
+        `image` input or modifies it in place - returning the result as `image` output.
+        Execution Engine disables the copy for steps consuming `image` output of
+        another step declaring the property, if no other step nor workflow output
+        may observe the in-place modification.
+        """
+        return None
+
     @classmethod
     def get_execution_engine_compatibility(cls) -> Optional[str]:
         return None
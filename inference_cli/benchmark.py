@@ -1,14 +1,19 @@
 import json
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import typer
 from typing_extensions import Annotated
 
 from inference_cli.lib.benchmark.dataset import PREDEFINED_DATASETS
+from inference_cli.lib.benchmark.load_test import parse_numbers_list
 from inference_cli.lib.benchmark_adapter import (
+    run_api_load_test_benchmark,
     run_infer_api_speed_benchmark,
     run_python_package_speed_benchmark,
+    run_session_profiles_tuning,
+    run_stages_benchmark,
     run_workflow_api_speed_benchmark,
+    run_workflows_execution_benchmark,
 )
 
 benchmark_app = typer.Typer(help="Commands for running inference benchmarks.")
@@ -195,6 +200,144 @@ def api_speed(
         raise typer.Exit(code=1)
 
 
+@benchmark_app.command()
+def api_load(
+    model_ids: Annotated[
+        List[str],
+        typer.Option(
+            "--model_id",
+            "-m",
+            help="Model ID in format project/version - may be given multiple times to test a mix "
+            "of models, optionally with weight of the model in the mix (`project/version=3`).",
+        ),
+    ],
+    dataset_reference: Annotated[
+        str,
+        typer.Option(
+            "--dataset_reference",
+            "-d",
+            help=f"Name of predefined dataset (one of {list(PREDEFINED_DATASETS.keys())}) or path to directory with images",
+        ),
+    ] = "coco",
+    host: Annotated[
+        str,
+        typer.Option("--host", "-h", help="Host to run inference on."),
+    ] = "http://localhost:9001",
+    requests_per_second: Annotated[
+        str,
+        typer.Option(
+            "--rps",
+            "-rps",
+            help="Comma-separated arrival rates (requests per second) to ramp through - ramp stops "
+            "at first rate the server cannot sustain.",
+        ),
+    ] = "1,2,5,10,20,50",
+    batch_sizes: Annotated[
+        str,
+        typer.Option(
+            "--batch_sizes",
+            "-bs",
+            help="Comma-separated batch sizes of requests - each is tested with all arrival rates.",
+        ),
+    ] = "1",
+    arrival_process: Annotated[
+        str,
+        typer.Option(
+            "--arrival",
+            help="Arrival process of requests: `poisson` or `constant`",
+        ),
+    ] = "poisson",
+    stage_duration: Annotated[
+        float,
+        typer.Option(
+            "--stage_duration",
+            "-sd",
+            help="Duration (in seconds) of emitting requests at given arrival rate",
+        ),
+    ] = 30.0,
+    max_in_flight_requests: Annotated[
+        int,
+        typer.Option(
+            "--max_in_flight",
+            help="Max number of requests in flight - requests scheduled above the limit are delayed "
+            "by client (and the delay is included in latency)",
+        ),
+    ] = 256,
+    warm_up_requests: Annotated[
+        int,
+        typer.Option(
+            "--warm_up_requests", "-wr", help="Number of warm-up requests per model"
+        ),
+    ] = 10,
+    api_key: Annotated[
+        Optional[str],
+        typer.Option(
+            "--api-key",
+            "-a",
+            help="Roboflow API key for your workspace. If not given - env variable `ROBOFLOW_API_KEY` will be used",
+        ),
+    ] = None,
+    model_configuration: Annotated[
+        Optional[str],
+        typer.Option(
+            "--model_config", "-mc", help="Location of yaml file with model config"
+        ),
+    ] = None,
+    output_location: Annotated[
+        Optional[str],
+        typer.Option(
+            "--output_location",
+            "-o",
+            help="Location where to save the result (path to file or directory)",
+        ),
+    ] = None,
+    proceed_automatically: Annotated[
+        bool,
+        typer.Option(
+            "--yes/--no",
+            "-y/-n",
+            help="Boolean flag to decide on auto `yes` answer given on user input required.",
+        ),
+    ] = False,
+    max_error_rate: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_error_rate",
+            help="Max error rate of stages below saturation point - if given and the error rate is higher - "
+            "command will return non-success error code. Expected percentage values in range 0.0-100.0",
+        ),
+    ] = None,
+):
+    if "roboflow.com" in host and not proceed_automatically:
+        proceed = input(
+            "This action may easily exceed your Roboflow inference credits. Are you sure? [y/N] "
+        )
+        if proceed.lower() != "y":
+            return None
+    try:
+        run_api_load_test_benchmark(
+            model_ids=model_ids,
+            dataset_reference=dataset_reference,
+            host=host,
+            requests_per_second=parse_numbers_list(requests_per_second),
+            batch_sizes=[int(e) for e in parse_numbers_list(batch_sizes)],
+            arrival_process=arrival_process,
+            stage_duration=stage_duration,
+            max_in_flight_requests=max_in_flight_requests,
+            warm_up_requests=warm_up_requests,
+            api_key=api_key,
+            model_configuration=model_configuration,
+            output_location=output_location,
+            max_error_rate=max_error_rate,
+        )
+    except KeyboardInterrupt:
+        print("Benchmark interrupted.")
+        return
+    except Exception as error:
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
+
+
 @benchmark_app.command()
 def python_package_speed(
     model_id: Annotated[
@@ -269,5 +412,349 @@ def python_package_speed(
         raise typer.Exit(code=1)
 
 
+@benchmark_app.command()
+def stages(
+    model_id: Annotated[
+        Optional[str],
+        typer.Option(
+            "--model_id",
+            "-m",
+            help="Model ID in format project/version. If not given - object detection model with "
+            "dummy ONNX session is used (no weights needed).",
+        ),
+    ] = None,
+    dataset_reference: Annotated[
+        Optional[str],
+        typer.Option(
+            "--dataset_reference",
+            "-d",
+            help=f"Name of predefined dataset (one of {list(PREDEFINED_DATASETS.keys())}) or path to directory "
+            f"with images. If not given - synthetic images are used.",
+        ),
+    ] = None,
+    resolutions: Annotated[
+        str,
+        typer.Option(
+            "--resolutions",
+            "-r",
+            help="Comma-separated resolutions (WIDTHxHEIGHT) of input images - dataset images are resized, "
+            "if both dataset and resolutions are given. Pass empty string to use dataset images as they are.",
+        ),
+    ] = "640x480,1280x720,1920x1080",
+    detections: Annotated[
+        str,
+        typer.Option(
+            "--detections",
+            help="Comma-separated numbers of confident detections returned by dummy model (before NMS)",
+        ),
+    ] = "10,100,1000",
+    batch_size: Annotated[
+        int,
+        typer.Option("--batch_size", "-bs", help="Batch size of single inference"),
+    ] = 1,
+    warm_up_inferences: Annotated[
+        int,
+        typer.Option(
+            "--warm_up_inferences", "-wi", help="Number of warm-up inferences"
+        ),
+    ] = 5,
+    benchmark_inferences: Annotated[
+        int,
+        typer.Option(
+            "--benchmark_inferences",
+            "-bi",
+            help="Number of benchmark inferences per scenario",
+        ),
+    ] = 100,
+    trace_allocations: Annotated[
+        bool,
+        typer.Option(
+            "--trace_allocations/--no_trace_allocations",
+            help="Flag to decide if peak memory allocated by stages should be measured (in separate run)",
+        ),
+    ] = False,
+    dummy_input_size: Annotated[
+        int,
+        typer.Option("--dummy_input_size", help="Input size of dummy model"),
+    ] = 640,
+    dummy_classes: Annotated[
+        int,
+        typer.Option("--dummy_classes", help="Number of classes of dummy model"),
+    ] = 80,
+    api_key: Annotated[
+        Optional[str],
+        typer.Option(
+            "--api-key",
+            "-a",
+            help="Roboflow API key for your workspace. If not given - env variable `ROBOFLOW_API_KEY` will be used",
+        ),
+    ] = None,
+    model_configuration: Annotated[
+        Optional[str],
+        typer.Option(
+            "--model_config", "-mc", help="Location of yaml file with model config"
+        ),
+    ] = None,
+    baseline_location: Annotated[
+        Optional[str],
+        typer.Option(
+            "--baseline",
+            "-b",
+            help="Location of results of previous run of the command to compare against",
+        ),
+    ] = None,
+    max_regression: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_regression",
+            help="Max slowdown of any stage against baseline (in percents) - if exceeded, command "
+            "will return non-success error code",
+        ),
+    ] = None,
+    output_location: Annotated[
+        Optional[str],
+        typer.Option(
+            "--output_location",
+            "-o",
+            help="Location where to save the result (path to file or directory)",
+        ),
+    ] = None,
+):
+    try:
+        run_stages_benchmark(
+            model_id=model_id,
+            dataset_reference=dataset_reference,
+            resolutions=parse_resolutions(resolutions),
+            detections=[int(e) for e in parse_numbers_list(detections)],
+            batch_size=batch_size,
+            warm_up_inferences=warm_up_inferences,
+            benchmark_inferences=benchmark_inferences,
+            trace_allocations=trace_allocations,
+            dummy_input_size=dummy_input_size,
+            dummy_classes=dummy_classes,
+            api_key=api_key,
+            model_configuration=model_configuration,
+            baseline_location=baseline_location,
+            max_regression=max_regression,
+            output_location=output_location,
+        )
+    except KeyboardInterrupt:
+        print("Benchmark interrupted.")
+        return
+    except Exception as error:
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
+
+
+@benchmark_app.command()
+def execution_engine(
+    depths: Annotated[
+        str,
+        typer.Option(
+            "--depths",
+            help="Comma-separated lengths of chains of steps in synthetic workflows",
+        ),
+    ] = "1,10,50",
+    widths: Annotated[
+        str,
+        typer.Option(
+            "--widths",
+            help="Comma-separated numbers of independent branches in synthetic workflows",
+        ),
+    ] = "1,4,16",
+    dimensionalities: Annotated[
+        str,
+        typer.Option(
+            "--dimensionalities",
+            help="Comma-separated dimensionalities of synthetic workflows - each level above 1 adds "
+            "cropping of the image (and aggregation of results at the end of the branch)",
+        ),
+    ] = "1,2",
+    detections: Annotated[
+        int,
+        typer.Option(
+            "--detections", help="Number of detections returned by stub detector"
+        ),
+    ] = 10,
+    max_crops: Annotated[
+        int,
+        typer.Option(
+            "--max_crops", help="Number of crops made for each image by stub crop"
+        ),
+    ] = 4,
+    batch_size: Annotated[
+        int,
+        typer.Option("--batch_size", "-bs", help="Number of input images"),
+    ] = 1,
+    compilations: Annotated[
+        int,
+        typer.Option("--compilations", help="Number of workflow compilations"),
+    ] = 10,
+    warm_up_runs: Annotated[
+        int,
+        typer.Option("--warm_up_runs", "-wr", help="Number of warm-up runs"),
+    ] = 5,
+    benchmark_runs: Annotated[
+        int,
+        typer.Option(
+            "--benchmark_runs", "-br", help="Number of benchmark runs per scenario"
+        ),
+    ] = 50,
+    max_concurrent_steps: Annotated[
+        int,
+        typer.Option(
+            "--max_concurrent_steps",
+            help="Max number of steps run concurrently by Execution Engine",
+        ),
+    ] = 1,
+    serialize_results: Annotated[
+        bool,
+        typer.Option(
+            "--serialize_results/--no_serialize_results",
+            help="Flag to decide if outputs should be serialized (as it happens in HTTP API)",
+        ),
+    ] = False,
+    baseline_location: Annotated[
+        Optional[str],
+        typer.Option(
+            "--baseline",
+            "-b",
+            help="Location of results of previous run of the command to compare against",
+        ),
+    ] = None,
+    max_regression: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_regression",
+            help="Max slowdown of any Execution Engine operation against baseline (in percents) - "
+            "if exceeded, command will return non-success error code",
+        ),
+    ] = None,
+    output_location: Annotated[
+        Optional[str],
+        typer.Option(
+            "--output_location",
+            "-o",
+            help="Location where to save the result (path to file or directory)",
+        ),
+    ] = None,
+):
+    try:
+        run_workflows_execution_benchmark(
+            depths=[int(e) for e in parse_numbers_list(depths)],
+            widths=[int(e) for e in parse_numbers_list(widths)],
+            dimensionalities=[int(e) for e in parse_numbers_list(dimensionalities)],
+            detections=detections,
+            max_crops=max_crops,
+            batch_size=batch_size,
+            compilations=compilations,
+            warm_up_runs=warm_up_runs,
+            benchmark_runs=benchmark_runs,
+            max_concurrent_steps=max_concurrent_steps,
+            serialize_results=serialize_results,
+            baseline_location=baseline_location,
+            max_regression=max_regression,
+            output_location=output_location,
+        )
+    except KeyboardInterrupt:
+        print("Benchmark interrupted.")
+        return
+    except Exception as error:
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
+
+
+@benchmark_app.command(
+    help="Benchmark onnxruntime session profiles of models on this host and save the best "
+    "profile of each model in model cache (used when `ONNXRUNTIME_SESSION_PROFILE=auto`)"
+)
+def session_profiles(
+    model_ids: Annotated[
+        List[str],
+        typer.Option(
+            "--model_id",
+            "-m",
+            help="Model ID in format project/version - option may be given multiple times, "
+            "to tune multiple models",
+        ),
+    ],
+    profiles: Annotated[
+        Optional[str],
+        typer.Option(
+            "--profiles",
+            "-p",
+            help="Comma-separated names of onnxruntime session profiles to compare. If not given - "
+            "all profiles are compared (default, latency, throughput, shared)",
+        ),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency",
+            "-c",
+            help="Number of inferences running at the same time - should reflect expected load",
+        ),
+    ] = 1,
+    warm_up_runs: Annotated[
+        int,
+        typer.Option("--warm_up_runs", "-wr", help="Number of warm-up inferences"),
+    ] = 5,
+    benchmark_runs: Annotated[
+        int,
+        typer.Option(
+            "--benchmark_runs",
+            "-br",
+            help="Number of benchmark inferences per profile",
+        ),
+    ] = 50,
+    api_key: Annotated[
+        Optional[str],
+        typer.Option(
+            "--api-key",
+            "-a",
+            help="Roboflow API key for your workspace. If not given - env variable `ROBOFLOW_API_KEY` will be used",
+        ),
+    ] = None,
+    output_location: Annotated[
+        Optional[str],
+        typer.Option(
+            "--output_location",
+            "-o",
+            help="Location where to save the result (path to file or directory)",
+        ),
+    ] = None,
+):
+    try:
+        run_session_profiles_tuning(
+            model_ids=model_ids,
+            profiles=(
+                [e.strip() for e in profiles.split(",") if e.strip()]
+                if profiles
+                else None
+            ),
+            concurrency=concurrency,
+            warm_up_runs=warm_up_runs,
+            benchmark_runs=benchmark_runs,
+            api_key=api_key,
+            output_location=output_location,
+        )
+    except KeyboardInterrupt:
+        print("Benchmark interrupted.")
+        return
+    except Exception as error:
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
+
+
+def parse_resolutions(value: str) -> List[Tuple[int, int]]:
+    resolutions = []
+    for chunk in value.split(","):
+        if not chunk.strip():
+            continue
+        width, height = chunk.lower().split("x")
+        resolutions.append((int(width), int(height)))
+    return resolutions
+
+
 if __name__ == "__main__":
     benchmark_app()
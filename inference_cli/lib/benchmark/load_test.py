@@ -0,0 +1,465 @@
+import asyncio
+import json
+import math
+import random
+from collections import defaultdict
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional
+
+import aiohttp
+import numpy as np
+
+from inference_cli.lib.benchmark.results_gathering import LatencyHistogram
+from inference_sdk import InferenceHTTPClient
+from inference_sdk.http.client import NEW_INFERENCE_ENDPOINTS
+from inference_sdk.http.utils.loaders import load_static_inference_input
+
+SATURATION_THROUGHPUT_RATIO = 0.9
+SATURATION_ERROR_RATE = 1.0
+MAX_DISTINCT_REQUEST_BODIES = 16
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class ArrivalProcess(Enum):
+    CONSTANT = "constant"
+    POISSON = "poisson"
+
+
+@dataclass(frozen=True)
+class ModelTarget:
+    model_id: str
+    weight: float = 1.0
+
+
+@dataclass(frozen=True)
+class LoadTestStageResult:
+    model_ids: List[str]
+    batch_size: int
+    arrival_process: str
+    target_requests_per_second: float
+    duration: float
+    requests_sent: int
+    requests_completed: int
+    requests_per_second: float
+    images_per_second: float
+    error_rate: float
+    error_status_codes: Dict[str, int]
+    latency_ms: Dict[str, Optional[float]]
+    service_time_ms: Dict[str, Optional[float]]
+    queueing_time_ms: Dict[str, Optional[float]]
+    client_delay_ms: Dict[str, Optional[float]]
+    latency_by_model_ms: Dict[str, Dict[str, Optional[float]]]
+    saturated: bool
+
+    def to_string(self) -> str:
+        return (
+            f"bs: {self.batch_size}\t| target rps: {self.target_requests_per_second}\t| "
+            f"rps: {self.requests_per_second}\t| latency: {self.latency_ms}\t| "
+            f"service: {self.service_time_ms}\t| queueing: {self.queueing_time_ms}\t| "
+            f"%err: {self.error_rate}" + ("\t| SATURATED" if self.saturated else "")
+        )
+
+
+@dataclass(frozen=True)
+class LoadTestReport:
+    stages: List[LoadTestStageResult]
+    max_sustained_requests_per_second: Dict[int, Optional[float]] = field(
+        default_factory=dict
+    )
+
+
+@dataclass(frozen=True)
+class _PreparedTarget:
+    model_id: str
+    url: str
+    bodies_by_batch_size: Dict[int, List[bytes]]
+
+
+class _StageStatistics:
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.service_time = LatencyHistogram()
+        self.queueing_time = LatencyHistogram()
+        self.client_delay = LatencyHistogram()
+        self.latency_by_model: Dict[str, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+        self.error_status_codes: Dict[str, int] = defaultdict(int)
+        self.requests_sent = 0
+        self.requests_completed = 0
+        self.last_completion: Optional[float] = None
+
+    def register(
+        self,
+        model_id: str,
+        scheduled_at: float,
+        sent_at: float,
+        completed_at: float,
+        service_time: Optional[float],
+        error: Optional[str],
+    ) -> None:
+        self.last_completion = max(completed_at, self.last_completion or completed_at)
+        self.client_delay.record(sent_at - scheduled_at)
+        if error is not None:
+            self.error_status_codes[error] += 1
+            return None
+        self.requests_completed += 1
+        # latency measured from the moment request was scheduled, such that
+        # requests delayed by saturated client are not omitted
+        self.latency.record(completed_at - scheduled_at)
+        self.latency_by_model[model_id].record(completed_at - scheduled_at)
+        if service_time is not None:
+            self.service_time.record(service_time)
+            self.queueing_time.record(max(completed_at - sent_at - service_time, 0.0))
+
+
+def parse_model_mix(model_ids: List[str]) -> List[ModelTarget]:
+    """Parses entries in format `model_id` or `model_id=weight`."""
+    targets = []
+    for entry in model_ids:
+        model_id, _, weight = entry.partition("=")
+        targets.append(
+            ModelTarget(model_id=model_id, weight=float(weight) if weight else 1.0)
+        )
+    return targets
+
+
+def parse_numbers_list(value: str) -> List[float]:
+    return [float(chunk) for chunk in value.split(",") if chunk.strip()]
+
+
+def generate_arrival_offsets(
+    requests_per_second: float,
+    duration: float,
+    arrival_process: ArrivalProcess,
+    random_generator: Optional[random.Random] = None,
+) -> List[float]:
+    if arrival_process is ArrivalProcess.CONSTANT:
+        requests = math.ceil(duration * requests_per_second)
+        return [i / requests_per_second for i in range(requests)]
+    if random_generator is None:
+        random_generator = random.Random()
+    offsets = []
+    offset = 0.0
+    while offset < duration:
+        offsets.append(offset)
+        offset += random_generator.expovariate(requests_per_second)
+    return offsets
+
+
+def coordinate_api_load_test(
+    client: InferenceHTTPClient,
+    api_url: str,
+    api_key: Optional[str],
+    images: List[np.ndarray],
+    model_targets: List[ModelTarget],
+    requests_per_second: List[float],
+    batch_sizes: List[int],
+    arrival_process: ArrivalProcess,
+    stage_duration: float,
+    max_in_flight_requests: int,
+    warm_up_requests: int,
+    request_timeout: float,
+) -> LoadTestReport:
+    """
+    Drives open-loop traffic against the server - requests are emitted at the
+    arrival rate (constant or Poisson) regardless of how many of them are still in
+    flight, so that server saturation shows up as growing latency, instead of silently
+    lowering offered load (which is what closed-loop clients do). Each batch size
+    is tested against increasing request rates, with requests spread across
+    models according to their weights. Latency is measured from the scheduled
+    arrival time and split into service time reported by the server and time
+    spent in queues and network.
+    """
+    prepared_targets = prepare_targets(
+        client=client,
+        api_url=api_url,
+        api_key=api_key,
+        images=images,
+        model_targets=model_targets,
+        batch_sizes=batch_sizes,
+        warm_up_requests=warm_up_requests,
+    )
+    return asyncio.run(
+        execute_api_load_test(
+            prepared_targets=prepared_targets,
+            weights=[target.weight for target in model_targets],
+            requests_per_second=requests_per_second,
+            batch_sizes=batch_sizes,
+            arrival_process=arrival_process,
+            stage_duration=stage_duration,
+            max_in_flight_requests=max_in_flight_requests,
+            request_timeout=request_timeout,
+        )
+    )
+
+
+def prepare_targets(
+    client: InferenceHTTPClient,
+    api_url: str,
+    api_key: Optional[str],
+    images: List[np.ndarray],
+    model_targets: List[ModelTarget],
+    batch_sizes: List[int],
+    warm_up_requests: int,
+) -> List[_PreparedTarget]:
+    # images are encoded and request bodies serialised upfront, so that the
+    # event loop emitting requests is not delayed by client-side CPU work
+    encoded_images = [e[0] for e in load_static_inference_input(images)]
+    prepared_targets = []
+    for model_target in model_targets:
+        model_description = client.get_model_description(model_id=model_target.model_id)
+        endpoint = NEW_INFERENCE_ENDPOINTS.get(model_description.task_type)
+        if endpoint is None:
+            raise ValueError(
+                f"Model task {model_description.task_type} of model {model_target.model_id} "
+                f"is not supported by load test."
+            )
+        for _ in range(warm_up_requests):
+            try:
+                _ = client.infer(
+                    inference_input=images[0], model_id=model_target.model_id
+                )
+            except Exception:
+                # ignoring errors, without slight API instability may terminate benchmark
+                pass
+        bodies_by_batch_size = {
+            batch_size: [
+                _build_request_body(
+                    model_id=model_target.model_id,
+                    api_key=api_key,
+                    encoded_images=random.sample(
+                        encoded_images * batch_size, k=batch_size
+                    ),
+                )
+                for _ in range(min(MAX_DISTINCT_REQUEST_BODIES, len(encoded_images)))
+            ]
+            for batch_size in batch_sizes
+        }
+        prepared_targets.append(
+            _PreparedTarget(
+                model_id=model_target.model_id,
+                url=f"{api_url.rstrip('/')}{endpoint}",
+                bodies_by_batch_size=bodies_by_batch_size,
+            )
+        )
+    return prepared_targets
+
+
+async def execute_api_load_test(
+    prepared_targets: List[_PreparedTarget],
+    weights: List[float],
+    requests_per_second: List[float],
+    batch_sizes: List[int],
+    arrival_process: ArrivalProcess,
+    stage_duration: float,
+    max_in_flight_requests: int,
+    request_timeout: float,
+) -> LoadTestReport:
+    stages = []
+    max_sustained_requests_per_second = {}
+    connector = aiohttp.TCPConnector(limit=max_in_flight_requests)
+    timeout = aiohttp.ClientTimeout(total=request_timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        for batch_size in batch_sizes:
+            max_sustained_requests_per_second[batch_size] = None
+            for rate in sorted(requests_per_second):
+                stage_result = await execute_load_test_stage(
+                    session=session,
+                    prepared_targets=prepared_targets,
+                    weights=weights,
+                    target_requests_per_second=rate,
+                    batch_size=batch_size,
+                    arrival_process=arrival_process,
+                    stage_duration=stage_duration,
+                    max_in_flight_requests=max_in_flight_requests,
+                )
+                print(stage_result.to_string())
+                stages.append(stage_result)
+                if stage_result.saturated:
+                    break
+                max_sustained_requests_per_second[batch_size] = rate
+    return LoadTestReport(
+        stages=stages,
+        max_sustained_requests_per_second=max_sustained_requests_per_second,
+    )
+
+
+async def execute_load_test_stage(
+    session: aiohttp.ClientSession,
+    prepared_targets: List[_PreparedTarget],
+    weights: List[float],
+    target_requests_per_second: float,
+    batch_size: int,
+    arrival_process: ArrivalProcess,
+    stage_duration: float,
+    max_in_flight_requests: int,
+) -> LoadTestStageResult:
+    loop = asyncio.get_running_loop()
+    statistics = _StageStatistics()
+    in_flight_limit = asyncio.Semaphore(max_in_flight_requests)
+    offsets = generate_arrival_offsets(
+        requests_per_second=target_requests_per_second,
+        duration=stage_duration,
+        arrival_process=arrival_process,
+    )
+    tasks = []
+    start = loop.time()
+    for offset in offsets:
+        delay = start + offset - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        target = random.choices(prepared_targets, weights=weights)[0]
+        body = random.choice(target.bodies_by_batch_size[batch_size])
+        statistics.requests_sent += 1
+        tasks.append(
+            asyncio.create_task(
+                _send_request(
+                    session=session,
+                    target=target,
+                    body=body,
+                    scheduled_at=start + offset,
+                    in_flight_limit=in_flight_limit,
+                    statistics=statistics,
+                )
+            )
+        )
+    await asyncio.gather(*tasks)
+    end = statistics.last_completion or loop.time()
+    return _build_stage_result(
+        statistics=statistics,
+        model_ids=[target.model_id for target in prepared_targets],
+        batch_size=batch_size,
+        arrival_process=arrival_process,
+        target_requests_per_second=target_requests_per_second,
+        duration=max(end - start, stage_duration),
+    )
+
+
+async def _send_request(
+    session: aiohttp.ClientSession,
+    target: _PreparedTarget,
+    body: bytes,
+    scheduled_at: float,
+    in_flight_limit: asyncio.Semaphore,
+    statistics: _StageStatistics,
+) -> None:
+    loop = asyncio.get_running_loop()
+    async with in_flight_limit:
+        sent_at = loop.time()
+        service_time, error = None, None
+        try:
+            async with session.post(
+                target.url, data=body, headers=JSON_HEADERS
+            ) as response:
+                content = await response.read()
+                if response.status >= 400:
+                    error = str(response.status)
+                else:
+                    service_time = _get_server_reported_service_time(
+                        server_timing=response.headers.get("Server-Timing"),
+                        content=content,
+                    )
+        except Exception as exc:
+            error = exc.__class__.__name__
+        statistics.register(
+            model_id=target.model_id,
+            scheduled_at=scheduled_at,
+            sent_at=sent_at,
+            completed_at=loop.time(),
+            service_time=service_time,
+            error=error,
+        )
+
+
+def _get_server_reported_service_time(
+    server_timing: Optional[str], content: bytes
+) -> Optional[float]:
+    if server_timing:
+        durations = _parse_server_timing(server_timing=server_timing)
+        if "total" in durations:
+            return durations["total"]
+    try:
+        response = json.loads(content)
+    except ValueError:
+        return None
+    if not isinstance(response, list):
+        response = [response]
+    reported_times = [
+        r["time"] for r in response if isinstance(r, dict) and r.get("time") is not None
+    ]
+    if not reported_times:
+        return None
+    # images of batch are processed together - the slowest one bounds service time
+    return max(reported_times)
+
+
+def _parse_server_timing(server_timing: str) -> Dict[str, float]:
+    durations = {}
+    for metric in server_timing.split(","):
+        name, *parameters = [chunk.strip() for chunk in metric.split(";")]
+        for parameter in parameters:
+            key, _, value = parameter.partition("=")
+            if key == "dur":
+                try:
+                    durations[name] = float(value) / 1000
+                except ValueError:
+                    pass
+    return durations
+
+
+def _build_request_body(
+    model_id: str, api_key: Optional[str], encoded_images: List[str]
+) -> bytes:
+    payload = {
+        "model_id": model_id,
+        "image": [{"type": "base64", "value": image} for image in encoded_images],
+    }
+    if api_key:
+        payload["api_key"] = api_key
+    return json.dumps(payload).encode("utf-8")
+
+
+def _build_stage_result(
+    statistics: _StageStatistics,
+    model_ids: List[str],
+    batch_size: int,
+    arrival_process: ArrivalProcess,
+    target_requests_per_second: float,
+    duration: float,
+) -> LoadTestStageResult:
+    errors = sum(statistics.error_status_codes.values())
+    error_rate = (
+        round(errors / statistics.requests_sent * 100, 2)
+        if statistics.requests_sent > 0
+        else 0.0
+    )
+    requests_per_second = round(statistics.requests_completed / duration, 1)
+    saturated = (
+        requests_per_second < SATURATION_THROUGHPUT_RATIO * target_requests_per_second
+        or error_rate > SATURATION_ERROR_RATE
+    )
+    return LoadTestStageResult(
+        model_ids=model_ids,
+        batch_size=batch_size,
+        arrival_process=arrival_process.value,
+        target_requests_per_second=target_requests_per_second,
+        duration=round(duration, 3),
+        requests_sent=statistics.requests_sent,
+        requests_completed=statistics.requests_completed,
+        requests_per_second=requests_per_second,
+        images_per_second=round(requests_per_second * batch_size, 1),
+        error_rate=error_rate,
+        error_status_codes=dict(statistics.error_status_codes),
+        latency_ms=statistics.latency.get_percentiles_ms(),
+        service_time_ms=statistics.service_time.get_percentiles_ms(),
+        queueing_time_ms=statistics.queueing_time.get_percentiles_ms(),
+        client_delay_ms=statistics.client_delay.get_percentiles_ms(),
+        latency_by_model_ms={
+            model_id: histogram.get_percentiles_ms()
+            for model_id, histogram in statistics.latency_by_model.items()
+        },
+        saturated=saturated,
+    )
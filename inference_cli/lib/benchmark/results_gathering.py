@@ -1,8 +1,9 @@
+import math
 from collections import defaultdict
 from copy import copy
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -128,3 +129,72 @@ class ResultsCollector:
                 f"{exc}: {count}" for exc, count in error_status_codes.items()
             ),
         )
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of latencies (in the spirit of HdrHistogram) - values are
+    recorded with fixed relative precision (`significant_digits`) in memory which does
+    not grow with number of samples, so it can hold latencies of long load tests and
+    answer high percentiles (p99.9) without keeping all samples.
+    """
+
+    def __init__(self, lowest_value: float = 1e-6, significant_digits: int = 3):
+        self._lowest_value = lowest_value
+        self._sub_buckets = 2 ** math.ceil(math.log2(2 * 10**significant_digits))
+        self._counts: Dict[int, int] = defaultdict(int)
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, value: float) -> None:
+        self._counts[self._get_bucket_index(value=value)] += 1
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other._counts.items():
+            self._counts[index] += count
+        self.count += other.count
+        for value in (other.min, other.max):
+            if value is None:
+                continue
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    def get_percentile(self, percentile: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        required_count = max(math.ceil(percentile / 100 * self.count), 1)
+        cumulative_count = 0
+        for index in sorted(self._counts):
+            cumulative_count += self._counts[index]
+            if cumulative_count >= required_count:
+                value = self._get_bucket_value(index=index)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def get_percentiles_ms(
+        self, percentiles: Iterable[float] = (50, 90, 99, 99.9)
+    ) -> Dict[str, Optional[float]]:
+        result = {}
+        for percentile in percentiles:
+            value = self.get_percentile(percentile=percentile)
+            result[f"p{percentile:g}"] = (
+                round(value * 1000, 2) if value is not None else None
+            )
+        return result
+
+    def _get_bucket_index(self, value: float) -> int:
+        units = max(int(value / self._lowest_value), 0)
+        if units < self._sub_buckets:
+            return units
+        shift = units.bit_length() - self._sub_buckets.bit_length() + 1
+        return shift * self._sub_buckets + (units >> shift)
+
+    def _get_bucket_value(self, index: int) -> float:
+        shift, sub_bucket = divmod(index, self._sub_buckets)
+        # middle of the range of values falling into the bucket
+        units = (sub_bucket << shift) + ((1 << shift) - 1) / 2
+        return units * self._lowest_value
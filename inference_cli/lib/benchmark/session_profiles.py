@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from inference import get_model
+from inference.core.models.roboflow import OnnxRoboflowInferenceModel
+from inference.core.models.utils.onnx_session import (
+    SessionProfileBenchmarkResult,
+    get_session_profiles,
+)
+
+
+@dataclass(frozen=True)
+class SessionProfilesTuningReport:
+    models_results: Dict[str, List[SessionProfileBenchmarkResult]]
+
+
+def tune_models_session_profiles(
+    model_ids: List[str],
+    profiles: Optional[List[str]] = None,
+    concurrency: int = 1,
+    warm_up_runs: int = 5,
+    benchmark_runs: int = 50,
+    api_key: Optional[str] = None,
+) -> SessionProfilesTuningReport:
+    session_profiles = get_session_profiles()
+    if profiles:
+        unknown_profiles = set(profiles).difference(p.name for p in session_profiles)
+        if unknown_profiles:
+            raise ValueError(f"Unknown session profiles: {sorted(unknown_profiles)}")
+        session_profiles = [p for p in session_profiles if p.name in profiles]
+    results = {}
+    for model_id in model_ids:
+        model = get_model(model_id=model_id, api_key=api_key)
+        if not isinstance(model, OnnxRoboflowInferenceModel):
+            print(f"Skipping {model_id} - model does not run with onnxruntime")
+            continue
+        print(f"Tuning session profile of {model_id}...")
+        results[model_id] = model.tune_session_profile(
+            concurrency=concurrency,
+            warm_up_runs=warm_up_runs,
+            benchmark_runs=benchmark_runs,
+            profiles=session_profiles,
+        )
+        print(
+            format_session_profiles_results(
+                model_id=model_id, results=results[model_id]
+            )
+        )
+    return SessionProfilesTuningReport(models_results=results)
+
+
+def format_session_profiles_results(
+    model_id: str, results: List[SessionProfileBenchmarkResult]
+) -> str:
+    lines = [f"{model_id} | selected profile: {results[0].profile.name}"]
+    for result in results:
+        lines.append(
+            f"  {result.profile.name:<12} mean latency: "
+            f"{round(result.average_latency * 1000, 2)}ms\t| "
+            f"throughput: {round(result.throughput, 2)}/s"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,519 @@
+import base64
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from tqdm import tqdm
+
+from inference.core.interfaces.http.orjson_utils import orjson_response
+from inference.core.models.base import Model
+from inference.core.models.roboflow import get_color_mapping_from_environment
+from inference.models.utils import get_model
+from inference.models.yolov8.yolov8_object_detection import YOLOv8ObjectDetection
+from inference_cli.lib.benchmark.results_gathering import LatencyHistogram
+
+# functions called by models, hooked in modules of model classes (and their bases)
+MODULE_STAGE_HOOKS = [
+    ("decode", "load_image"),
+    ("nms", "w_np_non_max_suppression"),
+    ("postprocess", "post_process_bboxes"),
+    ("postprocess", "post_process_polygons"),
+    ("postprocess", "post_process_keypoints"),
+]
+MODEL_STAGE_HOOKS = [
+    ("preprocess", "preprocess"),
+    ("predict", "predict"),
+    ("make_response", "make_response"),
+]
+SERIALIZE_STAGE = "serialize"
+TOTAL_STAGE = "total"
+DUMMY_MODEL_ID = "dummy/1"
+DUMMY_MODEL_CONFIDENCE = 0.9
+
+
+@dataclass(frozen=True)
+class StageStatistics:
+    stage: str
+    calls: int
+    mean_time_ms: float
+    p50_time_ms: Optional[float]
+    p99_time_ms: Optional[float]
+    share_of_total: float
+    peak_allocated_mb: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class StagesBenchmarkScenarioResult:
+    scenario: str
+    resolution: Tuple[int, int]
+    detections: Optional[int]
+    batch_size: int
+    inferences: int
+    images_per_second: float
+    stages: List[StageStatistics]
+
+
+@dataclass(frozen=True)
+class StageComparison:
+    scenario: str
+    stage: str
+    baseline_mean_time_ms: float
+    mean_time_ms: float
+    change_percent: float
+
+
+@dataclass(frozen=True)
+class StagesBenchmarkReport:
+    scenarios: List[StagesBenchmarkScenarioResult]
+    baseline_comparison: List[StageComparison] = field(default_factory=list)
+
+
+@dataclass
+class _StageFrame:
+    stage: str
+    start: float
+    children_time: float = 0.0
+    start_memory: int = 0
+    peak_memory: int = 0
+
+
+class StagesRecorder:
+    """
+    Collects self-time of pipeline stages (time spent in the stage, excluding nested
+    stages) - and optionally peak memory allocated by the stage (with `tracemalloc`,
+    which slows execution down, so allocations should be traced in separate run).
+    Nesting is tracked per thread - stages executed in worker threads (like decoding
+    of batch images) are reported separately, while the waiting thread accounts the
+    wait to its own stage.
+    """
+
+    def __init__(self, trace_allocations: bool = False):
+        if trace_allocations and not hasattr(tracemalloc, "reset_peak"):
+            raise RuntimeError("Tracing allocations of stages requires Python 3.9+")
+        self._trace_allocations = trace_allocations
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.durations: Dict[str, LatencyHistogram] = {}
+        self.total_time: Dict[str, float] = {}
+        self.peak_allocations: Dict[str, int] = {}
+
+    def wrap(self, stage: str, function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.measure(stage=stage):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    @contextmanager
+    def measure(self, stage: str) -> Generator[None, None, None]:
+        stack = self._get_stack()
+        frame = _StageFrame(stage=stage, start=0.0)
+        if self._trace_allocations:
+            current_memory, peak_memory = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak_memory = max(stack[-1].peak_memory, peak_memory)
+            tracemalloc.reset_peak()
+            frame.start_memory = frame.peak_memory = current_memory
+        stack.append(frame)
+        frame.start = time.perf_counter()
+        try:
+            yield None
+        finally:
+            duration = time.perf_counter() - frame.start
+            stack.pop()
+            if stack:
+                stack[-1].children_time += duration
+            allocated = None
+            if self._trace_allocations:
+                peak_memory = max(frame.peak_memory, tracemalloc.get_traced_memory()[1])
+                allocated = peak_memory - frame.start_memory
+                if stack:
+                    stack[-1].peak_memory = max(stack[-1].peak_memory, peak_memory)
+            self._register(
+                stage=stage,
+                self_time=duration - frame.children_time,
+                allocated=allocated,
+            )
+
+    def _get_stack(self) -> List[_StageFrame]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _register(self, stage: str, self_time: float, allocated: Optional[int]) -> None:
+        with self._lock:
+            if stage not in self.durations:
+                self.durations[stage] = LatencyHistogram()
+                self.total_time[stage] = 0.0
+            self.durations[stage].record(self_time)
+            self.total_time[stage] += self_time
+            if allocated is not None:
+                self.peak_allocations[stage] = max(
+                    self.peak_allocations.get(stage, 0), allocated
+                )
+
+
+@contextmanager
+def instrument_model_stages(
+    model: Model, recorder: StagesRecorder
+) -> Generator[None, None, None]:
+    """Hooks stages of model pipeline, restoring original functions on exit."""
+    patches = []
+    for model_class in type(model).__mro__:
+        module = sys.modules.get(model_class.__module__)
+        for stage, attribute in MODULE_STAGE_HOOKS:
+            if module is None or not callable(getattr(module, attribute, None)):
+                continue
+            if any(p[0] is module and p[1] == attribute for p in patches):
+                continue
+            original = getattr(module, attribute)
+            setattr(module, attribute, recorder.wrap(stage=stage, function=original))
+            patches.append((module, attribute, original))
+    for stage, attribute in MODEL_STAGE_HOOKS:
+        original = getattr(model, attribute)
+        setattr(model, attribute, recorder.wrap(stage=stage, function=original))
+        patches.append((model, attribute, None))
+    try:
+        yield None
+    finally:
+        for owner, attribute, original in reversed(patches):
+            if original is None:
+                # removing instance attribute uncovers the method of model class
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, original)
+
+
+class DummyOnnxSession:
+    """
+    Stands in for `onnxruntime.InferenceSession` of YOLOv8 object detection model -
+    returning raw predictions with given number of confident detections (before NMS),
+    such that stages around the model can be benchmarked without weights.
+    """
+
+    def __init__(
+        self,
+        input_size: int,
+        num_classes: int,
+        detections: int,
+        candidates: int = 8400,
+    ):
+        self._input_shape = (input_size, input_size)
+        random_generator = np.random.default_rng(seed=42)
+        candidates = max(candidates, detections)
+        centers = random_generator.uniform(0, input_size, size=(2, candidates))
+        sizes = random_generator.uniform(8, input_size / 4, size=(2, candidates))
+        scores = random_generator.uniform(
+            0.0, 0.01, size=(num_classes, candidates)
+        ).astype(np.float32)
+        confident = random_generator.choice(candidates, size=detections, replace=False)
+        scores[
+            random_generator.integers(0, num_classes, size=detections), confident
+        ] = DUMMY_MODEL_CONFIDENCE
+        self._output = np.concatenate([centers, sizes, scores], axis=0).astype(
+            np.float32
+        )[np.newaxis]
+
+    def get_inputs(self) -> List[SimpleNamespace]:
+        return [SimpleNamespace(name="images", shape=["batch", 3, *self._input_shape])]
+
+    def run(self, output_names: Any, input_feed: Dict[str, np.ndarray]) -> list:
+        batch_size = next(iter(input_feed.values())).shape[0]
+        return [np.repeat(self._output, batch_size, axis=0)]
+
+
+class DummyYOLOv8ObjectDetection(YOLOv8ObjectDetection):
+    """
+    YOLOv8 object detection model initialised as any other model, but without model
+    artefacts - class names are synthetic and `DummyOnnxSession` is used in place of
+    ONNX session created from weights.
+    """
+
+    def __init__(self, input_size: int, num_classes: int, detections: int):
+        self._dummy_input_size = input_size
+        self._dummy_num_classes = num_classes
+        self._dummy_detections = detections
+        super().__init__(model_id=DUMMY_MODEL_ID)
+
+    def get_model_artifacts(self) -> None:
+        self.environment = {}
+        self.class_names = [f"class_{i}" for i in range(self._dummy_num_classes)]
+        self.colors = get_color_mapping_from_environment(
+            environment=self.environment, class_names=self.class_names
+        )
+        self.num_classes = len(self.class_names)
+        self.preproc = {}
+        self.resize_method = "Stretch to"
+        self.multiclass = False
+        # dummy session is used regardless of accelerators available on the host
+        self.hailoProvider = None
+
+    def _create_onnx_session(self, *args, **kwargs) -> DummyOnnxSession:
+        return DummyOnnxSession(
+            input_size=self._dummy_input_size,
+            num_classes=self._dummy_num_classes,
+            detections=self._dummy_detections,
+        )
+
+
+def create_dummy_model(
+    input_size: int = 640,
+    num_classes: int = 80,
+    detections: int = 100,
+) -> YOLOv8ObjectDetection:
+    return DummyYOLOv8ObjectDetection(
+        input_size=input_size,
+        num_classes=num_classes,
+        detections=detections,
+    )
+
+
+def coordinate_stages_benchmark(
+    model_id: Optional[str],
+    images: Optional[List[np.ndarray]],
+    resolutions: List[Tuple[int, int]],
+    detections: List[int],
+    batch_size: int = 1,
+    warm_up_inferences: int = 5,
+    benchmark_inferences: int = 100,
+    trace_allocations: bool = False,
+    dummy_input_size: int = 640,
+    dummy_classes: int = 80,
+    api_key: Optional[str] = None,
+    inference_configuration: Optional[Dict[str, Any]] = None,
+) -> StagesBenchmarkReport:
+    """
+    Runs stages benchmark for each input resolution - and, for dummy model (used when
+    `model_id` is not given), for each density of detections returned by the model.
+    Inputs are given images (resized to requested resolutions, if any) or synthetic
+    images of requested resolutions.
+    """
+    if model_id is not None:
+        models = [(get_model(model_id=model_id, api_key=api_key), None)]
+    else:
+        models = [
+            (
+                create_dummy_model(
+                    input_size=dummy_input_size,
+                    num_classes=dummy_classes,
+                    detections=density,
+                ),
+                density,
+            )
+            for density in detections
+        ]
+    inputs = []
+    if images is not None and not resolutions:
+        inputs.append(("original", images))
+    for width, height in resolutions:
+        if images is not None:
+            resized = [cv2.resize(image, (width, height)) for image in images]
+        else:
+            resized = generate_synthetic_images(resolution=(width, height))
+        inputs.append((f"{width}x{height}", resized))
+    scenarios = []
+    for model, density in models:
+        for input_name, input_images in inputs:
+            scenario = input_name if density is None else f"{input_name}/{density}det"
+            result = run_stages_benchmark_scenario(
+                model=model,
+                scenario=scenario,
+                images=input_images,
+                detections=density,
+                batch_size=batch_size,
+                warm_up_inferences=warm_up_inferences,
+                benchmark_inferences=benchmark_inferences,
+                trace_allocations=trace_allocations,
+                inference_configuration=inference_configuration,
+            )
+            print(format_scenario_result(result=result))
+            scenarios.append(result)
+    return StagesBenchmarkReport(scenarios=scenarios)
+
+
+def generate_synthetic_images(
+    resolution: Tuple[int, int], number_of_images: int = 4
+) -> List[np.ndarray]:
+    width, height = resolution
+    random_generator = np.random.default_rng(seed=42)
+    images = []
+    for _ in range(number_of_images):
+        # smooth noise - compressible similarly to natural images
+        small = random_generator.integers(
+            0, 256, size=(max(height // 16, 1), max(width // 16, 1), 3), dtype=np.uint8
+        )
+        images.append(cv2.resize(small, (width, height), interpolation=cv2.INTER_CUBIC))
+    return images
+
+
+def encode_images(images: List[np.ndarray]) -> List[Dict[str, str]]:
+    # images are given to the model in the form in which they arrive to the server,
+    # such that decoding is part of the benchmark
+    payloads = []
+    for image in images:
+        _, encoded = cv2.imencode(".jpg", image)
+        payloads.append(
+            {"type": "base64", "value": base64.b64encode(encoded).decode("ascii")}
+        )
+    return payloads
+
+
+def run_stages_benchmark_scenario(
+    model: Model,
+    scenario: str,
+    images: List[np.ndarray],
+    detections: Optional[int],
+    batch_size: int,
+    warm_up_inferences: int,
+    benchmark_inferences: int,
+    trace_allocations: bool,
+    inference_configuration: Optional[Dict[str, Any]] = None,
+) -> StagesBenchmarkScenarioResult:
+    inference_configuration = inference_configuration or {}
+    payloads = encode_images(images=images)
+    while len(payloads) < batch_size:
+        payloads = payloads + payloads
+    batches = [
+        payloads[i : i + batch_size] if batch_size > 1 else payloads[i]
+        for i in range(len(payloads) - batch_size + 1)
+    ]
+    for i in range(warm_up_inferences):
+        _ = model.infer(batches[i % len(batches)], **inference_configuration)
+    recorder = StagesRecorder()
+    start = time.perf_counter()
+    with instrument_model_stages(model=model, recorder=recorder):
+        for i in tqdm(range(benchmark_inferences), desc=f"Benchmarking {scenario}"):
+            _run_instrumented_inference(
+                model=model,
+                payload=batches[i % len(batches)],
+                recorder=recorder,
+                inference_configuration=inference_configuration,
+            )
+    duration = time.perf_counter() - start
+    allocations_recorder = None
+    if trace_allocations:
+        allocations_recorder = StagesRecorder(trace_allocations=True)
+        tracemalloc.start()
+        try:
+            with instrument_model_stages(model=model, recorder=allocations_recorder):
+                for i in range(min(benchmark_inferences, len(batches))):
+                    _run_instrumented_inference(
+                        model=model,
+                        payload=batches[i],
+                        recorder=allocations_recorder,
+                        inference_configuration=inference_configuration,
+                    )
+        finally:
+            tracemalloc.stop()
+    return StagesBenchmarkScenarioResult(
+        scenario=scenario,
+        resolution=(int(images[0].shape[1]), int(images[0].shape[0])),
+        detections=detections,
+        batch_size=batch_size,
+        inferences=benchmark_inferences,
+        images_per_second=round(benchmark_inferences * batch_size / duration, 2),
+        stages=summarise_stages(
+            recorder=recorder,
+            allocations_recorder=allocations_recorder,
+        ),
+    )
+
+
+def _run_instrumented_inference(
+    model: Model,
+    payload: Any,
+    recorder: StagesRecorder,
+    inference_configuration: Dict[str, Any],
+) -> None:
+    with recorder.measure(stage=TOTAL_STAGE):
+        response = model.infer(payload, **inference_configuration)
+        with recorder.measure(stage=SERIALIZE_STAGE):
+            _ = orjson_response(response)
+
+
+def summarise_stages(
+    recorder: StagesRecorder,
+    allocations_recorder: Optional[StagesRecorder] = None,
+) -> List[StageStatistics]:
+    total_time = sum(recorder.total_time.values())
+    results = []
+    for stage, histogram in recorder.durations.items():
+        peak_allocated_mb = None
+        if allocations_recorder is not None:
+            peak_allocated = allocations_recorder.peak_allocations.get(stage)
+            if peak_allocated is not None:
+                peak_allocated_mb = round(peak_allocated / 2**20, 3)
+        # total stage holds time not attributed to any of the hooked stages
+        results.append(
+            StageStatistics(
+                stage=stage if stage != TOTAL_STAGE else "other",
+                calls=histogram.count,
+                mean_time_ms=round(
+                    recorder.total_time[stage] / histogram.count * 1000, 3
+                ),
+                p50_time_ms=histogram.get_percentiles_ms(percentiles=[50])["p50"],
+                p99_time_ms=histogram.get_percentiles_ms(percentiles=[99])["p99"],
+                share_of_total=(
+                    round(recorder.total_time[stage] / total_time * 100, 2)
+                    if total_time > 0
+                    else 0.0
+                ),
+                peak_allocated_mb=peak_allocated_mb,
+            )
+        )
+    return results
+
+
+def compare_with_baseline(
+    report: StagesBenchmarkReport, baseline: dict
+) -> List[StageComparison]:
+    baseline_times = {}
+    for scenario in baseline.get("scenarios", []):
+        for stage in scenario.get("stages", []):
+            baseline_times[(scenario["scenario"], stage["stage"])] = stage[
+                "mean_time_ms"
+            ]
+    comparisons = []
+    for scenario in report.scenarios:
+        for stage in scenario.stages:
+            baseline_time = baseline_times.get((scenario.scenario, stage.stage))
+            if not baseline_time:
+                continue
+            comparisons.append(
+                StageComparison(
+                    scenario=scenario.scenario,
+                    stage=stage.stage,
+                    baseline_mean_time_ms=baseline_time,
+                    mean_time_ms=stage.mean_time_ms,
+                    change_percent=round(
+                        (stage.mean_time_ms - baseline_time) / baseline_time * 100, 2
+                    ),
+                )
+            )
+    return comparisons
+
+
+def format_scenario_result(result: StagesBenchmarkScenarioResult) -> str:
+    lines = [
+        f"{result.scenario} | batch_size={result.batch_size} | "
+        f"images/s={result.images_per_second}"
+    ]
+    for stage in sorted(result.stages, key=lambda s: -s.share_of_total):
+        line = (
+            f"  {stage.stage:<14} mean: {stage.mean_time_ms}ms\t| "
+            f"p50: {stage.p50_time_ms}ms\t| p99: {stage.p99_time_ms}ms\t| "
+            f"share: {stage.share_of_total}%"
+        )
+        if stage.peak_allocated_mb is not None:
+            line += f"\t| peak alloc: {stage.peak_allocated_mb}MB"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,260 @@
+"""
+Workflow blocks used by Execution Engine benchmark - registered as Workflows plugin
+only for the time of benchmark. Blocks do (almost) no work on their own, such that
+time of workflow run is dominated by Execution Engine operations.
+"""
+
+from typing import Dict, List, Literal, Optional, Type
+
+import numpy as np
+import supervision as sv
+from pydantic import ConfigDict, Field
+
+from inference.core.workflows.core_steps.common.utils import (
+    attach_parents_coordinates_to_sv_detections,
+)
+from inference.core.workflows.execution_engine.constants import (
+    DETECTION_ID_KEY,
+    IMAGE_DIMENSIONS_KEY,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    Batch,
+    OutputDefinition,
+    WorkflowImageData,
+)
+from inference.core.workflows.execution_engine.entities.types import (
+    IMAGE_KIND,
+    OBJECT_DETECTION_PREDICTION_KIND,
+    Selector,
+)
+from inference.core.workflows.prototypes.block import (
+    BlockResult,
+    WorkflowBlock,
+    WorkflowBlockManifest,
+)
+
+STUB_BLOCKS_PLUGIN = "inference_cli.lib.benchmark.workflow_stub_blocks"
+
+BLOCK_SCHEMA_EXTRA = {
+    "short_description": "",
+    "long_description": "",
+    "license": "Apache-2.0",
+    "block_type": "transformation",
+}
+
+
+class BenchmarkDetectorManifest(WorkflowBlockManifest):
+    model_config = ConfigDict(json_schema_extra=BLOCK_SCHEMA_EXTRA)
+    type: Literal["BenchmarkStubDetector"]
+    images: Selector(kind=[IMAGE_KIND]) = Field(
+        description="Reference an image to be used as input for step processing",
+        examples=["$inputs.image"],
+    )
+    detections: int = Field(
+        default=10,
+        description="Number of detections returned for each image",
+    )
+
+    @classmethod
+    def get_parameters_accepting_batches(cls) -> List[str]:
+        return ["images"]
+
+    @classmethod
+    def describe_outputs(cls) -> List[OutputDefinition]:
+        return [
+            OutputDefinition(
+                name="predictions", kind=[OBJECT_DETECTION_PREDICTION_KIND]
+            ),
+        ]
+
+    @classmethod
+    def get_execution_engine_compatibility(cls) -> Optional[str]:
+        return ">=1.3.0,<2.0.0"
+
+
+class BenchmarkDetectorBlock(WorkflowBlock):
+
+    @classmethod
+    def get_manifest(cls) -> Type[WorkflowBlockManifest]:
+        return BenchmarkDetectorManifest
+
+    def run(self, images: Batch[WorkflowImageData], detections: int) -> BlockResult:
+        return [
+            {"predictions": create_stub_detections(image=image, detections=detections)}
+            for image in images
+        ]
+
+
+class BenchmarkTransformationManifest(WorkflowBlockManifest):
+    model_config = ConfigDict(json_schema_extra=BLOCK_SCHEMA_EXTRA)
+    type: Literal["BenchmarkStubTransformation"]
+    predictions: Selector(kind=[OBJECT_DETECTION_PREDICTION_KIND]) = Field(
+        description="Reference to predictions",
+        examples=["$steps.detector.predictions"],
+    )
+
+    @classmethod
+    def describe_outputs(cls) -> List[OutputDefinition]:
+        return [
+            OutputDefinition(
+                name="predictions", kind=[OBJECT_DETECTION_PREDICTION_KIND]
+            ),
+        ]
+
+    @classmethod
+    def get_execution_engine_compatibility(cls) -> Optional[str]:
+        return ">=1.3.0,<2.0.0"
+
+
+class BenchmarkTransformationBlock(WorkflowBlock):
+
+    @classmethod
+    def get_manifest(cls) -> Type[WorkflowBlockManifest]:
+        return BenchmarkTransformationManifest
+
+    def run(self, predictions: sv.Detections) -> BlockResult:
+        return {"predictions": predictions}
+
+
+class BenchmarkCropManifest(WorkflowBlockManifest):
+    model_config = ConfigDict(json_schema_extra=BLOCK_SCHEMA_EXTRA)
+    type: Literal["BenchmarkStubCrop"]
+    images: Selector(kind=[IMAGE_KIND]) = Field(
+        description="Reference an image to be cropped",
+        examples=["$inputs.image"],
+    )
+    predictions: Selector(kind=[OBJECT_DETECTION_PREDICTION_KIND]) = Field(
+        description="Reference to predictions defining crops",
+        examples=["$steps.detector.predictions"],
+    )
+    max_crops: int = Field(
+        default=4,
+        description="Maximum number of crops created for each image",
+    )
+
+    @classmethod
+    def get_parameters_accepting_batches(cls) -> List[str]:
+        return ["images", "predictions"]
+
+    @classmethod
+    def get_output_dimensionality_offset(cls) -> int:
+        return 1
+
+    @classmethod
+    def describe_outputs(cls) -> List[OutputDefinition]:
+        return [OutputDefinition(name="crops", kind=[IMAGE_KIND])]
+
+    @classmethod
+    def get_execution_engine_compatibility(cls) -> Optional[str]:
+        return ">=1.3.0,<2.0.0"
+
+
+class BenchmarkCropBlock(WorkflowBlock):
+
+    @classmethod
+    def get_manifest(cls) -> Type[WorkflowBlockManifest]:
+        return BenchmarkCropManifest
+
+    def run(
+        self,
+        images: Batch[WorkflowImageData],
+        predictions: Batch[sv.Detections],
+        max_crops: int,
+    ) -> BlockResult:
+        results = []
+        for image, detections in zip(images, predictions):
+            crops = []
+            for (x_min, y_min, x_max, y_max), detection_id in zip(
+                detections.xyxy[:max_crops].astype(int),
+                detections[DETECTION_ID_KEY][:max_crops],
+            ):
+                crop = WorkflowImageData.create_crop(
+                    origin_image_data=image,
+                    crop_identifier=detection_id,
+                    cropped_image=image.numpy_image[y_min:y_max, x_min:x_max],
+                    offset_x=x_min,
+                    offset_y=y_min,
+                )
+                crops.append({"crops": crop})
+            results.append(crops)
+        return results
+
+
+class BenchmarkAggregationManifest(WorkflowBlockManifest):
+    model_config = ConfigDict(json_schema_extra=BLOCK_SCHEMA_EXTRA)
+    type: Literal["BenchmarkStubAggregation"]
+    image: Selector(kind=[IMAGE_KIND]) = Field(
+        description="Reference to the image which crops were made from",
+        examples=["$inputs.image"],
+    )
+    predictions: Selector(kind=[OBJECT_DETECTION_PREDICTION_KIND]) = Field(
+        description="Reference to predictions made for crops",
+        examples=["$steps.crops_detector.predictions"],
+    )
+
+    @classmethod
+    def get_input_dimensionality_offsets(cls) -> Dict[str, int]:
+        return {
+            "image": 0,
+            "predictions": 1,
+        }
+
+    @classmethod
+    def get_dimensionality_reference_property(cls) -> Optional[str]:
+        return "image"
+
+    @classmethod
+    def describe_outputs(cls) -> List[OutputDefinition]:
+        return [
+            OutputDefinition(
+                name="predictions", kind=[OBJECT_DETECTION_PREDICTION_KIND]
+            ),
+        ]
+
+    @classmethod
+    def get_execution_engine_compatibility(cls) -> Optional[str]:
+        return ">=1.3.0,<2.0.0"
+
+
+class BenchmarkAggregationBlock(WorkflowBlock):
+
+    @classmethod
+    def get_manifest(cls) -> Type[WorkflowBlockManifest]:
+        return BenchmarkAggregationManifest
+
+    def run(
+        self, image: WorkflowImageData, predictions: Batch[sv.Detections]
+    ) -> BlockResult:
+        return {"predictions": create_stub_detections(image=image, detections=1)}
+
+
+def create_stub_detections(image: WorkflowImageData, detections: int) -> sv.Detections:
+    height, width = image.numpy_image.shape[:2]
+    box_width, box_height = max(width // 4, 1), max(height // 4, 1)
+    x_min = np.arange(detections) % max(width - box_width, 1)
+    y_min = np.arange(detections) % max(height - box_height, 1)
+    xyxy = np.stack(
+        [x_min, y_min, x_min + box_width, y_min + box_height], axis=1
+    ).astype(np.float32)
+    result = sv.Detections(
+        xyxy=xyxy,
+        confidence=np.full(detections, 0.9, dtype=np.float32),
+        class_id=np.zeros(detections, dtype=int),
+        data={
+            "class_name": np.array(["object"] * detections),
+            DETECTION_ID_KEY: np.array(
+                [f"{image.parent_metadata.parent_id}-{i}" for i in range(detections)]
+            ),
+            IMAGE_DIMENSIONS_KEY: np.array([[height, width]] * detections),
+        },
+    )
+    return attach_parents_coordinates_to_sv_detections(detections=result, image=image)
+
+
+def load_blocks() -> List[Type[WorkflowBlock]]:
+    return [
+        BenchmarkDetectorBlock,
+        BenchmarkTransformationBlock,
+        BenchmarkCropBlock,
+        BenchmarkAggregationBlock,
+    ]
@@ -0,0 +1,418 @@
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Generator, List, Tuple
+
+import numpy as np
+from tqdm import tqdm
+
+from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.core.workflows.execution_engine.introspection.blocks_loader import (
+    WORKFLOWS_PLUGINS_ENV,
+)
+from inference.core.workflows.execution_engine.profiling.core import (
+    BaseWorkflowsProfiler,
+)
+from inference.core.workflows.execution_engine.v1.compiler.core import COMPILATION_CACHE
+from inference_cli.lib.benchmark.workflow_stub_blocks import STUB_BLOCKS_PLUGIN
+
+# metrics of Execution Engine compared against baseline
+COMPARED_METRICS = [
+    "compilation",
+    "cached_compilation",
+    "run",
+    "overhead",
+    "workflow_input_assembly",
+    "steps_input_assembly",
+    "steps_output_registration",
+    "outputs_construction",
+]
+
+
+@dataclass(frozen=True)
+class TimingStatistics:
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+
+
+@dataclass(frozen=True)
+class WorkflowsBenchmarkScenarioResult:
+    scenario: str
+    depth: int
+    width: int
+    dimensionality: int
+    steps: int
+    batch_size: int
+    runs: int
+    compilation: TimingStatistics
+    cached_compilation: TimingStatistics
+    run: TimingStatistics
+    blocks: TimingStatistics
+    overhead: TimingStatistics
+    overhead_per_step_ms: float
+    workflow_input_assembly: TimingStatistics
+    steps_input_assembly: TimingStatistics
+    steps_output_registration: TimingStatistics
+    outputs_construction: TimingStatistics
+
+
+@dataclass(frozen=True)
+class WorkflowsMetricComparison:
+    scenario: str
+    stage: str
+    baseline_mean_time_ms: float
+    mean_time_ms: float
+    change_percent: float
+
+
+@dataclass(frozen=True)
+class WorkflowsBenchmarkReport:
+    scenarios: List[WorkflowsBenchmarkScenarioResult]
+    baseline_comparison: List[WorkflowsMetricComparison] = field(default_factory=list)
+
+
+def coordinate_workflows_benchmark(
+    depths: List[int],
+    widths: List[int],
+    dimensionalities: List[int],
+    detections: int = 10,
+    max_crops: int = 4,
+    batch_size: int = 1,
+    image_resolution: Tuple[int, int] = (640, 480),
+    compilations: int = 10,
+    warm_up_runs: int = 5,
+    benchmark_runs: int = 50,
+    max_concurrent_steps: int = 1,
+    serialize_results: bool = False,
+) -> WorkflowsBenchmarkReport:
+    """
+    Runs Execution Engine benchmark for each combination of synthetic workflow
+    depth, width and dimensionality. Steps of synthetic workflows are stub blocks,
+    registered as Workflows plugin for the time of benchmark.
+    """
+    width, height = image_resolution
+    image = np.random.randint(0, 256, (height, width, 3), dtype=np.uint8)
+    scenarios = []
+    with stub_blocks_registered():
+        for dimensionality in dimensionalities:
+            for workflow_width in widths:
+                for depth in depths:
+                    workflow_definition = generate_workflow_definition(
+                        depth=depth,
+                        width=workflow_width,
+                        dimensionality=dimensionality,
+                        detections=detections,
+                        max_crops=max_crops,
+                    )
+                    result = run_workflows_benchmark_scenario(
+                        workflow_definition=workflow_definition,
+                        scenario=f"d{depth}/w{workflow_width}/dim{dimensionality}",
+                        depth=depth,
+                        width=workflow_width,
+                        dimensionality=dimensionality,
+                        runtime_parameters={"image": [image] * batch_size},
+                        compilations=compilations,
+                        warm_up_runs=warm_up_runs,
+                        benchmark_runs=benchmark_runs,
+                        max_concurrent_steps=max_concurrent_steps,
+                        serialize_results=serialize_results,
+                    )
+                    print(format_scenario_result(result=result))
+                    scenarios.append(result)
+    return WorkflowsBenchmarkReport(scenarios=scenarios)
+
+
+@contextmanager
+def stub_blocks_registered() -> Generator[None, None, None]:
+    previous_value = os.environ.get(WORKFLOWS_PLUGINS_ENV)
+    plugins = [STUB_BLOCKS_PLUGIN]
+    if previous_value:
+        plugins.append(previous_value)
+    os.environ[WORKFLOWS_PLUGINS_ENV] = ",".join(plugins)
+    try:
+        yield None
+    finally:
+        if previous_value is None:
+            del os.environ[WORKFLOWS_PLUGINS_ENV]
+        else:
+            os.environ[WORKFLOWS_PLUGINS_ENV] = previous_value
+
+
+def generate_workflow_definition(
+    depth: int,
+    width: int,
+    dimensionality: int,
+    detections: int = 10,
+    max_crops: int = 4,
+) -> dict:
+    """
+    Generates workflow made of `width` independent lanes. In each lane, image is
+    cropped `dimensionality - 1` times (each crop adds dimensionality level), then
+    predictions made at the deepest level are passed through chain of `depth`
+    transformations and aggregated back to the dimensionality of input image.
+    """
+    if depth < 1 or width < 1 or dimensionality < 1:
+        raise ValueError("Depth, width and dimensionality of workflow must be positive")
+    steps, outputs = [], []
+    for lane in range(width):
+        images_selectors = ["$inputs.image"]
+        for level in range(dimensionality - 1):
+            detector_name = f"lane_{lane}_detector_{level}"
+            crop_name = f"lane_{lane}_crop_{level}"
+            steps.append(
+                {
+                    "type": "BenchmarkStubDetector",
+                    "name": detector_name,
+                    "images": images_selectors[-1],
+                    "detections": detections,
+                }
+            )
+            steps.append(
+                {
+                    "type": "BenchmarkStubCrop",
+                    "name": crop_name,
+                    "images": images_selectors[-1],
+                    "predictions": f"$steps.{detector_name}.predictions",
+                    "max_crops": max_crops,
+                }
+            )
+            images_selectors.append(f"$steps.{crop_name}.crops")
+        detector_name = f"lane_{lane}_detector_{dimensionality - 1}"
+        steps.append(
+            {
+                "type": "BenchmarkStubDetector",
+                "name": detector_name,
+                "images": images_selectors[-1],
+                "detections": detections,
+            }
+        )
+        predictions_selector = f"$steps.{detector_name}.predictions"
+        for i in range(depth):
+            transformation_name = f"lane_{lane}_transformation_{i}"
+            steps.append(
+                {
+                    "type": "BenchmarkStubTransformation",
+                    "name": transformation_name,
+                    "predictions": predictions_selector,
+                }
+            )
+            predictions_selector = f"$steps.{transformation_name}.predictions"
+        for level in reversed(range(dimensionality - 1)):
+            aggregation_name = f"lane_{lane}_aggregation_{level}"
+            steps.append(
+                {
+                    "type": "BenchmarkStubAggregation",
+                    "name": aggregation_name,
+                    "image": images_selectors[level],
+                    "predictions": predictions_selector,
+                }
+            )
+            predictions_selector = f"$steps.{aggregation_name}.predictions"
+        outputs.append(
+            {
+                "type": "JsonField",
+                "name": f"lane_{lane}",
+                "selector": predictions_selector,
+            }
+        )
+    return {
+        "version": "1.0",
+        "inputs": [{"type": "WorkflowImage", "name": "image"}],
+        "steps": steps,
+        "outputs": outputs,
+    }
+
+
+def run_workflows_benchmark_scenario(
+    workflow_definition: dict,
+    scenario: str,
+    depth: int,
+    width: int,
+    dimensionality: int,
+    runtime_parameters: dict,
+    compilations: int = 10,
+    warm_up_runs: int = 5,
+    benchmark_runs: int = 50,
+    max_concurrent_steps: int = 1,
+    serialize_results: bool = False,
+) -> WorkflowsBenchmarkScenarioResult:
+    compilation_times, cached_compilation_times = [], []
+    for _ in tqdm(range(compilations), desc=f"Compiling {scenario}..."):
+        COMPILATION_CACHE.clear()
+        start = time.perf_counter()
+        _ = ExecutionEngine.init(
+            workflow_definition=workflow_definition,
+            max_concurrent_steps=max_concurrent_steps,
+        )
+        compilation_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        _ = ExecutionEngine.init(
+            workflow_definition=workflow_definition,
+            max_concurrent_steps=max_concurrent_steps,
+        )
+        cached_compilation_times.append(time.perf_counter() - start)
+    # workflow is run twice - without profiler, to measure time of run as it is in
+    # production, and with profiler - to split the time into execution phases
+    engine = ExecutionEngine.init(
+        workflow_definition=workflow_definition,
+        max_concurrent_steps=max_concurrent_steps,
+    )
+    profiler = BaseWorkflowsProfiler.init(max_runs_in_buffer=1)
+    profiled_engine = ExecutionEngine.init(
+        workflow_definition=workflow_definition,
+        max_concurrent_steps=max_concurrent_steps,
+        profiler=profiler,
+    )
+    for _ in range(warm_up_runs):
+        engine.run(
+            runtime_parameters=runtime_parameters, serialize_results=serialize_results
+        )
+        profiled_engine.run(
+            runtime_parameters=runtime_parameters, serialize_results=serialize_results
+        )
+    run_times = []
+    phases_times = defaultdict(list)
+    for _ in tqdm(range(benchmark_runs), desc=f"Running {scenario}..."):
+        start = time.perf_counter()
+        engine.run(
+            runtime_parameters=runtime_parameters, serialize_results=serialize_results
+        )
+        run_times.append(time.perf_counter() - start)
+        profiled_engine.run(
+            runtime_parameters=runtime_parameters, serialize_results=serialize_results
+        )
+        for phase, duration in summarise_run_trace(
+            trace=profiler.export_trace()
+        ).items():
+            phases_times[phase].append(duration)
+    steps = len(workflow_definition["steps"])
+    overhead = calculate_timing_statistics(phases_times["overhead"])
+    return WorkflowsBenchmarkScenarioResult(
+        scenario=scenario,
+        depth=depth,
+        width=width,
+        dimensionality=dimensionality,
+        steps=steps,
+        batch_size=len(runtime_parameters["image"]),
+        runs=benchmark_runs,
+        compilation=calculate_timing_statistics(compilation_times),
+        cached_compilation=calculate_timing_statistics(cached_compilation_times),
+        run=calculate_timing_statistics(run_times),
+        blocks=calculate_timing_statistics(phases_times["blocks"]),
+        overhead=overhead,
+        overhead_per_step_ms=round(overhead.mean_ms / steps, 4),
+        workflow_input_assembly=calculate_timing_statistics(
+            phases_times["workflow_input_assembly"]
+        ),
+        steps_input_assembly=calculate_timing_statistics(
+            phases_times["steps_input_assembly"]
+        ),
+        steps_output_registration=calculate_timing_statistics(
+            phases_times["steps_output_registration"]
+        ),
+        outputs_construction=calculate_timing_statistics(
+            phases_times["outputs_construction"]
+        ),
+    )
+
+
+def summarise_run_trace(trace: List[dict]) -> Dict[str, float]:
+    """
+    Splits time of single workflow run (as recorded by `BaseWorkflowsProfiler`) into
+    time of blocks code and time of Execution Engine operations (in seconds). For steps
+    run in non-batch mode, inputs are assembled while iterating over steps inputs -
+    so that time is counted into `steps_input_assembly`.
+    """
+    durations = defaultdict(float)
+    steps_code_durations = defaultdict(float)
+    iterative_steps_durations = defaultdict(float)
+    run_start, run_end = None, None
+    for event in trace:
+        if event["name"] == "workflow_run":
+            if event["ph"] == "B":
+                run_start = event["ts"]
+            elif event["ph"] == "E":
+                run_end = event["ts"]
+            continue
+        if event["ph"] != "X":
+            continue
+        duration = event["dur"] / 10**6
+        step = event.get("args", {}).get("step")
+        if event["name"] == "step_code_execution":
+            steps_code_durations[step] += duration
+        elif event["name"] == "iterative_step_code_execution":
+            iterative_steps_durations[step] += duration
+        elif event["name"] == "step_input_assembly":
+            durations["steps_input_assembly"] += duration
+        elif event["name"] in {
+            "workflow_input_assembly",
+            "step_output_registration",
+            "outputs_construction",
+        }:
+            name = event["name"].replace("step_", "steps_")
+            durations[name] += duration
+    for step, duration in iterative_steps_durations.items():
+        durations["steps_input_assembly"] += duration - steps_code_durations[step]
+    blocks_duration = sum(steps_code_durations.values())
+    durations["blocks"] = blocks_duration
+    if run_start is not None and run_end is not None:
+        durations["overhead"] = (run_end - run_start) / 10**6 - blocks_duration
+    return durations
+
+
+def calculate_timing_statistics(durations: List[float]) -> TimingStatistics:
+    if not durations:
+        return TimingStatistics(mean_ms=0.0, p50_ms=0.0, p99_ms=0.0)
+    durations_ms = np.array(durations) * 1000
+    return TimingStatistics(
+        mean_ms=round(float(np.mean(durations_ms)), 4),
+        p50_ms=round(float(np.percentile(durations_ms, 50)), 4),
+        p99_ms=round(float(np.percentile(durations_ms, 99)), 4),
+    )
+
+
+def compare_with_baseline(
+    report: WorkflowsBenchmarkReport, baseline: dict
+) -> List[WorkflowsMetricComparison]:
+    baseline_scenarios = {
+        scenario["scenario"]: scenario for scenario in baseline.get("scenarios", [])
+    }
+    comparisons = []
+    for scenario in report.scenarios:
+        baseline_scenario = baseline_scenarios.get(scenario.scenario)
+        if baseline_scenario is None:
+            continue
+        for metric in COMPARED_METRICS:
+            baseline_time = baseline_scenario.get(metric, {}).get("mean_ms")
+            if not baseline_time:
+                continue
+            mean_time = getattr(scenario, metric).mean_ms
+            comparisons.append(
+                WorkflowsMetricComparison(
+                    scenario=scenario.scenario,
+                    stage=metric,
+                    baseline_mean_time_ms=baseline_time,
+                    mean_time_ms=mean_time,
+                    change_percent=round(
+                        (mean_time - baseline_time) / baseline_time * 100, 2
+                    ),
+                )
+            )
+    return comparisons
+
+
+def format_scenario_result(result: WorkflowsBenchmarkScenarioResult) -> str:
+    lines = [
+        f"{result.scenario} | steps={result.steps} | batch_size={result.batch_size} | "
+        f"overhead/step: {result.overhead_per_step_ms}ms"
+    ]
+    for metric in ["blocks"] + COMPARED_METRICS:
+        statistics = getattr(result, metric)
+        lines.append(
+            f"  {metric:<26} mean: {statistics.mean_ms}ms\t| "
+            f"p50: {statistics.p50_ms}ms\t| p99: {statistics.p99_ms}ms"
+        )
+    return "\n".join(lines)
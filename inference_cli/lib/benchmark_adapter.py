@@ -1,8 +1,10 @@
 import os.path
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from datetime import datetime
 from threading import Thread
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from supervision.utils.file import read_yaml_file
 
 from inference_cli.lib.benchmark.api_speed import (
     coordinate_infer_api_speed_benchmark,
@@ -10,15 +12,23 @@ from inference_cli.lib.benchmark.api_speed import (
     display_benchmark_statistics,
 )
 from inference_cli.lib.benchmark.dataset import load_dataset_images
+from inference_cli.lib.benchmark.load_test import (
+    ArrivalProcess,
+    LoadTestReport,
+    coordinate_api_load_test,
+    parse_model_mix,
+)
 from inference_cli.lib.benchmark.platform import retrieve_platform_specifics
 from inference_cli.lib.benchmark.results_gathering import (
     InferenceStatistics,
     ResultsCollector,
 )
+from inference_cli.lib.env import ROBOFLOW_API_KEY
 from inference_cli.lib.utils import (
     dump_json,
     ensure_inference_is_installed,
     initialise_client,
+    read_json,
 )
 
 
@@ -161,6 +171,78 @@ def run_workflow_api_speed_benchmark(
     )
 
 
+def run_api_load_test_benchmark(
+    model_ids: List[str],
+    dataset_reference: str,
+    host: str,
+    requests_per_second: List[float],
+    batch_sizes: List[int],
+    arrival_process: str = "poisson",
+    stage_duration: float = 30.0,
+    max_in_flight_requests: int = 256,
+    warm_up_requests: int = 10,
+    request_timeout: float = 60.0,
+    api_key: Optional[str] = None,
+    model_configuration: Optional[str] = None,
+    output_location: Optional[str] = None,
+    max_error_rate: Optional[float] = None,
+) -> None:
+    dataset_images = load_dataset_images(
+        dataset_reference=dataset_reference,
+    )
+    client = initialise_client(
+        host=host,
+        api_key=api_key,
+        model_configuration=model_configuration,
+        disable_active_learning=True,
+        max_concurrent_requests=1,
+    )
+    model_targets = parse_model_mix(model_ids=model_ids)
+    report = coordinate_api_load_test(
+        client=client,
+        api_url=host,
+        api_key=api_key or ROBOFLOW_API_KEY,
+        images=dataset_images,
+        model_targets=model_targets,
+        requests_per_second=requests_per_second,
+        batch_sizes=batch_sizes,
+        arrival_process=ArrivalProcess(arrival_process),
+        stage_duration=stage_duration,
+        max_in_flight_requests=max_in_flight_requests,
+        warm_up_requests=warm_up_requests,
+        request_timeout=request_timeout,
+    )
+    print(
+        f"Max sustained RPS by batch size: {report.max_sustained_requests_per_second}"
+    )
+    if output_location is not None:
+        benchmark_parameters = {
+            "datetime": datetime.now().isoformat(),
+            "model_ids": [asdict(target) for target in model_targets],
+            "dataset_reference": dataset_reference,
+            "host": host,
+            "requests_per_second": requests_per_second,
+            "batch_sizes": batch_sizes,
+            "arrival_process": arrival_process,
+            "stage_duration": stage_duration,
+            "max_in_flight_requests": max_in_flight_requests,
+            "model_configuration": model_configuration,
+        }
+        dump_benchmark_results(
+            output_location=output_location,
+            benchmark_parameters=benchmark_parameters,
+            benchmark_results=report,
+        )
+    for stage in report.stages:
+        if stage.saturated:
+            # error rate of stages above saturation point is expected to be high
+            continue
+        ensure_error_rate_is_below_threshold(
+            error_rate=stage.error_rate,
+            threshold=max_error_rate,
+        )
+
+
 def run_python_package_speed_benchmark(
     model_id: str,
     dataset_reference: str,
@@ -217,10 +299,215 @@ def run_python_package_speed_benchmark(
     )
 
 
+def run_stages_benchmark(
+    model_id: Optional[str],
+    dataset_reference: Optional[str],
+    resolutions: List[Tuple[int, int]],
+    detections: List[int],
+    batch_size: int = 1,
+    warm_up_inferences: int = 5,
+    benchmark_inferences: int = 100,
+    trace_allocations: bool = False,
+    dummy_input_size: int = 640,
+    dummy_classes: int = 80,
+    api_key: Optional[str] = None,
+    model_configuration: Optional[str] = None,
+    baseline_location: Optional[str] = None,
+    max_regression: Optional[float] = None,
+    output_location: Optional[str] = None,
+) -> None:
+    ensure_inference_is_installed()
+
+    # importing here not to affect other entrypoints by missing `inference` core library
+    from inference_cli.lib.benchmark.stages import (
+        compare_with_baseline,
+        coordinate_stages_benchmark,
+    )
+
+    dataset_images = None
+    if dataset_reference is not None:
+        dataset_images = load_dataset_images(dataset_reference=dataset_reference)
+    inference_configuration = {}
+    if model_configuration is not None:
+        inference_configuration = read_yaml_file(file_path=model_configuration)
+    report = coordinate_stages_benchmark(
+        model_id=model_id,
+        images=dataset_images,
+        resolutions=resolutions,
+        detections=detections,
+        batch_size=batch_size,
+        warm_up_inferences=warm_up_inferences,
+        benchmark_inferences=benchmark_inferences,
+        trace_allocations=trace_allocations,
+        dummy_input_size=dummy_input_size,
+        dummy_classes=dummy_classes,
+        api_key=api_key,
+        inference_configuration=inference_configuration,
+    )
+    if baseline_location is not None:
+        baseline = read_json(path=baseline_location)
+        report = replace(
+            report,
+            baseline_comparison=compare_with_baseline(
+                report=report,
+                baseline=baseline.get("benchmark_results", baseline),
+            ),
+        )
+        print_baseline_comparison(comparisons=report.baseline_comparison)
+    if output_location is not None:
+        benchmark_parameters = {
+            "datetime": datetime.now().isoformat(),
+            "model_id": model_id or "dummy",
+            "dataset_reference": dataset_reference,
+            "resolutions": resolutions,
+            "detections": detections if model_id is None else None,
+            "batch_size": batch_size,
+            "benchmark_inferences": benchmark_inferences,
+            "model_configuration": model_configuration,
+        }
+        dump_benchmark_results(
+            output_location=output_location,
+            benchmark_parameters=benchmark_parameters,
+            benchmark_results=report,
+        )
+    ensure_no_stage_regressed(report=report, threshold=max_regression)
+
+
+def run_workflows_execution_benchmark(
+    depths: List[int],
+    widths: List[int],
+    dimensionalities: List[int],
+    detections: int = 10,
+    max_crops: int = 4,
+    batch_size: int = 1,
+    compilations: int = 10,
+    warm_up_runs: int = 5,
+    benchmark_runs: int = 50,
+    max_concurrent_steps: int = 1,
+    serialize_results: bool = False,
+    baseline_location: Optional[str] = None,
+    max_regression: Optional[float] = None,
+    output_location: Optional[str] = None,
+) -> None:
+    ensure_inference_is_installed()
+
+    # importing here not to affect other entrypoints by missing `inference` core library
+    from inference_cli.lib.benchmark.workflows import (
+        compare_with_baseline,
+        coordinate_workflows_benchmark,
+    )
+
+    report = coordinate_workflows_benchmark(
+        depths=depths,
+        widths=widths,
+        dimensionalities=dimensionalities,
+        detections=detections,
+        max_crops=max_crops,
+        batch_size=batch_size,
+        compilations=compilations,
+        warm_up_runs=warm_up_runs,
+        benchmark_runs=benchmark_runs,
+        max_concurrent_steps=max_concurrent_steps,
+        serialize_results=serialize_results,
+    )
+    if baseline_location is not None:
+        baseline = read_json(path=baseline_location)
+        report = replace(
+            report,
+            baseline_comparison=compare_with_baseline(
+                report=report,
+                baseline=baseline.get("benchmark_results", baseline),
+            ),
+        )
+        print_baseline_comparison(comparisons=report.baseline_comparison)
+    if output_location is not None:
+        benchmark_parameters = {
+            "datetime": datetime.now().isoformat(),
+            "depths": depths,
+            "widths": widths,
+            "dimensionalities": dimensionalities,
+            "detections": detections,
+            "max_crops": max_crops,
+            "batch_size": batch_size,
+            "benchmark_runs": benchmark_runs,
+            "max_concurrent_steps": max_concurrent_steps,
+            "serialize_results": serialize_results,
+        }
+        dump_benchmark_results(
+            output_location=output_location,
+            benchmark_parameters=benchmark_parameters,
+            benchmark_results=report,
+        )
+    ensure_no_stage_regressed(report=report, threshold=max_regression)
+
+
+def run_session_profiles_tuning(
+    model_ids: List[str],
+    profiles: Optional[List[str]] = None,
+    concurrency: int = 1,
+    warm_up_runs: int = 5,
+    benchmark_runs: int = 50,
+    api_key: Optional[str] = None,
+    output_location: Optional[str] = None,
+) -> None:
+    ensure_inference_is_installed()
+
+    # importing here not to affect other entrypoints by missing `inference` core library
+    from inference_cli.lib.benchmark.session_profiles import (
+        tune_models_session_profiles,
+    )
+
+    report = tune_models_session_profiles(
+        model_ids=model_ids,
+        profiles=profiles,
+        concurrency=concurrency,
+        warm_up_runs=warm_up_runs,
+        benchmark_runs=benchmark_runs,
+        api_key=api_key or ROBOFLOW_API_KEY,
+    )
+    if output_location is None:
+        return None
+    benchmark_parameters = {
+        "datetime": datetime.now().isoformat(),
+        "model_ids": model_ids,
+        "profiles": profiles,
+        "concurrency": concurrency,
+        "benchmark_runs": benchmark_runs,
+    }
+    dump_benchmark_results(
+        output_location=output_location,
+        benchmark_parameters=benchmark_parameters,
+        benchmark_results=report,
+    )
+
+
+def print_baseline_comparison(comparisons: List[Any]) -> None:
+    for comparison in comparisons:
+        print(
+            f"{comparison.scenario} | {comparison.stage}: {comparison.baseline_mean_time_ms}ms -> "
+            f"{comparison.mean_time_ms}ms ({comparison.change_percent:+}%)"
+        )
+
+
+def ensure_no_stage_regressed(report: Any, threshold: Optional[float]) -> None:
+    if threshold is None:
+        return None
+    regressions = [
+        f"{c.scenario} | {c.stage} ({c.change_percent:+}%)"
+        for c in report.baseline_comparison
+        if c.change_percent > threshold
+    ]
+    if not regressions:
+        return None
+    raise RuntimeError(
+        f"Stages slowed down above threshold ({threshold}%): {', '.join(regressions)}"
+    )
+
+
 def dump_benchmark_results(
     output_location: str,
     benchmark_parameters: dict,
-    benchmark_results: InferenceStatistics,
+    benchmark_results: Union[InferenceStatistics, LoadTestReport],
 ) -> None:
     platform_specifics = retrieve_platform_specifics()
     if os.path.isdir(output_location):
@@ -1,10 +1,23 @@
 import json
 import os.path
 import re
+from collections import deque
+from concurrent.futures import Executor, Future
 from datetime import datetime
 from functools import lru_cache
 from threading import Lock
-from typing import Any, Dict, List, Optional, Set, TextIO, Tuple
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
 
 import cv2
 import numpy as np
@@ -68,6 +81,35 @@ def denote_image_processed(
         return None
 
 
+def prefetch_images_batches(
+    image_paths: Iterable[str],
+    batch_size: int,
+    reader_pool: Executor,
+    prefetch_batches: int = 2,
+) -> Generator[List[Tuple[str, Future]], None, None]:
+    """
+    Yields batches of (image path, future of decoded image) - images are read and decoded
+    in `reader_pool`, with up to `prefetch_batches` batches being loaded ahead of the
+    batch handed to the consumer. Future resolves to `None` if image cannot be decoded.
+    `image_paths` is consumed lazily, so it may be a stream of paths.
+    """
+    batch_size = max(batch_size, 1)
+    pending_batches: Deque[List[Tuple[str, Future]]] = deque()
+    current_batch = []
+    for image_path in image_paths:
+        current_batch.append((image_path, reader_pool.submit(cv2.imread, image_path)))
+        if len(current_batch) < batch_size:
+            continue
+        pending_batches.append(current_batch)
+        current_batch = []
+        if len(pending_batches) > prefetch_batches:
+            yield pending_batches.popleft()
+    if current_batch:
+        pending_batches.append(current_batch)
+    while pending_batches:
+        yield pending_batches.popleft()
+
+
 def get_progress_log_path(output_directory: str) -> str:
     return os.path.abspath(os.path.join(output_directory, "progress.log"))
 
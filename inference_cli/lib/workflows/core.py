@@ -45,6 +45,44 @@ def run_video_processing_with_workflows(
     )
 
 
+def run_videos_processing_with_workflows(
+    input_videos: str,
+    output_directory: str,
+    output_file_type: OutputFileType,
+    workflow_specification: Optional[dict] = None,
+    workspace_name: Optional[str] = None,
+    workflow_id: Optional[str] = None,
+    workflow_parameters: Optional[Dict[str, Any]] = None,
+    image_input_name: str = "image",
+    max_fps: Optional[float] = None,
+    save_image_outputs_as_video: bool = True,
+    api_key: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> None:
+    # enabling new behaviour ensuring frame rate will be subsample (needed until
+    # this becomes default) - inherited by worker processes
+    os.environ["ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING"] = "True"
+
+    ensure_inference_is_installed()
+
+    from inference_cli.lib.workflows.video_adapter import process_videos_with_workflow
+
+    process_videos_with_workflow(
+        input_videos=input_videos,
+        output_directory=output_directory,
+        output_file_type=output_file_type,
+        workflow_specification=workflow_specification,
+        workspace_name=workspace_name,
+        workflow_id=workflow_id,
+        workflow_parameters=workflow_parameters,
+        image_input_name=image_input_name,
+        max_fps=max_fps,
+        save_image_outputs_as_video=save_image_outputs_as_video,
+        api_key=api_key,
+        workers=workers,
+    )
+
+
 def process_image_with_workflow(
     image_path: str,
     output_directory: str,
@@ -113,6 +151,8 @@ def process_images_directory_with_workflow(
     debug_mode: bool = False,
     api_url: str = "https://detect.roboflow.com",
     processing_threads: Optional[int] = None,
+    batch_size: int = 8,
+    workers: int = 1,
 ) -> None:
     if processing_target is ProcessingTarget.INFERENCE_PACKAGE:
 
@@ -136,6 +176,8 @@ def process_images_directory_with_workflow(
             aggregate_structured_results=aggregate_structured_results,
             aggregation_format=aggregation_format,
             debug_mode=debug_mode,
+            batch_size=batch_size,
+            workers=workers,
         )
         return None
     process_image_directory_with_workflow_using_api(
@@ -1,10 +1,24 @@
+import multiprocessing
 import os
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from threading import Lock
-from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+from queue import Empty
+from threading import BoundedSemaphore, Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 import cv2
+import numpy as np
 from rich.progress import Progress, TaskID
 
 from inference.core.cache import cache
@@ -16,6 +30,9 @@ from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCac
 from inference.core.registries.roboflow import RoboflowModelRegistry
 from inference.core.roboflow_api import get_workflow_specification
 from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.core.workflows.execution_engine.introspection.blocks_loader import (
+    describe_available_blocks,
+)
 from inference.core.workflows.execution_engine.profiling.core import (
     NullWorkflowsProfiler,
 )
@@ -27,10 +44,17 @@ from inference_cli.lib.workflows.common import (
     dump_image_processing_results,
     get_all_images_in_directory,
     open_progress_log,
+    prefetch_images_batches,
     report_failed_files,
 )
 from inference_cli.lib.workflows.entities import OutputFileType
 
+DEFAULT_BATCH_SIZE = 8
+READER_THREADS = 4
+WRITER_THREADS = 4
+PENDING_WRITES_PER_IMAGE = 2
+WORKERS_POLLING_INTERVAL = 1.0
+
 
 def process_image_with_workflow_using_inference_package(
     image_path: str,
@@ -94,6 +118,8 @@ def process_image_directory_with_workflow_using_inference_package(
     aggregate_structured_results: bool = True,
     aggregation_format: OutputFileType = OutputFileType.JSONL,
     debug_mode: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = 1,
 ) -> None:
     if api_key is None:
         api_key = API_KEY
@@ -117,6 +143,8 @@ def process_image_directory_with_workflow_using_inference_package(
             api_key=api_key,
             save_image_outputs=save_image_outputs,
             log_file=log_file,
+            batch_size=batch_size,
+            workers=workers,
             debug_mode=debug_mode,
         )
     finally:
@@ -141,6 +169,8 @@ def _process_images_within_directory(
     api_key: Optional[str],
     save_image_outputs: bool,
     log_file: TextIO,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int = 1,
     debug_mode: bool = False,
 ) -> List[Tuple[str, str]]:
     workflow_specification = _get_workflow_specification(
@@ -149,7 +179,6 @@ def _process_images_within_directory(
         workflow_id=workflow_id,
         api_key=api_key,
     )
-    model_manager = _prepare_model_manager()
     progress_bar = Progress()
     processing_task = progress_bar.add_task(
         description="Processing images...",
@@ -157,7 +186,11 @@ def _process_images_within_directory(
     )
     failed_files = []
     on_success = partial(
-        _on_success, progress_bar=progress_bar, task_id=processing_task
+        _on_success,
+        log_file=log_file,
+        log_file_lock=Lock(),
+        progress_bar=progress_bar,
+        task_id=processing_task,
     )
     on_failure = partial(
         _on_failure,
@@ -166,8 +199,7 @@ def _process_images_within_directory(
         task_id=processing_task,
     )
     processing_fun = partial(
-        _process_single_image_from_directory,
-        model_manager=model_manager,
+        _process_images_batches,
         workflow_specification=workflow_specification,
         workflow_id=workflow_id,
         image_input_name=image_input_name,
@@ -175,22 +207,37 @@ def _process_images_within_directory(
         api_key=api_key,
         output_directory=output_directory,
         save_image_outputs=save_image_outputs,
-        log_file=log_file,
-        on_success=on_success,
-        on_failure=on_failure,
+        batch_size=batch_size,
         debug_mode=debug_mode,
     )
+    workers = max(min(workers, len(files_to_process)), 1)
     with progress_bar:
-        for image_path in files_to_process:
-            processing_fun(image_path)
+        if workers == 1:
+            processing_fun(
+                image_paths=files_to_process,
+                on_success=on_success,
+                on_failure=on_failure,
+            )
+        else:
+            _process_images_in_worker_processes(
+                files_to_process=files_to_process,
+                processing_fun=processing_fun,
+                workers=workers,
+                batch_size=batch_size,
+                on_success=on_success,
+                on_failure=on_failure,
+            )
     return failed_files
 
 
 def _on_success(
     path: str,
+    log_file: TextIO,
+    log_file_lock: Lock,
     progress_bar: Progress,
     task_id: TaskID,
 ) -> None:
+    denote_image_processed(log_file=log_file, image_path=path, lock=log_file_lock)
     progress_bar.update(task_id, advance=1)
 
 
@@ -205,47 +252,249 @@ def _on_failure(
     progress_bar.update(task_id, advance=1)
 
 
-def _process_single_image_from_directory(
-    image_path: str,
-    model_manager: ModelManagerDecorator,
-    workflow_specification: Optional[Dict[str, Any]],
+def _process_images_in_worker_processes(
+    files_to_process: List[str],
+    processing_fun: Callable[..., None],
+    workers: int,
+    batch_size: int,
+    on_success: Callable[[str], None],
+    on_failure: Callable[[str, str], None],
+) -> None:
+    # each worker loads its own models - files are handed to workers in chunks of
+    # `batch_size`, while progress log and failures are maintained by this process
+    context = multiprocessing.get_context("spawn")
+    tasks_queue = context.Queue()
+    events_queue = context.Queue()
+    for chunk_start in range(0, len(files_to_process), batch_size):
+        tasks_queue.put(files_to_process[chunk_start : chunk_start + batch_size])
+    for _ in range(workers):
+        tasks_queue.put(None)
+    processes = [
+        context.Process(
+            target=_run_directory_processing_worker,
+            kwargs={
+                "tasks_queue": tasks_queue,
+                "events_queue": events_queue,
+                "processing_fun": processing_fun,
+            },
+            daemon=True,
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    reported_files = 0
+    try:
+        while reported_files < len(files_to_process):
+            try:
+                image_path, error_summary = events_queue.get(
+                    timeout=WORKERS_POLLING_INTERVAL
+                )
+            except Empty:
+                if not any(process.is_alive() for process in processes):
+                    CLI_LOGGER.error(
+                        "All worker processes exited prematurely - not processed "
+                        "files will be picked up when the command is re-run."
+                    )
+                    return None
+                continue
+            reported_files += 1
+            if error_summary is None:
+                on_success(image_path)
+            else:
+                on_failure(image_path, error_summary)
+    finally:
+        for process in processes:
+            process.join(timeout=WORKERS_POLLING_INTERVAL)
+            if process.is_alive():
+                process.terminate()
+
+
+def _run_directory_processing_worker(
+    tasks_queue: multiprocessing.Queue,
+    events_queue: multiprocessing.Queue,
+    processing_fun: Callable[..., None],
+) -> None:
+    processing_fun(
+        image_paths=_iterate_worker_tasks(tasks_queue=tasks_queue),
+        on_success=lambda image_path: events_queue.put((image_path, None)),
+        on_failure=lambda image_path, cause: events_queue.put((image_path, cause)),
+    )
+
+
+def _iterate_worker_tasks(
+    tasks_queue: multiprocessing.Queue,
+) -> Generator[str, None, None]:
+    for image_paths in iter(tasks_queue.get, None):
+        yield from image_paths
+
+
+def _process_images_batches(
+    image_paths: Iterable[str],
+    on_success: Callable[[str], None],
+    on_failure: Callable[[str, str], None],
+    workflow_specification: Dict[str, Any],
     workflow_id: Optional[str],
     image_input_name: str,
     workflow_parameters: Optional[Dict[str, Any]],
     api_key: Optional[str],
     output_directory: str,
     save_image_outputs: bool,
-    log_file: TextIO,
-    on_success: Callable[[str], None],
-    on_failure: Callable[[str, str], None],
-    log_file_lock: Optional[Lock] = None,
+    batch_size: int,
     debug_mode: bool = False,
 ) -> None:
-    try:
-        result = _run_workflow_for_single_image_with_inference(
-            model_manager=model_manager,
-            image_path=image_path,
-            workflow_specification=workflow_specification,
+    model_manager = _prepare_model_manager()
+    pending_writes = BoundedSemaphore(max(batch_size, 1) * PENDING_WRITES_PER_IMAGE)
+    with ThreadPoolExecutor() as thread_pool_executor, ThreadPoolExecutor(
+        max_workers=READER_THREADS
+    ) as reader_pool, ThreadPoolExecutor(max_workers=WRITER_THREADS) as writer_pool:
+        execution_engine = ExecutionEngine.init(
+            workflow_definition=workflow_specification,
+            init_parameters={
+                "workflows_core.model_manager": model_manager,
+                "workflows_core.api_key": api_key,
+                "workflows_core.thread_pool_executor": thread_pool_executor,
+            },
             workflow_id=workflow_id,
+            profiler=NullWorkflowsProfiler.init(),
+        )
+        retry_images_separately = not _workflow_may_have_side_effects(
+            workflow_specification=workflow_specification
+        )
+        for batch in prefetch_images_batches(
+            image_paths=image_paths,
+            batch_size=batch_size,
+            reader_pool=reader_pool,
+        ):
+            loaded_paths, loaded_images = [], []
+            for image_path, image_future in batch:
+                image = image_future.result()
+                if image is None:
+                    _report_failure(
+                        image_path=image_path,
+                        error=ValueError("Could not decode image"),
+                        on_failure=on_failure,
+                        debug_mode=debug_mode,
+                    )
+                    continue
+                loaded_paths.append(image_path)
+                loaded_images.append(image)
+            if not loaded_images:
+                continue
+            results = _run_workflow_for_images_batch(
+                execution_engine=execution_engine,
+                images=loaded_images,
+                image_input_name=image_input_name,
+                workflow_parameters=workflow_parameters,
+                retry_images_separately=retry_images_separately,
+            )
+            for image_path, result in zip(loaded_paths, results):
+                if isinstance(result, Exception):
+                    _report_failure(
+                        image_path=image_path,
+                        error=result,
+                        on_failure=on_failure,
+                        debug_mode=debug_mode,
+                    )
+                    continue
+                pending_writes.acquire()
+                write_future = writer_pool.submit(
+                    _dump_results_of_image,
+                    image_path=image_path,
+                    result=result,
+                    output_directory=output_directory,
+                    save_image_outputs=save_image_outputs,
+                    on_success=on_success,
+                    on_failure=on_failure,
+                    debug_mode=debug_mode,
+                )
+                write_future.add_done_callback(lambda _: pending_writes.release())
+
+
+def _run_workflow_for_images_batch(
+    execution_engine: ExecutionEngine,
+    images: List[np.ndarray],
+    image_input_name: str,
+    workflow_parameters: Optional[Dict[str, Any]],
+    retry_images_separately: bool = True,
+) -> List[Union[Dict[str, Any], Exception]]:
+    runtime_parameters = dict(workflow_parameters or {})
+    runtime_parameters[image_input_name] = images
+    try:
+        return execution_engine.run(
+            runtime_parameters=runtime_parameters,
+            serialize_results=True,
+        )
+    except Exception as error:
+        if len(images) == 1 or not retry_images_separately:
+            return [error] * len(images)
+    # failure of the whole batch is attributed to specific images by re-running
+    # them one by one - which also re-runs the steps that succeeded for the batch,
+    # so it is only done for workflows without side effects
+    return [
+        _run_workflow_for_images_batch(
+            execution_engine=execution_engine,
+            images=[image],
             image_input_name=image_input_name,
             workflow_parameters=workflow_parameters,
-            api_key=api_key,
-        )
+        )[0]
+        for image in images
+    ]
+
+
+def _workflow_may_have_side_effects(workflow_specification: Dict[str, Any]) -> bool:
+    # sinks (like webhooks or dataset uploads) and Active Learning act on each image
+    # they see - steps of unknown type (like dynamic blocks) are assumed to do so as well
+    blocks_without_side_effects = set()
+    for block in describe_available_blocks(dynamic_blocks=[]).blocks:
+        if block.block_schema.get("block_type") == "sink":
+            continue
+        blocks_without_side_effects.add(block.manifest_type_identifier)
+        blocks_without_side_effects.update(block.manifest_type_identifier_aliases)
+    return any(
+        step.get("type") not in blocks_without_side_effects
+        or step.get("disable_active_learning", True) is not True
+        for step in workflow_specification.get("steps", [])
+    )
+
+
+def _dump_results_of_image(
+    image_path: str,
+    result: Dict[str, Any],
+    output_directory: str,
+    save_image_outputs: bool,
+    on_success: Callable[[str], None],
+    on_failure: Callable[[str, str], None],
+    debug_mode: bool = False,
+) -> None:
+    try:
         dump_image_processing_results(
             result=result,
             image_path=image_path,
             output_directory=output_directory,
             save_image_outputs=save_image_outputs,
         )
-        denote_image_processed(
-            log_file=log_file, image_path=image_path, lock=log_file_lock
-        )
-        on_success(image_path)
     except Exception as error:
-        error_summary = f"Error in processing {image_path}. Error type: {error.__class__.__name__} - {error}"
-        if debug_mode:
-            CLI_LOGGER.exception(error_summary)
-        on_failure(image_path, error_summary)
+        _report_failure(
+            image_path=image_path,
+            error=error,
+            on_failure=on_failure,
+            debug_mode=debug_mode,
+        )
+        return None
+    on_success(image_path)
+
+
+def _report_failure(
+    image_path: str,
+    error: Exception,
+    on_failure: Callable[[str, str], None],
+    debug_mode: bool = False,
+) -> None:
+    error_summary = f"Error in processing {image_path}. Error type: {error.__class__.__name__} - {error}"
+    if debug_mode:
+        CLI_LOGGER.error(error_summary, exc_info=error)
+    on_failure(image_path, error_summary)
 
 
 def _get_workflow_specification(
@@ -1,11 +1,17 @@
+import asyncio
+import json
 import logging
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from multiprocessing.pool import ThreadPool
 from threading import Lock
 from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
 
+import aiohttp
 import backoff
+import numpy as np
 from rich.progress import Progress, TaskID
 
 from inference_cli.lib.logger import CLI_LOGGER
@@ -23,7 +29,14 @@ from inference_sdk import (
     InferenceHTTPClient,
     VisualisationResponseFormat,
 )
+from inference_sdk.http.client import DEFAULT_HEADERS
 from inference_sdk.http.errors import HTTPCallErrorError
+from inference_sdk.http.utils.executors import RETRYABLE_STATUS_CODES
+from inference_sdk.http.utils.loaders import load_nested_batches_of_inference_input
+from inference_sdk.http.utils.post_processing import decode_workflow_outputs
+from inference_sdk.http.utils.requests import (
+    inject_nested_batches_of_images_into_payload,
+)
 
 HOSTED_API_URLS = {
     "https://detect.roboflow.com",
@@ -33,6 +46,18 @@ HOSTED_API_URLS = {
     "https://lambda-instance-segmentation.staging.roboflow.com",
     "https://lambda-classification.staging.roboflow.com",
 }
+MAX_REQUEST_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+# fraction of the retry delay added at random, such that throttled clients do not
+# retry in lockstep - the delay never gets shorter than requested by `Retry-After`
+RETRY_JITTER = 0.5
+REQUEST_TIMEOUT = 300.0
+KEEP_ALIVE_TIMEOUT = 60.0
+WRITER_TASKS = 4
+WORKER_THREADS = 8
+MAX_ERROR_DETAILS_LENGTH = 512
+STATISTICS_REFRESH_INTERVAL = 0.5
 
 
 def process_image_with_workflow_using_api(
@@ -103,7 +128,7 @@ def process_image_directory_with_workflow_using_api(
         if _is_roboflow_hosted_api(api_url=api_url):
             processing_threads = 32
         else:
-            processing_threads = 1
+            processing_threads = 8
     files_to_process = get_all_images_in_directory(input_directory=input_directory)
     log_file, log_content = open_progress_log(output_directory=output_directory)
     try:
@@ -159,105 +184,413 @@ def _process_images_within_directory_with_api(
         description="Processing images...",
         total=len(files_to_process),
     )
+    statistics = RemoteProcessingStatistics()
     failed_files = []
     on_success = partial(
-        _on_success, progress_bar=progress_bar, task_id=processing_task
+        _on_success,
+        log_file=log_file,
+        log_file_lock=Lock(),
+        statistics=statistics,
+        progress_bar=progress_bar,
+        task_id=processing_task,
     )
     on_failure = partial(
         _on_failure,
         failed_files=failed_files,
+        statistics=statistics,
         progress_bar=progress_bar,
         task_id=processing_task,
     )
-    log_file_lock = Lock()
-    processing_fun = partial(
-        _process_single_image_from_directory,
+    request_factory = partial(
+        _prepare_workflow_request,
         workflow_specification=workflow_specification,
         workspace_name=workspace_name,
         workflow_id=workflow_id,
         image_input_name=image_input_name,
         workflow_parameters=workflow_parameters,
-        api_url=api_url,
         api_key=api_key,
+        api_url=api_url,
+    )
+    results_dumper = partial(
+        _dump_results_of_image,
         output_directory=output_directory,
         save_image_outputs=save_image_outputs,
-        log_file=log_file,
         on_success=on_success,
         on_failure=on_failure,
-        log_file_lock=log_file_lock,
         debug_mode=debug_mode,
     )
     with progress_bar:
-        with ThreadPool(processes=processing_threads) as pool:
-            _ = pool.map(
-                processing_fun,
-                files_to_process,
+        asyncio.run(
+            _process_images_asynchronously(
+                files_to_process=files_to_process,
+                request_factory=request_factory,
+                results_dumper=results_dumper,
+                on_failure=on_failure,
+                max_concurrency=processing_threads,
+                statistics=statistics,
+                debug_mode=debug_mode,
             )
+        )
+    print(statistics.summarise())
     return failed_files
 
 
 def _on_success(
     path: str,
+    log_file: TextIO,
+    log_file_lock: Lock,
+    statistics: "RemoteProcessingStatistics",
     progress_bar: Progress,
     task_id: TaskID,
 ) -> None:
-    progress_bar.update(task_id, advance=1)
+    denote_image_processed(log_file=log_file, image_path=path, lock=log_file_lock)
+    progress_bar.update(task_id, advance=1, description=statistics.summarise())
 
 
 def _on_failure(
     path: str,
     cause: str,
     failed_files: List[Tuple[str, str]],
+    statistics: "RemoteProcessingStatistics",
     progress_bar: Progress,
     task_id: TaskID,
 ) -> None:
     failed_files.append((path, cause))
-    progress_bar.update(task_id, advance=1)
+    progress_bar.update(task_id, advance=1, description=statistics.summarise())
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of requests in flight, adjusting the limit in AIMD manner:
+    the limit grows by one after the number of successful requests equal to the
+    current limit and is halved when the server signals overload (429 / 503 or
+    connection errors) - at most once per window of `limit` finished requests, as
+    requests in flight are likely to hit the same overload. Thanks to that, the client
+    sends as much as server can handle.
+    Not thread-safe - to be used within single event loop.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        initial_concurrency: Optional[int] = None,
+        min_concurrency: int = 1,
+    ):
+        self._max_concurrency = max(max_concurrency, 1)
+        self._min_concurrency = max(min(min_concurrency, self._max_concurrency), 1)
+        if initial_concurrency is None:
+            initial_concurrency = self._max_concurrency
+        self._limit = max(
+            min(initial_concurrency, self._max_concurrency), self._min_concurrency
+        )
+        self._in_flight = 0
+        self._successes_since_adjustment = 0
+        self._finished_since_decrease = self._limit
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        self._finished_since_decrease += 1
+        self._successes_since_adjustment += 1
+        if self._successes_since_adjustment < self._limit:
+            return None
+        self._limit = min(self._limit + 1, self._max_concurrency)
+        self._successes_since_adjustment = 0
+
+    def on_overload(self) -> None:
+        self._finished_since_decrease += 1
+        self._successes_since_adjustment = 0
+        if self._finished_since_decrease < self._limit:
+            return None
+        self._limit = max(self._limit // 2, self._min_concurrency)
+        self._finished_since_decrease = 0
+
 
+class RemoteProcessingStatistics:
 
-def _process_single_image_from_directory(
+    def __init__(self):
+        self._start = time.monotonic()
+        self._latencies: List[float] = []
+        self._completed = 0
+        self._retries = 0
+        self._concurrency = 0
+        self._cached_summary: Optional[str] = None
+        self._cached_summary_time = 0.0
+        self._lock = Lock()
+
+    def on_request_finished(self, latency: float, concurrency: int) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+            self._concurrency = concurrency
+
+    def on_retry(self) -> None:
+        with self._lock:
+            self._retries += 1
+
+    def on_image_completed(self) -> None:
+        with self._lock:
+            self._completed += 1
+
+    def summarise(self) -> str:
+        # percentiles calculation is O(n log n), hence summary is refreshed periodically
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._cached_summary is not None
+                and now - self._cached_summary_time < STATISTICS_REFRESH_INTERVAL
+            ):
+                return self._cached_summary
+            throughput = self._completed / max(now - self._start, 1e-6)
+            summary = f"{throughput:.1f} img/s"
+            if self._latencies:
+                p50, p95, p99 = np.percentile(
+                    np.array(self._latencies) * 1000, [50, 95, 99]
+                )
+                summary = (
+                    f"{summary} | latency p50: {p50:.0f}ms p95: {p95:.0f}ms "
+                    f"p99: {p99:.0f}ms | concurrency: {self._concurrency}"
+                )
+            if self._retries:
+                summary = f"{summary} | retries: {self._retries}"
+            self._cached_summary = summary
+            self._cached_summary_time = now
+            return summary
+
+
+async def _process_images_asynchronously(
+    files_to_process: List[str],
+    request_factory: Callable[[str], Tuple[str, bytes]],
+    results_dumper: Callable[[str, bytes], None],
+    on_failure: Callable[[str, str], None],
+    max_concurrency: int,
+    statistics: RemoteProcessingStatistics,
+    debug_mode: bool = False,
+) -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=max_concurrency)
+    results_queue = asyncio.Queue(maxsize=max(max_concurrency, 1) * 2)
+    connector = aiohttp.TCPConnector(
+        limit=max(max_concurrency, 1), keepalive_timeout=KEEP_ALIVE_TIMEOUT
+    )
+    with ThreadPoolExecutor(max_workers=WORKER_THREADS) as executor:
+        writers = [
+            asyncio.create_task(
+                _write_results(
+                    results_queue=results_queue,
+                    results_dumper=results_dumper,
+                    executor=executor,
+                    statistics=statistics,
+                )
+            )
+            for _ in range(WRITER_TASKS)
+        ]
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+        ) as session:
+            requests = []
+            for image_path in files_to_process:
+                await limiter.acquire()
+                requests.append(
+                    asyncio.create_task(
+                        _process_single_image_from_directory(
+                            image_path=image_path,
+                            session=session,
+                            limiter=limiter,
+                            request_factory=request_factory,
+                            executor=executor,
+                            results_queue=results_queue,
+                            on_failure=on_failure,
+                            statistics=statistics,
+                            debug_mode=debug_mode,
+                        )
+                    )
+                )
+            await asyncio.gather(*requests)
+        for _ in writers:
+            await results_queue.put(None)
+        await asyncio.gather(*writers)
+
+
+async def _process_single_image_from_directory(
     image_path: str,
-    workflow_specification: Dict[str, Any],
+    session: aiohttp.ClientSession,
+    limiter: AdaptiveConcurrencyLimiter,
+    request_factory: Callable[[str], Tuple[str, bytes]],
+    executor: ThreadPoolExecutor,
+    results_queue: asyncio.Queue,
+    on_failure: Callable[[str, str], None],
+    statistics: RemoteProcessingStatistics,
+    debug_mode: bool = False,
+) -> None:
+    # slot of the limiter is acquired by the caller, to bound number of created tasks
+    try:
+        url, payload = await asyncio.get_running_loop().run_in_executor(
+            executor, request_factory, image_path
+        )
+        response_content = await _send_workflow_request(
+            session=session,
+            url=url,
+            payload=payload,
+            limiter=limiter,
+            statistics=statistics,
+        )
+    except Exception as error:
+        error_summary = f"Error in processing {image_path}. Error type: {error.__class__.__name__} - {error}"
+        if debug_mode:
+            CLI_LOGGER.error(error_summary, exc_info=error)
+        on_failure(image_path, error_summary)
+        return None
+    finally:
+        await limiter.release()
+    await results_queue.put((image_path, response_content))
+
+
+async def _send_workflow_request(
+    session: aiohttp.ClientSession,
+    url: str,
+    payload: bytes,
+    limiter: AdaptiveConcurrencyLimiter,
+    statistics: RemoteProcessingStatistics,
+) -> bytes:
+    for attempt in range(MAX_REQUEST_ATTEMPTS):
+        last_attempt = attempt == MAX_REQUEST_ATTEMPTS - 1
+        retry_after = None
+        start = time.monotonic()
+        try:
+            async with session.post(
+                url, data=payload, headers=DEFAULT_HEADERS
+            ) as response:
+                content = await response.read()
+                if response.status not in RETRYABLE_STATUS_CODES:
+                    if response.status >= 400:
+                        raise RuntimeError(
+                            f"Request failed with status {response.status}: "
+                            f"{content[:MAX_ERROR_DETAILS_LENGTH].decode(errors='replace')}"
+                        )
+                    statistics.on_request_finished(
+                        latency=time.monotonic() - start, concurrency=limiter.limit
+                    )
+                    limiter.on_success()
+                    return content
+                if last_attempt:
+                    raise RuntimeError(
+                        f"Server is overloaded - status {response.status} after "
+                        f"{MAX_REQUEST_ATTEMPTS} attempts"
+                    )
+                retry_after = _parse_retry_after(
+                    value=response.headers.get("Retry-After")
+                )
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last_attempt:
+                raise
+        limiter.on_overload()
+        statistics.on_retry()
+        await asyncio.sleep(_get_retry_delay(attempt=attempt, retry_after=retry_after))
+    raise RuntimeError("Could not send the request")
+
+
+def _get_retry_delay(attempt: int, retry_after: Optional[float]) -> float:
+    if retry_after is None:
+        retry_after = min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY)
+    return retry_after + random.uniform(0, RETRY_JITTER * retry_after)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+async def _write_results(
+    results_queue: asyncio.Queue,
+    results_dumper: Callable[[str, bytes], None],
+    executor: ThreadPoolExecutor,
+    statistics: RemoteProcessingStatistics,
+) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await results_queue.get()
+        if item is None:
+            return None
+        image_path, response_content = item
+        await loop.run_in_executor(
+            executor, results_dumper, image_path, response_content
+        )
+        statistics.on_image_completed()
+
+
+def _prepare_workflow_request(
+    image_path: str,
+    workflow_specification: Optional[Dict[str, Any]],
     workspace_name: Optional[str],
     workflow_id: Optional[str],
     image_input_name: str,
     workflow_parameters: Optional[Dict[str, Any]],
-    api_url: str,
     api_key: Optional[str],
+    api_url: str,
+) -> Tuple[str, bytes]:
+    inputs = {}
+    inject_nested_batches_of_images_into_payload(
+        payload=inputs,
+        encoded_images=load_nested_batches_of_inference_input(
+            inference_input=[image_path]
+        ),
+        key=image_input_name,
+    )
+    inputs.update(workflow_parameters or {})
+    payload = {"api_key": api_key, "use_cache": True, "inputs": inputs}
+    if workflow_specification is not None:
+        payload["specification"] = workflow_specification
+        url = f"{api_url}/workflows/run"
+    else:
+        url = f"{api_url}/{workspace_name}/workflows/{workflow_id}"
+    return url, json.dumps(payload).encode("utf-8")
+
+
+def _dump_results_of_image(
+    image_path: str,
+    response_content: bytes,
     output_directory: str,
     save_image_outputs: bool,
-    log_file: TextIO,
     on_success: Callable[[str], None],
     on_failure: Callable[[str, str], None],
-    log_file_lock: Optional[Lock] = None,
     debug_mode: bool = False,
 ) -> None:
     try:
-        result = _run_workflow_for_single_image_through_api(
-            image_path=image_path,
-            workflow_specification=workflow_specification,
-            workspace_name=workspace_name,
-            workflow_id=workflow_id,
-            image_input_name=image_input_name,
-            workflow_parameters=workflow_parameters,
-            api_key=api_key,
-            api_url=api_url,
-        )
+        workflow_outputs = json.loads(response_content)["outputs"]
+        result = decode_workflow_outputs(
+            workflow_outputs=workflow_outputs,
+            expected_format=VisualisationResponseFormat.NUMPY,
+        )[0]
         dump_image_processing_results(
             result=result,
             image_path=image_path,
             output_directory=output_directory,
             save_image_outputs=save_image_outputs,
         )
-        denote_image_processed(
-            log_file=log_file, image_path=image_path, lock=log_file_lock
-        )
-        on_success(image_path)
     except Exception as error:
         error_summary = f"Error in processing {image_path}. Error type: {error.__class__.__name__} - {error}"
         if debug_mode:
-            CLI_LOGGER.exception(error_summary)
+            CLI_LOGGER.error(error_summary, exc_info=error)
         on_failure(image_path, error_summary)
+        return None
+    on_success(image_path)
 
 
 @backoff.on_exception(
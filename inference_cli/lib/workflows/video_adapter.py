@@ -12,11 +12,18 @@ from rich.progress import Progress, TaskID
 
 from inference import InferencePipeline
 from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream.offline_processing import (
+    OfflineProcessingProgress,
+    process_video_files,
+    resolve_video_files,
+)
 from inference.core.interfaces.stream.sinks import multi_sink
+from inference.core.managers.decorators.base import ModelManagerDecorator
 from inference.core.utils.image_utils import load_image_bgr
 from inference_cli.lib.utils import dump_jsonl
 from inference_cli.lib.workflows.common import deduct_images, dump_objects_to_json
 from inference_cli.lib.workflows.entities import OutputFileType
+from inference_cli.lib.workflows.local_image_adapter import _prepare_model_manager
 
 
 def process_video_with_workflow(
@@ -66,6 +73,86 @@ def process_video_with_workflow(
         video_sink.release()
 
 
+def process_videos_with_workflow(
+    input_videos: str,
+    output_directory: str,
+    output_file_type: OutputFileType,
+    workflow_specification: Optional[dict] = None,
+    workspace_name: Optional[str] = None,
+    workflow_id: Optional[str] = None,
+    workflow_parameters: Optional[Dict[str, Any]] = None,
+    image_input_name: str = "image",
+    max_fps: Optional[float] = None,
+    save_image_outputs_as_video: bool = True,
+    api_key: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> None:
+    video_paths = resolve_video_files(video_files=input_videos)
+    pipeline_factory = WorkflowsPipelineFactory(
+        workflow_specification=workflow_specification,
+        workspace_name=workspace_name,
+        workflow_id=workflow_id,
+        api_key=api_key,
+        workflows_parameters=workflow_parameters,
+        serialize_results=True,
+        image_input_name=image_input_name,
+        max_fps=max_fps,
+    )
+    sink_factory = partial(
+        WorkflowsVideoFileResultsSink.init,
+        output_directory=output_directory,
+        output_file_type=output_file_type,
+        save_image_outputs_as_video=save_image_outputs_as_video,
+        input_root=os.path.commonpath(
+            [os.path.dirname(os.path.abspath(path)) for path in video_paths]
+        ),
+    )
+    progress_sink = MultipleVideosProgressSink()
+    progress_sink.start()
+    try:
+        report = process_video_files(
+            video_files=video_paths,
+            pipeline_factory=pipeline_factory,
+            sink_factory=sink_factory,
+            workers=workers,
+            on_progress=progress_sink.on_progress,
+        )
+    finally:
+        progress_sink.stop()
+    print(
+        f"Processed {report.frames_processed} frames of {len(report.results)} videos "
+        f"in {report.duration:.1f}s ({report.throughput:.1f} FPS)"
+    )
+    if report.failed:
+        failed_videos = ", ".join(result.video_path for result in report.failed)
+        raise RuntimeError(
+            f"Processing of the following videos failed: {failed_videos}"
+        )
+
+
+class WorkflowsPipelineFactory:
+    """
+    Creates `InferencePipeline` running Workflow for each processed video file. Model
+    manager is created lazily, on first call - such that each worker process of offline
+    processing loads models once and reuses them for all files it processes.
+    """
+
+    def __init__(self, **init_with_workflow_kwargs: Any):
+        self._init_with_workflow_kwargs = init_with_workflow_kwargs
+        self._model_manager: Optional[ModelManagerDecorator] = None
+
+    def __call__(self, **kwargs: Any) -> InferencePipeline:
+        if self._model_manager is None:
+            self._model_manager = _prepare_model_manager()
+        return InferencePipeline.init_with_workflow(
+            **self._init_with_workflow_kwargs,
+            **kwargs,
+            workflow_init_parameters={
+                "workflows_core.model_manager": self._model_manager,
+            },
+        )
+
+
 class WorkflowsStructuredDataSink:
 
     def __init__(
@@ -192,6 +279,90 @@ class WorkflowsVideoSink:
         self.release()
 
 
+class WorkflowsVideoFileResultsSink:
+
+    @classmethod
+    def init(
+        cls,
+        input_video_path: str,
+        output_directory: str,
+        output_file_type: OutputFileType,
+        save_image_outputs_as_video: bool = True,
+        input_root: Optional[str] = None,
+    ) -> "WorkflowsVideoFileResultsSink":
+        video_output_directory = _generate_output_directory_for_video(
+            output_directory=output_directory,
+            input_video_path=input_video_path,
+            input_root=input_root,
+        )
+        structured_sink = WorkflowsStructuredDataSink(
+            output_directory=video_output_directory,
+            output_file_type=output_file_type,
+        )
+        video_sink = None
+        if save_image_outputs_as_video:
+            video_sink = WorkflowsVideoSink.init(
+                input_video_path=input_video_path,
+                output_directory=video_output_directory,
+            )
+        return cls(structured_sink=structured_sink, video_sink=video_sink)
+
+    def __init__(
+        self,
+        structured_sink: WorkflowsStructuredDataSink,
+        video_sink: Optional[WorkflowsVideoSink],
+    ):
+        self._structured_sink = structured_sink
+        self._video_sink = video_sink
+
+    def on_prediction(
+        self,
+        predictions: Union[Optional[dict], List[Optional[dict]]],
+        video_frames: Union[Optional[VideoFrame], List[Optional[VideoFrame]]],
+    ) -> None:
+        self._structured_sink.on_prediction(
+            predictions=predictions, video_frames=video_frames
+        )
+        if self._video_sink is not None:
+            self._video_sink.on_prediction(
+                predictions=predictions, video_frames=video_frames
+            )
+
+    def release(self) -> None:
+        self._structured_sink.flush()
+        if self._video_sink is not None:
+            self._video_sink.release()
+
+
+class MultipleVideosProgressSink:
+
+    def __init__(self):
+        self._progress_bar = Progress()
+        self._task: Optional[TaskID] = None
+
+    def start(self) -> None:
+        self._progress_bar.start()
+
+    def on_progress(self, progress: OfflineProcessingProgress) -> None:
+        description = (
+            f"Processed {progress.files_completed}/{progress.files_total} videos "
+            f"({progress.throughput:.1f} FPS)"
+        )
+        if self._task is None:
+            self._task = self._progress_bar.add_task(
+                description=description,
+                total=progress.total_frames,
+            )
+        self._progress_bar.update(
+            self._task,
+            completed=progress.frames_processed,
+            description=description,
+        )
+
+    def stop(self) -> None:
+        self._progress_bar.stop()
+
+
 class ProgressSink:
 
     @classmethod
@@ -265,6 +436,23 @@ class VideoSink:
         self.__writer.release()
 
 
+def _generate_output_directory_for_video(
+    output_directory: str,
+    input_video_path: str,
+    input_root: Optional[str],
+) -> str:
+    # directory structure of inputs is mirrored and extension is kept in the name,
+    # such that videos of the same stem do not override each other results
+    input_video_path = os.path.abspath(input_video_path)
+    if input_root is None:
+        input_root = os.path.dirname(input_video_path)
+    relative_path = os.path.relpath(input_video_path, os.path.abspath(input_root))
+    stem, extension = os.path.splitext(relative_path)
+    if extension:
+        stem = f"{stem}_{extension[1:]}"
+    return os.path.join(output_directory, stem)
+
+
 def _generate_target_path_for_video(
     output_directory: str, source_id: int, field_name: str
 ) -> str:
@@ -8,6 +8,7 @@ from inference_cli.lib.workflows.core import (
     process_image_with_workflow,
     process_images_directory_with_workflow,
     run_video_processing_with_workflows,
+    run_videos_processing_with_workflows,
 )
 from inference_cli.lib.workflows.entities import OutputFileType, ProcessingTarget
 
@@ -159,6 +160,162 @@ def process_video(
         raise typer.Exit(code=1)
 
 
+@workflows_app.command(
+    context_settings={"allow_extra_args": True, "ignore_unknown_options": True},
+    help="Process multiple video files with your Workflow locally, in parallel worker processes "
+    "(inference Python package required)",
+)
+def process_videos(
+    context: typer.Context,
+    input_videos: Annotated[
+        str,
+        typer.Option(
+            "--input",
+            "-i",
+            help="Path to directory with videos, video file or glob pattern (quoted) matching videos to be processed",
+        ),
+    ],
+    output_directory: Annotated[
+        str,
+        typer.Option(
+            "--output_dir",
+            "-o",
+            help="Path to output directory",
+        ),
+    ],
+    output_file_type: Annotated[
+        OutputFileType,
+        typer.Option(
+            "--output_file_type",
+            "-ft",
+            help="Type of the output file",
+            case_sensitive=False,
+        ),
+    ] = OutputFileType.CSV,
+    workflow_specification_path: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow_spec",
+            "-ws",
+            help="Path to JSON file with Workflow definition "
+            "(mutually exclusive with `workspace_name` and `workflow_id`)",
+        ),
+    ] = None,
+    workspace_name: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workspace_name",
+            "-wn",
+            help="Name of Roboflow workspace the that Workflow belongs to "
+            "(mutually exclusive with `workflow_specification_path`)",
+        ),
+    ] = None,
+    workflow_id: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow_id",
+            "-wid",
+            help="Identifier of a Workflow on Roboflow platform "
+            "(mutually exclusive with `workflow_specification_path`)",
+        ),
+    ] = None,
+    workflow_parameters_path: Annotated[
+        Optional[str],
+        typer.Option(
+            "--workflow_params",
+            help="Path to JSON document with Workflow parameters - helpful when Workflow is parametrized and "
+            "passing the parameters in CLI is not handy / impossible due to typing conversion issues.",
+        ),
+    ] = None,
+    image_input_name: Annotated[
+        str,
+        typer.Option(
+            "--image_input_name",
+            help="Name of the Workflow input that defines placeholder for image to be processed",
+        ),
+    ] = "image",
+    max_fps: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_fps",
+            help="Use the parameter to limit video FPS (additional frames will be skipped in processing).",
+        ),
+    ] = None,
+    image_outputs_as_video: Annotated[
+        bool,
+        typer.Option(
+            "--save_out_video/--no_save_out_video",
+            help="Flag deciding if image outputs of the workflow should be saved as video file",
+        ),
+    ] = True,
+    api_key: Annotated[
+        Optional[str],
+        typer.Option(
+            "--api-key",
+            "-a",
+            help="Roboflow API key for your workspace. If not given - env variable `ROBOFLOW_API_KEY` will be used",
+        ),
+    ] = None,
+    workers: Annotated[
+        Optional[int],
+        typer.Option(
+            "--workers",
+            help="Number of worker processes processing videos in parallel (one video at a time each, "
+            "each loading its own models). Defaults to 2 (limited by the number of CPUs).",
+        ),
+    ] = None,
+    allow_override: Annotated[
+        bool,
+        typer.Option(
+            "--allow_override/--no_override",
+            help="Flag to decide if content of output directory can be overridden.",
+        ),
+    ] = False,
+    debug_mode: Annotated[
+        bool,
+        typer.Option(
+            "--debug_mode/--no_debug_mode",
+            help="Flag enabling errors stack traces to be displayed (helpful for debugging)",
+        ),
+    ] = False,
+):
+    try:
+        ensure_target_directory_is_empty(
+            output_directory=output_directory,
+            allow_override=allow_override,
+            only_files=False,
+        )
+        workflow_parameters = prepare_workflow_parameters(
+            context=context,
+            workflows_parameters_path=workflow_parameters_path,
+        )
+        workflow_specification = None
+        if workflow_specification_path is not None:
+            workflow_specification = read_json(path=workflow_specification_path)
+        run_videos_processing_with_workflows(
+            input_videos=input_videos,
+            output_directory=output_directory,
+            output_file_type=output_file_type,
+            workflow_specification=workflow_specification,
+            workspace_name=workspace_name,
+            workflow_id=workflow_id,
+            workflow_parameters=workflow_parameters,
+            image_input_name=image_input_name,
+            max_fps=max_fps,
+            save_image_outputs_as_video=image_outputs_as_video,
+            api_key=api_key,
+            workers=workers,
+        )
+    except KeyboardInterrupt:
+        print("Command interrupted - results may not be fully consistent.")
+        return
+    except Exception as error:
+        if debug_mode:
+            raise error
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
+
+
 @workflows_app.command(
     context_settings={"allow_extra_args": True, "ignore_unknown_options": True},
     help="Process single image with Workflows (inference Package may be needed dependent on mode)",
@@ -445,10 +602,30 @@ def process_images_directory(
         Optional[int],
         typer.Option(
             "--threads",
-            help="Defines number of threads that will be used to send requests when processing target is API. "
-            "Default for Roboflow Hosted API is 32, and for on-prem deployments: 1.",
+            help="Defines maximum number of concurrent requests sent when processing target is API - the "
+            "actual concurrency is reduced when server signals overload. "
+            "Default for Roboflow Hosted API is 32, and for on-prem deployments: 8.",
         ),
     ] = None,
+    batch_size: Annotated[
+        int,
+        typer.Option(
+            "--batch_size",
+            "-bs",
+            help="Number of images processed by the Workflow at once when processing target is "
+            "inference_package - model steps receive batches of that size. When the whole batch "
+            "fails, its images are re-processed one by one to find the failing ones - unless the "
+            "Workflow has side effects (sinks, Active Learning), then all images of the batch fail.",
+        ),
+    ] = 8,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            help="Number of worker processes (each loading its own models) sharing the images "
+            "when processing target is inference_package.",
+        ),
+    ] = 1,
     debug_mode: Annotated[
         bool,
         typer.Option(
@@ -486,6 +663,8 @@ def process_images_directory(
             aggregate_structured_results=aggregate_structured_results,
             aggregation_format=aggregation_format,
             processing_threads=processing_threads,
+            batch_size=batch_size,
+            workers=workers,
             debug_mode=debug_mode,
         )
     except KeyboardInterrupt:
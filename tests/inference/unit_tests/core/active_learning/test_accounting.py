@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 from inference.core.active_learning import accounting
 from inference.core.active_learning.accounting import (
+    BatchCapacityCache,
     get_images_in_labeling_jobs_of_specific_batch,
     get_matching_labeling_batch,
     image_can_be_submitted_to_batch,
@@ -218,3 +219,127 @@ def test_image_can_be_submitted_to_batch_when_found_matching_batches_with_labeli
 
     # then
     assert result is False
+
+
+@mock.patch.object(accounting, "get_roboflow_labeling_batches")
+def test_batch_capacity_cache_when_capacity_is_fetched_once_within_ttl(
+    get_roboflow_labeling_batches_mock: MagicMock,
+) -> None:
+    # given
+    get_roboflow_labeling_batches_mock.return_value = {
+        "batches": [{"name": "some", "numJobs": 0, "images": 7, "id": "YYY"}]
+    }
+    capacity_cache = BatchCapacityCache(ttl_seconds=3600)
+
+    # when
+    first_result = capacity_cache.reserve_capacity(
+        requested_images=2,
+        batch_name="some",
+        workspace_id="workspace",
+        dataset_id="project",
+        max_batch_images=10,
+        api_key="api-key",
+    )
+    second_result = capacity_cache.reserve_capacity(
+        requested_images=2,
+        batch_name="some",
+        workspace_id="workspace",
+        dataset_id="project",
+        max_batch_images=10,
+        api_key="api-key",
+    )
+    third_result = capacity_cache.reserve_capacity(
+        requested_images=2,
+        batch_name="some",
+        workspace_id="workspace",
+        dataset_id="project",
+        max_batch_images=10,
+        api_key="api-key",
+    )
+
+    # then
+    assert (first_result, second_result, third_result) == (2, 1, 0)
+    get_roboflow_labeling_batches_mock.assert_called_once()
+
+
+@mock.patch.object(accounting, "get_roboflow_labeling_batches")
+def test_batch_capacity_cache_when_capacity_is_refreshed_after_ttl(
+    get_roboflow_labeling_batches_mock: MagicMock,
+) -> None:
+    # given
+    get_roboflow_labeling_batches_mock.return_value = {"batches": []}
+    capacity_cache = BatchCapacityCache(ttl_seconds=0)
+
+    # when
+    for _ in range(3):
+        _ = capacity_cache.reserve_capacity(
+            requested_images=1,
+            batch_name="some",
+            workspace_id="workspace",
+            dataset_id="project",
+            max_batch_images=10,
+            api_key="api-key",
+        )
+
+    # then
+    assert get_roboflow_labeling_batches_mock.call_count >= 2
+
+
+@mock.patch.object(accounting, "get_roboflow_labeling_batches")
+def test_batch_capacity_cache_when_batch_size_is_not_limited(
+    get_roboflow_labeling_batches_mock: MagicMock,
+) -> None:
+    # given
+    capacity_cache = BatchCapacityCache(ttl_seconds=3600)
+
+    # when
+    result = capacity_cache.reserve_capacity(
+        requested_images=5,
+        batch_name="some",
+        workspace_id="workspace",
+        dataset_id="project",
+        max_batch_images=None,
+        api_key="api-key",
+    )
+
+    # then
+    assert result == 5
+    get_roboflow_labeling_batches_mock.assert_not_called()
+
+
+@mock.patch.object(accounting, "get_roboflow_labeling_batches")
+def test_batch_capacity_cache_when_reserved_capacity_is_released(
+    get_roboflow_labeling_batches_mock: MagicMock,
+) -> None:
+    # given
+    get_roboflow_labeling_batches_mock.return_value = {"batches": []}
+    capacity_cache = BatchCapacityCache(ttl_seconds=3600)
+    _ = capacity_cache.reserve_capacity(
+        requested_images=3,
+        batch_name="some",
+        workspace_id="workspace",
+        dataset_id="project",
+        max_batch_images=3,
+        api_key="api-key",
+    )
+
+    # when
+    capacity_cache.release_capacity(
+        released_images=2,
+        batch_name="some",
+        workspace_id="workspace",
+        dataset_id="project",
+        max_batch_images=3,
+    )
+    result = capacity_cache.reserve_capacity(
+        requested_images=3,
+        batch_name="some",
+        workspace_id="workspace",
+        dataset_id="project",
+        max_batch_images=3,
+        api_key="api-key",
+    )
+
+    # then
+    assert result == 2, "Expected released places to be available again"
+    get_roboflow_labeling_batches_mock.assert_called_once()
@@ -18,6 +18,7 @@ from inference.core.active_learning.cache_operations import (
     return_strategy_limit_usage_credit,
     set_current_strategy_limit_usage,
     use_credit_of_matching_strategy,
+    use_credits_of_matching_strategies,
 )
 from inference.core.active_learning.entities import StrategyLimit, StrategyLimitType
 from inference.core.cache import MemoryCache
@@ -575,3 +576,28 @@ def test_use_credit_of_matching_strategy_when_spare_strategy_found(
         strategy_name="a",
     )
     cache.lock.assert_called_once()
+
+
+def test_use_credits_of_matching_strategies_acquires_lock_once_for_whole_batch() -> (
+    None
+):
+    # given
+    cache = MemoryCache()
+    cache.lock = MagicMock(wraps=cache.lock)
+    strategy_limits = [StrategyLimit(limit_type=StrategyLimitType.MINUTELY, value=2)]
+
+    # when
+    result = use_credits_of_matching_strategies(
+        cache=cache,
+        workspace="some",
+        project="other",
+        matching_strategies_limits=[
+            OrderedDict({"a": strategy_limits}),
+            OrderedDict({"a": strategy_limits, "b": []}),
+            OrderedDict({"a": strategy_limits}),
+        ],
+    )
+
+    # then
+    assert result == ["a", "a", None]
+    cache.lock.assert_called_once()
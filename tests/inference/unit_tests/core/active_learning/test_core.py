@@ -15,6 +15,7 @@ from inference.core.active_learning.core import (
     is_prediction_registration_forbidden,
     prepare_image_to_registration,
     register_datapoint_at_roboflow,
+    register_image_at_roboflow_with_retries,
     safe_register_image_at_roboflow,
 )
 from inference.core.active_learning.entities import (
@@ -25,7 +26,10 @@ from inference.core.active_learning.entities import (
     StrategyLimit,
     StrategyLimitType,
 )
-from inference.core.exceptions import RoboflowAPIConnectionError
+from inference.core.exceptions import (
+    RoboflowAPIConnectionError,
+    RoboflowAPINotAuthorizedError,
+)
 
 
 def test_execute_sampling() -> None:
@@ -431,6 +435,7 @@ def test_register_datapoint_at_roboflow_when_predictions_not_to_be_persisted(
         batch_name="some-batch",
         tags=["a", "b"],
         inference_id="inference-id-987",
+        max_upload_attempts=1,
     )
     annotate_image_at_roboflow_mock.assert_not_called()
 
@@ -478,6 +483,7 @@ def test_register_datapoint_at_roboflow_when_predictions_to_be_persisted_but_dup
         batch_name="some-batch",
         tags=["a", "b"],
         inference_id="inference-id-123",
+        max_upload_attempts=1,
     )
     annotate_image_at_roboflow_mock.assert_not_called()
 
@@ -525,6 +531,7 @@ def test_register_datapoint_at_roboflow_when_predictions_to_be_persisted(
         batch_name="some-batch",
         tags=["a", "b"],
         inference_id="inference-id-ABC",
+        max_upload_attempts=1,
     )
     annotate_image_at_roboflow_mock.assert_called_once_with(
         api_key="api-key",
@@ -583,6 +590,7 @@ def test_register_datapoint_at_roboflow_when_image_registration_error_occurs(
         batch_name="some-batch",
         tags=["a", "b"],
         inference_id="inference-id-876",
+        max_upload_attempts=1,
     )
     annotate_image_at_roboflow_mock.assert_not_called()
 
@@ -795,3 +803,65 @@ def test_is_prediction_registration_forbidden_when_detection_output_without_pred
 
     # then
     assert result is True
+
+
+@mock.patch.object(core, "UPLOAD_RETRY_BACKOFF_SECONDS", 0)
+@mock.patch.object(core, "register_image_at_roboflow")
+def test_register_image_at_roboflow_with_retries_when_transient_error_occurs(
+    register_image_at_roboflow_mock: MagicMock,
+) -> None:
+    # given
+    register_image_at_roboflow_mock.side_effect = [
+        RoboflowAPIConnectionError("some"),
+        {"id": "roboflow-id", "success": True},
+    ]
+
+    # when
+    result = register_image_at_roboflow_with_retries(
+        max_upload_attempts=3,
+        api_key="api-key",
+        dataset_id="some",
+    )
+
+    # then
+    assert result == {"id": "roboflow-id", "success": True}
+    assert register_image_at_roboflow_mock.call_count == 2
+
+
+@mock.patch.object(core, "UPLOAD_RETRY_BACKOFF_SECONDS", 0)
+@mock.patch.object(core, "register_image_at_roboflow")
+def test_register_image_at_roboflow_with_retries_when_attempts_exhausted(
+    register_image_at_roboflow_mock: MagicMock,
+) -> None:
+    # given
+    register_image_at_roboflow_mock.side_effect = RoboflowAPIConnectionError("some")
+
+    # when
+    with pytest.raises(RoboflowAPIConnectionError):
+        _ = register_image_at_roboflow_with_retries(
+            max_upload_attempts=3,
+            api_key="api-key",
+            dataset_id="some",
+        )
+
+    # then
+    assert register_image_at_roboflow_mock.call_count == 3
+
+
+@mock.patch.object(core, "register_image_at_roboflow")
+def test_register_image_at_roboflow_with_retries_when_non_transient_error_occurs(
+    register_image_at_roboflow_mock: MagicMock,
+) -> None:
+    # given
+    register_image_at_roboflow_mock.side_effect = RoboflowAPINotAuthorizedError("some")
+
+    # when
+    with pytest.raises(RoboflowAPINotAuthorizedError):
+        _ = register_image_at_roboflow_with_retries(
+            max_upload_attempts=3,
+            api_key="api-key",
+            dataset_id="some",
+        )
+
+    # then
+    register_image_at_roboflow_mock.assert_called_once()
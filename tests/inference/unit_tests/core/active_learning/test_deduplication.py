@@ -0,0 +1,118 @@
+import numpy as np
+
+from inference.core.active_learning.deduplication import (
+    PerceptualHashDeduplicator,
+    compute_difference_hash,
+)
+
+
+def _gradient_image(horizontal: bool) -> np.ndarray:
+    gradient = np.tile(np.arange(0, 256, 2, dtype=np.uint8), (128, 1))
+    if not horizontal:
+        gradient = gradient.T
+    return np.stack([gradient] * 3, axis=-1).copy()
+
+
+def test_compute_difference_hash_for_identical_images() -> None:
+    # given
+    image = _gradient_image(horizontal=True)
+
+    # when
+    first_hash = compute_difference_hash(image=image)
+    second_hash = compute_difference_hash(image=image.copy())
+
+    # then
+    assert first_hash == second_hash
+
+
+def test_compute_difference_hash_for_different_images() -> None:
+    # when
+    first_hash = compute_difference_hash(image=_gradient_image(horizontal=True))
+    second_hash = compute_difference_hash(image=_gradient_image(horizontal=False))
+
+    # then
+    assert bin(first_hash ^ second_hash).count("1") > 16
+
+
+def test_perceptual_hash_deduplicator_when_near_duplicate_image_provided() -> None:
+    # given
+    deduplicator = PerceptualHashDeduplicator(max_hamming_distance=4, history_size=8)
+    image = _gradient_image(horizontal=True)
+    noisy_image = image.copy()
+    noisy_image[0, 0] = 255
+
+    # when
+    first_result = deduplicator.is_duplicate(
+        image_hash=compute_difference_hash(image=image)
+    )
+    deduplicator.remember(image_hash=compute_difference_hash(image=image))
+    second_result = deduplicator.is_duplicate(
+        image_hash=compute_difference_hash(image=noisy_image)
+    )
+
+    # then
+    assert first_result is False
+    assert second_result is True
+
+
+def test_perceptual_hash_deduplicator_when_different_image_provided() -> None:
+    # given
+    deduplicator = PerceptualHashDeduplicator(max_hamming_distance=4, history_size=8)
+    deduplicator.remember(
+        image_hash=compute_difference_hash(image=_gradient_image(horizontal=True))
+    )
+
+    # when
+    result = deduplicator.is_duplicate(
+        image_hash=compute_difference_hash(image=_gradient_image(horizontal=False))
+    )
+
+    # then
+    assert result is False
+
+
+def test_perceptual_hash_deduplicator_when_image_is_checked_but_not_remembered() -> (
+    None
+):
+    # given
+    deduplicator = PerceptualHashDeduplicator(max_hamming_distance=0, history_size=8)
+    image_hash = compute_difference_hash(image=_gradient_image(horizontal=True))
+
+    # when
+    first_result = deduplicator.is_duplicate(image_hash=image_hash)
+    second_result = deduplicator.is_duplicate(image_hash=image_hash)
+
+    # then
+    assert first_result is False
+    assert second_result is False, "Expected only remembered images to be considered"
+
+
+def test_perceptual_hash_deduplicator_when_duplicate_of_pending_image_provided() -> (
+    None
+):
+    # given
+    deduplicator = PerceptualHashDeduplicator(max_hamming_distance=0, history_size=8)
+    image_hash = compute_difference_hash(image=_gradient_image(horizontal=True))
+
+    # when
+    result = deduplicator.is_duplicate(
+        image_hash=image_hash, pending_hashes=[image_hash]
+    )
+
+    # then
+    assert result is True
+
+
+def test_perceptual_hash_deduplicator_forgets_images_beyond_history_size() -> None:
+    # given
+    deduplicator = PerceptualHashDeduplicator(max_hamming_distance=0, history_size=1)
+    first_hash = compute_difference_hash(image=_gradient_image(horizontal=True))
+    second_hash = compute_difference_hash(image=_gradient_image(horizontal=False))
+
+    # when
+    deduplicator.remember(image_hash=first_hash)
+    deduplicator.remember(image_hash=second_hash)
+    result = deduplicator.is_duplicate(image_hash=first_hash)
+
+    # then
+    assert result is False
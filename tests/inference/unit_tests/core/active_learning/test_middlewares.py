@@ -6,8 +6,13 @@ import numpy as np
 import pytest
 
 from inference.core.active_learning import middlewares
+from inference.core.active_learning.deduplication import (
+    PerceptualHashDeduplicator,
+    compute_difference_hash,
+)
 from inference.core.active_learning.middlewares import (
     ActiveLearningMiddleware,
+    BatchingActiveLearningMiddleware,
     ThreadingActiveLearningMiddleware,
 )
 
@@ -282,3 +287,190 @@ def test_threading_active_learning_middleware() -> None:
             ),
         ]
     )
+
+
+@pytest.mark.timeout(30)
+@mock.patch.object(middlewares, "execute_batch_of_datapoints_registration")
+@mock.patch.object(middlewares, "generate_batch_name")
+@mock.patch.object(middlewares, "execute_sampling")
+@mock.patch.object(middlewares, "load_image")
+def test_batching_active_learning_middleware(
+    load_image_mock: MagicMock,
+    execute_sampling_mock: MagicMock,
+    generate_batch_name_mock: MagicMock,
+    execute_batch_of_datapoints_registration_mock: MagicMock,
+) -> None:
+    # given
+    images = [np.ones((64, 64, 3), dtype=np.uint8) * i * 50 for i in range(3)]
+    configuration, cache = MagicMock(), MagicMock()
+    execute_sampling_mock.side_effect = [["strategy-a"], [], ["strategy-b"]]
+    generate_batch_name_mock.return_value = "some-batch"
+    deduplicator = MagicMock()
+    deduplicator.is_duplicate.return_value = False
+    batch_capacity_cache = MagicMock()
+    batch_capacity_cache.reserve_capacity.return_value = 2
+    execute_batch_of_datapoints_registration_mock.return_value = [True, True]
+    middleware = BatchingActiveLearningMiddleware(
+        api_key="api-key",
+        configuration=configuration,
+        cache=cache,
+        task_queue=Queue(),
+        max_batch_size=8,
+        max_upload_attempts=2,
+        deduplicator=deduplicator,
+        batch_capacity_cache=batch_capacity_cache,
+    )
+
+    # when
+    middleware.register_batch(
+        inference_inputs=images,
+        predictions=[{"id": 0}, {"id": 1}, {"id": 2}],
+        prediction_type="object-detection",
+        inference_id="some-id",
+    )
+    with middleware:
+        pass
+
+    # then
+    assert middleware._registration_thread is None
+    load_image_mock.assert_not_called()
+    assert execute_sampling_mock.call_count == 3
+    batch_capacity_cache.reserve_capacity.assert_called_once_with(
+        requested_images=2,
+        batch_name="some-batch",
+        workspace_id=configuration.workspace_id,
+        dataset_id=configuration.dataset_id,
+        max_batch_images=configuration.max_batch_images,
+        api_key="api-key",
+    )
+    execute_batch_of_datapoints_registration_mock.assert_called_once()
+    registration_kwargs = execute_batch_of_datapoints_registration_mock.call_args[1]
+    assert registration_kwargs["matching_strategies"] == [
+        ["strategy-a"],
+        ["strategy-b"],
+    ]
+    assert registration_kwargs["images"][0] is images[0]
+    assert registration_kwargs["images"][1] is images[2]
+    assert registration_kwargs["predictions"] == [{"id": 0}, {"id": 2}]
+    assert registration_kwargs["inference_ids"] == ["some-id", "some-id"]
+    assert registration_kwargs["max_upload_attempts"] == 2
+    assert deduplicator.remember.call_count == 2
+    assert batch_capacity_cache.release_capacity.call_args[1]["released_images"] == 0
+
+
+@pytest.mark.timeout(30)
+@mock.patch.object(middlewares, "execute_batch_of_datapoints_registration")
+@mock.patch.object(middlewares, "generate_batch_name")
+@mock.patch.object(middlewares, "execute_sampling")
+def test_batching_active_learning_middleware_when_duplicates_and_capacity_exceeded(
+    execute_sampling_mock: MagicMock,
+    generate_batch_name_mock: MagicMock,
+    execute_batch_of_datapoints_registration_mock: MagicMock,
+) -> None:
+    # given
+    image = np.zeros((64, 64, 3), dtype=np.uint8)
+    execute_sampling_mock.return_value = ["strategy-a"]
+    generate_batch_name_mock.return_value = "some-batch"
+    deduplicator = MagicMock()
+    deduplicator.is_duplicate.side_effect = [False, True]
+    batch_capacity_cache = MagicMock()
+    batch_capacity_cache.reserve_capacity.return_value = 0
+    middleware = BatchingActiveLearningMiddleware(
+        api_key="api-key",
+        configuration=MagicMock(),
+        cache=MagicMock(),
+        task_queue=Queue(),
+        deduplicator=deduplicator,
+        batch_capacity_cache=batch_capacity_cache,
+    )
+
+    # when
+    middleware.register_batch(
+        inference_inputs=[image, image],
+        predictions=[{"some": "prediction"}, {"other": "prediction"}],
+        prediction_type="object-detection",
+    )
+    with middleware:
+        pass
+
+    # then
+    assert batch_capacity_cache.reserve_capacity.call_args[1]["requested_images"] == 1
+    execute_batch_of_datapoints_registration_mock.assert_not_called()
+
+
+@pytest.mark.timeout(30)
+@mock.patch.object(middlewares, "execute_batch_of_datapoints_registration")
+@mock.patch.object(middlewares, "generate_batch_name")
+@mock.patch.object(middlewares, "execute_sampling")
+def test_batching_active_learning_middleware_when_strategy_credit_is_denied(
+    execute_sampling_mock: MagicMock,
+    generate_batch_name_mock: MagicMock,
+    execute_batch_of_datapoints_registration_mock: MagicMock,
+) -> None:
+    # given
+    images = [np.ones((64, 64, 3), dtype=np.uint8) * i * 50 for i in range(2)]
+    images[1][:, 32:] = 255
+    configuration = MagicMock()
+    execute_sampling_mock.return_value = ["strategy-a"]
+    generate_batch_name_mock.return_value = "some-batch"
+    deduplicator = PerceptualHashDeduplicator(max_hamming_distance=0, history_size=8)
+    batch_capacity_cache = MagicMock()
+    batch_capacity_cache.reserve_capacity.return_value = 2
+    execute_batch_of_datapoints_registration_mock.return_value = [True, False]
+    middleware = BatchingActiveLearningMiddleware(
+        api_key="api-key",
+        configuration=configuration,
+        cache=MagicMock(),
+        task_queue=Queue(),
+        deduplicator=deduplicator,
+        batch_capacity_cache=batch_capacity_cache,
+    )
+
+    # when
+    middleware.register_batch(
+        inference_inputs=images,
+        predictions=[{"some": "prediction"}, {"other": "prediction"}],
+        prediction_type="object-detection",
+    )
+    with middleware:
+        pass
+
+    # then
+    batch_capacity_cache.release_capacity.assert_called_once_with(
+        released_images=1,
+        batch_name="some-batch",
+        workspace_id=configuration.workspace_id,
+        dataset_id=configuration.dataset_id,
+        max_batch_images=configuration.max_batch_images,
+    )
+    assert deduplicator.is_duplicate(
+        image_hash=compute_difference_hash(image=images[0])
+    ), "Expected submitted image to be remembered"
+    assert not deduplicator.is_duplicate(
+        image_hash=compute_difference_hash(image=images[1])
+    ), "Expected image denied by strategy limit not to block its later registration"
+
+
+def test_batching_active_learning_middleware_drops_datapoints_when_queue_is_full() -> (
+    None
+):
+    # given
+    task_queue = Queue(1)
+    middleware = BatchingActiveLearningMiddleware(
+        api_key="api-key",
+        configuration=MagicMock(),
+        cache=MagicMock(),
+        task_queue=task_queue,
+        deduplicator=MagicMock(),
+        batch_capacity_cache=MagicMock(),
+    )
+
+    # when
+    middleware.register_batch(
+        inference_inputs=[MagicMock(), MagicMock()],
+        predictions=[{"some": "prediction"}, {"other": "prediction"}],
+        prediction_type="object-detection",
+    )
+
+    # then
+    assert task_queue.qsize() == 1
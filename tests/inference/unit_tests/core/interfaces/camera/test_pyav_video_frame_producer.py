@@ -0,0 +1,85 @@
+import pytest
+
+pytest.importorskip("av")
+
+from inference.core.interfaces.camera.pyav_video_frame_producer import (
+    PyAVVideoFrameProducer,
+)
+from inference.core.interfaces.camera.video_source import CV2VideoFrameProducer
+
+
+def test_discover_source_properties_when_local_file_given(
+    local_video_path: str,
+) -> None:
+    # given
+    video = PyAVVideoFrameProducer(local_video_path)
+    reference_video = CV2VideoFrameProducer(local_video_path)
+
+    # when
+    result = video.discover_source_properties()
+
+    # then
+    expected_result = reference_video.discover_source_properties()
+    video.release()
+    reference_video.release()
+    assert result.is_file is True
+    assert (result.width, result.height) == (
+        expected_result.width,
+        expected_result.height,
+    )
+    assert abs(result.fps - expected_result.fps) < 1e-3
+    assert result.total_frames == expected_result.total_frames
+
+
+def test_grab_and_retrieve_all_frames_of_local_file(local_video_path: str) -> None:
+    # given
+    video = PyAVVideoFrameProducer(local_video_path)
+    properties = video.discover_source_properties()
+
+    # when
+    frames = 0
+    shapes = set()
+    while video.grab():
+        success, image = video.retrieve()
+        assert success is True
+        shapes.add(image.shape)
+        frames += 1
+    video.release()
+
+    # then
+    assert frames == properties.total_frames
+    assert shapes == {(properties.height, properties.width, 3)}
+
+
+def test_skip_frames_of_local_file(local_video_path: str) -> None:
+    # given
+    video = PyAVVideoFrameProducer(local_video_path)
+    properties = video.discover_source_properties()
+
+    # when
+    frames = 0
+    while video.grab():
+        frames += 1
+        frames += video.skip(frames_number=9)
+    retrieved_after_end = video.retrieve()
+    video.release()
+
+    # then
+    assert frames == properties.total_frames
+    assert retrieved_after_end == (False, None)
+
+
+def test_retrieve_with_reduced_resolution(local_video_path: str) -> None:
+    # given
+    video = PyAVVideoFrameProducer(local_video_path, max_dimension=64)
+    properties = video.discover_source_properties()
+
+    # when
+    _ = video.grab()
+    success, image = video.retrieve()
+    video.release()
+
+    # then
+    assert success is True
+    assert max(image.shape[:2]) == 64
+    assert image.shape[:2] == (properties.height, properties.width)
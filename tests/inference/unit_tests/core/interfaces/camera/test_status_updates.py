@@ -0,0 +1,152 @@
+import time
+from typing import List
+
+from inference.core.interfaces.camera.entities import StatusUpdate, UpdateSeverity
+from inference.core.interfaces.camera.status_updates import (
+    EVENTS_COUNT_KEY,
+    StatusUpdateSubscription,
+    dispatch_status_update,
+)
+
+
+def test_dispatch_status_update_delivers_update_to_plain_handlers() -> None:
+    # given
+    updates: List[StatusUpdate] = []
+
+    # when
+    dispatch_status_update(
+        severity=UpdateSeverity.DEBUG,
+        event_type="FRAME_CAPTURED",
+        context="video_source",
+        status_update_handlers=[updates.append],
+        payload_factory=lambda: {"frame_id": 1},
+    )
+
+    # then
+    assert len(updates) == 1
+    assert updates[0].event_type == "FRAME_CAPTURED"
+    assert updates[0].payload == {"frame_id": 1}
+    assert updates[0].context == "video_source"
+
+
+def test_dispatch_status_update_does_not_build_payload_when_no_handler_interested() -> (
+    None
+):
+    # given
+    updates: List[StatusUpdate] = []
+    payload_requests = []
+    subscription = StatusUpdateSubscription(
+        handler=updates.append, min_severity=UpdateSeverity.INFO
+    )
+
+    # when
+    dispatch_status_update(
+        severity=UpdateSeverity.DEBUG,
+        event_type="FRAME_CAPTURED",
+        context="video_source",
+        status_update_handlers=[subscription],
+        payload_factory=lambda: payload_requests.append(1) or {},
+    )
+
+    # then
+    assert updates == []
+    assert payload_requests == []
+
+
+def test_dispatch_status_update_filters_by_event_types() -> None:
+    # given
+    updates: List[StatusUpdate] = []
+    subscription = StatusUpdateSubscription(
+        handler=updates.append, event_types=["SOURCE_ERROR"]
+    )
+
+    # when
+    for event_type in ["FRAME_CAPTURED", "SOURCE_ERROR"]:
+        dispatch_status_update(
+            severity=UpdateSeverity.ERROR,
+            event_type=event_type,
+            context="video_source",
+            status_update_handlers=[subscription],
+        )
+
+    # then
+    assert [u.event_type for u in updates] == ["SOURCE_ERROR"]
+
+
+def test_dispatch_status_update_aggregates_high_frequency_events() -> None:
+    # given
+    updates: List[StatusUpdate] = []
+    subscription = StatusUpdateSubscription(
+        handler=updates.append,
+        aggregated_event_types=["FRAME_CAPTURED"],
+        aggregation_interval=0.05,
+    )
+
+    # when
+    for _ in range(3):
+        dispatch_status_update(
+            severity=UpdateSeverity.DEBUG,
+            event_type="FRAME_CAPTURED",
+            context="video_source",
+            status_update_handlers=[subscription],
+            payload_factory=lambda: {"frame_id": 1},
+        )
+    updates_before_interval_elapsed = list(updates)
+    time.sleep(0.06)
+    dispatch_status_update(
+        severity=UpdateSeverity.DEBUG,
+        event_type="FRAME_CAPTURED",
+        context="video_source",
+        status_update_handlers=[subscription],
+    )
+
+    # then
+    assert updates_before_interval_elapsed == []
+    assert len(updates) == 1
+    assert updates[0].event_type == "FRAME_CAPTURED"
+    assert updates[0].payload[EVENTS_COUNT_KEY] == 4
+
+
+def test_status_update_subscription_flush_emits_pending_aggregates() -> None:
+    # given
+    updates: List[StatusUpdate] = []
+    subscription = StatusUpdateSubscription(
+        handler=updates.append,
+        aggregated_event_types=["FRAME_DROPPED"],
+        aggregation_interval=60.0,
+    )
+    for context in ["video_source.a", "video_source.b", "video_source.a"]:
+        dispatch_status_update(
+            severity=UpdateSeverity.DEBUG,
+            event_type="FRAME_DROPPED",
+            context=context,
+            status_update_handlers=[subscription],
+        )
+
+    # when
+    subscription.flush()
+
+    # then
+    assert sorted((u.context, u.payload[EVENTS_COUNT_KEY]) for u in updates) == [
+        ("video_source.a", 2),
+        ("video_source.b", 1),
+    ]
+
+
+def test_dispatch_status_update_isolates_failing_handlers() -> None:
+    # given
+    updates: List[StatusUpdate] = []
+
+    def failing_handler(status_update: StatusUpdate) -> None:
+        raise RuntimeError()
+
+    # when
+    dispatch_status_update(
+        severity=UpdateSeverity.INFO,
+        event_type="SOURCE_STATE_UPDATE",
+        context="video_source",
+        status_update_handlers=[failing_handler, updates.append],
+    )
+
+    # then
+    assert len(updates) == 1
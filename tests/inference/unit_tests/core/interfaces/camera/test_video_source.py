@@ -2,6 +2,7 @@ import time
 from datetime import datetime
 from queue import Queue
 from threading import Thread
+from typing import Tuple
 from unittest import mock
 from unittest.mock import MagicMock, call, patch
 
@@ -15,6 +16,7 @@ from inference.core.interfaces.camera.entities import (
     StatusUpdate,
     UpdateSeverity,
     VideoFrame,
+    VideoFrameProducer,
 )
 from inference.core.interfaces.camera.exceptions import (
     SourceConnectionError,
@@ -141,6 +143,26 @@ def test_video_source_throwing_error_when_invalid_video_reference_given() -> Non
         source.start()
 
 
+@mock.patch.object(video_source, "VIDEO_FILE_DECODING_BACKEND", "pyav")
+@mock.patch.dict(
+    "sys.modules",
+    {"av": None, "inference.core.interfaces.camera.pyav_video_frame_producer": None},
+)
+def test_video_source_throwing_error_when_pyav_backend_used_without_av_installed(
+    local_video_path: str,
+) -> None:
+    # given
+    source = VideoSource.init(video_reference=local_video_path)
+
+    # when
+    with pytest.raises(SourceConnectionError) as error:
+        source.start()
+
+    # then
+    assert "`av` package is not installed" in str(error.value)
+    assert source.describe_source().state is StreamState.ERROR
+
+
 def test_video_source_describe_source_when_stream_consumption_not_yet_started() -> None:
     # given
     source = VideoSource.init(video_reference="invalid", source_id=2)
@@ -1316,3 +1338,79 @@ def test_source_properties_initialized_on_video_source_using_string_values(
         ],
         any_order=True,
     )
+
+
+class FrameCountingProducer(VideoFrameProducer):
+    def __init__(self, total_frames: int, fps: float):
+        self._total_frames = total_frames
+        self._fps = fps
+        self.position = 0
+        self.grabbed_frames = []
+        self.skip_calls = []
+
+    def isOpened(self) -> bool:
+        return True
+
+    def grab(self) -> bool:
+        if self.position >= self._total_frames:
+            return False
+        self.position += 1
+        self.grabbed_frames.append(self.position)
+        return True
+
+    def retrieve(self) -> Tuple[bool, np.ndarray]:
+        return True, np.zeros((128, 128, 3), dtype=np.uint8)
+
+    def skip(self, frames_number: int) -> int:
+        self.skip_calls.append(frames_number)
+        skipped = min(frames_number, self._total_frames - self.position)
+        self.position += skipped
+        return skipped
+
+    def discover_source_properties(self) -> SourceProperties:
+        return SourceProperties(
+            width=128,
+            height=128,
+            total_frames=self._total_frames,
+            is_file=True,
+            fps=self._fps,
+        )
+
+    def release(self):
+        pass
+
+
+def test_video_file_consumption_with_desired_fps_skips_frames_not_to_be_accepted() -> (
+    None
+):
+    # given
+    consumer = VideoConsumer.init(
+        buffer_filling_strategy=None,
+        adaptive_mode_stream_pace_tolerance=0.1,
+        adaptive_mode_reader_pace_tolerance=5.0,
+        minimum_adaptive_mode_samples=10,
+        maximum_adaptive_frames_dropped_in_row=16,
+        status_update_handlers=[],
+        desired_fps=10,
+    )
+    video = FrameCountingProducer(total_frames=10, fps=30.0)
+    source_properties = video.discover_source_properties()
+    buffer = Queue()
+
+    # when
+    consumer.reset(source_properties=source_properties)
+    while consumer.consume_frame(
+        video=video,
+        declared_source_fps=source_properties.fps,
+        is_source_video_file=source_properties.is_file,
+        buffer=buffer,
+        frames_buffering_allowed=True,
+    ):
+        pass
+
+    # then
+    frames_ids = [buffer.get().frame_id for _ in range(buffer.qsize())]
+    assert frames_ids == [1, 4, 7, 10], "Every third frame expected to be decoded"
+    assert video.grabbed_frames == [1, 4, 7, 10], "Only accepted frames to be grabbed"
+    assert video.skip_calls == [2, 2, 2, 2]
+    assert consumer.frames_skipped == 6
@@ -0,0 +1,169 @@
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+from inference.core.exceptions import RoboflowAPINotAuthorizedError
+from inference.core.interfaces.http.middlewares import dedicated_deployment_auth
+from inference.core.interfaces.http.middlewares.dedicated_deployment_auth import (
+    AUTHORIZATION_FIELDS,
+    DedicatedDeploymentAuthorizer,
+    SingleFlightTTLCache,
+    extract_top_level_json_fields,
+)
+
+
+def test_extract_top_level_json_fields_when_fields_are_mixed_with_large_values() -> (
+    None
+):
+    # given
+    body = json.dumps(
+        {
+            "image": {"type": "base64", "value": "a" * 100_000},
+            "nested": {"api_key": "not-this-one", "list": [1, ']}\\"', {"x": None}]},
+            "confidence": 0.5,
+            "model_id": "some/1",
+            "api_key": 'my-key"with-quote',
+            "project": None,
+        },
+        indent=2,
+    ).encode("utf-8")
+
+    # when
+    result = extract_top_level_json_fields(body=body, fields=AUTHORIZATION_FIELDS)
+
+    # then
+    assert result == {"model_id": "some/1", "api_key": 'my-key"with-quote'}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"api_key": "k", "model_id": "mine/1", "project": "mine", "model_id": "other/1"}',
+        b'{"model_id": "mine/1", "image": "aaa", "project": "mine", "project": null}',
+    ],
+)
+def test_extract_top_level_json_fields_when_keys_are_duplicated(body: bytes) -> None:
+    # when
+    result = extract_top_level_json_fields(body=body, fields=AUTHORIZATION_FIELDS)
+
+    # then
+    expected = {
+        key: value
+        for key, value in json.loads(body).items()
+        if key in AUTHORIZATION_FIELDS and isinstance(value, str)
+    }
+    assert result == expected, "Expected last occurrence of the key to win"
+
+
+def test_extract_top_level_json_fields_when_document_is_malformed() -> None:
+    # given
+    body = b'{"api_key": "my-key", "image": {"value": "aaa'
+
+    # when
+    result = extract_top_level_json_fields(body=body, fields=AUTHORIZATION_FIELDS)
+
+    # then
+    assert result == {"api_key": "my-key"}
+
+
+@pytest.mark.parametrize("body", [b"", b"[]", b'"api_key"', b"{}", b"{,}"])
+def test_extract_top_level_json_fields_when_document_is_not_an_object(
+    body: bytes,
+) -> None:
+    # when
+    result = extract_top_level_json_fields(body=body, fields=AUTHORIZATION_FIELDS)
+
+    # then
+    assert result == {}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cache_merges_concurrent_lookups() -> None:
+    # given
+    cache = SingleFlightTTLCache[str, bool](ttl=60, max_size=1)
+    calls = []
+
+    async def compute() -> bool:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return True
+
+    # when
+    results = await asyncio.gather(*[cache.get(key="a", compute=compute)] * 8)
+    cached_result = await cache.get(key="a", compute=compute)
+    _ = await cache.get(key="b", compute=compute)
+    result_after_eviction = await cache.get(key="a", compute=compute)
+
+    # then
+    assert results == [True] * 8
+    assert cached_result is True
+    assert result_after_eviction is True
+    assert len(calls) == 3, "Expected call for a, call for b and call for evicted a"
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cache_does_not_store_rejected_results_and_errors() -> None:
+    # given
+    cache = SingleFlightTTLCache[str, bool](ttl=60, max_size=8, should_cache=bool)
+    calls = []
+
+    async def reject() -> bool:
+        calls.append("reject")
+        return False
+
+    async def fail() -> bool:
+        calls.append("fail")
+        raise RuntimeError()
+
+    # when
+    first_result = await cache.get(key="a", compute=reject)
+    with pytest.raises(RuntimeError):
+        _ = await cache.get(key="a", compute=fail)
+    second_result = await cache.get(key="a", compute=reject)
+
+    # then
+    assert first_result is False
+    assert second_result is False
+    assert calls == ["reject", "fail", "reject"]
+
+
+@pytest.mark.asyncio
+@mock.patch.object(dedicated_deployment_auth, "get_roboflow_dataset_type")
+@mock.patch.object(dedicated_deployment_auth, "get_roboflow_workspace")
+async def test_dedicated_deployment_authorizer(
+    get_roboflow_workspace_mock: mock.MagicMock,
+    get_roboflow_dataset_type_mock: mock.MagicMock,
+) -> None:
+    # given
+    authorizer = DedicatedDeploymentAuthorizer(
+        workspace_url="my-workspace", cache_ttl=60, cache_max_size=8
+    )
+
+    def get_workspace(api_key: str) -> str:
+        if api_key == "invalid":
+            raise RoboflowAPINotAuthorizedError()
+        return {"valid": "my-workspace"}.get(api_key, "other-workspace")
+
+    get_roboflow_workspace_mock.side_effect = get_workspace
+
+    # when
+    results = [
+        await authorizer.is_api_key_authorized(api_key=api_key)
+        for api_key in ["valid", "valid", "invalid", "foreign", None]
+    ]
+    project_results = [
+        await authorizer.is_project_authorized(
+            api_key="valid", project_url="my-project"
+        )
+        for _ in range(2)
+    ]
+
+    # then
+    assert results == [True, True, False, False, False]
+    assert project_results == [True, True]
+    assert get_roboflow_workspace_mock.call_count == 3
+    get_roboflow_dataset_type_mock.assert_called_once_with(
+        "valid", "my-workspace", "my-project"
+    )
@@ -0,0 +1,67 @@
+import time
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from inference.core.interfaces.http.middlewares.stage_timing import (
+    StageTimingMiddleware,
+)
+from inference.core.utils.stage_timing import (
+    RequestStageTimer,
+    get_active_stage_timer,
+    measure_stage,
+)
+
+
+def _create_app(
+    observed: List[RequestStageTimer], server_timing_header: bool
+) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        StageTimingMiddleware,
+        observe_durations=observed.append,
+        server_timing_header=server_timing_header,
+    )
+
+    @app.get("/infer")
+    async def infer():
+        get_active_stage_timer().model_id = "some/1"
+        with measure_stage(name="predict"):
+            time.sleep(0.01)
+        return {"status": "ok"}
+
+    return app
+
+
+def test_stage_timing_middleware_when_server_timing_header_enabled() -> None:
+    # given
+    observed = []
+    client = TestClient(_create_app(observed=observed, server_timing_header=True))
+
+    # when
+    response = client.get("/infer")
+
+    # then
+    assert response.status_code == 200
+    assert len(observed) == 1
+    assert observed[0].model_id == "some/1"
+    assert observed[0].durations["predict"] >= 0.01
+    assert observed[0].durations["total"] >= observed[0].durations["predict"]
+    header = response.headers["Server-Timing"]
+    assert header.startswith("predict;dur=")
+    assert ", total;dur=" in header
+
+
+def test_stage_timing_middleware_when_server_timing_header_disabled() -> None:
+    # given
+    observed = []
+    client = TestClient(_create_app(observed=observed, server_timing_header=False))
+
+    # when
+    response = client.get("/infer")
+
+    # then
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+    assert set(observed[0].durations.keys()) == {"predict", "total"}
@@ -0,0 +1,176 @@
+import random
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream.binary_udp import (
+    BinaryUDPReceiver,
+    MessagesReassembler,
+    decode_message,
+    encode_frame_predictions,
+    encode_message,
+    split_into_datagrams,
+)
+from inference.core.interfaces.stream.sinks import BinaryUDPSink
+
+
+def _video_frame(frame_id: int, source_id: int = 3) -> VideoFrame:
+    return VideoFrame(
+        image=np.zeros((10, 10, 3), dtype=np.uint8),
+        frame_id=frame_id,
+        frame_timestamp=datetime.now(),
+        source_id=source_id,
+    )
+
+
+def _detections_predictions(detections_count: int) -> dict:
+    return {
+        "image": {"width": 640, "height": 480},
+        "inference_id": "some",
+        "predictions": [
+            {
+                "x": float(i),
+                "y": 2.5,
+                "width": 10.0,
+                "height": 20.0,
+                "confidence": 0.5,
+                "class": "dog" if i % 2 else "cat",
+                "class_id": i % 2,
+                "detection_id": f"id-{i}",
+            }
+            for i in range(detections_count)
+        ],
+    }
+
+
+def test_encoding_and_decoding_detections() -> None:
+    # given
+    predictions = _detections_predictions(detections_count=3)
+    video_frame = _video_frame(frame_id=7)
+
+    # when
+    message = encode_message(
+        records=[
+            encode_frame_predictions(predictions=predictions, video_frame=video_frame)
+        ],
+        emission_time=1000.0,
+    )
+    result = decode_message(message=message)
+
+    # then
+    assert len(result) == 1
+    assert result[0].source_id == 3
+    assert result[0].frame_id == 7
+    assert (
+        abs(result[0].frame_decoding_time - video_frame.frame_timestamp).total_seconds()
+        < 1e-3
+    )
+    assert result[0].emission_time == datetime.fromtimestamp(1000.0)
+    assert result[0].predictions == predictions
+
+
+def test_encoding_and_decoding_predictions_not_being_detections() -> None:
+    # given
+    predictions = {"top": "cat", "predictions": {"cat": {"confidence": 0.7}}}
+
+    # when
+    message = encode_message(
+        records=[
+            encode_frame_predictions(
+                predictions=predictions, video_frame=_video_frame(frame_id=1)
+            ),
+            encode_frame_predictions(
+                predictions=None, video_frame=_video_frame(frame_id=2, source_id=None)
+            ),
+        ],
+        emission_time=1000.0,
+    )
+    result = decode_message(message=message)
+
+    # then
+    assert [r.predictions for r in result] == [predictions, None]
+    assert [r.source_id for r in result] == [3, None]
+
+
+def test_messages_reassembly_when_datagrams_delivered_out_of_order() -> None:
+    # given
+    message = bytes(range(256)) * 40
+    datagrams = split_into_datagrams(
+        message=message, message_id=5, max_datagram_size=500
+    )
+    random.Random(42).shuffle(datagrams)
+    reassembler = MessagesReassembler()
+
+    # when
+    results = [reassembler.add(datagram=d, sender="a") for d in datagrams]
+
+    # then
+    assert all(len(d) <= 500 for d in datagrams)
+    assert results[:-1] == [None] * (len(datagrams) - 1)
+    assert results[-1] == message
+
+
+def test_messages_reassembly_discards_incomplete_messages_after_timeout() -> None:
+    # given
+    reassembler = MessagesReassembler(reassembly_timeout=0.0)
+    first_datagrams = split_into_datagrams(
+        message=b"a" * 100, message_id=1, max_datagram_size=50
+    )
+    second_datagrams = split_into_datagrams(
+        message=b"b" * 10, message_id=2, max_datagram_size=50
+    )
+
+    # when
+    _ = reassembler.add(datagram=first_datagrams[0])
+    result = reassembler.add(datagram=second_datagrams[0])
+
+    # then
+    assert result == b"b" * 10
+    assert reassembler.add(datagram=first_datagrams[1]) is None
+    assert reassembler.discarded_messages == 1
+
+
+def test_split_into_datagrams_when_datagram_size_is_too_small() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = split_into_datagrams(message=b"a", message_id=1, max_datagram_size=4)
+
+
+def test_binary_udp_sink_over_loopback_with_fragmentation_and_batching() -> None:
+    # given
+    receiver = BinaryUDPReceiver.init(ip_address="127.0.0.1", port=0)
+    sink = BinaryUDPSink.init(
+        ip_address="127.0.0.1",
+        port=receiver.port,
+        max_batch_size=2,
+        max_batch_delay=10.0,
+    )
+    large_predictions = _detections_predictions(detections_count=300)
+    small_predictions = _detections_predictions(detections_count=1)
+
+    try:
+        # when
+        sink.send_predictions(
+            predictions=large_predictions, video_frame=_video_frame(frame_id=1)
+        )
+        first_message = receiver.receive(timeout=2.0)
+        sink.send_predictions(
+            predictions=[small_predictions, None, small_predictions],
+            video_frame=[
+                _video_frame(frame_id=2, source_id=0),
+                None,
+                _video_frame(frame_id=2, source_id=2),
+            ],
+        )
+        second_message = receiver.receive(timeout=2.0)
+    finally:
+        sink.release()
+        receiver.close()
+
+    # then
+    assert [r.frame_id for r in first_message] == [1]
+    assert first_message[0].predictions == large_predictions
+    assert [r.source_id for r in second_message] == [0, 2]
+    assert [r.predictions for r in second_message] == [small_predictions] * 2
@@ -21,6 +21,10 @@ from inference.core.interfaces.camera.exceptions import (
     EndOfStreamError,
     SourceConnectionError,
 )
+from inference.core.interfaces.camera.status_updates import (
+    EVENTS_COUNT_KEY,
+    StatusUpdateSubscription,
+)
 from inference.core.interfaces.camera.video_source import (
     SourceMetadata,
     SourceProperties,
@@ -29,7 +33,10 @@ from inference.core.interfaces.camera.video_source import (
     lock_state_transition,
 )
 from inference.core.interfaces.stream.entities import ModelConfig
-from inference.core.interfaces.stream.inference_pipeline import InferencePipeline
+from inference.core.interfaces.stream.inference_pipeline import (
+    INFERENCE_COMPLETED_EVENT,
+    InferencePipeline,
+)
 from inference.core.interfaces.stream.model_handlers.roboflow_models import (
     default_process_frame,
 )
@@ -284,6 +291,50 @@ def test_inference_pipeline_works_correctly_against_stream_including_reconnectio
     ), "Expected to process at least one frame after reconnection"
 
 
+def test_inference_pipeline_flushes_aggregated_status_updates_when_it_ends() -> None:
+    # given
+    model = ModelStub()
+    video_source = VideoSourceStub(frames_number=100, is_file=False, rounds=1)
+    watchdog = BasePipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source])
+    predictions, updates = [], []
+    subscription = StatusUpdateSubscription(
+        handler=updates.append,
+        event_types=[],
+        aggregated_event_types=[INFERENCE_COMPLETED_EVENT],
+        aggregation_interval=3600.0,
+    )
+    inference_config = ModelConfig.init(confidence=0.5, iou_threshold=0.5)
+    process_frame_func = partial(
+        default_process_frame, model=model, inference_config=inference_config
+    )
+    inference_pipeline = InferencePipeline(
+        on_video_frame=process_frame_func,
+        video_sources=[video_source],
+        on_prediction=lambda prediction, video_frame: predictions.append(prediction),
+        max_fps=None,
+        predictions_queue=Queue(maxsize=512),
+        watchdog=watchdog,
+        status_update_handlers=[subscription],
+    )
+
+    def stop() -> None:
+        inference_pipeline._stop = True
+
+    video_source.on_end = stop
+
+    # when
+    inference_pipeline.start(use_main_thread=False)
+    inference_pipeline.join()
+
+    # then
+    assert len(predictions) > 0
+    assert [u.event_type for u in updates] == [INFERENCE_COMPLETED_EVENT]
+    assert updates[0].payload[EVENTS_COUNT_KEY] == len(
+        predictions
+    ), "Expected counter of the last aggregation window to be flushed"
+
+
 @pytest.mark.parametrize("use_main_thread", [True, False])
 def test_inference_pipeline_works_correctly_against_multiple_streams_including_reconnections(
     use_main_thread: bool,
@@ -0,0 +1,151 @@
+import os.path
+from datetime import datetime
+from typing import Callable, List
+
+import numpy as np
+import pytest
+
+from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.stream.offline_processing import (
+    OfflineProcessingProgress,
+    process_video_files,
+    resolve_video_files,
+)
+
+
+class FakePipeline:
+    def __init__(self, video_reference: str, on_prediction: Callable, frames: int):
+        self._video_reference = video_reference
+        self._on_prediction = on_prediction
+        self._frames = frames
+
+    def start(self, use_main_thread: bool = True) -> None:
+        for frame_id in range(1, self._frames + 1):
+            video_frame = VideoFrame(
+                image=np.zeros((10, 10, 3), dtype=np.uint8),
+                frame_id=frame_id,
+                frame_timestamp=datetime.now(),
+            )
+            self._on_prediction({"video": self._video_reference}, video_frame)
+
+    def join(self) -> None:
+        pass
+
+
+class RecordingSink:
+    def __init__(self, video_path: str):
+        self.video_path = video_path
+        self.predictions = []
+        self.released = False
+
+    def on_prediction(self, predictions: dict, video_frame: VideoFrame) -> None:
+        self.predictions.append(predictions)
+
+    def release(self) -> None:
+        self.released = True
+
+
+def _create_videos(directory: str, names: List[str]) -> List[str]:
+    paths = []
+    for name in names:
+        path = os.path.join(directory, name)
+        with open(path, "wb") as f:
+            f.write(b"")
+        paths.append(path)
+    return paths
+
+
+def test_resolve_video_files_when_directory_glob_and_files_given(
+    empty_local_dir: str,
+) -> None:
+    # given
+    first, second, _ = _create_videos(
+        directory=empty_local_dir, names=["b.mp4", "a.MOV", "notes.txt"]
+    )
+
+    # when
+    result = resolve_video_files(
+        video_files=[empty_local_dir, os.path.join(empty_local_dir, "*.mp4"), first]
+    )
+
+    # then
+    assert result == [second, first], "Expected videos in order, without duplicates"
+
+
+def test_resolve_video_files_when_nothing_matches(empty_local_dir: str) -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = resolve_video_files(video_files=os.path.join(empty_local_dir, "*.mp4"))
+
+
+def test_process_video_files_in_calling_process(empty_local_dir: str) -> None:
+    # given
+    video_paths = _create_videos(directory=empty_local_dir, names=["a.mp4", "b.mp4"])
+    sinks = []
+    progress_updates: List[OfflineProcessingProgress] = []
+
+    def pipeline_factory(video_reference: str, on_prediction: Callable):
+        frames = 3 if video_reference.endswith("a.mp4") else 5
+        return FakePipeline(
+            video_reference=video_reference, on_prediction=on_prediction, frames=frames
+        )
+
+    def sink_factory(video_path: str) -> RecordingSink:
+        sinks.append(RecordingSink(video_path=video_path))
+        return sinks[-1]
+
+    # when
+    report = process_video_files(
+        video_files=video_paths,
+        pipeline_factory=pipeline_factory,
+        sink_factory=sink_factory,
+        workers=1,
+        on_progress=progress_updates.append,
+    )
+
+    # then
+    assert [r.video_path for r in report.results] == video_paths
+    assert [r.frames_processed for r in report.results] == [3, 5]
+    assert report.frames_processed == 8
+    assert report.failed == []
+    assert [len(sink.predictions) for sink in sinks] == [3, 5]
+    assert all(sink.released for sink in sinks)
+    assert progress_updates[-1].files_completed == 2
+    assert progress_updates[-1].frames_processed == 8
+    assert progress_updates[-1].frames_processed_by_file == {
+        video_paths[0]: 3,
+        video_paths[1]: 5,
+    }
+
+
+def test_process_video_files_when_pipeline_fails_for_one_of_files(
+    empty_local_dir: str,
+) -> None:
+    # given
+    video_paths = _create_videos(directory=empty_local_dir, names=["a.mp4", "b.mp4"])
+    sinks = []
+
+    def pipeline_factory(video_reference: str, on_prediction: Callable):
+        if video_reference.endswith("a.mp4"):
+            raise RuntimeError("Could not decode")
+        return FakePipeline(
+            video_reference=video_reference, on_prediction=on_prediction, frames=2
+        )
+
+    def sink_factory(video_path: str) -> RecordingSink:
+        sinks.append(RecordingSink(video_path=video_path))
+        return sinks[-1]
+
+    # when
+    report = process_video_files(
+        video_files=empty_local_dir,
+        pipeline_factory=pipeline_factory,
+        sink_factory=sink_factory,
+        workers=1,
+    )
+
+    # then
+    assert [r.video_path for r in report.failed] == [video_paths[0]]
+    assert report.failed[0].error == "RuntimeError: Could not decode"
+    assert report.results[1].frames_processed == 2
+    assert all(sink.released for sink in sinks), "Expected sinks to be released"
@@ -1,10 +1,12 @@
 import json
+import os.path
 from datetime import datetime
 from functools import partial
 from typing import List, Union
 from unittest.mock import MagicMock
 
 import numpy as np
+import pytest
 
 from inference.core.entities.responses.inference import (
     InferenceResponseImage,
@@ -16,6 +18,7 @@ from inference.core.interfaces.stream.sinks import (
     ImageWithSourceID,
     InMemoryBufferSink,
     UDPSink,
+    VideoFileSink,
     active_learning_sink,
     multi_sink,
     render_boxes,
@@ -463,3 +466,33 @@ def test_in_memory_buffer_sink_for_batch_input() -> None:
         None,
     ], "Expected to be third dict wrapped in list (first to be lost by queue size)"
     assert empty_status is True, "Expected buffer to be purged during test"
+
+
+def test_video_file_sink_release_writes_pending_frames_and_stops_writer(
+    empty_local_dir: str,
+) -> None:
+    # given
+    video_file_name = os.path.join(empty_local_dir, "video.avi")
+    sink = VideoFileSink.init(
+        video_file_name=video_file_name,
+        video_frame_size=(64, 48),
+        quiet=True,
+    )
+    for frame_id in range(1, 4):
+        sink.on_prediction(
+            {"predictions": []},
+            VideoFrame(
+                image=np.zeros((48, 64, 3), dtype=np.uint8),
+                frame_id=frame_id,
+                frame_timestamp=datetime.now(),
+            ),
+        )
+
+    # when
+    sink.release()
+
+    # then
+    assert os.path.isfile(video_file_name)
+    assert sink._background_writer.describe().completed_tasks == 3
+    with pytest.raises(RuntimeError):
+        sink.on_prediction({"predictions": []}, None)
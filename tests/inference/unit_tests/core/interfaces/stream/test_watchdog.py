@@ -4,7 +4,12 @@ from unittest.mock import MagicMock
 
 import numpy as np
 
-from inference.core.interfaces.camera.entities import VideoFrame
+from inference.core.interfaces.camera.entities import UpdateSeverity, VideoFrame
+from inference.core.interfaces.camera.status_updates import (
+    EVENTS_COUNT_KEY,
+    dispatch_status_update,
+    flush_status_update_subscriptions,
+)
 from inference.core.interfaces.stream.entities import (
     LatencyMonitorReport,
     ModelActivityEvent,
@@ -293,3 +298,27 @@ def test_base_watchdog_gives_correct_report_when_all_events_are_in_series_relate
     assert (
         result.sources_metadata[0] == "METADATA"
     ), "Metadata must match mocked video source response"
+
+
+def test_base_watchdog_reports_counters_of_dropped_frames() -> None:
+    # given
+    watchdog = BasePipelineWatchDog()
+    status_update_handlers = [watchdog.get_status_updates_subscription()]
+
+    # when
+    for event_type in ["FRAME_DROPPED", "FRAME_CAPTURED", "FRAME_DROPPED"]:
+        dispatch_status_update(
+            severity=UpdateSeverity.DEBUG,
+            event_type=event_type,
+            context="video_source",
+            status_update_handlers=status_update_handlers,
+        )
+    flush_status_update_subscriptions(status_update_handlers=status_update_handlers)
+    result = watchdog.get_report()
+
+    # then
+    assert [u.event_type for u in result.video_source_status_updates] == [
+        "FRAME_DROPPED"
+    ], "Expected only aggregated frame drops to be reported"
+    assert result.video_source_status_updates[0].severity is UpdateSeverity.INFO
+    assert result.video_source_status_updates[0].payload[EVENTS_COUNT_KEY] == 2
@@ -5,6 +5,7 @@ import pytest
 from inference.core.exceptions import InferenceModelNotFound
 from inference.core.managers.base import ModelManager
 from inference.core.managers.entities import ModelDescription
+from inference.core.models.types import ModelMemoryUsage, QuantizationReport
 
 
 def test_add_model_when_model_already_loaded() -> None:
@@ -384,3 +385,64 @@ def test_model_manager_describe_models() -> None:
             input_height=480,
         ),
     ]
+
+
+def test_model_manager_describe_models_when_memory_usage_is_reported() -> None:
+    # given
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+    model = MagicMock()
+    model.task_type = "object-detection"
+    model.batch_size = 1
+    model.img_size_w = 640
+    model.img_size_h = 640
+    model.memory_usage = ModelMemoryUsage(shared_bytes=1024, private_bytes=2048)
+    model_manager._models = {"some/1": model}
+
+    # when
+    result = model_manager.describe_models()
+
+    # then
+    assert result == [
+        ModelDescription(
+            model_id="some/1",
+            task_type="object-detection",
+            batch_size=1,
+            input_width=640,
+            input_height=640,
+            shared_memory_bytes=1024,
+            private_memory_bytes=2048,
+        ),
+    ]
+
+
+def test_model_manager_describe_models_when_model_is_quantized() -> None:
+    # given
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+    model = MagicMock()
+    model.task_type = "object-detection"
+    model.batch_size = 1
+    model.img_size_w = 640
+    model.img_size_h = 640
+    model.memory_usage = None
+    model.weights_variant = "dynamic-int8"
+    model.quantization_report = QuantizationReport(
+        mode="dynamic",
+        weights_file="weights.dynamic.int8.onnx",
+        calibration_samples=32,
+        output_drift=0.01,
+        max_output_drift=0.05,
+        reference_latency=0.03,
+        quantized_latency=0.02,
+        accepted=True,
+    )
+    model_manager._models = {"some/1": model}
+
+    # when
+    result = model_manager.describe_models()
+
+    # then
+    assert len(result) == 1
+    assert result[0].weights_variant == "dynamic-int8"
+    assert abs(result[0].quantization_speedup - 1.5) < 1e-6
@@ -0,0 +1,274 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Lock
+from typing import List, Optional, Union
+
+import numpy as np
+import pytest
+
+from inference.core.entities.requests.inference import (
+    ClassificationInferenceRequest,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+    ObjectDetectionPrediction,
+)
+from inference.core.managers.coalescing import (
+    ModelCallsCoalescingGroup,
+    coalescing_group_participation,
+    get_active_coalescing_group,
+)
+
+
+class FakeModel:
+    """Detects class `a` with confidence 0.4 and class `b` with 0.8 on each image."""
+
+    def __init__(self, barrier: Optional[Barrier] = None):
+        self.requests = []
+        self._lock = Lock()
+        self._barrier = barrier
+
+    def infer_from_request(
+        self, request: ObjectDetectionInferenceRequest
+    ) -> Union[
+        ObjectDetectionInferenceResponse, List[ObjectDetectionInferenceResponse]
+    ]:
+        with self._lock:
+            self.requests.append(request)
+        if self._barrier is not None:
+            self._barrier.wait(timeout=2.0)
+        images = request.image if isinstance(request.image, list) else [request.image]
+        responses = [
+            ObjectDetectionInferenceResponse(
+                predictions=[
+                    ObjectDetectionPrediction(
+                        **{
+                            "x": 5,
+                            "y": 5,
+                            "width": 2,
+                            "height": 2,
+                            "confidence": confidence,
+                            "class": class_name,
+                            "class_id": class_id,
+                        }
+                    )
+                    for class_id, (class_name, confidence) in enumerate(
+                        [("a", 0.4), ("b", 0.8)]
+                    )
+                    if confidence >= request.confidence
+                    and (not request.class_filter or class_name in request.class_filter)
+                ],
+                image=InferenceResponseImage(
+                    width=image.value.shape[1], height=image.value.shape[0]
+                ),
+                inference_id=request.id,
+            )
+            for image in images
+        ]
+        if not isinstance(request.image, list):
+            return responses[0]
+        return responses
+
+
+def _request(
+    images: list,
+    confidence: float = 0.3,
+    class_filter: Optional[List[str]] = None,
+    iou_threshold: float = 0.5,
+) -> ObjectDetectionInferenceRequest:
+    return ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        image=[{"type": "numpy_object", "value": image} for image in images],
+        confidence=confidence,
+        class_filter=class_filter,
+        iou_threshold=iou_threshold,
+    )
+
+
+def _run_participants(
+    group: ModelCallsCoalescingGroup,
+    model: FakeModel,
+    requests: List[ObjectDetectionInferenceRequest],
+) -> list:
+    def participate(request: ObjectDetectionInferenceRequest):
+        with coalescing_group_participation(group=group):
+            return get_active_coalescing_group().infer(
+                model_id="some/1",
+                request=request,
+                infer_from_request=model.infer_from_request,
+            )
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        return list(executor.map(participate, requests))
+
+
+def test_coalescing_group_merges_matching_calls_into_single_batch() -> None:
+    # given
+    model = FakeModel()
+    group = ModelCallsCoalescingGroup(participants=2, max_wait=5.0)
+    shared_image = np.zeros((10, 20, 3), dtype=np.uint8)
+    first_request = _request(images=[shared_image, np.zeros((30, 40, 3))])
+    second_request = _request(images=[np.zeros((50, 60, 3)), shared_image])
+
+    # when
+    results = _run_participants(
+        group=group, model=model, requests=[first_request, second_request]
+    )
+
+    # then
+    assert len(model.requests) == 1, "Expected single batched model call"
+    assert len(model.requests[0].image) == 3, "Expected shared image to be deduplicated"
+    assert [(r.image.width, r.image.height) for r in results[0]] == [
+        (20, 10),
+        (40, 30),
+    ]
+    assert [(r.image.width, r.image.height) for r in results[1]] == [
+        (60, 50),
+        (20, 10),
+    ]
+    assert all(r.inference_id == first_request.id for r in results[0])
+    assert all(r.inference_id == second_request.id for r in results[1])
+
+
+def test_coalescing_group_merges_calls_with_different_postprocessing_filters() -> None:
+    # given
+    model = FakeModel()
+    group = ModelCallsCoalescingGroup(participants=3, max_wait=5.0)
+    requests = [
+        _request(images=[np.zeros((10, 20, 3))], confidence=0.3),
+        _request(images=[np.zeros((10, 20, 3))], confidence=0.7),
+        _request(images=[np.zeros((10, 20, 3))], confidence=0.3, class_filter=["a"]),
+    ]
+
+    # when
+    results = _run_participants(group=group, model=model, requests=requests)
+
+    # then
+    assert len(model.requests) == 1, "Expected single batched model call"
+    assert model.requests[0].confidence == 0.3
+    assert model.requests[0].class_filter is None
+    assert [[p.class_name for p in result[0].predictions] for result in results] == [
+        ["a", "b"],
+        ["b"],
+        ["a"],
+    ], "Expected filters of each call to be applied to its results"
+
+
+def test_coalescing_group_runs_not_matching_calls_concurrently() -> None:
+    # given
+    model = FakeModel(barrier=Barrier(2))
+    group = ModelCallsCoalescingGroup(participants=2, max_wait=5.0)
+    requests = [
+        _request(images=[np.zeros((10, 20, 3))], iou_threshold=0.3),
+        _request(images=[np.zeros((10, 20, 3))], iou_threshold=0.7),
+    ]
+
+    # when
+    results = _run_participants(group=group, model=model, requests=requests)
+
+    # then
+    assert sorted(r.iou_threshold for r in model.requests) == [0.3, 0.7]
+    assert len(results[0]) == 1 and len(results[1]) == 1
+
+
+def test_coalescing_group_when_other_participant_leaves_without_calling_model() -> None:
+    # given
+    model = FakeModel()
+    group = ModelCallsCoalescingGroup(participants=2, max_wait=5.0)
+    request = _request(images=[np.zeros((10, 20, 3))])
+
+    def participate_without_model_call() -> None:
+        with coalescing_group_participation(group=group):
+            pass
+
+    # when
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future = executor.submit(
+            group.infer,
+            model_id="some/1",
+            request=request,
+            infer_from_request=model.infer_from_request,
+        )
+        executor.submit(participate_without_model_call).result()
+        result = future.result(timeout=2.0)
+
+    # then
+    assert len(model.requests) == 1
+    assert len(result) == 1
+
+
+def test_coalescing_group_executes_call_alone_when_other_participant_is_late() -> None:
+    # given
+    model = FakeModel()
+    group = ModelCallsCoalescingGroup(participants=2, max_wait=0.05)
+    request = _request(images=[np.zeros((10, 20, 3))])
+
+    # when
+    result = group.infer(
+        model_id="some/1",
+        request=request,
+        infer_from_request=model.infer_from_request,
+    )
+
+    # then
+    assert len(model.requests) == 1
+    assert result[0].inference_id == request.id
+
+
+def test_coalescing_group_propagates_model_errors_to_all_participants() -> None:
+    # given
+    group = ModelCallsCoalescingGroup(participants=2, max_wait=5.0)
+
+    def failing_inference(request: ObjectDetectionInferenceRequest) -> None:
+        raise RuntimeError("some error")
+
+    def participate(request: ObjectDetectionInferenceRequest) -> None:
+        with coalescing_group_participation(group=group):
+            group.infer(
+                model_id="some/1",
+                request=request,
+                infer_from_request=failing_inference,
+            )
+
+    # when
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(participate, _request(images=[np.zeros((10, 20, 3))]))
+            for _ in range(2)
+        ]
+
+    # then
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result()
+
+
+def test_coalescing_group_participation_when_no_group_given() -> None:
+    # when
+    with coalescing_group_participation(group=None):
+        active_group = get_active_coalescing_group()
+
+    # then
+    assert active_group is None
+
+
+def test_coalescing_group_passes_through_requests_with_visualisation() -> None:
+    # given
+    group = ModelCallsCoalescingGroup(participants=2, max_wait=5.0)
+    request = ClassificationInferenceRequest(
+        model_id="some/1",
+        image={"type": "numpy_object", "value": np.zeros((10, 20, 3))},
+        visualize_predictions=True,
+    )
+    calls = []
+
+    # when
+    group.infer(
+        model_id="some/1",
+        request=request,
+        infer_from_request=lambda r: calls.append(r),
+    )
+
+    # then
+    assert calls == [request], "Expected visualisation requests to bypass coalescing"
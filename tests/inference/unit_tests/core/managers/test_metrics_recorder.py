@@ -0,0 +1,182 @@
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from inference.core.cache.memory import MemoryCache
+from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
+from inference.core.entities.requests.inference import (
+    InferenceRequestImage,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+)
+from inference.core.managers import metrics_recorder
+from inference.core.managers.metrics_recorder import InferenceMetricsRecorder
+
+
+def _build_request(model_id: str = "some/1") -> ObjectDetectionInferenceRequest:
+    return ObjectDetectionInferenceRequest(
+        model_id=model_id,
+        api_key="my-key",
+        image=InferenceRequestImage(type="numpy", value=np.zeros((2, 2, 3))),
+    )
+
+
+def _build_response() -> ObjectDetectionInferenceResponse:
+    return ObjectDetectionInferenceResponse(
+        predictions=[],
+        image=InferenceResponseImage(width=2, height=2),
+        time=0.25,
+    )
+
+
+def test_recorder_in_write_behind_mode_saves_records_in_batches() -> None:
+    # given
+    cache = MemoryCache()
+    recorder = InferenceMetricsRecorder(
+        cache=cache, write_behind=True, flush_interval=60.0, flush_batch_size=100
+    )
+    request = _build_request()
+
+    # when
+    recorder.record_inference(
+        model_id="some/1", request=request, response=_build_response(), finish_time=1.0
+    )
+    recorder.record_inference(
+        model_id="some/1", request=request, response=_build_response(), finish_time=2.0
+    )
+    recorder.record_error(
+        model_id="some/1", request=request, error=ValueError("e"), finish_time=3.0
+    )
+    pending_before_flush = recorder.describe().pending_records
+    flushed = recorder.flush(timeout=5.0)
+
+    # then
+    assert pending_before_flush == 3, "Expected records not to be saved before flush"
+    assert flushed is True
+    assert recorder.describe().flushed_records == 3
+    assert cache.zrangebyscore("models", withscores=True) == [
+        (f"{GLOBAL_INFERENCE_SERVER_ID}:my-key:some/1", 3.0)
+    ], "Expected usage of model to be deduplicated within batch"
+    inferences = cache.zrangebyscore(
+        f"inference:{GLOBAL_INFERENCE_SERVER_ID}:some/1", withscores=True
+    )
+    assert [score for _, score in inferences] == [1.0, 2.0]
+    assert inferences[0][0]["request"]["model_id"] == "some/1"
+    errors = cache.zrangebyscore(f"error:{GLOBAL_INFERENCE_SERVER_ID}:some/1")
+    assert errors[0]["error"] == "e"
+    assert isinstance(request.image.value, np.ndarray), "Expected request untouched"
+
+
+def test_recorder_drops_oldest_records_when_buffer_is_full() -> None:
+    # given
+    cache = MemoryCache()
+    recorder = InferenceMetricsRecorder(
+        cache=cache,
+        write_behind=True,
+        max_pending_records=2,
+        flush_interval=60.0,
+        flush_batch_size=100,
+    )
+
+    # when
+    for i in range(5):
+        recorder.record_inference(
+            model_id="some/1",
+            request=_build_request(),
+            response=_build_response(),
+            finish_time=float(i),
+        )
+    recorder.flush(timeout=5.0)
+
+    # then
+    report = recorder.describe()
+    assert report.recorded_records == 5
+    assert report.dropped_records == 3
+    assert report.flushed_records == 2
+    inferences = cache.zrangebyscore(
+        f"inference:{GLOBAL_INFERENCE_SERVER_ID}:some/1", withscores=True
+    )
+    assert [score for _, score in inferences] == [3.0, 4.0]
+
+
+def test_recorder_counts_failed_records_when_cache_write_fails() -> None:
+    # given
+    cache = MagicMock()
+    cache.zadd_many.side_effect = ConnectionError()
+    recorder = InferenceMetricsRecorder(
+        cache=cache, write_behind=True, flush_interval=60.0, flush_batch_size=100
+    )
+
+    # when
+    recorder.record_inference(
+        model_id="some/1", request=_build_request(), response=_build_response()
+    )
+    recorder.flush(timeout=5.0)
+
+    # then
+    assert recorder.describe().failed_records == 1
+
+
+def test_recorder_without_write_behind_saves_records_immediately() -> None:
+    # given
+    cache = MagicMock()
+    recorder = InferenceMetricsRecorder(cache=cache, write_behind=False)
+
+    # when
+    recorder.record_inference(
+        model_id="some/1",
+        request=_build_request(),
+        response=_build_response(),
+        finish_time=1.0,
+    )
+
+    # then
+    items = cache.zadd_many.call_args[1]["items"]
+    assert [(key, score) for key, _, score, _ in items] == [
+        ("models", 1.0),
+        (f"inference:{GLOBAL_INFERENCE_SERVER_ID}:some/1", 1.0),
+    ]
+
+
+@mock.patch.object(metrics_recorder, "TINY_CACHE", True)
+def test_recorder_does_not_keep_images_of_pending_records() -> None:
+    # given
+    recorder = InferenceMetricsRecorder(
+        cache=MemoryCache(), write_behind=True, flush_interval=60.0
+    )
+    request = _build_request()
+
+    # when
+    recorder.record_inference(
+        model_id="some/1", request=request, response=_build_response()
+    )
+    recorder.record_error(model_id="some/1", request=request, error=ValueError("e"))
+
+    # then
+    pending_records = list(recorder._pending_records)
+    assert all(record.request.image is None for record in pending_records)
+    assert all(record.request.api_key == "my-key" for record in pending_records)
+    assert isinstance(request.image.value, np.ndarray), "Expected request untouched"
+
+
+@mock.patch.object(metrics_recorder, "TINY_CACHE", False)
+def test_recorder_keeps_serialised_image_when_full_requests_are_cached() -> None:
+    # given
+    recorder = InferenceMetricsRecorder(
+        cache=MemoryCache(), write_behind=True, flush_interval=60.0
+    )
+    request = _build_request()
+
+    # when
+    recorder.record_inference(
+        model_id="some/1", request=request, response=_build_response()
+    )
+
+    # then
+    record = recorder._pending_records[0]
+    assert record.request.image.value == str(request.image.value)
+    assert isinstance(request.image.value, np.ndarray), "Expected request untouched"
@@ -3,6 +3,7 @@ from typing import Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from inference.core.exceptions import ModelArtefactError
@@ -13,6 +14,7 @@ from inference.core.models.roboflow import (
     get_class_names_from_environment_file,
     get_color_mapping_from_environment,
     is_model_artefacts_bucket_available,
+    pack_images_into_batch,
 )
 
 
@@ -194,3 +196,26 @@ def test_get_class_names_from_environment_file() -> None:
         "class_k",
         "class_l",
     ]
+
+
+def test_pack_images_into_batch() -> None:
+    # given
+    images = [
+        np.full((4, 6, 3), fill_value=index, dtype=np.uint8) for index in range(3)
+    ]
+    images[1][0, 0] = [10, 20, 30]
+
+    # when
+    result = pack_images_into_batch(images=images)
+
+    # then
+    expected = np.concatenate(
+        [
+            np.expand_dims(np.transpose(image, (2, 0, 1)).astype(np.float32), axis=0)
+            for image in images
+        ],
+        axis=0,
+    )
+    assert result.dtype == np.float32
+    assert result.shape == (3, 3, 4, 6)
+    assert np.array_equal(result, expected)
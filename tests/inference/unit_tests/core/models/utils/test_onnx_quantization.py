@@ -0,0 +1,227 @@
+import os
+import sys
+import time
+from typing import List
+from unittest import mock
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from inference.core.exceptions import ModelArtefactError
+from inference.core.models.types import QuantizationReport
+from inference.core.models.utils import onnx_quantization
+from inference.core.models.utils.onnx_quantization import (
+    calibrate_and_quantize,
+    load_calibration_images,
+    load_quantization_report,
+    measure_output_drift,
+    quantize_onnx_model,
+    runs_on_cpu_only,
+    save_quantization_report,
+)
+
+
+class FakeSession:
+    def __init__(self, outputs: List[np.ndarray], latency: float = 0.0):
+        self._outputs = outputs
+        self._latency = latency
+
+    def run(self, output_names, input_feed) -> List[np.ndarray]:
+        time.sleep(self._latency)
+        return self._outputs
+
+
+def test_runs_on_cpu_only_when_only_cpu_providers_available() -> None:
+    # when
+    result = runs_on_cpu_only(
+        providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+        available_providers=["CPUExecutionProvider"],
+    )
+
+    # then
+    assert result is True
+
+
+def test_runs_on_cpu_only_when_gpu_provider_available() -> None:
+    # when
+    result = runs_on_cpu_only(
+        providers=[
+            ("TensorrtExecutionProvider", {}),
+            "CUDAExecutionProvider",
+            "CPUExecutionProvider",
+        ],
+        available_providers=["CUDAExecutionProvider", "CPUExecutionProvider"],
+    )
+
+    # then
+    assert result is False
+
+
+def test_quantize_onnx_model_when_onnx_is_not_installed(empty_local_dir: str) -> None:
+    # when
+    with mock.patch.dict(sys.modules, {"onnxruntime.quantization": None}):
+        with pytest.raises(ModelArtefactError):
+            quantize_onnx_model(
+                source_path=os.path.join(empty_local_dir, "weights.onnx"),
+                target_path=os.path.join(empty_local_dir, "weights.int8.onnx"),
+                mode="dynamic",
+                calibration_inputs=[],
+            )
+
+
+def test_measure_output_drift() -> None:
+    # given
+    reference_session = FakeSession(outputs=[np.array([3.0, 4.0]), np.ones((2, 2))])
+    candidate_session = FakeSession(outputs=[np.array([3.0, 4.5]), np.ones((2, 2))])
+
+    # when
+    result = measure_output_drift(
+        reference_session=reference_session,
+        candidate_session=candidate_session,
+        inputs=[{"images": np.zeros((1,))}, {"images": np.zeros((1,))}],
+    )
+
+    # then
+    assert (
+        abs(result - 0.05) < 1e-6
+    ), "Mean of 0.5 / 5 for first output and 0 for second"
+
+
+@mock.patch.object(onnx_quantization, "quantize_onnx_model")
+def test_calibrate_and_quantize_when_quantized_variant_is_accurate_and_faster(
+    quantize_onnx_model_mock: MagicMock,
+) -> None:
+    # given
+    sessions = {
+        "weights.onnx": FakeSession(outputs=[np.array([100.0])], latency=0.01),
+        "weights.dynamic.int8.onnx": FakeSession(outputs=[np.array([101.0])]),
+    }
+    calibration_inputs = [{"images": np.zeros((1,))}] * 3
+
+    # when
+    result = calibrate_and_quantize(
+        weights_path="weights.onnx",
+        quantized_weights_path="weights.dynamic.int8.onnx",
+        mode="dynamic",
+        calibration_inputs=calibration_inputs,
+        max_output_drift=0.05,
+        create_session=lambda path: sessions[path],
+    )
+
+    # then
+    quantize_onnx_model_mock.assert_called_once_with(
+        source_path="weights.onnx",
+        target_path="weights.dynamic.int8.onnx",
+        mode="dynamic",
+        calibration_inputs=calibration_inputs,
+    )
+    assert result.accepted is True
+    assert result.weights_file == "weights.dynamic.int8.onnx"
+    assert result.calibration_samples == 3
+    assert abs(result.output_drift - 0.01) < 1e-6
+    assert result.speedup > 1.0
+
+
+@mock.patch.object(onnx_quantization, "quantize_onnx_model")
+def test_calibrate_and_quantize_when_quantized_variant_drifts_too_much(
+    quantize_onnx_model_mock: MagicMock,
+) -> None:
+    # given
+    sessions = {
+        "weights.onnx": FakeSession(outputs=[np.array([100.0])], latency=0.01),
+        "weights.static.int8.onnx": FakeSession(outputs=[np.array([120.0])]),
+    }
+
+    # when
+    result = calibrate_and_quantize(
+        weights_path="weights.onnx",
+        quantized_weights_path="weights.static.int8.onnx",
+        mode="static",
+        calibration_inputs=[{"images": np.zeros((1,))}] * 3,
+        max_output_drift=0.05,
+        create_session=lambda path: sessions[path],
+    )
+
+    # then
+    assert result.accepted is False
+    assert abs(result.output_drift - 0.2) < 1e-6
+
+
+@mock.patch.object(onnx_quantization, "quantize_onnx_model")
+def test_calibrate_and_quantize_when_quantized_variant_is_not_faster(
+    quantize_onnx_model_mock: MagicMock,
+) -> None:
+    # given
+    sessions = {
+        "weights.onnx": FakeSession(outputs=[np.array([100.0])]),
+        "weights.static.int8.onnx": FakeSession(
+            outputs=[np.array([100.0])], latency=0.01
+        ),
+    }
+
+    # when
+    result = calibrate_and_quantize(
+        weights_path="weights.onnx",
+        quantized_weights_path="weights.static.int8.onnx",
+        mode="static",
+        calibration_inputs=[{"images": np.zeros((1,))}] * 3,
+        max_output_drift=0.05,
+        create_session=lambda path: sessions[path],
+    )
+
+    # then
+    assert result.accepted is False
+    assert result.speedup < 1.0
+
+
+def test_save_and_load_quantization_report(empty_local_dir: str) -> None:
+    # given
+    path = os.path.join(empty_local_dir, "quantization.json")
+    report = QuantizationReport(
+        mode="dynamic",
+        weights_file="weights.dynamic.int8.onnx",
+        calibration_samples=32,
+        output_drift=0.01,
+        max_output_drift=0.05,
+        reference_latency=0.04,
+        quantized_latency=0.02,
+        accepted=True,
+    )
+
+    # when
+    save_quantization_report(path=path, report=report)
+    result = load_quantization_report(path=path)
+
+    # then
+    assert result == report
+    assert result.speedup == 2.0
+
+
+def test_load_quantization_report_when_file_does_not_exist(
+    empty_local_dir: str,
+) -> None:
+    # when
+    result = load_quantization_report(
+        path=os.path.join(empty_local_dir, "quantization.json")
+    )
+
+    # then
+    assert result is None
+
+
+def test_load_calibration_images(empty_local_dir: str) -> None:
+    # given
+    for i in range(3):
+        image = np.full((8, 8, 3), i, dtype=np.uint8)
+        cv2.imwrite(os.path.join(empty_local_dir, f"image_{i}.png"), image)
+        os.utime(os.path.join(empty_local_dir, f"image_{i}.png"), (i, i))
+    with open(os.path.join(empty_local_dir, "predictions.jsonl"), "w") as f:
+        f.write("{}")
+
+    # when
+    result = load_calibration_images(directory=empty_local_dir, max_images=2)
+
+    # then
+    assert [image[0, 0, 0] for image in result] == [2, 1], "Most recent images first"
@@ -0,0 +1,206 @@
+import json
+import os
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import onnxruntime
+import pytest
+
+from inference.core.exceptions import InvalidEnvironmentVariableError
+from inference.core.models.utils.onnx_session import (
+    OnnxSessionProfile,
+    SessionProfileBenchmarkResult,
+    apply_session_profile,
+    benchmark_session_profiles,
+    get_session_profiles,
+    load_session_profile,
+    resolve_session_profile,
+    save_session_profile,
+)
+
+
+def test_get_session_profiles() -> None:
+    # when
+    result = {profile.name: profile for profile in get_session_profiles(cpu_count=16)}
+
+    # then
+    assert set(result.keys()) == {"default", "latency", "throughput", "shared"}
+    assert result["default"] == OnnxSessionProfile(name="default")
+    assert result["latency"].intra_op_num_threads == 16
+    assert result["throughput"].intra_op_num_threads == 4
+    assert result["throughput"].allow_spinning is False
+    assert result["shared"].intra_op_num_threads == 1
+    assert result["shared"].enable_cpu_mem_arena is False
+
+
+def test_get_session_profiles_on_single_core_host() -> None:
+    # when
+    result = {profile.name: profile for profile in get_session_profiles(cpu_count=1)}
+
+    # then
+    assert result["latency"].intra_op_num_threads == 1
+    assert result["throughput"].intra_op_num_threads == 1
+
+
+def test_apply_session_profile() -> None:
+    # given
+    session_options = onnxruntime.SessionOptions()
+    profile = OnnxSessionProfile(
+        name="custom",
+        intra_op_num_threads=3,
+        inter_op_num_threads=2,
+        parallel_execution=True,
+        enable_cpu_mem_arena=False,
+        enable_mem_pattern=False,
+        allow_spinning=False,
+    )
+
+    # when
+    apply_session_profile(session_options=session_options, profile=profile)
+
+    # then
+    assert session_options.intra_op_num_threads == 3
+    assert session_options.inter_op_num_threads == 2
+    assert session_options.execution_mode == onnxruntime.ExecutionMode.ORT_PARALLEL
+    assert session_options.enable_cpu_mem_arena is False
+    assert session_options.enable_mem_pattern is False
+    assert (
+        session_options.get_session_config_entry("session.intra_op.allow_spinning")
+        == "0"
+    )
+
+
+def test_apply_session_profile_when_default_profile_given() -> None:
+    # given
+    session_options = onnxruntime.SessionOptions()
+
+    # when
+    apply_session_profile(
+        session_options=session_options, profile=OnnxSessionProfile(name="default")
+    )
+
+    # then
+    assert session_options.intra_op_num_threads == 0
+    assert session_options.inter_op_num_threads == 0
+    assert session_options.execution_mode == onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+
+
+def test_resolve_session_profile_when_predefined_profile_requested(
+    empty_local_dir: str,
+) -> None:
+    # when
+    result = resolve_session_profile(
+        profile_name="Shared",
+        tuned_profile_path=os.path.join(empty_local_dir, "session_profile.json"),
+    )
+
+    # then
+    assert result.name == "shared"
+
+
+def test_resolve_session_profile_when_unknown_profile_requested(
+    empty_local_dir: str,
+) -> None:
+    # when
+    with pytest.raises(InvalidEnvironmentVariableError):
+        _ = resolve_session_profile(
+            profile_name="unknown",
+            tuned_profile_path=os.path.join(empty_local_dir, "session_profile.json"),
+        )
+
+
+def test_resolve_session_profile_when_auto_requested_and_model_not_tuned(
+    empty_local_dir: str,
+) -> None:
+    # when
+    result = resolve_session_profile(
+        profile_name="auto",
+        tuned_profile_path=os.path.join(empty_local_dir, "session_profile.json"),
+    )
+
+    # then
+    assert result == OnnxSessionProfile(name="default")
+
+
+def test_resolve_session_profile_when_auto_requested_and_model_tuned(
+    empty_local_dir: str,
+) -> None:
+    # given
+    path = os.path.join(empty_local_dir, "session_profile.json")
+    profile = OnnxSessionProfile(name="throughput", intra_op_num_threads=2)
+    save_session_profile(
+        path=path,
+        profile=profile,
+        results=[
+            SessionProfileBenchmarkResult(
+                profile=profile, average_latency=0.01, throughput=100.0
+            )
+        ],
+    )
+
+    # when
+    result = resolve_session_profile(profile_name="auto", tuned_profile_path=path)
+
+    # then
+    assert result == profile
+
+
+def test_load_session_profile_when_tuned_on_different_host(
+    empty_local_dir: str,
+) -> None:
+    # given
+    path = os.path.join(empty_local_dir, "session_profile.json")
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "cpu_count": (os.cpu_count() or 1) + 1,
+                "profile": {"name": "latency", "intra_op_num_threads": 1},
+                "results": [],
+            },
+            f,
+        )
+
+    # when
+    result = load_session_profile(path=path)
+
+    # then
+    assert result is None
+
+
+def test_load_session_profile_when_file_is_malformed(empty_local_dir: str) -> None:
+    # given
+    path = os.path.join(empty_local_dir, "session_profile.json")
+    with open(path, "w") as f:
+        f.write("not a json")
+
+    # when
+    result = load_session_profile(path=path)
+
+    # then
+    assert result is None
+
+
+def test_benchmark_session_profiles() -> None:
+    # given
+    profiles = [OnnxSessionProfile(name="slow"), OnnxSessionProfile(name="fast")]
+    sessions = {"slow": MagicMock(), "fast": MagicMock()}
+    sessions["slow"].run.side_effect = lambda *_: time.sleep(0.01)
+    input_feed = {"images": np.zeros((1, 3, 8, 8), dtype=np.float32)}
+
+    # when
+    result = benchmark_session_profiles(
+        create_session=lambda profile: sessions[profile.name],
+        input_feed=input_feed,
+        profiles=profiles,
+        warm_up_runs=1,
+        benchmark_runs=4,
+        concurrency=2,
+    )
+
+    # then
+    assert [r.profile.name for r in result] == ["fast", "slow"]
+    assert sessions["slow"].run.call_count == 5
+    assert sessions["fast"].run.call_count == 5
+    assert result[1].average_latency >= 0.01
+    sessions["fast"].run.assert_called_with(None, input_feed)
@@ -0,0 +1,188 @@
+import os
+
+import numpy as np
+import onnxruntime
+
+from inference.core.models.utils.onnx_weights import (
+    SHARED_WEIGHTS_FILE_SUFFIX,
+    MemoryMappedWeights,
+    ensure_shared_weights_file,
+    find_onnx_initializers,
+)
+
+
+def _varint(value: int) -> bytes:
+    result = b""
+    while True:
+        byte, value = value & 0x7F, value >> 7
+        if not value:
+            return result + bytes([byte])
+        result += bytes([byte | 0x80])
+
+
+def _field(number: int, data: bytes) -> bytes:
+    return _varint((number << 3) | 2) + _varint(len(data)) + data
+
+
+def _int_field(number: int, value: int) -> bytes:
+    return _varint(number << 3) + _varint(value)
+
+
+def _string_field(number: int, value: str) -> bytes:
+    return _field(number, value.encode("utf-8"))
+
+
+def _value_info(name: str, dims: list) -> bytes:
+    shape = b"".join(
+        _field(1, _int_field(1, d) if isinstance(d, int) else _string_field(2, d))
+        for d in dims
+    )
+    tensor_type = _field(1, _int_field(1, 1) + _field(2, shape))
+    return _string_field(1, name) + _field(2, tensor_type)
+
+
+def _create_matmul_model(weights: np.ndarray, bias: np.ndarray) -> bytes:
+    # serialised ModelProto of y = x @ weights + bias, encoded by hand, not to depend on `onnx`
+    initializers = b""
+    for name, value in [("weights", weights), ("bias", bias)]:
+        tensor = (
+            b"".join(_int_field(1, d) for d in value.shape)
+            + _int_field(2, 1)
+            + _string_field(8, name)
+            + _field(9, value.astype(np.float32).tobytes())
+        )
+        initializers += _field(5, tensor)
+    nodes = _field(
+        1,
+        _string_field(1, "x")
+        + _string_field(1, "weights")
+        + _string_field(2, "product")
+        + _string_field(4, "MatMul"),
+    ) + _field(
+        1,
+        _string_field(1, "product")
+        + _string_field(1, "bias")
+        + _string_field(2, "y")
+        + _string_field(4, "Add"),
+    )
+    graph = (
+        nodes
+        + _string_field(2, "graph")
+        + initializers
+        + _field(11, _value_info("x", ["batch", weights.shape[0]]))
+        + _field(12, _value_info("y", ["batch", weights.shape[1]]))
+    )
+    opset = _string_field(1, "") + _int_field(2, 17)
+    return _int_field(1, 8) + _field(8, opset) + _field(7, graph)
+
+
+def _dump_model(path: str, weights: np.ndarray, bias: np.ndarray) -> None:
+    with open(path, "wb") as f:
+        f.write(_create_matmul_model(weights=weights, bias=bias))
+
+
+def test_find_onnx_initializers() -> None:
+    # given
+    weights = np.arange(64 * 32, dtype=np.float32).reshape((64, 32))
+    bias = np.ones((32,), dtype=np.float32)
+    model = _create_matmul_model(weights=weights, bias=bias)
+
+    # when
+    result = find_onnx_initializers(buffer=model)
+
+    # then
+    assert [(i.name, i.data_type, i.dims) for i in result] == [
+        ("weights", 1, (64, 32)),
+        ("bias", 1, (32,)),
+    ]
+    weights_data = model[result[0].offset : result[0].offset + result[0].length]
+    assert np.array_equal(
+        np.frombuffer(weights_data, dtype=np.float32).reshape((64, 32)), weights
+    )
+
+
+def test_ensure_shared_weights_file_when_file_does_not_exist(
+    empty_local_dir: str,
+) -> None:
+    # given
+    model_path = os.path.join(empty_local_dir, "weights.onnx")
+    _dump_model(
+        path=model_path,
+        weights=np.random.rand(64, 32).astype(np.float32),
+        bias=np.ones((32,), dtype=np.float32),
+    )
+
+    # when
+    result = ensure_shared_weights_file(weights_path=model_path)
+
+    # then
+    assert result == f"{model_path}{SHARED_WEIGHTS_FILE_SUFFIX}"
+    assert os.path.isfile(result)
+    assert sorted(os.listdir(empty_local_dir)) == [
+        "weights.onnx",
+        f"weights.onnx{SHARED_WEIGHTS_FILE_SUFFIX}",
+    ]
+
+
+def test_ensure_shared_weights_file_when_file_is_up_to_date(
+    empty_local_dir: str,
+) -> None:
+    # given
+    model_path = os.path.join(empty_local_dir, "weights.onnx")
+    _dump_model(
+        path=model_path,
+        weights=np.random.rand(64, 32).astype(np.float32),
+        bias=np.ones((32,), dtype=np.float32),
+    )
+    shared_weights_path = ensure_shared_weights_file(weights_path=model_path)
+    modification_time = os.stat(shared_weights_path).st_mtime_ns
+
+    # when
+    result = ensure_shared_weights_file(weights_path=model_path)
+
+    # then
+    assert result == shared_weights_path
+    assert os.stat(shared_weights_path).st_mtime_ns == modification_time
+
+
+def test_ensure_shared_weights_file_when_model_changed(empty_local_dir: str) -> None:
+    # given
+    model_path = os.path.join(empty_local_dir, "weights.onnx")
+    _dump_model(
+        path=model_path,
+        weights=np.zeros((64, 32), dtype=np.float32),
+        bias=np.ones((32,), dtype=np.float32),
+    )
+    _ = ensure_shared_weights_file(weights_path=model_path)
+    new_weights = np.ones((64, 64), dtype=np.float32)
+    _dump_model(path=model_path, weights=new_weights, bias=np.ones((64,)))
+
+    # when
+    mapped_weights = MemoryMappedWeights.load(weights_path=model_path)
+
+    # then
+    assert mapped_weights.size == new_weights.nbytes
+
+
+def test_memory_mapped_weights_registered_in_session(empty_local_dir: str) -> None:
+    # given
+    model_path = os.path.join(empty_local_dir, "weights.onnx")
+    weights = np.random.rand(64, 32).astype(np.float32)
+    bias = np.random.rand(32).astype(np.float32)
+    _dump_model(path=model_path, weights=weights, bias=bias)
+    x = np.random.rand(2, 64).astype(np.float32)
+    session_options = onnxruntime.SessionOptions()
+
+    # when
+    mapped_weights = MemoryMappedWeights.load(weights_path=model_path)
+    mapped_weights.register_in(session_options)
+    session = onnxruntime.InferenceSession(
+        model_path,
+        sess_options=session_options,
+        providers=["CPUExecutionProvider"],
+    )
+    result = session.run(None, {"x": x})[0]
+
+    # then
+    assert mapped_weights.size == weights.nbytes, "Bias is too small to be shared"
+    assert np.allclose(result, x @ weights + bias, atol=1e-5)
@@ -0,0 +1,106 @@
+import time
+from threading import Event
+from typing import List
+
+from inference.core.utils.background_writer import (
+    BackgroundWriter,
+    FullQueuePolicy,
+    close_background_writers,
+    describe_background_writers,
+)
+
+
+def test_background_writer_executes_tasks_in_order_of_submission() -> None:
+    # given
+    results: List[int] = []
+    idle_calls: List[int] = []
+    writer = BackgroundWriter(
+        name="some",
+        max_pending_tasks=4,
+        on_idle=lambda: idle_calls.append(len(results)),
+    )
+
+    # when
+    for i in range(10):
+        writer.submit(lambda i=i: results.append(i))
+    writer.flush()
+
+    # then
+    assert results == list(range(10))
+    assert idle_calls[-1] == 10, "Expected idle callback after queue got drained"
+    assert writer.describe().completed_tasks == 10
+    writer.close()
+
+
+def test_background_writer_drops_tasks_when_queue_is_full_and_drop_policy_used() -> (
+    None
+):
+    # given
+    unblock = Event()
+    writer = BackgroundWriter(
+        name="some",
+        max_pending_tasks=2,
+        full_queue_policy=FullQueuePolicy.DROP,
+    )
+    writer.submit(unblock.wait)
+    while writer.describe().pending_tasks > 0:
+        time.sleep(0.01)
+
+    # when
+    submission_results = [writer.submit(lambda: None) for _ in range(4)]
+    report = writer.describe()
+    unblock.set()
+    writer.close()
+
+    # then
+    assert submission_results == [True, True, False, False]
+    assert report.pending_tasks == 2
+    assert report.dropped_tasks == 2
+    assert report.lag > 0, "Expected lag of the blocked task to be reported"
+
+
+def test_background_writer_counts_failed_tasks() -> None:
+    # given
+    writer = BackgroundWriter(name="some")
+
+    def failing_task() -> None:
+        raise RuntimeError()
+
+    # when
+    writer.submit(failing_task)
+    writer.submit(lambda: None)
+    writer.flush()
+
+    # then
+    report = writer.describe()
+    assert report.failed_tasks == 1
+    assert report.completed_tasks == 1
+    assert report.lag == 0.0
+    writer.close()
+
+
+def test_describe_background_writers_does_not_report_closed_writers() -> None:
+    # given
+    writer = BackgroundWriter(name="closed-writer")
+    writer.submit(lambda: None)
+
+    # when
+    writer.close()
+
+    # then
+    assert all(r.name != "closed-writer" for r in describe_background_writers())
+
+
+def test_close_background_writers_completes_pending_tasks() -> None:
+    # given
+    writer = BackgroundWriter(name="exiting-writer")
+    executed = []
+    for i in range(3):
+        writer.submit(lambda i=i: (time.sleep(0.01), executed.append(i)))
+
+    # when
+    close_background_writers()
+
+    # then
+    assert executed == [0, 1, 2]
+    assert all(r.name != "exiting-writer" for r in describe_background_writers())
@@ -0,0 +1,117 @@
+import threading
+import time
+
+import pytest
+
+from inference.core.exceptions import SamplingProfilerBusyError
+from inference.core.utils.sampling_profiler import SamplingProfiler
+
+
+def _busy_loop(stop_event: threading.Event) -> None:
+    while not stop_event.is_set():
+        sum(i * i for i in range(1000))
+
+
+@pytest.fixture
+def busy_threads():
+    stop_event = threading.Event()
+    threads = [
+        threading.Thread(target=_busy_loop, args=(stop_event,), name=f"busy-{i}")
+        for i in range(2)
+    ]
+    idle_thread = threading.Thread(target=stop_event.wait, name="idle")
+    for thread in threads + [idle_thread]:
+        thread.start()
+    yield None
+    stop_event.set()
+    for thread in threads + [idle_thread]:
+        thread.join()
+
+
+def test_sampling_profiler_collects_collapsed_stacks_of_threads(busy_threads) -> None:
+    # given
+    profiler = SamplingProfiler(max_overhead=0.05)
+
+    # when
+    profiler.start(duration=0.5, frequency=100)
+    status = _wait_until_finished(profiler)
+    stacks = profiler.export_collapsed_stacks().splitlines()
+
+    # then
+    assert status.running is False
+    assert status.samples > 0
+    assert status.overhead <= 0.05
+    busy_stacks = [stack for stack in stacks if ":_busy_loop" in stack]
+    assert len(busy_stacks) > 0, "Expected stacks of busy threads to be sampled"
+    assert all(
+        stack.startswith("busy;") for stack in busy_stacks
+    ), "Expected numbers of threads to be stripped, so that their stacks are merged"
+    assert not any(
+        stack.startswith("idle;") for stack in stacks
+    ), "Expected waiting threads to be skipped"
+    assert all(int(stack.rsplit(" ", 1)[1]) > 0 for stack in stacks)
+
+
+def test_sampling_profiler_includes_idle_threads_when_requested(busy_threads) -> None:
+    # given
+    profiler = SamplingProfiler(include_idle_threads=True)
+
+    # when
+    profiler.start(duration=0.3, frequency=100)
+    _wait_until_finished(profiler)
+    stacks = profiler.export_collapsed_stacks().splitlines()
+
+    # then
+    assert any(stack.startswith("idle;") for stack in stacks)
+
+
+def test_sampling_profiler_when_session_is_already_running() -> None:
+    # given
+    profiler = SamplingProfiler()
+    profiler.start(duration=10, frequency=10)
+
+    # when
+    with pytest.raises(SamplingProfilerBusyError):
+        profiler.start(duration=10, frequency=10)
+    status = profiler.stop()
+
+    # then
+    assert status.running is False
+    assert status.elapsed < 10
+
+
+def test_sampling_profiler_when_session_is_restarted() -> None:
+    # given
+    profiler = SamplingProfiler()
+    profiler.start(duration=0.2, frequency=50)
+    _wait_until_finished(profiler)
+
+    # when
+    status = profiler.start(duration=10, frequency=50)
+    profiler.stop()
+
+    # then
+    assert status.running is True
+    assert status.samples == 0
+    assert status.duration == 10
+
+
+def test_sampling_profiler_status_before_first_session() -> None:
+    # given
+    profiler = SamplingProfiler()
+
+    # when
+    status = profiler.status()
+
+    # then
+    assert status.running is False
+    assert status.samples == 0
+    assert status.elapsed == 0.0
+    assert profiler.export_collapsed_stacks() == ""
+
+
+def _wait_until_finished(profiler: SamplingProfiler, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while profiler.running and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return profiler.status()
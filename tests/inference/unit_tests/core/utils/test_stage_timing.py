@@ -0,0 +1,86 @@
+import time
+
+from inference.core.utils.stage_timing import (
+    RequestStageTimer,
+    format_server_timing_header,
+    get_active_stage_timer,
+    measure_stage,
+    stage_timing,
+)
+
+
+def test_measure_stage_when_no_timer_is_active() -> None:
+    # when
+    with measure_stage(name="preprocess"):
+        result = get_active_stage_timer()
+
+    # then
+    assert result is None
+
+
+def test_measure_stage_excludes_nested_stages_from_enclosing_stage() -> None:
+    # given
+    timer = RequestStageTimer()
+
+    # when
+    with stage_timing(timer=timer):
+        with measure_stage(name="postprocess"):
+            time.sleep(0.01)
+            with measure_stage(name="nms"):
+                time.sleep(0.05)
+    durations = timer.durations
+
+    # then
+    assert get_active_stage_timer() is None
+    assert set(durations.keys()) == {"postprocess", "nms"}
+    assert durations["nms"] >= 0.05
+    assert 0.01 <= durations["postprocess"] < 0.05
+
+
+def test_measure_stage_accumulates_repeated_stages() -> None:
+    # given
+    timer = RequestStageTimer()
+
+    # when
+    with stage_timing(timer=timer):
+        for _ in range(3):
+            with measure_stage(name="predict"):
+                time.sleep(0.01)
+
+    # then
+    assert timer.durations["predict"] >= 0.03
+
+
+def test_record_since_mark_when_stage_was_marked() -> None:
+    # given
+    timer = RequestStageTimer()
+    timer.mark(name="queue_wait")
+    time.sleep(0.01)
+
+    # when
+    timer.record_since_mark(name="queue_wait")
+    timer.record_since_mark(name="queue_wait")
+
+    # then
+    assert 0.01 <= timer.durations["queue_wait"] < 1.0
+
+
+def test_record_since_mark_when_stage_was_not_marked() -> None:
+    # given
+    timer = RequestStageTimer()
+
+    # when
+    timer.record_since_mark(name="queue_wait")
+
+    # then
+    assert timer.durations == {}
+
+
+def test_format_server_timing_header() -> None:
+    # when
+    result = format_server_timing_header(
+        durations={"preprocess": 0.0012345, "predict": 0.5}
+    )
+
+    # then
+    assert result == "preprocess;dur=1.23, predict;dur=500.00"
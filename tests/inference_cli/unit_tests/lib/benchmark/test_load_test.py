@@ -0,0 +1,165 @@
+import random
+
+import pytest
+from aiohttp import web
+
+from inference_cli.lib.benchmark.load_test import (
+    ArrivalProcess,
+    ModelTarget,
+    _get_server_reported_service_time,
+    _PreparedTarget,
+    execute_api_load_test,
+    generate_arrival_offsets,
+    parse_model_mix,
+)
+from inference_cli.lib.benchmark.results_gathering import LatencyHistogram
+
+
+def test_latency_histogram_percentiles() -> None:
+    # given
+    histogram = LatencyHistogram()
+    values = [i / 1000 for i in range(1, 10001)]
+    random.shuffle(values)
+
+    # when
+    for value in values:
+        histogram.record(value)
+
+    # then
+    assert histogram.count == 10000
+    assert abs(histogram.get_percentile(50) - 5.0) / 5.0 < 1e-3
+    assert abs(histogram.get_percentile(99.9) - 9.99) / 9.99 < 1e-3
+    assert histogram.get_percentile(100) <= histogram.max
+    assert histogram.get_percentiles_ms(percentiles=[50])["p50"] == pytest.approx(
+        5000, rel=1e-3
+    )
+
+
+def test_latency_histogram_merge() -> None:
+    # given
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(0.01)
+    second.record(0.02)
+    second.record(0.03)
+
+    # when
+    first.merge(second)
+
+    # then
+    assert first.count == 3
+    assert first.min == 0.01 and first.max == 0.03
+    assert first.get_percentile(50) == pytest.approx(0.02, rel=1e-3)
+
+
+def test_generate_arrival_offsets_for_constant_rate() -> None:
+    # when
+    result = generate_arrival_offsets(
+        requests_per_second=10,
+        duration=1.0,
+        arrival_process=ArrivalProcess.CONSTANT,
+    )
+
+    # then
+    assert result == pytest.approx([i / 10 for i in range(10)])
+
+
+def test_generate_arrival_offsets_for_poisson_process() -> None:
+    # when
+    result = generate_arrival_offsets(
+        requests_per_second=100,
+        duration=100.0,
+        arrival_process=ArrivalProcess.POISSON,
+        random_generator=random.Random(42),
+    )
+
+    # then
+    assert 9500 < len(result) < 10500
+    assert result == sorted(result)
+
+
+def test_parse_model_mix() -> None:
+    # when
+    result = parse_model_mix(model_ids=["yolov8n-640=3", "some/1"])
+
+    # then
+    assert result == [
+        ModelTarget(model_id="yolov8n-640", weight=3.0),
+        ModelTarget(model_id="some/1", weight=1.0),
+    ]
+
+
+def test_get_server_reported_service_time_prefers_server_timing_header() -> None:
+    # when
+    result = _get_server_reported_service_time(
+        server_timing="decode;dur=2.5, total;dur=12.5",
+        content=b'{"time": 1.0}',
+    )
+
+    # then
+    assert result == pytest.approx(0.0125)
+
+
+def test_get_server_reported_service_time_when_batch_response_given() -> None:
+    # when
+    result = _get_server_reported_service_time(
+        server_timing=None,
+        content=b'[{"time": 0.01}, {"time": 0.03}]',
+    )
+
+    # then
+    assert result == pytest.approx(0.03)
+
+
+@pytest.mark.asyncio
+async def test_execute_api_load_test_against_local_server() -> None:
+    # given
+    async def handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        return web.json_response(
+            [{"time": 0.001} for _ in payload["image"]],
+            headers={"Server-Timing": "total;dur=1.0"},
+        )
+
+    app = web.Application()
+    app.router.add_post("/infer/object_detection", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    target = _PreparedTarget(
+        model_id="some/1",
+        url=f"http://127.0.0.1:{port}/infer/object_detection",
+        bodies_by_batch_size={
+            1: [b'{"image": [1]}'],
+            2: [b'{"image": [1, 2]}'],
+        },
+    )
+
+    # when
+    try:
+        report = await execute_api_load_test(
+            prepared_targets=[target],
+            weights=[1.0],
+            requests_per_second=[20, 40],
+            batch_sizes=[1, 2],
+            arrival_process=ArrivalProcess.CONSTANT,
+            stage_duration=0.5,
+            max_in_flight_requests=8,
+            request_timeout=5.0,
+        )
+    finally:
+        await runner.cleanup()
+
+    # then
+    assert len(report.stages) == 4
+    assert [s.batch_size for s in report.stages] == [1, 1, 2, 2]
+    assert [s.requests_sent for s in report.stages] == [10, 20, 10, 20]
+    assert all(s.requests_completed == s.requests_sent for s in report.stages)
+    assert all(s.error_rate == 0.0 for s in report.stages)
+    assert report.stages[0].service_time_ms["p50"] == pytest.approx(1.0, rel=1e-2)
+    assert report.stages[0].latency_ms["p99"] is not None
+    assert set(report.stages[0].latency_by_model_ms) == {"some/1"}
+    assert report.stages[2].images_per_second == pytest.approx(
+        2 * report.stages[2].requests_per_second
+    )
@@ -0,0 +1,119 @@
+import time
+
+import numpy as np
+
+from inference_cli.lib.benchmark.stages import (
+    StagesBenchmarkReport,
+    StagesBenchmarkScenarioResult,
+    StagesRecorder,
+    StageStatistics,
+    compare_with_baseline,
+    create_dummy_model,
+    instrument_model_stages,
+    run_stages_benchmark_scenario,
+)
+
+
+def test_stages_recorder_excludes_nested_stages_from_self_time() -> None:
+    # given
+    recorder = StagesRecorder()
+
+    # when
+    with recorder.measure(stage="outer"):
+        time.sleep(0.02)
+        with recorder.measure(stage="inner"):
+            time.sleep(0.05)
+
+    # then
+    assert 0.02 <= recorder.total_time["outer"] < 0.05
+    assert recorder.total_time["inner"] >= 0.05
+    assert recorder.durations["outer"].count == 1
+
+
+def test_instrument_model_stages_restores_original_functions() -> None:
+    # given
+    model = create_dummy_model(input_size=64, num_classes=3, detections=5)
+    recorder = StagesRecorder()
+
+    # when
+    with instrument_model_stages(model=model, recorder=recorder):
+        _ = model.infer(np.zeros((48, 64, 3), dtype=np.uint8))
+
+    # then
+    assert {"preprocess", "decode", "predict", "nms", "postprocess"}.issubset(
+        recorder.durations.keys()
+    )
+    assert "predict" not in vars(model), "Expected hooks to be removed from model"
+
+
+def test_run_stages_benchmark_scenario_with_dummy_model() -> None:
+    # given
+    model = create_dummy_model(input_size=64, num_classes=3, detections=5)
+    images = [np.random.randint(0, 256, (48, 64, 3), dtype=np.uint8)]
+
+    # when
+    result = run_stages_benchmark_scenario(
+        model=model,
+        scenario="64x48",
+        images=images,
+        detections=5,
+        batch_size=2,
+        warm_up_inferences=1,
+        benchmark_inferences=3,
+        trace_allocations=False,
+    )
+
+    # then
+    stages = {stage.stage: stage for stage in result.stages}
+    assert result.resolution == (64, 48)
+    assert stages["serialize"].calls == 3
+    assert stages["predict"].calls == 3
+    assert stages["decode"].calls == 6, "Expected each image of the batch decoded"
+    assert abs(sum(s.share_of_total for s in result.stages) - 100) < 0.1
+
+
+def test_compare_with_baseline() -> None:
+    # given
+    report = StagesBenchmarkReport(
+        scenarios=[
+            StagesBenchmarkScenarioResult(
+                scenario="640x480",
+                resolution=(640, 480),
+                detections=None,
+                batch_size=1,
+                inferences=10,
+                images_per_second=10.0,
+                stages=[
+                    StageStatistics(
+                        stage="nms",
+                        calls=10,
+                        mean_time_ms=15.0,
+                        p50_time_ms=15.0,
+                        p99_time_ms=16.0,
+                        share_of_total=50.0,
+                    ),
+                    StageStatistics(
+                        stage="predict",
+                        calls=10,
+                        mean_time_ms=15.0,
+                        p50_time_ms=15.0,
+                        p99_time_ms=16.0,
+                        share_of_total=50.0,
+                    ),
+                ],
+            )
+        ]
+    )
+    baseline = {
+        "scenarios": [
+            {"scenario": "640x480", "stages": [{"stage": "nms", "mean_time_ms": 10.0}]}
+        ]
+    }
+
+    # when
+    result = compare_with_baseline(report=report, baseline=baseline)
+
+    # then
+    assert len(result) == 1
+    assert result[0].stage == "nms"
+    assert result[0].change_percent == 50.0
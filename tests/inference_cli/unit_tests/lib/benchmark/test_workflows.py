@@ -0,0 +1,94 @@
+from inference_cli.lib.benchmark.workflows import (
+    TimingStatistics,
+    WorkflowsBenchmarkReport,
+    coordinate_workflows_benchmark,
+    generate_workflow_definition,
+    summarise_run_trace,
+)
+
+
+def test_generate_workflow_definition() -> None:
+    # when
+    result = generate_workflow_definition(depth=3, width=2, dimensionality=3)
+
+    # then
+    steps_types = [step["type"] for step in result["steps"]]
+    assert len(result["steps"]) == 2 * (2 * 2 + 1 + 3 + 2)
+    assert steps_types.count("BenchmarkStubCrop") == 4
+    assert steps_types.count("BenchmarkStubAggregation") == 4
+    assert [o["selector"] for o in result["outputs"]] == [
+        "$steps.lane_0_aggregation_0.predictions",
+        "$steps.lane_1_aggregation_0.predictions",
+    ]
+
+
+def test_summarise_run_trace() -> None:
+    # given
+    trace = [
+        {"name": "workflow_run", "ph": "B", "ts": 0},
+        {"name": "workflow_input_assembly", "ph": "X", "ts": 0, "dur": 100},
+        {
+            "name": "step_input_assembly",
+            "ph": "X",
+            "ts": 100,
+            "dur": 200,
+            "args": {"step": "$steps.a"},
+        },
+        {
+            "name": "step_code_execution",
+            "ph": "X",
+            "ts": 300,
+            "dur": 1000,
+            "args": {"step": "$steps.a"},
+        },
+        {
+            "name": "iterative_step_code_execution",
+            "ph": "X",
+            "ts": 1300,
+            "dur": 2500,
+            "args": {"step": "$steps.b"},
+        },
+        {
+            "name": "step_code_execution",
+            "ph": "X",
+            "ts": 1400,
+            "dur": 2000,
+            "args": {"step": "$steps.b"},
+        },
+        {"name": "outputs_construction", "ph": "X", "ts": 3800, "dur": 150},
+        {"name": "workflow_run", "ph": "E", "ts": 4000},
+    ]
+
+    # when
+    result = summarise_run_trace(trace=trace)
+
+    # then
+    assert abs(result["blocks"] - 0.003) < 1e-9
+    assert abs(result["overhead"] - 0.001) < 1e-9
+    assert abs(result["steps_input_assembly"] - 0.0007) < 1e-9
+    assert abs(result["workflow_input_assembly"] - 0.0001) < 1e-9
+    assert abs(result["outputs_construction"] - 0.00015) < 1e-9
+
+
+def test_coordinate_workflows_benchmark() -> None:
+    # when
+    result = coordinate_workflows_benchmark(
+        depths=[2],
+        widths=[2],
+        dimensionalities=[1, 2],
+        image_resolution=(64, 48),
+        compilations=1,
+        warm_up_runs=1,
+        benchmark_runs=2,
+        serialize_results=True,
+    )
+
+    # then
+    assert isinstance(result, WorkflowsBenchmarkReport)
+    assert [s.scenario for s in result.scenarios] == ["d2/w2/dim1", "d2/w2/dim2"]
+    assert [s.steps for s in result.scenarios] == [6, 12]
+    assert all(s.run.mean_ms > 0 for s in result.scenarios)
+    assert all(s.blocks.mean_ms > 0 for s in result.scenarios)
+    assert all(
+        isinstance(s.outputs_construction, TimingStatistics) for s in result.scenarios
+    )
@@ -1,6 +1,11 @@
+from types import SimpleNamespace
+
 import pytest
 
-from inference_cli.lib.benchmark_adapter import ensure_error_rate_is_below_threshold
+from inference_cli.lib.benchmark_adapter import (
+    ensure_error_rate_is_below_threshold,
+    ensure_no_stage_regressed,
+)
 
 
 def test_ensure_error_rate_is_below_threshold_when_threshold_not_given() -> None:
@@ -28,3 +33,20 @@ def test_ensure_error_rate_is_below_threshold_when_value_above_threshold() -> No
     # when
     with pytest.raises(RuntimeError):
         ensure_error_rate_is_below_threshold(error_rate=30.51, threshold=30.5)
+
+
+def test_ensure_no_stage_regressed_when_stage_slowed_down_above_threshold() -> None:
+    # given
+    report = SimpleNamespace(
+        baseline_comparison=[
+            SimpleNamespace(scenario="640x480", stage="nms", change_percent=12.0),
+            SimpleNamespace(scenario="640x480", stage="predict", change_percent=-3.0),
+        ]
+    )
+
+    # when
+    with pytest.raises(RuntimeError):
+        ensure_no_stage_regressed(report=report, threshold=10.0)
+
+    # then - no error for threshold above change
+    ensure_no_stage_regressed(report=report, threshold=12.0)
@@ -1,6 +1,7 @@
 import base64
 import json
 import os.path
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
@@ -22,6 +23,7 @@ from inference_cli.lib.workflows.common import (
     extract_images_from_result,
     get_all_images_in_directory,
     open_progress_log,
+    prefetch_images_batches,
     report_failed_files,
 )
 from inference_cli.lib.workflows.entities import OutputFileType
@@ -484,6 +486,39 @@ def test_dump_image_processing_results_when_images_not_to_be_saved(
     )
 
 
+def test_prefetch_images_batches(empty_directory: str) -> None:
+    # given
+    image_paths = []
+    for i in range(5):
+        image_path = os.path.join(empty_directory, f"{i}.jpg")
+        cv2.imwrite(image_path, np.full((16, 16, 3), i * 10, dtype=np.uint8))
+        image_paths.append(image_path)
+    broken_image_path = os.path.join(empty_directory, "broken.jpg")
+    with open(broken_image_path, "w") as f:
+        f.write("not an image")
+    image_paths.append(broken_image_path)
+
+    # when
+    with ThreadPoolExecutor(max_workers=2) as reader_pool:
+        batches = [
+            [(path, future.result()) for path, future in batch]
+            for batch in prefetch_images_batches(
+                image_paths=iter(image_paths),
+                batch_size=4,
+                reader_pool=reader_pool,
+                prefetch_batches=1,
+            )
+        ]
+
+    # then
+    assert [[path for path, _ in batch] for batch in batches] == [
+        image_paths[:4],
+        image_paths[4:],
+    ]
+    assert batches[0][2][1].shape == (16, 16, 3)
+    assert batches[1][1][1] is None, "Expected broken image to be resolved to None"
+
+
 def _encode_image_to_base64(image: np.ndarray) -> str:
     _, img_encoded = cv2.imencode(".jpg", image)
     image_bytes = np.array(img_encoded).tobytes()
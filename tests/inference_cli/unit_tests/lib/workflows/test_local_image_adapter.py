@@ -0,0 +1,208 @@
+import os.path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from unittest import mock
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+
+from inference_cli.lib.workflows import local_image_adapter
+from inference_cli.lib.workflows.local_image_adapter import (
+    _process_images_batches,
+    _process_images_in_worker_processes,
+)
+
+WORKFLOW_WITHOUT_SIDE_EFFECTS = {
+    "version": "1.0",
+    "inputs": [{"type": "WorkflowImage", "name": "image"}],
+    "steps": [
+        {
+            "type": "roboflow_core/roboflow_object_detection_model@v2",
+            "name": "model",
+            "images": "$inputs.image",
+            "model_id": "yolov8n-640",
+        }
+    ],
+    "outputs": [],
+}
+WORKFLOW_WITH_SINK = {
+    **WORKFLOW_WITHOUT_SIDE_EFFECTS,
+    "steps": WORKFLOW_WITHOUT_SIDE_EFFECTS["steps"]
+    + [
+        {
+            "type": "roboflow_core/webhook_sink@v1",
+            "name": "webhook",
+            "url": "http://localhost:9999",
+        }
+    ],
+}
+
+
+class StubExecutionEngine:
+    """Returns mean pixel value of each image, fails batches with white images."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def run(
+        self, runtime_parameters: Dict[str, Any], serialize_results: bool
+    ) -> List[dict]:
+        images = runtime_parameters["image"]
+        self.batch_sizes.append(len(images))
+        if any(image.mean() == 255 for image in images):
+            raise ValueError("White image")
+        return [{"mean": float(image.mean())} for image in images]
+
+
+def _create_images(directory: str, values: List[int]) -> List[str]:
+    paths = []
+    for i, value in enumerate(values):
+        path = os.path.join(directory, f"image_{i}.jpg")
+        cv2.imwrite(path, np.full((8, 8, 3), value, dtype=np.uint8))
+        paths.append(path)
+    return paths
+
+
+def _run_batches_processing(
+    image_paths: List[str],
+    workflow_specification: dict,
+    output_directory: str,
+    execution_engine: StubExecutionEngine,
+) -> Tuple[List[str], List[str]]:
+    succeeded, failed = [], []
+    with mock.patch.object(
+        local_image_adapter, "_prepare_model_manager"
+    ), mock.patch.object(local_image_adapter, "ExecutionEngine") as engine_class_mock:
+        engine_class_mock.init.return_value = execution_engine
+        _process_images_batches(
+            image_paths=image_paths,
+            on_success=succeeded.append,
+            on_failure=lambda path, _: failed.append(path),
+            workflow_specification=workflow_specification,
+            workflow_id=None,
+            image_input_name="image",
+            workflow_parameters=None,
+            api_key=None,
+            output_directory=output_directory,
+            save_image_outputs=False,
+            batch_size=2,
+        )
+    return sorted(succeeded), sorted(failed)
+
+
+def test_process_images_batches_runs_workflow_for_batches_of_images(
+    empty_directory: str,
+) -> None:
+    # given
+    image_paths = _create_images(directory=empty_directory, values=[0, 10, 20])
+    output_directory = os.path.join(empty_directory, "output")
+    execution_engine = StubExecutionEngine()
+
+    # when
+    succeeded, failed = _run_batches_processing(
+        image_paths=image_paths,
+        workflow_specification=WORKFLOW_WITHOUT_SIDE_EFFECTS,
+        output_directory=output_directory,
+        execution_engine=execution_engine,
+    )
+
+    # then
+    assert execution_engine.batch_sizes == [2, 1]
+    assert succeeded == image_paths
+    assert failed == []
+    assert sorted(os.listdir(output_directory)) == [
+        "image_0.jpg",
+        "image_1.jpg",
+        "image_2.jpg",
+    ], "Expected results of each image to be dumped"
+
+
+def test_process_images_batches_when_batch_fails_for_workflow_without_side_effects(
+    empty_directory: str,
+) -> None:
+    # given
+    image_paths = _create_images(directory=empty_directory, values=[0, 255, 20])
+    execution_engine = StubExecutionEngine()
+
+    # when
+    succeeded, failed = _run_batches_processing(
+        image_paths=image_paths,
+        workflow_specification=WORKFLOW_WITHOUT_SIDE_EFFECTS,
+        output_directory=os.path.join(empty_directory, "output"),
+        execution_engine=execution_engine,
+    )
+
+    # then
+    assert execution_engine.batch_sizes == [
+        2,
+        1,
+        1,
+        1,
+    ], "Expected images of failed batch to be re-run one by one"
+    assert succeeded == [image_paths[0], image_paths[2]]
+    assert failed == [image_paths[1]]
+
+
+def test_process_images_batches_when_batch_fails_for_workflow_with_sink(
+    empty_directory: str,
+) -> None:
+    # given
+    image_paths = _create_images(directory=empty_directory, values=[0, 255, 20])
+    execution_engine = StubExecutionEngine()
+
+    # when
+    succeeded, failed = _run_batches_processing(
+        image_paths=image_paths,
+        workflow_specification=WORKFLOW_WITH_SINK,
+        output_directory=os.path.join(empty_directory, "output"),
+        execution_engine=execution_engine,
+    )
+
+    # then
+    assert execution_engine.batch_sizes == [
+        2,
+        1,
+    ], "Expected images of failed batch not to be re-run, as sink would fire again"
+    assert succeeded == [image_paths[2]]
+    assert failed == [image_paths[0], image_paths[1]]
+
+
+def _fail_on_odd_images(
+    image_paths: Iterable[str],
+    on_success: Callable[[str], None],
+    on_failure: Callable[[str, str], None],
+) -> None:
+    for image_path in image_paths:
+        if int(image_path.split("_")[-1]) % 2:
+            on_failure(image_path, "odd image")
+        else:
+            on_success(image_path)
+
+
+def test_process_images_in_worker_processes_reports_results_of_all_images() -> None:
+    # given
+    image_paths = [f"image_{i}" for i in range(7)]
+    on_success, on_failure = MagicMock(), MagicMock()
+
+    # when
+    _process_images_in_worker_processes(
+        files_to_process=image_paths,
+        processing_fun=_fail_on_odd_images,
+        workers=2,
+        batch_size=2,
+        on_success=on_success,
+        on_failure=on_failure,
+    )
+
+    # then
+    assert sorted(call.args[0] for call in on_success.call_args_list) == [
+        "image_0",
+        "image_2",
+        "image_4",
+        "image_6",
+    ]
+    assert sorted(call.args for call in on_failure.call_args_list) == [
+        ("image_1", "odd image"),
+        ("image_3", "odd image"),
+        ("image_5", "odd image"),
+    ]
@@ -0,0 +1,124 @@
+import json
+import os.path
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from inference_cli.lib.workflows import remote_image_adapter
+from inference_cli.lib.workflows.remote_image_adapter import (
+    AdaptiveConcurrencyLimiter,
+    RemoteProcessingStatistics,
+    _get_retry_delay,
+    _process_images_asynchronously,
+)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_adjusts_limit() -> None:
+    # given
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8)
+
+    # when
+    limiter.on_overload()
+    limit_after_overload = limiter.limit
+    for _ in range(3):
+        limiter.on_overload()
+    limit_after_overloads_in_the_same_window = limiter.limit
+    limiter.on_overload()
+    limit_after_overload_in_next_window = limiter.limit
+    for _ in range(2):
+        limiter.on_success()
+    limit_after_successes = limiter.limit
+    for _ in range(100):
+        limiter.on_success()
+
+    # then
+    assert limit_after_overload == 4
+    assert limit_after_overloads_in_the_same_window == 4
+    assert limit_after_overload_in_next_window == 2
+    assert limit_after_successes == 3
+    assert limiter.limit == 8
+
+
+@pytest.mark.parametrize(
+    "attempt, retry_after, expected_min, expected_max",
+    [(0, 45.0, 45.0, 67.5), (0, None, 0.5, 0.75), (10, None, 30.0, 45.0)],
+)
+def test_get_retry_delay(
+    attempt: int,
+    retry_after: Optional[float],
+    expected_min: float,
+    expected_max: float,
+) -> None:
+    # when
+    delays = [
+        _get_retry_delay(attempt=attempt, retry_after=retry_after) for _ in range(100)
+    ]
+
+    # then
+    assert all(
+        expected_min <= delay <= expected_max for delay in delays
+    ), "Expected delay not shorter than requested and jitter to be bounded"
+
+
+@pytest.mark.asyncio
+async def test_process_images_asynchronously_when_server_is_overloaded_at_first(
+    empty_directory: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # given
+    monkeypatch.setattr(remote_image_adapter, "RETRY_BASE_DELAY", 0.01)
+    image_paths = []
+    for i in range(6):
+        image_path = os.path.join(empty_directory, f"{i}.jpg")
+        cv2.imwrite(image_path, np.zeros((16, 16, 3), dtype=np.uint8))
+        image_paths.append(image_path)
+    received_requests = []
+
+    async def handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        received_requests.append(payload)
+        if len(received_requests) <= 2:
+            return web.Response(status=429)
+        if payload["inputs"]["param"] == "fail" and len(received_requests) == 3:
+            return web.Response(status=500, text="some error")
+        return web.json_response({"outputs": [{"result": payload["inputs"]["param"]}]})
+
+    app = web.Application()
+    app.router.add_post("/workflows/run", handle)
+    dumped_results: List[Tuple[str, dict]] = []
+    failures: List[str] = []
+
+    # when
+    async with TestServer(app) as server:
+        await _process_images_asynchronously(
+            files_to_process=image_paths,
+            request_factory=lambda image_path: (
+                str(server.make_url("/workflows/run")),
+                json.dumps(
+                    {
+                        "inputs": {
+                            "param": ("fail" if image_path == image_paths[0] else "ok")
+                        }
+                    }
+                ).encode("utf-8"),
+            ),
+            results_dumper=lambda image_path, content: dumped_results.append(
+                (image_path, json.loads(content))
+            ),
+            on_failure=lambda image_path, cause: failures.append(image_path),
+            max_concurrency=1,
+            statistics=RemoteProcessingStatistics(),
+        )
+
+    # then
+    assert failures == [image_paths[0]]
+    assert sorted(path for path, _ in dumped_results) == sorted(image_paths[1:])
+    assert all(
+        content == {"outputs": [{"result": "ok"}]} for _, content in dumped_results
+    )
+    assert len(received_requests) == 8, "Expected 2 throttled requests and 6 others"
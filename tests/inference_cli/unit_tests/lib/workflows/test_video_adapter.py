@@ -0,0 +1,74 @@
+import os.path
+from unittest import mock
+from unittest.mock import MagicMock
+
+from inference_cli.lib.workflows import video_adapter
+from inference_cli.lib.workflows.entities import OutputFileType
+from inference_cli.lib.workflows.video_adapter import (
+    WorkflowsPipelineFactory,
+    WorkflowsVideoFileResultsSink,
+)
+
+
+def test_workflows_video_file_results_sink_when_videos_of_the_same_stem_processed(
+    empty_directory: str,
+) -> None:
+    # given
+    output_directory = os.path.join(empty_directory, "output")
+    input_root = os.path.join(empty_directory, "input")
+    video_paths = [
+        os.path.join(input_root, "video.mp4"),
+        os.path.join(input_root, "video.avi"),
+        os.path.join(input_root, "nested", "video.mp4"),
+    ]
+
+    # when
+    for video_path in video_paths:
+        sink = WorkflowsVideoFileResultsSink.init(
+            input_video_path=video_path,
+            output_directory=output_directory,
+            output_file_type=OutputFileType.JSONL,
+            save_image_outputs_as_video=False,
+            input_root=input_root,
+        )
+        sink.on_prediction(predictions={"video": video_path}, video_frames=None)
+        sink.release()
+
+    # then
+    results_directories = sorted(
+        os.path.relpath(directory, output_directory)
+        for directory, _, files in os.walk(output_directory)
+        if files
+    )
+    assert results_directories == [
+        os.path.join("nested", "video_mp4"),
+        "video_avi",
+        "video_mp4",
+    ], "Expected results of each video to be saved in separate directory"
+
+
+@mock.patch.object(video_adapter, "InferencePipeline")
+@mock.patch.object(video_adapter, "_prepare_model_manager")
+def test_workflows_pipeline_factory_reuses_model_manager_between_videos(
+    prepare_model_manager_mock: MagicMock,
+    inference_pipeline_mock: MagicMock,
+) -> None:
+    # given
+    factory = WorkflowsPipelineFactory(
+        workspace_name="my-workspace", workflow_id="my-workflow"
+    )
+
+    # when
+    for video_reference in ["a.mp4", "b.mp4"]:
+        _ = factory(video_reference=video_reference, on_prediction=print)
+
+    # then
+    prepare_model_manager_mock.assert_called_once()
+    calls = inference_pipeline_mock.init_with_workflow.call_args_list
+    assert [call.kwargs["video_reference"] for call in calls] == ["a.mp4", "b.mp4"]
+    assert all(
+        call.kwargs["workspace_name"] == "my-workspace"
+        and call.kwargs["workflow_init_parameters"]
+        == {"workflows_core.model_manager": prepare_model_manager_mock.return_value}
+        for call in calls
+    ), "Expected the same model manager to be used by all pipelines"
@@ -0,0 +1,91 @@
+from unittest import mock
+
+import numpy as np
+
+from inference.core.env import WORKFLOWS_MAX_CONCURRENT_STEPS
+from inference.core.managers.base import ModelManager
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.core_steps.formatters.expression import v1
+from inference.core.workflows.execution_engine.core import ExecutionEngine
+from inference.core.workflows.execution_engine.profiling.core import (
+    BaseWorkflowsProfiler,
+)
+from inference.core.workflows.execution_engine.v1.executor import core
+
+WORKFLOW_WITH_NON_BATCH_STEP = {
+    "version": "1.3.0",
+    "inputs": [
+        {"type": "WorkflowImage", "name": "image"},
+        {"type": "WorkflowParameter", "name": "class_names"},
+    ],
+    "steps": [
+        {
+            "type": "roboflow_core/expression@v1",
+            "name": "classes_count",
+            "data": {"class_names": "$inputs.class_names"},
+            "data_operations": {"class_names": [{"type": "SequenceLength"}]},
+            "switch": {
+                "type": "CasesDefinition",
+                "cases": [],
+                "default": {
+                    "type": "DynamicCaseResult",
+                    "parameter_name": "class_names",
+                },
+            },
+        },
+    ],
+    "outputs": [
+        {
+            "type": "JsonField",
+            "name": "classes_count",
+            "selector": "$steps.classes_count.output",
+        },
+    ],
+}
+
+
+@mock.patch.object(core, "WORKFLOWS_STEP_OUTPUTS_MEMOIZATION_ENABLED", True)
+def test_workflow_reuses_outputs_of_deterministic_non_batch_steps_across_runs(
+    model_manager: ModelManager,
+    dogs_image: np.ndarray,
+) -> None:
+    # given
+    workflow_init_parameters = {
+        "workflows_core.model_manager": model_manager,
+        "workflows_core.api_key": None,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    profiler = BaseWorkflowsProfiler.init(max_runs_in_buffer=8)
+    execution_engine = ExecutionEngine.init(
+        workflow_definition=WORKFLOW_WITH_NON_BATCH_STEP,
+        init_parameters=workflow_init_parameters,
+        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+        profiler=profiler,
+    )
+
+    # when
+    with mock.patch.object(
+        v1, "build_operations_chain", wraps=v1.build_operations_chain
+    ) as operations_chain_mock:
+        results = [
+            execution_engine.run(
+                runtime_parameters={
+                    "image": dogs_image,
+                    "class_names": class_names,
+                }
+            )
+            for class_names in (["dog"], ["dog"], ["dog", "cat"])
+        ]
+
+    # then
+    assert [r[0]["classes_count"] for r in results] == [1, 1, 2]
+    assert (
+        operations_chain_mock.call_count == 2
+    ), "Expected second run to re-use output and third run to invalidate it"
+    memoization_events = [
+        event["args"]
+        for event in profiler.export_trace()
+        if event["name"] == "step_output_memoization"
+    ]
+    assert [event["hit"] for event in memoization_events] == [False, True, False]
+    assert memoization_events[1]["hits"] == 1
@@ -0,0 +1,290 @@
+from copy import copy
+
+import numpy as np
+import pytest
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.query_language.entities.operations import (
+    DEFAULT_OPERAND_NAME,
+    StatementGroup,
+)
+from inference.core.workflows.core_steps.common.query_language.errors import (
+    EvaluationEngineError,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
+    build_eval_function,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.vectorized import (
+    build_detections_mask_function,
+)
+from inference.core.workflows.core_steps.common.query_language.operations.core import (
+    execute_operations,
+)
+
+
+def _property_operand(property_name: str) -> dict:
+    return {
+        "type": "DynamicOperand",
+        "operations": [
+            {"type": "ExtractDetectionProperty", "property_name": property_name}
+        ],
+    }
+
+
+def _binary_statement(
+    property_name: str, comparator: str, right_operand: dict, negate: bool = False
+) -> dict:
+    return {
+        "type": "BinaryStatement",
+        "left_operand": _property_operand(property_name=property_name),
+        "comparator": {"type": comparator},
+        "right_operand": right_operand,
+        "negate": negate,
+    }
+
+
+def _static(value) -> dict:
+    return {"type": "StaticOperand", "value": value}
+
+
+def _evaluate_in_python(
+    definition: StatementGroup, detections: sv.Detections, global_parameters: dict
+) -> np.ndarray:
+    eval_function = build_eval_function(definition=definition)
+    local_parameters = copy(global_parameters)
+    result = []
+    for detection in detections:
+        local_parameters[DEFAULT_OPERAND_NAME] = detection
+        result.append(eval_function(local_parameters))
+    return np.array(result, dtype=bool)
+
+
+@pytest.fixture
+def detections() -> sv.Detections:
+    return sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 10, 10],
+                [10.1, 20.2, 30.3, 40.4],
+                [50, 50, 150, 120],
+                [5, 100, 25, 130],
+            ],
+            dtype=np.float32,
+        ),
+        confidence=np.array([0.1, 0.3, 0.7, 0.91], dtype=np.float32),
+        class_id=np.array([0, 1, 2, 1]),
+        data={"class_name": np.array(["car", "person", "truck", "person"])},
+    )
+
+
+@pytest.mark.parametrize(
+    "statements, operator",
+    [
+        ([_binary_statement("confidence", "(Number) >=", _static(0.3))], "and"),
+        ([_binary_statement("confidence", "(Number) >", _static(0.7))], "and"),
+        ([_binary_statement("x_min", "(Number) ==", _static(10.1))], "and"),
+        ([_binary_statement("size", "(Number) <", _static(500))], "and"),
+        ([_binary_statement("class_id", "!=", _static(1))], "and"),
+        ([_binary_statement("class_name", "==", _static("person"))], "and"),
+        (
+            [_binary_statement("class_name", "in (Sequence)", _static(["car", "x"]))],
+            "and",
+        ),
+        ([_binary_statement("class_id", "in (Sequence)", _static([0, 2]))], "and"),
+        ([_binary_statement("class_name", "(String) startsWith", _static("p"))], "or"),
+        ([_binary_statement("class_name", "(String) endsWith", _static("k"))], "or"),
+        ([_binary_statement("class_name", "(String) contains", _static("ar"))], "or"),
+        (
+            [
+                _binary_statement(
+                    "center",
+                    "(Detection) in zone",
+                    _static([[0, 0], [100, 0], [100, 100], [0, 100]]),
+                )
+            ],
+            "or",
+        ),
+        (
+            [
+                _binary_statement("confidence", "(Number) >", _static(0.2)),
+                _binary_statement("class_name", "==", _static("car"), negate=True),
+            ],
+            "and",
+        ),
+        (
+            [
+                _binary_statement("y_max", "(Number) <=", _static(10)),
+                _binary_statement(
+                    "class_name",
+                    "in (Sequence)",
+                    {"type": "DynamicOperand", "operand_name": "classes"},
+                ),
+            ],
+            "or",
+        ),
+    ],
+)
+def test_vectorized_evaluation_matches_python_evaluation(
+    detections: sv.Detections, statements: list, operator: str
+) -> None:
+    # given
+    definition = StatementGroup.model_validate(
+        {"type": "StatementGroup", "operator": operator, "statements": statements}
+    )
+    global_parameters = {"classes": ["truck"]}
+
+    # when
+    mask_function = build_detections_mask_function(definition=definition)
+    result = mask_function(detections, global_parameters)
+
+    # then
+    expected_result = _evaluate_in_python(
+        definition=definition,
+        detections=detections,
+        global_parameters=global_parameters,
+    )
+    assert result.tolist() == expected_result.tolist()
+
+
+def test_build_detections_mask_function_when_operator_is_not_vectorized() -> None:
+    # given
+    definition = StatementGroup.model_validate(
+        {
+            "type": "StatementGroup",
+            "statements": [
+                {
+                    "type": "UnaryStatement",
+                    "operand": _property_operand(property_name="class_name"),
+                    "operator": {"type": "(Sequence) is empty"},
+                }
+            ],
+        }
+    )
+
+    # when
+    result = build_detections_mask_function(definition=definition)
+
+    # then
+    assert result is None
+
+
+def test_build_detections_mask_function_when_operand_applies_more_operations() -> None:
+    # given
+    operand = _property_operand(property_name="class_name")
+    operand["operations"].append({"type": "StringToUpperCase"})
+    definition = StatementGroup.model_validate(
+        {
+            "type": "StatementGroup",
+            "statements": [
+                {
+                    "type": "BinaryStatement",
+                    "left_operand": operand,
+                    "comparator": {"type": "=="},
+                    "right_operand": _static("CAR"),
+                }
+            ],
+        }
+    )
+
+    # when
+    result = build_detections_mask_function(definition=definition)
+
+    # then
+    assert result is None
+
+
+def test_mask_function_when_input_cannot_be_vectorized(
+    detections: sv.Detections,
+) -> None:
+    # given
+    definition = StatementGroup.model_validate(
+        {
+            "type": "StatementGroup",
+            "statements": [
+                _binary_statement("confidence", "(Number) >", _static("invalid"))
+            ],
+        }
+    )
+    mask_function = build_detections_mask_function(definition=definition)
+
+    # when
+    result = mask_function(detections, {})
+
+    # then
+    assert result is None
+
+
+def test_detections_filter_falls_back_to_python_evaluation_preserving_errors(
+    detections: sv.Detections,
+) -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "statements": [
+                    _binary_statement("confidence", "(Number) >", _static("invalid"))
+                ],
+            },
+        }
+    ]
+
+    # when
+    with pytest.raises(EvaluationEngineError):
+        _ = execute_operations(value=detections, operations=operations)
+
+
+def test_detections_filter_when_evaluation_is_vectorized(
+    detections: sv.Detections,
+) -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "and",
+                "statements": [
+                    _binary_statement("confidence", "(Number) >", _static(0.2)),
+                    _binary_statement(
+                        "class_name",
+                        "in (Sequence)",
+                        {"type": "DynamicOperand", "operand_name": "classes"},
+                    ),
+                ],
+            },
+        }
+    ]
+
+    # when
+    result = execute_operations(
+        value=detections,
+        operations=operations,
+        global_parameters={"classes": ["person"]},
+    )
+
+    # then
+    assert result.class_id.tolist() == [1, 1]
+    assert np.allclose(result.confidence, [0.3, 0.91])
+
+
+def test_detections_filter_when_empty_detections_provided() -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "statements": [
+                    _binary_statement("confidence", "(Number) >", _static(0.2)),
+                ],
+            },
+        }
+    ]
+
+    # when
+    result = execute_operations(value=sv.Detections.empty(), operations=operations)
+
+    # then
+    assert len(result) == 0
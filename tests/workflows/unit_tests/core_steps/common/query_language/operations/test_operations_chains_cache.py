@@ -0,0 +1,58 @@
+from unittest import mock
+
+from inference.core.workflows.core_steps.common.query_language.entities.operations import (
+    OperationsChain,
+)
+from inference.core.workflows.core_steps.common.query_language.operations import core
+from inference.core.workflows.core_steps.common.query_language.operations.core import (
+    OperationsChainsCache,
+)
+
+
+def _parse(operations: list) -> list:
+    return OperationsChain.model_validate({"operations": operations}).operations
+
+
+@mock.patch.object(core, "build_operations_chain", wraps=core.build_operations_chain)
+def test_operations_chains_cache_builds_chain_once_for_the_same_definition(
+    build_operations_chain_mock: mock.MagicMock,
+) -> None:
+    # given
+    cache = OperationsChainsCache()
+
+    # when
+    first_chain = cache.get_or_build(operations=_parse([{"type": "StringToUpperCase"}]))
+    second_chain = cache.get_or_build(
+        operations=_parse([{"type": "StringToUpperCase"}])
+    )
+
+    # then
+    assert first_chain is second_chain
+    assert build_operations_chain_mock.call_count == 1
+    assert second_chain("a", global_parameters={}) == "A"
+
+
+def test_operations_chains_cache_distinguishes_definitions() -> None:
+    # given
+    cache = OperationsChainsCache()
+
+    # when
+    upper_chain = cache.get_or_build(operations=_parse([{"type": "StringToUpperCase"}]))
+    lower_chain = cache.get_or_build(operations=_parse([{"type": "StringToLowerCase"}]))
+
+    # then
+    assert upper_chain("a", global_parameters={}) == "A"
+    assert lower_chain("A", global_parameters={}) == "a"
+    assert len(cache) == 2
+
+
+def test_operations_chains_cache_evicts_least_recently_used_chains() -> None:
+    # given
+    cache = OperationsChainsCache(max_size=1)
+
+    # when
+    _ = cache.get_or_build(operations=_parse([{"type": "StringToUpperCase"}]))
+    _ = cache.get_or_build(operations=_parse([{"type": "StringToLowerCase"}]))
+
+    # then
+    assert len(cache) == 1
@@ -0,0 +1,253 @@
+from dataclasses import asdict
+from typing import Generator
+from unittest import mock
+
+import numpy as np
+import pytest
+import supervision as sv
+
+from inference.core.workflows.core_steps.common import tracking
+from inference.core.workflows.core_steps.common.tracking import (
+    ByteTrackCompatibility,
+    ByteTrackEngine,
+    ByteTrackParameters,
+    VideoTracker,
+    kalman_initiate,
+    kalman_predict,
+    kalman_update,
+    linear_assignment,
+)
+
+PARAMETERS = ByteTrackParameters(
+    track_activation_threshold=0.25,
+    lost_track_buffer=30,
+    minimum_matching_threshold=0.8,
+    minimum_consecutive_frames=1,
+    frame_rate=30,
+)
+
+
+def _generate_scene_detections(
+    generator: np.random.Generator, frames: int
+) -> Generator[sv.Detections, None, None]:
+    objects = int(generator.integers(1, 25))
+    positions = generator.uniform(0, 400, size=(objects, 2))
+    velocities = generator.normal(0, 4, size=(objects, 2))
+    sizes = generator.uniform(15, 60, size=(objects, 2))
+    miss_probability = generator.uniform(0, 0.4)
+    dtype = generator.choice([np.float32, np.float64])
+    for _ in range(frames):
+        positions += velocities + generator.normal(0, 0.5, size=velocities.shape)
+        visible = generator.random(objects) > miss_probability
+        xyxy = np.concatenate([positions, positions + sizes], axis=1)[visible]
+        xyxy += generator.normal(0, generator.uniform(0.1, 3), size=xyxy.shape)
+        false_positives = generator.uniform(0, 400, size=(generator.poisson(1.0), 2))
+        false_positives = np.concatenate(
+            [
+                false_positives,
+                false_positives + generator.uniform(10, 50, size=false_positives.shape),
+            ],
+            axis=1,
+        )
+        xyxy = np.concatenate([xyxy, false_positives])
+        order = generator.permutation(len(xyxy))
+        yield sv.Detections(
+            xyxy=xyxy[order].astype(dtype),
+            confidence=generator.uniform(0.0, 1.0, size=len(xyxy)).astype(dtype),
+            class_id=np.zeros((len(xyxy),), dtype=int),
+        )
+
+
+@pytest.mark.parametrize("seed", list(range(60)))
+def test_video_tracker_assigns_the_same_ids_as_supervision_byte_track(
+    seed: int,
+) -> None:
+    # given
+    generator = np.random.default_rng(seed)
+    parameters = ByteTrackParameters(
+        track_activation_threshold=float(generator.choice([0.25, 0.5, 0.95])),
+        lost_track_buffer=int(generator.choice([1, 3, 30])),
+        minimum_matching_threshold=float(generator.choice([0.5, 0.8, 0.95])),
+        minimum_consecutive_frames=int(generator.choice([1, 2, 3])),
+        frame_rate=float(generator.choice([15, 30])),
+    )
+    tracker = VideoTracker(parameters=parameters)
+    reference_tracker = sv.ByteTrack(**asdict(parameters))
+    frames = int(generator.integers(5, 60))
+
+    for detections in _generate_scene_detections(generator=generator, frames=frames):
+        # when
+        result = tracker.update(detections=detections)
+        expected = reference_tracker.update_with_detections(detections[:])
+
+        # then
+        assert np.array_equal(result.xyxy, expected.xyxy)
+        assert result.tracker_id.tolist() == expected.tracker_id.tolist()
+
+
+@pytest.mark.parametrize(
+    "version, initial_tracklet_length, external_id_on_track_creation, duplicated_tracks_iou_distance",
+    [
+        ("0.25.1", 0, True, 0.15),
+        ("0.27.0", 0, True, 0.15),
+        ("0.28.0", 0, False, 0.05),
+        ("0.30.0", 1, False, 0.05),
+        ("0.31.0rc1", 1, False, 0.05),
+    ],
+)
+def test_byte_track_compatibility_for_supervision_version(
+    version: str,
+    initial_tracklet_length: int,
+    external_id_on_track_creation: bool,
+    duplicated_tracks_iou_distance: float,
+) -> None:
+    # when
+    result = ByteTrackCompatibility.for_supervision_version(version=version)
+
+    # then
+    assert result.initial_tracklet_length == initial_tracklet_length
+    assert result.external_id_on_track_creation is external_id_on_track_creation
+    assert result.duplicated_tracks_iou_distance == duplicated_tracks_iou_distance
+
+
+def test_video_tracker_when_empty_detections_provided() -> None:
+    # given
+    tracker = VideoTracker(parameters=PARAMETERS)
+
+    # when
+    result = tracker.update(detections=sv.Detections.empty())
+
+    # then
+    assert len(result) == 0
+    assert result.tracker_id.tolist() == []
+
+
+def test_video_tracker_when_confidence_not_provided() -> None:
+    # given
+    tracker = VideoTracker(parameters=PARAMETERS)
+
+    # when
+    with pytest.raises(ValueError):
+        _ = tracker.update(detections=sv.Detections(xyxy=np.array([[0, 0, 1, 1]])))
+
+
+def test_linear_assignment_respects_threshold() -> None:
+    # given
+    cost_matrix = np.array([[0.1, 0.9], [0.95, 0.99], [0.9, 0.2]])
+
+    # when
+    matches, unmatched_rows, unmatched_columns = linear_assignment(
+        cost_matrix=cost_matrix, threshold=0.5
+    )
+
+    # then
+    assert matches.tolist() == [[0, 0], [2, 1]]
+    assert unmatched_rows.tolist() == [1]
+    assert unmatched_columns.tolist() == []
+
+
+def test_linear_assignment_when_cost_matrix_is_empty() -> None:
+    # when
+    matches, unmatched_rows, unmatched_columns = linear_assignment(
+        cost_matrix=np.empty((0, 3)), threshold=0.5
+    )
+
+    # then
+    assert matches.shape == (0, 2)
+    assert unmatched_rows.tolist() == []
+    assert unmatched_columns.tolist() == [0, 1, 2]
+
+
+def test_vectorized_kalman_filter_matches_supervision_implementation() -> None:
+    # given
+    reference_filter = sv.tracker.byte_tracker.kalman_filter.KalmanFilter()
+    measurements = np.array([[50.0, 60.0, 0.5, 40.0], [10.0, 20.0, 1.5, 12.0]])
+    new_measurements = measurements + np.array([[2.0, 1.0, 0.01, 1.0]])
+
+    # when
+    mean, covariance = kalman_initiate(measurement=measurements)
+    mean, covariance = kalman_predict(mean=mean, covariance=covariance)
+    mean, covariance = kalman_update(
+        mean=mean, covariance=covariance, measurement=new_measurements
+    )
+
+    # then
+    for i in range(len(measurements)):
+        expected_mean, expected_covariance = reference_filter.initiate(measurements[i])
+        expected_mean, expected_covariance = reference_filter.predict(
+            expected_mean, expected_covariance
+        )
+        expected_mean, expected_covariance = reference_filter.update(
+            expected_mean, expected_covariance, new_measurements[i]
+        )
+        assert np.allclose(mean[i], expected_mean)
+        assert np.allclose(covariance[i], expected_covariance)
+
+
+def test_byte_track_engine_keeps_independent_state_per_video() -> None:
+    # given
+    engine = ByteTrackEngine(idle_timeout=60, max_videos=16)
+    detections = sv.Detections(
+        xyxy=np.array([[10, 10, 20, 20], [30, 30, 50, 50]], dtype=float),
+        confidence=np.array([0.9, 0.9]),
+    )
+
+    # when
+    results = engine.update_batch(
+        video_identifiers=["a", "b"],
+        detections=[detections, detections[:1]],
+        parameters=[PARAMETERS, PARAMETERS],
+    )
+
+    # then
+    assert results[0].tracker_id.tolist() == [1, 2]
+    assert results[1].tracker_id.tolist() == [1]
+    assert len(engine) == 2
+
+
+def test_byte_track_engine_evicts_idle_videos() -> None:
+    # given
+    engine = ByteTrackEngine(idle_timeout=10, max_videos=16)
+    detections = sv.Detections(
+        xyxy=np.array([[10, 10, 20, 20]], dtype=float), confidence=np.array([0.9])
+    )
+
+    # when
+    with mock.patch.object(tracking.time, "monotonic", return_value=100.0):
+        _ = engine.update(
+            video_identifier="a", detections=detections, parameters=PARAMETERS
+        )
+    with mock.patch.object(tracking.time, "monotonic", return_value=105.0):
+        _ = engine.update(
+            video_identifier="b", detections=detections, parameters=PARAMETERS
+        )
+    with mock.patch.object(tracking.time, "monotonic", return_value=111.0):
+        _ = engine.update(
+            video_identifier="b", detections=detections, parameters=PARAMETERS
+        )
+
+    # then
+    assert "a" not in engine
+    assert "b" in engine
+
+
+def test_byte_track_engine_drops_least_recently_used_videos_on_overflow() -> None:
+    # given
+    engine = ByteTrackEngine(idle_timeout=3600, max_videos=2)
+    detections = sv.Detections(
+        xyxy=np.array([[10, 10, 20, 20]], dtype=float), confidence=np.array([0.9])
+    )
+
+    # when
+    for video_identifier in ["a", "b", "a", "c"]:
+        _ = engine.update(
+            video_identifier=video_identifier,
+            detections=detections,
+            parameters=PARAMETERS,
+        )
+
+    # then
+    assert len(engine) == 2
+    assert "a" in engine
+    assert "b" not in engine
+    assert "c" in engine
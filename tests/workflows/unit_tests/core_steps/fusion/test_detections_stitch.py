@@ -1,9 +1,18 @@
-from typing import Union
+from typing import Tuple, Union
 
+import numpy as np
 import pytest
+import supervision as sv
 
 from inference.core.workflows.core_steps.fusion.detections_stitch.v1 import (
     BlockManifest,
+    stitch_detections,
+)
+from inference.core.workflows.execution_engine.constants import (
+    PARENT_COORDINATES_KEY,
+    PARENT_DIMENSIONS_KEY,
+    PARENT_ID_KEY,
+    ROOT_PARENT_COORDINATES_KEY,
 )
 
 
@@ -55,3 +64,107 @@ def test_detections_stitch_v1_manifest_parsing_when_overlap_mode_invalid() -> No
     # when
     with pytest.raises(ValueError):
         _ = BlockManifest.model_validate(raw_manifest)
+
+
+def test_stitch_detections_when_all_crops_are_empty() -> None:
+    # when
+    result = stitch_detections(
+        detections_list=[sv.Detections.empty(), sv.Detections.empty()],
+        parent_id="parent",
+    )
+
+    # then
+    assert len(result) == 0
+
+
+def test_stitch_detections_moves_boxes_and_metadata_to_parent_coordinates() -> None:
+    # given
+    first_crop = _crop_detections(
+        xyxy=np.array([[0, 0, 10, 10], [5, 5, 20, 20]]),
+        offset=(0, 0),
+    )
+    second_crop = _crop_detections(
+        xyxy=np.array([[1, 2, 3, 4]]),
+        offset=(100, 50),
+    )
+
+    # when
+    result = stitch_detections(
+        detections_list=[first_crop, sv.Detections.empty(), second_crop],
+        parent_id="parent",
+    )
+
+    # then
+    assert np.allclose(
+        result.xyxy,
+        np.array([[0, 0, 10, 10], [5, 5, 20, 20], [101, 52, 103, 54]]),
+    )
+    assert np.allclose(result.data[PARENT_COORDINATES_KEY], np.zeros((3, 2)))
+    assert np.allclose(
+        result.data[ROOT_PARENT_COORDINATES_KEY],
+        np.array([[10, 10], [10, 10], [10, 10]]),
+    )
+    assert result.data[PARENT_ID_KEY].tolist() == ["parent"] * 3
+    assert np.allclose(
+        second_crop.xyxy, np.array([[1, 2, 3, 4]])
+    ), "Expected input detections not to be modified"
+    assert np.allclose(second_crop.data[PARENT_COORDINATES_KEY], [[100, 50]])
+
+
+def test_stitch_detections_pastes_masks_of_crops_with_different_sizes() -> None:
+    # given
+    first_mask = np.zeros((1, 40, 60), dtype=bool)
+    first_mask[0, 10:20, 30:60] = True
+    second_mask = np.zeros((2, 20, 30), dtype=bool)
+    second_mask[0, 0:5, 0:5] = True
+    second_mask[1, 15:20, 25:30] = True
+    first_crop = _crop_detections(
+        xyxy=np.array([[30, 10, 60, 20]]),
+        offset=(0, 0),
+        mask=first_mask,
+    )
+    second_crop = _crop_detections(
+        xyxy=np.array([[0, 0, 5, 5], [25, 15, 30, 20]]),
+        offset=(50, 40),
+        mask=second_mask,
+    )
+
+    # when
+    result = stitch_detections(
+        detections_list=[first_crop, second_crop],
+        parent_id="parent",
+    )
+
+    # then
+    expected_masks = np.concatenate(
+        [
+            sv.move_masks(
+                masks=first_mask, offset=np.array([0, 0]), resolution_wh=(80, 60)
+            ),
+            sv.move_masks(
+                masks=second_mask, offset=np.array([50, 40]), resolution_wh=(80, 60)
+            ),
+        ]
+    )
+    assert result.mask.shape == (3, 60, 80)
+    assert np.array_equal(result.mask, expected_masks)
+
+
+def _crop_detections(
+    xyxy: np.ndarray,
+    offset: Tuple[int, int],
+    mask: Union[np.ndarray, None] = None,
+) -> sv.Detections:
+    detections = sv.Detections(
+        xyxy=xyxy.astype(np.float64),
+        mask=mask,
+        confidence=np.array([0.9] * len(xyxy)),
+        class_id=np.array([0] * len(xyxy)),
+    )
+    detections[PARENT_ID_KEY] = np.array(["crop"] * len(xyxy))
+    detections[PARENT_COORDINATES_KEY] = np.array([list(offset)] * len(xyxy))
+    detections[PARENT_DIMENSIONS_KEY] = np.array([[60, 80]] * len(xyxy))
+    detections[ROOT_PARENT_COORDINATES_KEY] = np.array(
+        [[offset[0] + 10, offset[1] + 10]] * len(xyxy)
+    )
+    return detections
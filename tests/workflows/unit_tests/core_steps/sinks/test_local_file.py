@@ -75,6 +75,7 @@ def test_saving_into_file_when_execution_is_prevented(empty_directory: str) -> N
             target_directory=empty_directory,
             file_name_prefix="my_file",
             max_entries_per_file=100,
+            fire_and_forget=False,
         )
 
     # then
@@ -95,6 +96,7 @@ def test_saving_txt_into_separate_files(empty_directory: str) -> None:
         target_directory=empty_directory,
         file_name_prefix="my_file",
         max_entries_per_file=100,
+        fire_and_forget=False,
     )
     result_2 = block.run(
         content="content-2",
@@ -103,6 +105,7 @@ def test_saving_txt_into_separate_files(empty_directory: str) -> None:
         target_directory=empty_directory,
         file_name_prefix="my_file",
         max_entries_per_file=100,
+        fire_and_forget=False,
     )
 
     # then
@@ -134,6 +137,7 @@ def test_saving_txt_into_separate_files_when_allowed_directory_pointed(
         target_directory=empty_directory,
         file_name_prefix="my_file",
         max_entries_per_file=100,
+        fire_and_forget=False,
     )
     result_2 = block.run(
         content="content-2",
@@ -142,6 +146,7 @@ def test_saving_txt_into_separate_files_when_allowed_directory_pointed(
         target_directory=empty_directory,
         file_name_prefix="my_file",
         max_entries_per_file=100,
+        fire_and_forget=False,
     )
 
     # then
@@ -174,6 +179,7 @@ def test_saving_files_when_allowed_write_directory_does_not_match(
             target_directory=f"{empty_directory}but-something-else",
             file_name_prefix="my_file",
             max_entries_per_file=100,
+            fire_and_forget=False,
         )
 
 
@@ -191,6 +197,7 @@ def test_saving_json_into_separate_files(empty_directory: str) -> None:
         target_directory=empty_directory,
         file_name_prefix="my_file",
         max_entries_per_file=100,
+        fire_and_forget=False,
     )
     result_2 = block.run(
         content=json.dumps({"other": "data"}),
@@ -199,6 +206,7 @@ def test_saving_json_into_separate_files(empty_directory: str) -> None:
         target_directory=empty_directory,
         file_name_prefix="my_file",
         max_entries_per_file=100,
+        fire_and_forget=False,
     )
 
     # then
@@ -230,6 +238,7 @@ def test_saving_csv_into_separate_files(empty_directory: str) -> None:
         target_directory=empty_directory,
         file_name_prefix="my_file",
         max_entries_per_file=100,
+        fire_and_forget=False,
     )
     result_2 = block.run(
         content=df_2.to_csv(index=False),
@@ -238,6 +247,7 @@ def test_saving_csv_into_separate_files(empty_directory: str) -> None:
         target_directory=empty_directory,
         file_name_prefix="my_file",
         max_entries_per_file=100,
+        fire_and_forget=False,
     )
 
     # then
@@ -264,6 +274,7 @@ def test_saving_txt_into_append_log(empty_directory: str) -> None:
             target_directory=empty_directory,
             file_name_prefix="my_file",
             max_entries_per_file=3,
+            fire_and_forget=False,
         )
     # flushing buffer
     del block
@@ -298,6 +309,7 @@ def test_saving_json_into_append_log(empty_directory: str) -> None:
             target_directory=empty_directory,
             file_name_prefix="my_file",
             max_entries_per_file=3,
+            fire_and_forget=False,
         )
     # flushing buffer
     del block
@@ -330,6 +342,7 @@ def test_saving_csv_into_append_log(empty_directory: str) -> None:
             target_directory=empty_directory,
             file_name_prefix="my_file",
             max_entries_per_file=3,
+            fire_and_forget=False,
         )
     # flushing buffer
     del block
@@ -341,6 +354,69 @@ def test_saving_csv_into_append_log(empty_directory: str) -> None:
     assert pd.read_csv(saved_files[1])["data"].tolist() == [3, 4]
 
 
+def test_saving_txt_into_append_log_in_the_background(empty_directory: str) -> None:
+    # given
+    block = LocalFileSinkBlockV1(
+        allow_access_to_file_system=True, allowed_write_directory=None
+    )
+
+    # when
+    results = [
+        block.run(
+            content=f"content-{i}",
+            file_type="txt",
+            output_mode="append_log",
+            target_directory=empty_directory,
+            file_name_prefix="my_file",
+            max_entries_per_file=3,
+            fire_and_forget=True,
+        )
+        for i in range(5)
+    ]
+    block._background_writer.flush()
+
+    # then
+    assert all(r["error_status"] is False for r in results)
+    saved_files = sorted(glob(os.path.join(empty_directory, "my_file_*.txt")))
+    assert len(saved_files) == 2, "Expected 2 separate files"
+    with open(saved_files[0]) as f:
+        assert f.read() == "content-0\ncontent-1\ncontent-2\n"
+    with open(saved_files[1]) as f:
+        assert (
+            f.read() == "content-3\ncontent-4\n"
+        ), "Expected file to be flushed once writer got idle"
+
+
+def test_saving_in_the_background_reports_failures_of_previous_writes(
+    empty_directory: str,
+) -> None:
+    # given
+    block = LocalFileSinkBlockV1(
+        allow_access_to_file_system=True, allowed_write_directory=None
+    )
+    run_kwargs = dict(
+        file_type="json",
+        output_mode="append_log",
+        target_directory=empty_directory,
+        file_name_prefix="my_file",
+        max_entries_per_file=3,
+        fire_and_forget=True,
+    )
+
+    # when
+    first_result = block.run(content="invalid", **run_kwargs)
+    block._background_writer.flush()
+    second_result = block.run(content=json.dumps({"some": "value"}), **run_kwargs)
+    block._background_writer.flush()
+    third_result = block.run(content=json.dumps({"other": "value"}), **run_kwargs)
+
+    # then
+    assert first_result["error_status"] is False
+    assert second_result["error_status"] is True
+    assert "Invalid JSON content" in second_result["message"]
+    assert third_result["error_status"] is False, "Expected error to be reported once"
+
+
 def test_path_is_within_specified_directory_when_relative_paths_given_and_values_match() -> (
     None
 ):
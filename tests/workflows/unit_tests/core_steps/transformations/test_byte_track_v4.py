@@ -0,0 +1,124 @@
+import datetime
+
+import numpy as np
+import supervision as sv
+
+from inference.core.workflows.core_steps.transformations.byte_tracker.v4 import (
+    ByteTrackerBlockV4,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    Batch,
+    ImageParentMetadata,
+    VideoMetadata,
+    WorkflowImageData,
+)
+
+
+def test_byte_tracker_processing_multiple_videos_in_single_batch() -> None:
+    # given
+    frame1_detections = sv.Detections(
+        xyxy=np.array(
+            [[10, 10, 20, 20], [21, 10, 31, 20], [31, 10, 41, 20], [100, 100, 110, 110]]
+        ),
+        confidence=np.array([0.9, 0.9, 0.9, 0.9]),
+        class_id=np.array([1, 1, 1, 1]),
+    )
+    frame2_detections = sv.Detections(
+        xyxy=np.array(
+            [[12, 10, 22, 20], [23, 10, 33, 20], [33, 10, 43, 20], [102, 100, 112, 110]]
+        ),
+        confidence=np.array([0.9, 0.9, 0.9, 0.9]),
+        class_id=np.array([1, 1, 1, 1]),
+    )
+    frame3_detections = sv.Detections(
+        xyxy=np.array([[14, 10, 24, 20], [25, 10, 35, 20], [35, 10, 45, 20]]),
+        confidence=np.array([0.9, 0.9, 0.9]),
+        class_id=np.array([1, 1, 1]),
+    )
+    byte_tracker_block = ByteTrackerBlockV4()
+
+    # when
+    results = []
+    for frame_number, detections in enumerate(
+        [frame1_detections, frame2_detections, frame3_detections], start=10
+    ):
+        batch_result = byte_tracker_block.run(
+            image=Batch(
+                content=[
+                    _wrap_with_workflow_image(
+                        video_identifier="vid_1", frame_number=frame_number
+                    ),
+                    _wrap_with_workflow_image(
+                        video_identifier="vid_2", frame_number=frame_number
+                    ),
+                ],
+                indices=[(0,), (1,)],
+            ),
+            detections=Batch(
+                content=[detections, detections[:2]],
+                indices=[(0,), (1,)],
+            ),
+        )
+        results.append(batch_result)
+
+    # then
+    vid_1_results = [batch_result[0] for batch_result in results]
+    vid_2_results = [batch_result[1] for batch_result in results]
+    assert vid_1_results[0]["tracked_detections"].tracker_id.tolist() == [1, 2, 3, 4]
+    assert vid_1_results[2]["tracked_detections"].tracker_id.tolist() == [
+        1,
+        2,
+        3,
+    ], "Expected the same 3 first objects in third frame"
+    assert vid_1_results[0]["new_instances"].tracker_id.tolist() == [1, 2, 3, 4]
+    assert len(vid_1_results[0]["already_seen_instances"]) == 0
+    assert len(vid_1_results[1]["new_instances"]) == 0
+    assert vid_1_results[1]["already_seen_instances"].tracker_id.tolist() == [
+        1,
+        2,
+        3,
+        4,
+    ]
+    assert all(
+        r["tracked_detections"].tracker_id.tolist() == [1, 2] for r in vid_2_results
+    ), "Expected second video to be tracked independently"
+    assert vid_2_results[0]["new_instances"].tracker_id.tolist() == [1, 2]
+    assert len(vid_2_results[2]["new_instances"]) == 0
+
+
+def test_byte_tracker_when_no_detections_provided() -> None:
+    # given
+    byte_tracker_block = ByteTrackerBlockV4()
+
+    # when
+    result = byte_tracker_block.run(
+        image=Batch(
+            content=[_wrap_with_workflow_image(video_identifier="vid_1")],
+            indices=[(0,)],
+        ),
+        detections=Batch(content=[sv.Detections.empty()], indices=[(0,)]),
+    )
+
+    # then
+    assert len(result) == 1
+    assert len(result[0]["tracked_detections"]) == 0
+    assert len(result[0]["new_instances"]) == 0
+    assert len(result[0]["already_seen_instances"]) == 0
+
+
+def _wrap_with_workflow_image(
+    video_identifier: str, frame_number: int = 0
+) -> WorkflowImageData:
+    return WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="some"),
+        numpy_image=np.zeros((192, 168, 3), dtype=np.uint8),
+        video_metadata=VideoMetadata(
+            video_identifier=video_identifier,
+            frame_number=frame_number,
+            fps=1,
+            frame_timestamp=datetime.datetime.fromtimestamp(1726570875).astimezone(
+                tz=datetime.timezone.utc
+            ),
+            comes_from_video_file=True,
+        ),
+    )
@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import supervision as sv
+
+from inference.core.workflows.core_steps.visualizations.common.annotators_cache import (
+    SharedAnnotatorsCache,
+    clear_annotators_cache,
+)
+
+
+def test_get_or_create_creates_annotator_only_once() -> None:
+    # given
+    clear_annotators_cache()
+    cache = SharedAnnotatorsCache(namespace="some", max_size=2)
+    factory = MagicMock(side_effect=lambda: sv.BlurAnnotator())
+
+    # when
+    first = cache.get_or_create(key=("a", 1), factory=factory)
+    second = cache.get_or_create(key=("a", 1), factory=factory)
+
+    # then
+    assert first is second
+    factory.assert_called_once()
+
+
+def test_get_or_create_evicts_least_recently_used_annotator() -> None:
+    # given
+    clear_annotators_cache()
+    cache = SharedAnnotatorsCache(namespace="some", max_size=2)
+    first = cache.get_or_create(key="a", factory=sv.BlurAnnotator)
+    second = cache.get_or_create(key="b", factory=sv.BlurAnnotator)
+    _ = cache.get_or_create(key="a", factory=sv.BlurAnnotator)
+
+    # when
+    _ = cache.get_or_create(key="c", factory=sv.BlurAnnotator)
+    first_after_eviction = cache.get_or_create(key="a", factory=sv.BlurAnnotator)
+    second_after_eviction = cache.get_or_create(key="b", factory=sv.BlurAnnotator)
+
+    # then
+    assert first_after_eviction is first, "Expected recently used annotator to stay"
+    assert second_after_eviction is not second, "Expected LRU annotator to be evicted"
+
+
+def test_get_or_create_when_annotators_are_evicted_concurrently() -> None:
+    # given
+    clear_annotators_cache()
+    cache = SharedAnnotatorsCache(namespace="some", max_size=1)
+
+    # when
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda i: cache.get_or_create(key=i % 4, factory=sv.BlurAnnotator),
+                range(2000),
+            )
+        )
+
+    # then
+    assert all(isinstance(result, sv.BlurAnnotator) for result in results)
@@ -150,3 +150,28 @@ def test_bounding_box_visualization_block_nocopy() -> None:
         output.get("image").numpy_image.__array_interface__["data"][0]
         == start_image.__array_interface__["data"][0]
     )
+
+
+def test_bounding_box_visualization_blocks_share_annotators_of_the_same_configuration() -> (
+    None
+):
+    # given
+    first_block = BoundingBoxVisualizationBlockV1()
+    second_block = BoundingBoxVisualizationBlockV1()
+
+    # when
+    first_annotator = first_block.getAnnotator(
+        "CUSTOM", 10, ["#FF0000"], "CLASS", 2, 0.0
+    )
+    second_annotator = second_block.getAnnotator(
+        "CUSTOM", 10, ["#FF0000"], "CLASS", 2, 0.0
+    )
+    annotator_with_other_colors = second_block.getAnnotator(
+        "CUSTOM", 10, ["#00FF00"], "CLASS", 2, 0.0
+    )
+
+    # then
+    assert first_annotator is second_annotator
+    assert (
+        annotator_with_other_colors is not first_annotator
+    ), "Expected custom colors to be part of annotator configuration"
@@ -97,3 +97,50 @@ def test_mask_visualization_block() -> None:
     assert not np.array_equal(
         output.get("image").numpy_image, np.zeros((1000, 1000, 3), dtype=np.uint8)
     )
+
+
+def test_mask_visualization_block_produces_the_same_image_as_supervision_annotator() -> (
+    None
+):
+    # given
+    block = MaskVisualizationBlockV1()
+    image = np.random.randint(0, 256, size=(480, 640, 3), dtype=np.uint8)
+    original_image = image.copy()
+    mask = np.zeros((3, 480, 640), dtype=bool)
+    mask[0, 10:100, 20:200] = True
+    mask[1, 50:300, 100:150] = True
+    mask[2, 400:470, 600:630] = True
+    detections = sv.Detections(
+        xyxy=np.array(
+            [[20, 10, 200, 100], [100, 50, 150, 300], [600, 400, 630, 470]],
+            dtype=np.float64,
+        ),
+        mask=mask,
+        class_id=np.array([1, 2, 3]),
+    )
+    expected_image = sv.MaskAnnotator(
+        color=sv.ColorPalette.DEFAULT,
+        color_lookup=sv.ColorLookup.CLASS,
+        opacity=0.5,
+    ).annotate(scene=image.copy(), detections=detections)
+
+    # when
+    output = block.run(
+        image=WorkflowImageData(
+            parent_metadata=ImageParentMetadata(parent_id="some"),
+            numpy_image=image,
+        ),
+        predictions=detections,
+        copy_image=True,
+        color_palette="DEFAULT",
+        palette_size=10,
+        custom_colors=None,
+        color_axis="CLASS",
+        opacity=0.5,
+    )
+
+    # then
+    assert np.array_equal(output["image"].numpy_image, expected_image)
+    assert np.array_equal(
+        image, original_image
+    ), "Expected input image not to be modified"
@@ -1,5 +1,11 @@
+from typing import List
+
 import pytest
 
+from inference.core.workflows.core_steps.visualizations.bounding_box.v1 import (
+    BoundingBoxManifest,
+)
+from inference.core.workflows.core_steps.visualizations.label.v1 import LabelManifest
 from inference.core.workflows.errors import (
     ExecutionGraphStructureError,
     InvalidReferenceTargetError,
@@ -746,3 +752,59 @@ def test_execution_graph_construction_when_connection_kind_missmatch_detected()
         _ = prepare_execution_graph(
             workflow_definition=workflow_definition,
         )
+
+
+@pytest.mark.parametrize(
+    "outputs_selectors, expected_copy_image",
+    [
+        (["$steps.label.image"], False),
+        (["$steps.label.image", "$steps.bbox.image"], True),
+    ],
+)
+def test_execution_graph_construction_disables_image_copy_for_chained_visualizations(
+    outputs_selectors: List[str],
+    expected_copy_image: bool,
+) -> None:
+    # given
+    model_manifest = ExampleModelBlockManifest(
+        type="ExampleModel",
+        name="model_1",
+        images="$inputs.image",
+        model_id="my_model",
+    )
+    bbox_manifest = BoundingBoxManifest(
+        type="roboflow_core/bounding_box_visualization@v1",
+        name="bbox",
+        image="$inputs.image",
+        predictions="$steps.model_1.predictions",
+    )
+    label_manifest = LabelManifest(
+        type="roboflow_core/label_visualization@v1",
+        name="label",
+        image="$steps.bbox.image",
+        predictions="$steps.model_1.predictions",
+    )
+    workflow_definition = ParsedWorkflowDefinition(
+        version="1.0",
+        inputs=[WorkflowImage(type="WorkflowImage", name="image")],
+        steps=[model_manifest, bbox_manifest, label_manifest],
+        outputs=[
+            JsonField(type="JsonField", name=f"output_{i}", selector=selector)
+            for i, selector in enumerate(outputs_selectors)
+        ],
+    )
+
+    # when
+    result = prepare_execution_graph(
+        workflow_definition=workflow_definition,
+    )
+
+    # then
+    bbox_node = result.nodes["$steps.bbox"]["node_compilation_output"]
+    label_node = result.nodes["$steps.label"]["node_compilation_output"]
+    assert (
+        bbox_node.input_data["copy_image"].value is True
+    ), "Expected first visualization to preserve workflow input image"
+    assert (
+        label_node.input_data["copy_image"].value is expected_copy_image
+    ), "Expected copy to be skipped only if nobody else observes image of bbox step"
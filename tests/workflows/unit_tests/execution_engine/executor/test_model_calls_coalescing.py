@@ -0,0 +1,96 @@
+from typing import Optional
+from unittest.mock import MagicMock
+
+from inference.core.workflows.execution_engine.v1.executor.model_calls_coalescing import (
+    order_steps_by_coalescing_groups,
+    plan_model_calls_coalescing,
+)
+
+
+def _workflow_with_steps(**model_ids: Optional[str]) -> MagicMock:
+    workflow = MagicMock()
+    workflow.steps = {}
+    for step_name, model_id in model_ids.items():
+        step = MagicMock()
+        step.manifest = MagicMock(spec=["type"] if model_id is None else None)
+        if model_id is not None:
+            step.manifest.model_id = model_id
+        workflow.steps[step_name] = step
+    return workflow
+
+
+def test_plan_model_calls_coalescing_groups_steps_referring_the_same_model() -> None:
+    # given
+    workflow = _workflow_with_steps(
+        a="some/1",
+        b="other/1",
+        c="some/1",
+        d=None,
+        e="$inputs.model",
+        f="$inputs.model",
+    )
+
+    # when
+    result = plan_model_calls_coalescing(
+        steps=[f"$steps.{name}" for name in "abcdef"],
+        workflow=workflow,
+        max_concurrent_steps=8,
+        max_wait=1.0,
+    )
+
+    # then
+    assert set(result.keys()) == {"$steps.a", "$steps.c", "$steps.e", "$steps.f"}
+    assert result["$steps.a"] is result["$steps.c"]
+    assert result["$steps.e"] is result["$steps.f"]
+    assert result["$steps.a"] is not result["$steps.e"]
+
+
+def test_plan_model_calls_coalescing_respects_max_concurrent_steps() -> None:
+    # given
+    workflow = _workflow_with_steps(a="some/1", b="some/1", c="some/1")
+
+    # when
+    result = plan_model_calls_coalescing(
+        steps=["$steps.a", "$steps.b", "$steps.c"],
+        workflow=workflow,
+        max_concurrent_steps=2,
+        max_wait=1.0,
+    )
+
+    # then
+    assert set(result.keys()) == {"$steps.a", "$steps.b"}
+    assert result["$steps.a"] is result["$steps.b"]
+
+
+def test_plan_model_calls_coalescing_when_steps_executed_sequentially() -> None:
+    # given
+    workflow = _workflow_with_steps(a="some/1", b="some/1")
+
+    # when
+    result = plan_model_calls_coalescing(
+        steps=["$steps.a", "$steps.b"],
+        workflow=workflow,
+        max_concurrent_steps=1,
+        max_wait=1.0,
+    )
+
+    # then
+    assert result == {}
+
+
+def test_order_steps_by_coalescing_groups() -> None:
+    # given
+    workflow = _workflow_with_steps(a="some/1", b=None, c="other/1", d="some/1")
+    steps = ["$steps.a", "$steps.b", "$steps.c", "$steps.d"]
+    groups = plan_model_calls_coalescing(
+        steps=steps,
+        workflow=workflow,
+        max_concurrent_steps=8,
+        max_wait=1.0,
+    )
+
+    # when
+    result = order_steps_by_coalescing_groups(steps=steps, coalescing_groups=groups)
+
+    # then
+    assert result == ["$steps.a", "$steps.d", "$steps.b", "$steps.c"]
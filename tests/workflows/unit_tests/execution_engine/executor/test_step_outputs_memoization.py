@@ -0,0 +1,216 @@
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from inference.core.workflows.execution_engine.profiling.core import (
+    NullWorkflowsProfiler,
+)
+from inference.core.workflows.execution_engine.v1.executor import core
+from inference.core.workflows.execution_engine.v1.executor.core import run_non_simd_step
+from inference.core.workflows.execution_engine.v1.executor.step_outputs_memoization import (
+    StepOutputsCache,
+    fingerprint_step_input,
+)
+
+
+def test_step_outputs_cache_when_step_not_executed_yet() -> None:
+    # given
+    cache = StepOutputsCache()
+
+    # when
+    result = cache.get(
+        step_selector="$steps.a",
+        input_fingerprint=fingerprint_step_input(step_input={"value": 1}),
+    )
+
+    # then
+    assert result is None
+
+
+def test_step_outputs_cache_when_inputs_did_not_change() -> None:
+    # given
+    cache = StepOutputsCache()
+    step_input = {"value": [1, 2], "array": np.array([1.0, 2.0])}
+    output = {"out": [3], "array": np.array([1, 2])}
+    cache.put(
+        step_selector="$steps.a",
+        input_fingerprint=fingerprint_step_input(step_input=step_input),
+        output=output,
+    )
+    output["out"].append(5)
+    output["array"][0] = 5
+    same_input_fingerprint = fingerprint_step_input(
+        step_input={"value": [1, 2], "array": np.array([1.0, 2.0])}
+    )
+
+    # when
+    first_result = cache.get(
+        step_selector="$steps.a", input_fingerprint=same_input_fingerprint
+    )
+    first_result.output["out"].append(4)
+    second_result = cache.get(
+        step_selector="$steps.a", input_fingerprint=same_input_fingerprint
+    )
+
+    # then
+    assert first_result.hits == 1
+    assert second_result.hits == 2
+    assert second_result.output["out"] == [
+        3
+    ], "Expected cached output not to be affected by modifications of returned one"
+    assert second_result.output["array"].tolist() == [1, 2]
+    with pytest.raises(ValueError):
+        second_result.output["array"][0] = 5
+
+
+def test_step_outputs_cache_when_inputs_changed() -> None:
+    # given
+    cache = StepOutputsCache()
+    cache.put(
+        step_selector="$steps.a",
+        input_fingerprint=fingerprint_step_input(step_input={"value": 1}),
+        output={"out": 1},
+    )
+
+    # when
+    result = cache.get(
+        step_selector="$steps.a",
+        input_fingerprint=fingerprint_step_input(step_input={"value": 2}),
+    )
+
+    # then
+    assert result is None
+
+
+def test_fingerprint_step_input() -> None:
+    # when
+    results = [
+        (
+            fingerprint_step_input({"a": np.array([1, 2])}),
+            fingerprint_step_input({"a": np.array([1, 2])}),
+        ),
+        (
+            fingerprint_step_input({"a": np.array([1, 2])}),
+            fingerprint_step_input({"a": np.array([1, 3])}),
+        ),
+        (
+            fingerprint_step_input({"a": np.array([1, 2])}),
+            fingerprint_step_input({"a": np.array([[1, 2]])}),
+        ),
+        (
+            fingerprint_step_input({"a": [1, (2, 3)]}),
+            fingerprint_step_input({"a": [1, (2, 3)]}),
+        ),
+        (
+            fingerprint_step_input({"a": 1}),
+            fingerprint_step_input({"b": 1}),
+        ),
+        (
+            fingerprint_step_input({"a": 1}),
+            fingerprint_step_input({"a": 1.0}),
+        ),
+        (
+            fingerprint_step_input({"a": [1, [2]]}),
+            fingerprint_step_input({"a": [[1], 2]}),
+        ),
+    ]
+
+    # then
+    assert [first == second for first, second in results] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_fingerprint_step_input_when_input_cannot_be_fingerprinted() -> None:
+    # when
+    result = fingerprint_step_input({"a": object()})
+
+    # then
+    assert result is None
+
+
+@mock.patch.object(core, "WORKFLOWS_STEP_OUTPUTS_MEMOIZATION_ENABLED", True)
+def test_run_non_simd_step_reuses_output_of_deterministic_step() -> None:
+    # given
+    workflow = MagicMock()
+    workflow.steps["a"].manifest.has_deterministic_outputs.return_value = True
+    workflow.steps["a"].step.run.return_value = {"output": 1}
+    execution_data_manager = MagicMock()
+    execution_data_manager.get_non_simd_step_input.return_value = {"value": 1}
+    cache = StepOutputsCache()
+
+    # when
+    for _ in range(3):
+        run_non_simd_step(
+            step_selector="$steps.a",
+            workflow=workflow,
+            execution_data_manager=execution_data_manager,
+            profiler=NullWorkflowsProfiler.init(),
+            step_outputs_cache=cache,
+        )
+
+    # then
+    assert workflow.steps["a"].step.run.call_count == 1
+    assert execution_data_manager.register_non_simd_step_output.call_count == 3
+    execution_data_manager.register_non_simd_step_output.assert_called_with(
+        step_selector="$steps.a",
+        output={"output": 1},
+    )
+
+
+@mock.patch.object(core, "WORKFLOWS_STEP_OUTPUTS_MEMOIZATION_ENABLED", True)
+def test_run_non_simd_step_does_not_memoize_outputs_of_non_deterministic_step() -> None:
+    # given
+    workflow = MagicMock()
+    workflow.steps["a"].manifest.has_deterministic_outputs.return_value = False
+    workflow.steps["a"].step.run.return_value = {"output": 1}
+    execution_data_manager = MagicMock()
+    execution_data_manager.get_non_simd_step_input.return_value = {"value": 1}
+    cache = StepOutputsCache()
+
+    # when
+    for _ in range(3):
+        run_non_simd_step(
+            step_selector="$steps.a",
+            workflow=workflow,
+            execution_data_manager=execution_data_manager,
+            profiler=NullWorkflowsProfiler.init(),
+            step_outputs_cache=cache,
+        )
+
+    # then
+    assert workflow.steps["a"].step.run.call_count == 3
+    assert len(cache) == 0
+
+
+@mock.patch.object(core, "WORKFLOWS_STEP_OUTPUTS_MEMOIZATION_ENABLED", False)
+def test_run_non_simd_step_does_not_memoize_outputs_when_memoization_disabled() -> None:
+    # given
+    workflow = MagicMock()
+    workflow.steps["a"].manifest.has_deterministic_outputs.return_value = True
+    workflow.steps["a"].step.run.return_value = {"output": 1}
+    execution_data_manager = MagicMock()
+    execution_data_manager.get_non_simd_step_input.return_value = {"value": 1}
+    cache = StepOutputsCache()
+
+    # when
+    for _ in range(3):
+        run_non_simd_step(
+            step_selector="$steps.a",
+            workflow=workflow,
+            execution_data_manager=execution_data_manager,
+            profiler=NullWorkflowsProfiler.init(),
+            step_outputs_cache=cache,
+        )
+
+    # then
+    assert workflow.steps["a"].step.run.call_count == 3
+    assert len(cache) == 0
@@ -0,0 +1,155 @@
+import json
+import os
+import time
+
+from inference.core.workflows.execution_engine.profiling.streaming import (
+    StreamingWorkflowsProfiler,
+    summarise_measurements,
+)
+
+
+def test_streaming_profiler_aggregates_metrics_of_steps() -> None:
+    # given
+    profiler = StreamingWorkflowsProfiler.init(window_size=2)
+
+    # when
+    for _ in range(3):
+        profiler.start_workflow_run()
+        with profiler.profile_execution_phase(
+            name="step_execution", metadata={"step_selector": "$steps.model"}
+        ):
+            time.sleep(0.01)
+        profiler.end_workflow_run()
+    report = profiler.get_report()
+
+    # then
+    assert report["runs"] == 3, "Expected all runs to be counted"
+    assert report["workflow_run"]["wall_time"]["samples"] == 2
+    step_report = report["steps"]["$steps.model"]
+    assert set(step_report.keys()) == {
+        "wall_time",
+        "cpu_time",
+    }, "Expected queue time and allocations not to be reported outside steps group"
+    assert (
+        step_report["wall_time"]["samples"] == 2
+    ), "Expected only measurements from rolling window to be kept"
+    assert step_report["wall_time"]["p50"] >= 0.01
+    assert (
+        step_report["cpu_time"]["max"] < 0.01
+    ), "Expected sleeping not to be counted as CPU time"
+
+
+def test_streaming_profiler_measures_queue_time_within_group_of_steps() -> None:
+    # given
+    profiler = StreamingWorkflowsProfiler.init()
+
+    # when
+    with profiler.profile_execution_phase(name="group_of_steps_execution"):
+        time.sleep(0.02)
+        with profiler.profile_execution_phase(
+            name="step_execution", metadata={"step_selector": "$steps.crop"}
+        ):
+            pass
+    report = profiler.get_report()
+
+    # then
+    assert report["steps"]["$steps.crop"]["queue_time"]["p50"] >= 0.02
+
+
+def test_streaming_profiler_when_allocations_are_tracked() -> None:
+    # given
+    profiler = StreamingWorkflowsProfiler.init(track_allocations=True)
+
+    # when
+    with profiler.profile_execution_phase(
+        name="step_execution", metadata={"step_selector": "$steps.buffer"}
+    ):
+        buffer = [bytearray(1024) for _ in range(1024)]
+    profiler.close()
+    report = profiler.get_report()
+
+    # then
+    assert len(buffer) == 1024
+    assert report["steps"]["$steps.buffer"]["allocated_bytes"]["max"] >= 1024 * 1024
+
+
+def test_streaming_profiler_keeps_trace_of_other_phases() -> None:
+    # given
+    profiler = StreamingWorkflowsProfiler.init()
+
+    # when
+    profiler.start_workflow_run()
+    with profiler.profile_execution_phase(name="some", categories=["a"]):
+        pass
+    profiler.end_workflow_run()
+    trace = profiler.export_trace()
+
+    # then
+    assert [(event["name"], event["ph"]) for event in trace] == [
+        ("workflow_run", "B"),
+        ("some", "X"),
+        ("workflow_run", "E"),
+    ]
+    assert profiler.get_report()["steps"] == {}
+
+
+def test_streaming_profiler_saves_snapshots_in_chrome_trace_format(tmp_path) -> None:
+    # given
+    profiler = StreamingWorkflowsProfiler.init(
+        snapshots_directory=str(tmp_path),
+        snapshot_interval=0.0,
+        max_snapshots=2,
+    )
+
+    # when
+    for _ in range(4):
+        profiler.start_workflow_run()
+        with profiler.profile_execution_phase(
+            name="step_execution", metadata={"step_selector": "$steps.model"}
+        ):
+            pass
+        profiler.end_workflow_run()
+        time.sleep(0.002)
+    path = profiler.save_snapshot()
+
+    # then
+    assert sorted(os.listdir(tmp_path))[-1] == os.path.basename(path)
+    assert len(os.listdir(tmp_path)) == 2, "Expected old snapshots to be removed"
+    with open(path) as f:
+        snapshot = json.load(f)
+    assert snapshot["displayTimeUnit"] == "ms"
+    assert len(snapshot["traceEvents"]) == 12
+    assert snapshot["otherData"]["runs"] == 4
+    assert "$steps.model" in snapshot["otherData"]["steps"]
+
+
+def test_streaming_profiler_when_snapshots_directory_not_given() -> None:
+    # given
+    profiler = StreamingWorkflowsProfiler.init()
+
+    # when
+    result = profiler.save_snapshot()
+
+    # then
+    assert result is None
+
+
+def test_summarise_measurements() -> None:
+    # when
+    result = summarise_measurements(values=[float(i) for i in range(1, 101)])
+
+    # then
+    assert result["samples"] == 100
+    assert abs(result["mean"] - 50.5) < 1e-6
+    assert abs(result["p50"] - 50.5) < 1e-6
+    assert abs(result["p90"] - 90.1) < 1e-6
+    assert abs(result["p99"] - 99.01) < 1e-6
+    assert result["max"] == 100.0
+
+
+def test_summarise_measurements_when_no_measurements_registered() -> None:
+    # when
+    result = summarise_measurements(values=[])
+
+    # then
+    assert result == {"samples": 0}